@@ -0,0 +1,51 @@
+"""add_simulation_result_cache
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f6a8
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b9'
+down_revision: Union[str, None] = 'b2c3d4e5f6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'etter_simulation_result_cache',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('company', sa.String(length=200), nullable=True),
+        sa.Column('seed', sa.Integer(), nullable=False),
+        sa.Column('n_iterations', sa.Integer(), nullable=False),
+        sa.Column('kernel', sa.String(length=50), nullable=False),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        schema='etter'
+    )
+    op.create_index(
+        op.f('ix_etter_simulation_result_cache_cache_key'),
+        'etter_simulation_result_cache',
+        ['cache_key'],
+        unique=True,
+        schema='etter'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_etter_simulation_result_cache_cache_key'),
+        table_name='etter_simulation_result_cache',
+        schema='etter'
+    )
+    op.drop_table('etter_simulation_result_cache', schema='etter')
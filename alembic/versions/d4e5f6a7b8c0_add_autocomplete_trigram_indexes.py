@@ -0,0 +1,70 @@
+"""add autocomplete trigram indexes
+
+Indexes for every AUTOCOMPLETE_REGISTRY column (services/autocomplete_service):
+- GIN gin_trgm_ops on the column, for substring ILIKE '%term%' (3+ characters)
+- btree lower(column) text_pattern_ops, for prefix LIKE 'term%' on short terms
+
+Built CONCURRENTLY so the large tables (ace.machine_learning_jobrole,
+iris1.iris1_mastercompany) stay writable while the indexes build.
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c0'
+down_revision: Union[str, None] = 'c3d4e5f6a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (schema, table, column)
+AUTOCOMPLETE_COLUMNS = [
+    ('etter', 'etter_role_taxonomy', 'job_title'),
+    ('etter', 'etter_master_company_role_management_level', 'name'),
+    ('etter', 'etter_master_company_role_job_track', 'name'),
+    ('etter', 'etter_master_company_role_job_family', 'name'),
+    ('etter', 'etter_master_company_role_occupation', 'name'),
+    ('etter', 'etter_master_skill_taxonomy_categories', 'name'),
+    ('etter', 'etter_master_tech_stack_category', 'name'),
+    ('etter', 'etter_functionworkflow', 'workflow_name'),
+    ('ace', 'machine_learning_jobrole', 'job_role'),
+    ('iris1', 'iris1_mastercompany', 'company_name'),
+]
+
+
+def _index_names(table: str, column: str):
+    # Postgres truncates identifiers at 63 characters
+    base = f"ix_{table}_{column}"[:54]
+    return f"{base}_trgm", f"{base}_lprefix"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for schema, table, column in AUTOCOMPLETE_COLUMNS:
+            trgm_index, prefix_index = _index_names(table, column)
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {trgm_index}
+                ON {schema}.{table}
+                USING gin ({column} gin_trgm_ops)
+            """)
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {prefix_index}
+                ON {schema}.{table} (lower({column}) text_pattern_ops)
+            """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for schema, table, column in AUTOCOMPLETE_COLUMNS:
+            for index in _index_names(table, column):
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{index}")
+
+    # Note: Not dropping pg_trgm extension as it is used by other tables
@@ -12,13 +12,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-import requests
+import httpx
 
 from api.s3.dependencies import get_auth_context, get_uow, get_s3_service, AuthContext
 from api.s3.infra.db.uow import UnitOfWork
 from api.s3.infra.s3.s3_management_service import S3ManagementService
 from api.s3.domain.services.document_custodian import DocumentCustodian
-from api.etter_apis import get_draup_world_api, get_token
+from api.etter_apis import get_draup_world_api, get_token_async, draup_world_request_async
+from services.upstream_client import iter_stream, UPSTREAM_TIMEOUTS, UPSTREAM_DRAUP_WORLD, UPSTREAM_DRAUP_WORLD_STREAM
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ chatbot_router = APIRouter(prefix="/chatbot", tags=["Chatbot"])
 # Configuration
 DRAUP_WORLD_MODEL_BASE_URL = get_draup_world_api()
 CHATBOT_QUERY_ENDPOINT = f"{DRAUP_WORLD_MODEL_BASE_URL}/query"
-TIMEOUT_SECONDS = 300  # 5 minutes for long-running workflows
+TIMEOUT_SECONDS = UPSTREAM_TIMEOUTS[UPSTREAM_DRAUP_WORLD].read  # 5 minutes for long-running workflows
 
 
 class ChatbotQueryRequest(BaseModel):
@@ -203,7 +204,7 @@ async def query_chatbot(
 
         # Get authentication token for draup_world_model_graph
         # Use the same authentication pattern as other etter-backend APIs
-        token = get_token()
+        token = await get_token_async()
         if not token:
             logger.error("Failed to obtain auth token for draup_world_model_graph")
             raise HTTPException(
@@ -222,16 +223,20 @@ async def query_chatbot(
         # Forward request to draup_world_model_graph
         logger.info(f"Forwarding chatbot query to {CHATBOT_QUERY_ENDPOINT}")
 
-        response = requests.post(
+        response = await draup_world_request_async(
+            "POST",
             CHATBOT_QUERY_ENDPOINT,
+            token=token,
+            upstream=UPSTREAM_DRAUP_WORLD_STREAM if query_request.stream_answers else UPSTREAM_DRAUP_WORLD,
+            stream=query_request.stream_answers,
             json=payload,
             headers=headers,
-            timeout=TIMEOUT_SECONDS,
-            stream=query_request.stream_answers
         )
 
         # Check response status
         if response.status_code != 200:
+            await response.aread()
+            await response.aclose()
             logger.error(
                 f"Workflow engine returned error: "
                 f"status={response.status_code}, body={response.text[:500]}"
@@ -244,7 +249,7 @@ async def query_chatbot(
         # Return streaming response
         if query_request.stream_answers:
             return StreamingResponse(
-                response.iter_content(chunk_size=8192),
+                iter_stream(response),
                 media_type="text/event-stream"
             )
         else:
@@ -252,13 +257,13 @@ async def query_chatbot(
 
     except HTTPException:
         raise
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error(f"Timeout calling workflow engine after {TIMEOUT_SECONDS}s")
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="Workflow engine timeout"
         )
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error calling workflow engine: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import math
 from datetime import datetime, timedelta
@@ -22,12 +23,13 @@ from sqlalchemy.orm import (
 import os
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse, Response
+from starlette.concurrency import run_in_threadpool
 import httpx
 from uuid import uuid4
 import uuid
 
 from common.common_utils import get_minimized_time_ago
-from common.pagination import paginate
+from common.pagination import SortKey, paginate
 from models.auth import User
 
 from ml_models.simulation import SimulationRequestData
@@ -36,7 +38,12 @@ from ml_models.role_adjacency.role_adjacency import get_similar_roles_async
 
 from services.simulation.store import get_sim_store
 from services.role_adjaceny_service import get_adjacent_roles_cacheable
-from services.simulation.simulation_service import run_and_store_simulation
+from services.simulation.job_service import (
+    get_simulation_job_runner,
+    is_active_job,
+    PROGRESS_FLUSH_SECONDS,
+    TERMINAL_STATUSES,
+)
 from services.task_simulation_score_service import compute_task_simulator_scores_service
 from models.etter import (
     UserWorkflowHistory,
@@ -66,6 +73,7 @@ from services.etter import (
     bulk_upsert_sample_data,
     check_titles_availability,
 )
+from services import step_history
 from services.autocomplete_service import fetch_autocomplete_data
 from schemas.etter_schemas import (
     CreateNewWorkflow,
@@ -98,16 +106,24 @@ from schemas.etter_schemas import (
     DynamicProxyRequest,
 )
 
-from settings.database import get_db
-from services.auth import verify_token
+from settings.database import get_db, SessionLocal
+from services.auth import verify_token, verify_token_async
+from services.draup_world_token import get_token_manager
+from services.upstream_client import (
+    iter_stream,
+    UPSTREAM_TIMEOUTS,
+    UPSTREAM_DRAUP_WORLD,
+    UPSTREAM_DRAUP_WORLD_FAST,
+    UPSTREAM_DRAUP_WORLD_STREAM,
+)
 from services.etter import (
     upsert_workflow_step,
     upsert_user_workflow_history_data,
     update_user_workflow_step_history_data,
 )
-from constants.etter import DRAUP_WORLD_API, DRAUP_WORLD_API_QA, DRAUP_WORLD_USERNAME, DRAUP_WORLD_PASSWORD, TASK_FEASIBILITY_STALE_DAYS
+from constants.etter import DRAUP_WORLD_API, DRAUP_WORLD_API_QA, TASK_FEASIBILITY_STALE_DAYS
 from common.common_utils import getCurrentEnvironment
-from sqlalchemy import or_, func, asc, case, distinct
+from sqlalchemy import and_, or_, func, asc, case, distinct
 from services.email_service import send_mail_through_draup_services
 from api.function_workflow_task_apis import create_comprehensive_workflow, bulk_upsert_tasks
 from pydantic import ValidationError
@@ -508,6 +524,40 @@ def get_simulation(sim_id: str,
     return {"error": "Simulation ID not found."}
 
 
+def _financial_simulation_saver(company_name: str, user_id: int):
+    """
+    Completion hook that saves a finished simulation to FinancialSimulator,
+    keyed by company and user. Runs after the request has returned, so it
+    opens its own session.
+    """
+    def save(result: Dict) -> None:
+        db = SessionLocal()
+        try:
+            company = db.query(MasterCompany).filter(MasterCompany.company_name == company_name).first()
+            if not company:
+                return
+            existing_simulation = db.query(FinancialSimulator).filter(
+                FinancialSimulator.company_id == company.id,
+                FinancialSimulator.modified_by == user_id
+            ).first()
+
+            if existing_simulation:
+                existing_simulation.last_ran_on = datetime.utcnow()
+                existing_simulation.simulation_data = result
+            else:
+                db.add(FinancialSimulator(
+                    company_id=company.id,
+                    modified_by=user_id,
+                    last_ran_on=datetime.utcnow(),
+                    simulation_data=result
+                ))
+            db.commit()
+        finally:
+            db.close()
+
+    return save
+
+
 @etter_api_router.post("/simulation/v1", status_code=status.HTTP_200_OK)
 async def start_simulation(
     data: SimulationRequest, 
@@ -515,73 +565,85 @@ async def start_simulation(
     draup_user: ResponseModel = Depends(verify_token)
 ):
     """
-    Start an asynchronous simulation which is blocking and return the data of the request.
-    Saves simulation data with respect to user and updates based on username+company.
+    Queue a simulation and return its state without waiting for it to finish.
+    A completed cached result is returned as-is, and an identical request that
+    is still running is joined instead of being started again. Poll
+    /simulation/v1/jobs/{sim_id} or follow /simulation/v1/jobs/{sim_id}/events
+    for progress. The finished result is saved with respect to user and
+    company, as before. Only seeded runs are reproducible, so only they are
+    served from and saved to the persistent result cache.
     """
-    # Generate a unique ID for this simulation run
-    sim_id = f"sim-{str(uuid4())}"
     sim_cache_key = f"sim:{hashlib.sha256(data.model_dump_json().encode()).hexdigest()}"
     sim_store = get_sim_store()
-    if sim_store.exists(sim_cache_key):
-        if sim_store.get(sim_cache_key) is None:
-            sim_store.delete(sim_cache_key)
-        elif "status" in sim_store.get(sim_cache_key) and sim_store.get(sim_cache_key)["status"] == "completed":
-            cached_data = sim_store.get(sim_cache_key)
-            return cached_data
-        else:
-            sim_cache_key = sim_cache_key + "-1"
+    cached_data = sim_store.get(sim_cache_key)
+    if cached_data and cached_data.get("status") == "completed":
+        return cached_data
+
+    draup_user_data = draup_user.data
+    current_user = db.query(User).filter(User.email == draup_user_data["email"]).first()
+    on_complete = _financial_simulation_saver(data.company, current_user.id) if data.company and current_user else None
+
+    job_runner = get_simulation_job_runner()
+    if is_active_job(cached_data) and not job_runner.is_running(sim_cache_key):
+        # Running on another worker: share its progress rather than starting again.
+        return cached_data
 
     simulation_data = SimulationRequestData(
         n_iterations=data.n_iterations,
         company=data.company,
         automation_factor=data.automation_factor,
         roles=[role.model_dump() for role in data.roles],
+        seed=data.seed,
     )
+    return await job_runner.submit(sim_cache_key, f"sim-{str(uuid4())}", simulation_data, on_complete=on_complete)
 
-    sim_store.create(sim_cache_key, id=sim_id, input_data=simulation_data)
-    sim_store.update(sim_cache_key, status="in_progress", simulation_steps=[])
-
-    simulation_steps, yearly_metrics, workloads, explanations = await run_and_store_simulation(simulation_data)
-    status = "failed"
-    if simulation_steps:
-        status = "completed"
-
-    sim_store.update(
-        sim_cache_key,
-        id=sim_id,
-        status=status,
-        workloads=workloads,
-        yearly_metrics=yearly_metrics,
-        explanations=explanations,
-        simulation_steps=simulation_steps,
+
+@etter_api_router.get("/simulation/v1/jobs/{sim_id}", status_code=status.HTTP_200_OK)
+async def get_simulation_job(sim_id: str, draup_user: ResponseModel = Depends(verify_token)):
+    """
+    Current state of a simulation job: status and progress while it runs, the
+    full result once it has completed.
+    """
+    sim_data = await run_in_threadpool(get_simulation_job_runner().get_job, sim_id)
+    if not sim_data:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation ID not found.")
+    return sim_data
+
+
+@etter_api_router.get("/simulation/v1/jobs/{sim_id}/events")
+async def stream_simulation_job(sim_id: str, draup_user: ResponseModel = Depends(verify_token)):
+    """
+    Server-sent events for a simulation job. A ``progress`` event is sent
+    whenever the progress changes, then a single ``completed`` or ``failed``
+    event carrying the full result closes the stream.
+    """
+    job_runner = get_simulation_job_runner()
+    sim_data = await run_in_threadpool(job_runner.get_job, sim_id)
+    if not sim_data:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation ID not found.")
+
+    async def events():
+        last_event = None
+        current = sim_data
+        while True:
+            if not current:
+                yield f"event: failed\ndata: {json.dumps({'id': sim_id, 'status': 'failed'})}\n\n"
+                return
+            if current.get("status") in TERMINAL_STATUSES:
+                yield f"event: {current['status']}\ndata: {json.dumps(current)}\n\n"
+                return
+            event = {"id": sim_id, "status": current.get("status"), "progress": current.get("progress")}
+            if event != last_event:
+                yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+                last_event = event
+            await asyncio.sleep(PROGRESS_FLUSH_SECONDS)
+            current = await run_in_threadpool(job_runner.get_job, sim_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    result = sim_store.get(sim_cache_key)
-    draup_user_data = draup_user.data
-    current_user = db.query(User).filter(User.email == draup_user_data["email"]).first()
-    # Save to FinancialSimulator if company exists
-    if data.company:
-        company = db.query(MasterCompany).filter(MasterCompany.company_name == data.company).first()
-        if company:
-            existing_simulation = db.query(FinancialSimulator).filter(
-                FinancialSimulator.company_id == company.id,
-                FinancialSimulator.modified_by == current_user.id
-            ).first()
-            
-            if existing_simulation:
-                existing_simulation.last_ran_on = datetime.utcnow()
-                existing_simulation.simulation_data = result
-                db.commit()
-            else:
-                financial_sim = FinancialSimulator(
-                    company_id=company.id,
-                    modified_by=current_user.id,
-                    last_ran_on=datetime.utcnow(),
-                    simulation_data=result
-                )
-                db.add(financial_sim)
-                db.commit()
-    
-    return result
 
 
 @etter_api_router.post("/simulation/company", status_code=status.HTTP_200_OK)
@@ -940,16 +1002,21 @@ def update_user_workflow_step_history(
 
 
 def fetch_steps_data(db, workflow_history_id):
-    return [
-        row.data
-        for row in db.query(UserWorkflowStepsHistory.data)
+    rows = (
+        db.query(
+            UserWorkflowStepsHistory.user_workflow_history_id,
+            UserWorkflowStepsHistory.workflow_step_info_id,
+            UserWorkflowStepsHistory.version_id,
+            UserWorkflowStepsHistory.data,
+        )
         .filter(
             UserWorkflowStepsHistory.user_workflow_history_id == workflow_history_id,
             UserWorkflowStepsHistory.is_latest == True,
         )
         .order_by(UserWorkflowStepsHistory.id.asc())
         .all()
-    ]
+    )
+    return step_history.resolve_step_data(db, rows)
 
 
 def get_etter_and_validated_data(
@@ -1142,6 +1209,8 @@ def get_user_workflow_steps_history(
                 UserWorkflowStepsHistory.updated_at,
                 UserWorkflowStepsHistory.created_at,
                 UserWorkflowStepsHistory.version_id,
+                UserWorkflowStepsHistory.user_workflow_history_id,
+                UserWorkflowStepsHistory.workflow_step_info_id,
             )
             .filter(*step_filters)
             .join(
@@ -1162,8 +1231,9 @@ def get_user_workflow_steps_history(
         steps_list = []
         last_step = None
         latest_version = 1
-        for row in user_workflow_steps:
-            data = row.data if row.data else {}
+        steps_data = step_history.resolve_step_data(db, user_workflow_steps)
+        for row, data in zip(user_workflow_steps, steps_data):
+            data = data if data else {}
             data["lastModifiedOn"] = (
                 get_minimized_time_ago(row.updated_at or row.created_at)
                 if row.updated_at or row.created_at
@@ -1179,7 +1249,7 @@ def get_user_workflow_steps_history(
                 "approver_name": row.approver_name,
             }
             if row.type and row.type == "data":
-                last_step = row.data.get("step")
+                last_step = data.get("step")
             steps_list.append(step_dict)
 
         user_workflow_data["steps"] = steps_list
@@ -1246,22 +1316,17 @@ def get_user_workflows_summary(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
-        query = (
-            db.query(UserWorkflowHistory)
-            .join(WorkflowInfo)
-            .join(
-                UserWorkflowHistoryStatus,
-                UserWorkflowHistoryStatus.history_id == UserWorkflowHistory.id,
-            )
-        )
+        query = db.query(UserWorkflowHistory).join(WorkflowInfo)
 
-        query = query.filter(
+        # Matched with EXISTS rather than a join: a history has a status row per
+        # user, and joining them would return the history once per row.
+        status_conditions = [
             or_(
                 UserWorkflowHistory.user_id == current_user.id,
                 UserWorkflowHistory.approver_id == current_user.id,
                 UserWorkflowHistoryStatus.user_id == current_user.id,
             )
-        )
+        ]
 
         if filters:
             if filters.workflow_name:
@@ -1290,9 +1355,10 @@ def get_user_workflows_summary(
                     )
                 )
             if filters.unread_flag is not None:
-                query = query.filter(
+                status_conditions.append(
                     UserWorkflowHistoryStatus.unread_flag == filters.unread_flag
                 )
+        query = query.filter(UserWorkflowHistory.status_records.any(and_(*status_conditions)))
 
         page = (filters.page + 1) if filters and filters.page >= 0 else 1
         page_size = filters.limit if filters and filters.limit > 0 else 50
@@ -1304,9 +1370,14 @@ def get_user_workflows_summary(
             joinedload(UserWorkflowHistory.user),
         )
         
-        query = query.order_by(UserWorkflowHistory.updated_at.desc(), UserWorkflowHistory.id.desc())
-        
-        paginated_result = paginate(query, page=page, page_size=page_size)
+        paginated_result = paginate(
+            query,
+            page=page,
+            page_size=page_size,
+            count_mode=filters.count_mode if filters else "exact",
+            sort_keys=[SortKey(UserWorkflowHistory.updated_at, True), SortKey(UserWorkflowHistory.id, True)],
+            cursor=filters.cursor if filters else None,
+        )
         user_workflow_histories = paginated_result.items
         history_ids = [h.id for h in user_workflow_histories]
 
@@ -1340,6 +1411,11 @@ def get_user_workflows_summary(
                 ):
                     data_step_map[hid] = step
 
+        shown_steps = list({s.id: s for s in [*step_map.values(), *data_step_map.values()]}.values())
+        shown_data = {
+            s.id: data for s, data in zip(shown_steps, step_history.resolve_step_data(db, shown_steps))
+        }
+
         step_info_ids = [
             s.workflow_step_info_id
             for s in step_map.values()
@@ -1400,8 +1476,8 @@ def get_user_workflows_summary(
                     else None,
                     "username": history.user.username if history.user else None,
                     "step_name": step_name,
-                    "step_data": data_step.data if data_step else None,
-                    "step_info": step.data if step else None,
+                    "step_data": shown_data[data_step.id] if data_step else None,
+                    "step_info": shown_data[step.id] if step else None,
                     "info": history.info,
                     "other_users": other_users,
                     "unread_flag": user_status_record.unread_flag
@@ -1433,6 +1509,8 @@ def get_user_workflows_summary(
         resp_obj["total_pages"] = paginated_result.total_pages
         resp_obj["has_next"] = paginated_result.has_next
         resp_obj["has_prev"] = paginated_result.has_prev
+        resp_obj["next_cursor"] = paginated_result.next_cursor
+        resp_obj["total_is_estimate"] = paginated_result.total_is_estimate
 
     except Exception as e:
         resp_obj["status"] = "failure"
@@ -2188,7 +2266,7 @@ def process_workflow_builder(
         "content-type": "application/json"
     }
     try:
-        remote_response = requests.post(target_url, headers=headers, json=data.model_dump())
+        remote_response = draup_world_request("POST", target_url, token=token, headers=headers, json=data.model_dump())
     except Exception as exc:
         resp_obj["status"] = "failure"
         resp_obj["errors"].append(f"Upstream request failed: {str(exc)}")
@@ -2275,7 +2353,7 @@ def enrich_tasks(
     }
     
     try:
-        remote_response = requests.post(target_url, headers=headers, json=data.model_dump())
+        remote_response = draup_world_request("POST", target_url, token=token, headers=headers, json=data.model_dump())
     except Exception as exc:
         resp_obj["status"] = "failure"
         resp_obj["errors"].append(f"Upstream request failed: {str(exc)}")
@@ -2434,7 +2512,7 @@ def recalculate_score(
     }
     
     try:
-        remote_response = requests.post(target_url, headers=headers, json=data.model_dump())
+        remote_response = draup_world_request("POST", target_url, token=token, headers=headers, json=data.model_dump())
     except Exception as exc:
         resp_obj["status"] = "failure"
         resp_obj["errors"].append(f"Upstream request failed: {str(exc)}")
@@ -2527,7 +2605,7 @@ async def get_workflows(
 ):
     try:
         target_url = f"{get_draup_world_api()}/workflows"
-        token = get_token()
+        token = await get_token_async()
         if not token:
             return JSONResponse(status_code=500, content={"error": "Failed to obtain auth token"})
 
@@ -2536,7 +2614,9 @@ async def get_workflows(
         headers["content-type"] = "application/json"
         body = await request.body()
 
-        resp = requests.post(target_url, headers=headers, json=json.loads(body.decode()))
+        resp = await draup_world_request_async(
+            "POST", target_url, token=token, upstream=UPSTREAM_DRAUP_WORLD, headers=headers, json=json.loads(body.decode())
+        )
 
         if resp.status_code == 200:
             return JSONResponse(status_code=200, content=resp.json())
@@ -2550,7 +2630,7 @@ async def get_workflows(
 async def detect_intent(request: Request):
     try:
         target_url = f"{get_draup_world_api()}/detect_intent"
-        token = get_token()
+        token = await get_token_async()
         if not token:
             return JSONResponse(
                 status_code=500, content={"error": "Failed to obtain auth token"}
@@ -2562,7 +2642,9 @@ async def detect_intent(request: Request):
         headers["content-type"] = "application/json"
         body = await request.body()
 
-        resp = requests.post(target_url, headers=headers, json=json.loads(body.decode()))
+        resp = await draup_world_request_async(
+            "POST", target_url, token=token, upstream=UPSTREAM_DRAUP_WORLD_FAST, headers=headers, json=json.loads(body.decode())
+        )
 
         if resp.status_code == 200:
             res = resp.json()
@@ -2580,7 +2662,7 @@ async def detect_intent(request: Request):
 async def autocomplete_contextual(request: Request):
     try:
         target_url = f"{get_draup_world_api()}/autocomplete/contextual"
-        token = get_token()
+        token = await get_token_async()
         if not token:
             return JSONResponse(
                 status_code=500, content={"error": "Failed to obtain auth token"}
@@ -2591,7 +2673,9 @@ async def autocomplete_contextual(request: Request):
         headers["content-type"] = "application/json"
         body = await request.body()
 
-        resp = requests.post(target_url, headers=headers, json=json.loads(body.decode()))
+        resp = await draup_world_request_async(
+            "POST", target_url, token=token, upstream=UPSTREAM_DRAUP_WORLD_FAST, headers=headers, json=json.loads(body.decode())
+        )
 
         if resp.status_code == 200:
             res = resp.json()
@@ -2614,7 +2698,7 @@ async def proxy(request: Request):
     target_url = f"{get_draup_world_api()}/query"
 
     # Get auth token
-    token = get_token()
+    token = await get_token_async()
     if not token:
         return JSONResponse(status_code=500, content={"error": "Failed to obtain auth token"})
 
@@ -2632,36 +2716,29 @@ async def proxy(request: Request):
         return JSONResponse(status_code=400, content={"error": "Invalid request body"})
 
     try:
-        # Use requests for initial connection to handle redirects
-        response = requests.post(
+        # Only the headers are awaited here; the body is streamed through below
+        response = await draup_world_request_async(
+            "POST",
             target_url,
-            data=body,
+            token=token,
+            upstream=UPSTREAM_DRAUP_WORLD_STREAM,
+            stream=True,
+            content=body,
             headers=headers,
-            params=request.query_params,
-            stream=True
+            params=dict(request.query_params),
+            follow_redirects=True,
         )
 
-        if not response.ok:
+        if not response.is_success:
+            await response.aread()
+            await response.aclose()
             return JSONResponse(
                 status_code=response.status_code,
                 content={"error": "Upstream server error", "details": response.text}
             )
 
-        async def event_stream():
-            try:
-                # Stream directly from requests response
-                for chunk in response.iter_content(chunk_size=None):
-                    if chunk:
-                        yield chunk
-            except Exception as exc:
-                logger.error(f"Streaming error: {exc}")
-                error_msg = b'data: {"error": "Stream interrupted"}\n\n'
-                yield error_msg
-            finally:
-                response.close()
-
         return StreamingResponse(
-            event_stream(),
+            iter_stream(response, on_error=b'data: {"error": "Stream interrupted"}\n\n'),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -2829,7 +2906,7 @@ async def dynamic_proxy_draup_world(
     endpoint_path: str,
     request: Request,
     db: Session = Depends(get_db),
-    draup_user: ResponseModel = Depends(verify_token),
+    draup_user: ResponseModel = Depends(verify_token_async),
 ):
     """
     Dynamic proxy endpoint for any get_draup_world_api() endpoint.
@@ -2850,7 +2927,7 @@ async def dynamic_proxy_draup_world(
     """
     resp_obj = {"status": "success", "data": None, "errors": []}
     
-    token = get_token()
+    token = await get_token_async()
     if not token:
         resp_obj["status"] = "failure"
         resp_obj["errors"].append("Failed to obtain auth token")
@@ -2926,31 +3003,33 @@ async def dynamic_proxy_draup_world(
     query_params = dict(request.query_params)
     
     # Make the request to the upstream service
-    # Maximum timeout: 5 minutes (300 seconds)
-    request_timeout = 300
+    # Maximum timeout: the draup_world upstream budget (5 minutes by default)
+    request_timeout = UPSTREAM_TIMEOUTS[UPSTREAM_DRAUP_WORLD].read
     try:
         if method_override == "GET":
             # For GET, payload goes as query parameters
             if payload:
                 query_params.update(payload)
-            remote_response = requests.get(
+            remote_response = await draup_world_request_async(
+                "GET",
                 target_url,
+                token=token,
                 headers=headers,
                 params=query_params,
-                timeout=request_timeout
             )
         else:  # POST
             # For POST, payload goes in JSON body
-            remote_response = requests.post(
+            remote_response = await draup_world_request_async(
+                "POST",
                 target_url,
+                token=token,
                 headers=headers,
                 json=payload,
                 params=query_params,
-                timeout=request_timeout
             )
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         resp_obj["status"] = "failure"
-        resp_obj["errors"].append(f"Request to upstream service timed out after {request_timeout} seconds (5 minutes)")
+        resp_obj["errors"].append(f"Request to upstream service timed out after {request_timeout:g} seconds")
         return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content=resp_obj)
     except Exception as exc:
         resp_obj["status"] = "failure"
@@ -2981,25 +3060,29 @@ async def dynamic_proxy_draup_world(
 
 
 def get_token():
-    try:
-        target_url = f"{get_draup_world_api()}/login"
-        payload = {
-            "username": DRAUP_WORLD_USERNAME,
-            "password": DRAUP_WORLD_PASSWORD
-        }
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        resp = requests.post(target_url, headers=headers, json=payload)
-        if resp.status_code == 200:
-            resp_json = resp.json()
-            return resp_json.get("token")
-        else:
-            logger.error(f"Failed to get token, status code: {resp.status_code}, response: {resp.text}")
-    except Exception as e:
-        logger.error(f"Error in getting token: {e}")
+    return get_token_manager(get_draup_world_api()).get_token()
+
+
+async def get_token_async() -> Optional[str]:
+    return await get_token_manager(get_draup_world_api()).get_token_async()
+
+
+def draup_world_request(method: str, url: str, token: Optional[str] = None, **kwargs) -> requests.Response:
+    """
+    Send a request to the Draup World API with the cached service token,
+    refreshing the token and retrying once on a 401.
+    """
+    return get_token_manager(get_draup_world_api()).request(method, url, token=token, **kwargs)
+
 
-    return None
+async def draup_world_request_async(
+    method: str, url: str, token: Optional[str] = None, **kwargs
+) -> httpx.Response:
+    """
+    Non-blocking ``draup_world_request`` for async routes, sent over the
+    shared upstream connection pool. See ``DraupWorldTokenManager.request_async``.
+    """
+    return await get_token_manager(get_draup_world_api()).request_async(method, url, token=token, **kwargs)
 
 
 @etter_api_router.get("/sample_data")
@@ -10,19 +10,19 @@ import logging
 import os
 from datetime import datetime
 from itertools import groupby
-from typing import Dict, List, Optional, Union, Type, Callable, Any, Dict as DictType
+from typing import Dict, List, Literal, Optional, Union, Type, Callable, Any, Dict as DictType
 from dataclasses import dataclass
 from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status, Query, Security
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 from sqlalchemy import cast, or_, select, and_, delete
 from sqlalchemy.dialects.postgresql import JSONB
 
 from common.common_utils import get_minimized_time_ago
-from common.pagination import paginate
+from common.pagination import InvalidCursorError, SortKey, count_rows, paginate
 from settings.database import get_db
 from api.s3.dependencies import get_uow, get_s3_service
 from api.s3.infra.db.uow import UnitOfWork
@@ -41,6 +41,7 @@ from models.etter import (
 )
 from models.s3 import Document, DocumentStatus
 from services.extraction_service import ExtractionService
+from services.extraction_batch_service import get_batch_extraction_engine
 from services.auth import verify_token, ResponseModel, create_user
 
 logger = logging.getLogger(__name__)
@@ -590,12 +591,15 @@ def get_taxonomy_by_company_generic(
     name_filter: Optional[str],
     sort_column: Optional[str] = None,
     sort_type: Optional[str] = None,
-    job_titles: Optional[List[str]] = None
+    job_titles: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
 ):
     """
     Generic function to get taxonomy records by company.
     
     Works for all taxonomy types: role, skill, tech_stack
+    Pages by page number, or by cursor (next_cursor of the previous page) for deep pages.
     """
     config = TAXONOMY_CONFIGS.get(taxonomy_type)
     if not config:
@@ -641,8 +645,6 @@ def get_taxonomy_by_company_generic(
             base_query = base_query.filter(job_title_filter_condition)
             total_count_query = total_count_query.filter(job_title_filter_condition)
     
-    total_count = total_count_query.count()
-    
     pending_count_query = db.query(config.model_class).filter(
         config.model_class.company_id == company_id,
         config.model_class.approval_status == "pending"
@@ -654,25 +656,26 @@ def get_taxonomy_by_company_generic(
         pending_count_query = pending_count_query.filter(job_title_filter_condition)
     pending_count = pending_count_query.count()
     
+    created_on_column = getattr(config.model_class, 'created_on')
     if sort_column and hasattr(config.model_class, sort_column):
         sort_column_attr = getattr(config.model_class, sort_column)
-        if sort_type and sort_type.lower() == 'desc':
-            base_query = base_query.order_by(sort_column_attr.desc())
-        else:
-            base_query = base_query.order_by(sort_column_attr.asc())
-        created_on_column = getattr(config.model_class, 'created_on')
-        base_query = base_query.order_by(created_on_column.desc())
+        first_key = SortKey(sort_column_attr, bool(sort_type and sort_type.lower() == 'desc'))
     else:
-        order_by_column = getattr(config.model_class, config.order_by_field)
-        created_on_column = getattr(config.model_class, 'created_on')
-        base_query = base_query.order_by(
-            order_by_column.asc(),
-            created_on_column.desc()
-        )
+        first_key = SortKey(getattr(config.model_class, config.order_by_field))
+    # id breaks created_on ties so the order (and the cursor) is stable
+    sort_keys = [first_key, SortKey(created_on_column, True), SortKey(config.model_class.id, True)]
     
-    paginated_result = paginate(base_query, page=page, page_size=page_size)
+    paginated_result = paginate(
+        base_query, page=page, page_size=page_size, count_mode=count_mode, sort_keys=sort_keys, cursor=cursor
+    )
     records = paginated_result.items
     
+    if status_filter:
+        total_count, total_is_estimate = count_rows(total_count_query, count_mode)
+    else:
+        # Same filters as base_query: reuse the count paginate already ran
+        total_count, total_is_estimate = paginated_result.total, paginated_result.total_is_estimate
+    
     master_data = config.get_master_names_func(db, records)
     
     user_ids = set()
@@ -805,7 +808,9 @@ def get_taxonomy_by_company_generic(
         page_size=paginated_result.page_size,
         total_pages=paginated_result.total_pages,
         has_next=paginated_result.has_next,
-        has_prev=paginated_result.has_prev
+        has_prev=paginated_result.has_prev,
+        next_cursor=paginated_result.next_cursor,
+        total_is_estimate=total_is_estimate
     )
 
 
@@ -1514,7 +1519,6 @@ async def create_session(
 @extraction_router.post("/process", response_model=ProcessDocumentResponse)
 async def process_document(
     request: ProcessDocumentRequest,
-    background_tasks: BackgroundTasks,
     draup_user: ResponseModel = Depends(verify_token),
     db: Session = Depends(get_db),
     uow: UnitOfWork = Depends(get_uow),
@@ -1523,8 +1527,8 @@ async def process_document(
     """
     Initiate extraction for one or more documents.
 
-    Documents are processed sequentially in the background.
-    Accepts 1-5 document IDs per request.
+    Documents are extracted concurrently in the background by the batch
+    extraction engine. Accepts 1-5 document IDs per request.
     """
     try:
         user = ensure_user_exists(db, draup_user)
@@ -1594,11 +1598,7 @@ async def process_document(
         valid_record_ids = [r.record_id for r in records if r.record_id > 0]
 
         if valid_record_ids:
-            background_tasks.add_task(
-                _run_batch_extraction,
-                extracted_doc_ids=valid_record_ids,
-                tenant_id=tenant_id
-            )
+            get_batch_extraction_engine().submit(valid_record_ids, tenant_id)
 
         message = f"Extraction started for {len(valid_record_ids)} document(s)"
         if len(valid_record_ids) != len(request.document_ids):
@@ -1675,6 +1675,8 @@ async def get_session_status(
             "completed": sum(1 for d in session.documents if d.status == ExtractionStatus.COMPLETED),
             "failed": sum(1 for d in session.documents if d.status == ExtractionStatus.FAILED)
         }
+        finished = doc_counts["completed"] + doc_counts["failed"]
+        doc_counts["progress"] = round(100 * finished / doc_counts["total"], 1) if doc_counts["total"] else 0.0
 
         can_complete = (
             session.status == ExtractionSessionStatus.ACTIVE and
@@ -2748,6 +2750,8 @@ async def get_role_taxonomy_by_company(
     job_title: Optional[str] = Query(None),
     sort_column: Optional[str] = Query(None),
     sort_type: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; page is ignored when set"),
+    count_mode: Literal["exact", "planner_estimate", "none"] = Query("exact"),
     draup_user: ResponseModel = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -2761,7 +2765,8 @@ async def get_role_taxonomy_by_company(
     try:
         ensure_user_exists(db, draup_user)
         result = get_taxonomy_by_company_generic(
-            db, 'role', company_id, page, page_size, status_filter, job_title, sort_column, sort_type
+            db, 'role', company_id, page, page_size, status_filter, job_title, sort_column, sort_type,
+            cursor=cursor, count_mode=count_mode
         )
         if result is None:
             raise HTTPException(
@@ -2771,6 +2776,8 @@ async def get_role_taxonomy_by_company(
         return result
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving role taxonomy for company {company_id}: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -2952,6 +2959,8 @@ async def get_skill_taxonomy_by_company(
     job_titles: Optional[List[str]] = Query(None, description="Filter by job titles (case-insensitive contains)"),
     sort_column: Optional[str] = Query(None),
     sort_type: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; page is ignored when set"),
+    count_mode: Literal["exact", "planner_estimate", "none"] = Query("exact"),
     draup_user: ResponseModel = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -2965,7 +2974,8 @@ async def get_skill_taxonomy_by_company(
     try:
         ensure_user_exists(db, draup_user)
         result = get_taxonomy_by_company_generic(
-            db, 'skill', company_id, page, page_size, status_filter, skill_name, sort_column, sort_type, job_titles
+            db, 'skill', company_id, page, page_size, status_filter, skill_name, sort_column, sort_type, job_titles,
+            cursor=cursor, count_mode=count_mode
         )
         if result is None:
             raise HTTPException(
@@ -2975,6 +2985,8 @@ async def get_skill_taxonomy_by_company(
         return result
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving skill taxonomy for company {company_id}: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -3238,6 +3250,8 @@ async def get_tech_stack_taxonomy_by_company(
     job_titles: Optional[List[str]] = Query(None, description="Filter by job titles (case-insensitive contains)"),
     sort_column: Optional[str] = Query(None),
     sort_type: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; page is ignored when set"),
+    count_mode: Literal["exact", "planner_estimate", "none"] = Query("exact"),
     draup_user: ResponseModel = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -3253,7 +3267,8 @@ async def get_tech_stack_taxonomy_by_company(
     try:
         ensure_user_exists(db, draup_user)
         result = get_taxonomy_by_company_generic(
-            db, 'tech_stack', company_id, page, page_size, status_filter, tech_stack_name, sort_column, sort_type, job_titles
+            db, 'tech_stack', company_id, page, page_size, status_filter, tech_stack_name, sort_column, sort_type, job_titles,
+            cursor=cursor, count_mode=count_mode
         )
         if result is None:
             raise HTTPException(
@@ -3291,7 +3306,8 @@ async def get_tech_stack_taxonomy_by_company(
                         logger.info(f"Successfully fetched and saved {len(items)} tech stack products from Draup for company {company_id} (company_name: {company_name})")
                         
                         result = get_taxonomy_by_company_generic(
-                            db, 'tech_stack', company_id, page, page_size, status_filter, tech_stack_name, sort_column, sort_type
+                            db, 'tech_stack', company_id, page, page_size, status_filter, tech_stack_name, sort_column, sort_type,
+                            cursor=cursor, count_mode=count_mode
                         )
                         if result is None:
                             raise HTTPException(
@@ -3306,6 +3322,8 @@ async def get_tech_stack_taxonomy_by_company(
         return result
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving tech stack taxonomy for company {company_id}: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -3707,64 +3725,6 @@ def _run_extraction(extracted_doc_id: int, tenant_id: str):
         db.close()
 
 
-def _run_batch_extraction(extracted_doc_ids: List[int], tenant_id: str):
-    """
-    Background task for sequential batch extraction.
-
-    Processes multiple documents one at a time to avoid overloading
-    the Draup World Model API. Continues processing even if individual
-    documents fail.
-    """
-    from settings.database import SessionLocal
-
-    db = SessionLocal()
-    session_id = None
-
-    try:
-        logger.info(f"Starting batch extraction for {len(extracted_doc_ids)} documents")
-
-        from api.s3.infra.db.uow import UnitOfWork
-        from api.s3.infra.s3.s3_management_service import S3ManagementService
-
-        uow = UnitOfWork(db)
-        s3_service = S3ManagementService()
-        service = ExtractionService(uow, s3_service)
-
-        # Process each document sequentially
-        for idx, doc_id in enumerate(extracted_doc_ids, 1):
-            try:
-                logger.info(f"Processing document {idx}/{len(extracted_doc_ids)}: record_id={doc_id}")
-
-                extracted_doc = db.query(ExtractedDocument).get(doc_id)
-                if not extracted_doc:
-                    logger.error(f"ExtractedDocument {doc_id} not found")
-                    continue
-
-                if session_id is None:
-                    session_id = extracted_doc.session_id
-
-                # Process the document
-                service.process_document(extracted_doc, tenant_id, db)
-
-                logger.info(f"Completed document {idx}/{len(extracted_doc_ids)}: status={extracted_doc.status.value}")
-
-            except Exception as e:
-                logger.error(f"Failed to process document {doc_id}: {e}", exc_info=True)
-                continue
-
-        # Session status no longer auto-updated - manual completion required via /complete endpoint
-        if session_id:
-            logger.info(
-                f"Batch extraction completed for {len(extracted_doc_ids)} documents. "
-                f"Session {session_id} requires manual completion via /complete endpoint."
-            )
-
-    except Exception as e:
-        logger.error(f"Batch extraction failed: {e}", exc_info=True)
-    finally:
-        db.close()
-
-
 # =============================================================================
 # Taxonomy Extraction API (LLM-based schema mapping)
 # =============================================================================
@@ -2,6 +2,7 @@ import logging
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from settings.database import get_db
 from services.gateway_service import gateway_service
@@ -23,13 +24,13 @@ gateway_router = APIRouter(prefix="/etter", tags=["Gateway"])
     response_model=TechStackWithMasterDataResponse,
     status_code=status.HTTP_200_OK
 )
-def get_techstack_suggestions_with_master_data(
+async def get_techstack_suggestions_with_master_data(
     request: TechStackSuggestionRequest,
     db: Session = Depends(get_db),
     user=Depends(verify_token)
 ):
     try:
-        gateway_response = gateway_service.get_techstack_suggestions(
+        gateway_response = await gateway_service.get_techstack_suggestions(
             input_text=request.input_text,
             score_limit=request.score_limit
         )
@@ -49,7 +50,8 @@ def get_techstack_suggestions_with_master_data(
                 if product:
                     all_products.append(product)
         
-        master_data = gateway_service.fetch_master_techstack_data(
+        master_data = await run_in_threadpool(
+            gateway_service.fetch_master_techstack_data,
             db=db,
             products=all_products
         )
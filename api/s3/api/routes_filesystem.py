@@ -4,9 +4,9 @@ from typing import Optional, List
 from uuid import UUID
 import logging
 
-from api.s3.dependencies import get_auth_context, get_uow, get_s3_service, AuthContext
+from api.s3.dependencies import get_auth_context, get_uow, get_async_s3_service, AuthContext
 from api.s3.infra.db.uow import UnitOfWork
-from api.s3.infra.s3.s3_management_service import S3ManagementService
+from api.s3.infra.s3.async_s3_service import AsyncS3Service
 from api.s3.domain.services.filesystem_service import FilesystemService
 from api.s3.domain.services.upload_coordinator import UploadCoordinator
 from api.s3.schemas.filesystem import (
@@ -33,7 +33,7 @@ async def list_folder(
     path: Optional[str] = Query(None, description="Parent folder path to list contents of"),
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     List folders and files at the specified path.
@@ -77,7 +77,7 @@ async def create_folder(
     request: CreateFolderRequest,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Validate folder path (folders are created implicitly when files are uploaded).
@@ -118,7 +118,7 @@ async def delete_folder(
     recursive: bool = Query(False, description="Delete subfolders recursively"),
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Delete all files in a folder.
@@ -131,7 +131,7 @@ async def delete_folder(
     """
     try:
         service = FilesystemService(uow, s3_service)
-        count = service.delete_folder(
+        count = await service.delete_folder(
             tenant_id=auth.tenant_id,
             folder_path=path,
             user_id=auth.user_id,
@@ -167,7 +167,7 @@ async def initiate_filesystem_upload(
     request: FilesystemUploadRequest,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Initiate file upload to filesystem.
@@ -193,7 +193,7 @@ async def initiate_filesystem_upload(
             custom_metadata=request.custom_metadata
         )
 
-        response = coordinator.plan_upload(
+        response = await coordinator.plan_upload(
             request=upload_req,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id,
@@ -230,17 +230,18 @@ async def upload_filesystem_data(
     part_number: int = Query(None, ge=1, le=10000),
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Upload file data for a filesystem upload session.
 
     For single-part uploads: Upload the entire file (no part_number needed).
-    For multipart uploads: Upload a specific part (requires part_number).
+    For multipart uploads: Upload a specific part (with part_number), or the whole
+    file without part_number to have it split into parts and uploaded server-side.
 
     - **session_id**: The session ID returned from /upload
     - **file**: The file data to upload
-    - **part_number**: Part number (required for multipart uploads)
+    - **part_number**: Part number (omit to upload a multipart session in one request)
     """
     try:
         coordinator = UploadCoordinator(uow, s3_service)
@@ -268,7 +269,7 @@ async def upload_filesystem_data(
                     detail="part_number should not be provided for single-part uploads"
                 )
 
-            coordinator.stream_single(
+            await coordinator.stream_single(
                 document_id=session_id,
                 tenant_id=auth.tenant_id,
                 fileobj=file.file,
@@ -289,12 +290,27 @@ async def upload_filesystem_data(
         elif document.mode.value == "multipart":
             # Multipart upload
             if part_number is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="part_number is required for multipart uploads"
+                # Server-side multipart: split the whole file into parts here
+                parts = await coordinator.stream_multipart(
+                    document_id=session_id,
+                    tenant_id=auth.tenant_id,
+                    stream=file,
+                    user_id=auth.user_id
+                )
+
+                logger.info(f"Filesystem multipart upload streamed: document_id={session_id}, parts={parts}")
+
+                return JSONResponse(
+                    status_code=status.HTTP_202_ACCEPTED,
+                    content={
+                        "status": "uploaded",
+                        "document_id": str(session_id),
+                        "parts": parts,
+                        "message": "File uploaded successfully. Call /complete to finalize."
+                    }
                 )
 
-            result = coordinator.upload_part(
+            result = await coordinator.upload_part(
                 document_id=session_id,
                 tenant_id=auth.tenant_id,
                 part_number=part_number,
@@ -341,7 +357,7 @@ async def complete_filesystem_upload(
     request: CompleteUploadRequest,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Complete a filesystem upload session and finalize the document.
@@ -367,7 +383,7 @@ async def complete_filesystem_upload(
                 detail=f"Document {request.document_id} is not a filesystem upload"
             )
 
-        response = coordinator.complete_upload(
+        response = await coordinator.complete_upload(
             document_id=request.document_id,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id
@@ -399,7 +415,7 @@ async def abort_filesystem_upload(
     document_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Abort an in-progress filesystem upload.
@@ -425,7 +441,7 @@ async def abort_filesystem_upload(
                 detail=f"Document {document_id} is not a filesystem upload"
             )
 
-        coordinator.abort_upload(
+        await coordinator.abort_upload(
             document_id=document_id,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id
@@ -4,12 +4,11 @@ from fastapi.responses import JSONResponse
 import logging
 import json
 from typing import Optional, Dict
-from io import BytesIO
 from datetime import datetime
 
-from api.s3.dependencies import get_auth_context, get_uow, get_s3_service, AuthContext
+from api.s3.dependencies import get_auth_context, get_uow, get_async_s3_service, AuthContext
 from api.s3.infra.db.uow import UnitOfWork
-from api.s3.infra.s3.s3_management_service import S3ManagementService
+from api.s3.infra.s3.async_s3_service import AsyncS3Service
 from api.s3.domain.services.upload_coordinator import UploadCoordinator
 from api.s3.schemas.uploads import (
     InitiateUploadRequest,
@@ -32,7 +31,7 @@ async def initiate_upload(
     request: InitiateUploadRequest,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Initiate a document upload session (role-based mode for legacy flows).
@@ -58,7 +57,7 @@ async def initiate_upload(
 
         coordinator = UploadCoordinator(uow, s3_service)
 
-        response = coordinator.plan_upload(
+        response = await coordinator.plan_upload(
             request=request,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id,
@@ -95,17 +94,18 @@ async def upload_data(
     part_number: int = Query(None, ge=1, le=10000),
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Upload file data for a session.
     
     For single-part uploads: Upload the entire file (no part_number needed).
-    For multipart uploads: Upload a specific part (requires part_number).
+    For multipart uploads: Upload a specific part (with part_number), or the whole
+    file without part_number to have it split into parts and uploaded server-side.
     
     - **session_id**: The session ID returned from /initiate
     - **file**: The file data to upload
-    - **part_number**: Part number (required for multipart uploads)
+    - **part_number**: Part number (omit to upload a multipart session in one request)
     """
     try:
         coordinator = UploadCoordinator(uow, s3_service)
@@ -126,7 +126,7 @@ async def upload_data(
                     detail="part_number should not be provided for single-part uploads"
                 )
             
-            coordinator.stream_single(
+            await coordinator.stream_single(
                 document_id=session_id,
                 tenant_id=auth.tenant_id,
                 fileobj=file.file,
@@ -147,12 +147,27 @@ async def upload_data(
         elif document.mode.value == "multipart":
             # Multipart upload
             if part_number is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="part_number is required for multipart uploads"
+                # Server-side multipart: split the whole file into parts here
+                parts = await coordinator.stream_multipart(
+                    document_id=session_id,
+                    tenant_id=auth.tenant_id,
+                    stream=file,
+                    user_id=auth.user_id
                 )
-            
-            result = coordinator.upload_part(
+
+                logger.info(f"Multipart upload streamed: document_id={session_id}, parts={parts}")
+
+                return JSONResponse(
+                    status_code=status.HTTP_202_ACCEPTED,
+                    content={
+                        "status": "uploaded",
+                        "document_id": str(session_id),
+                        "parts": parts,
+                        "message": "File uploaded successfully. Call /uploads/complete to finalize."
+                    }
+                )
+
+            result = await coordinator.upload_part(
                 document_id=session_id,
                 tenant_id=auth.tenant_id,
                 part_number=part_number,
@@ -199,7 +214,7 @@ async def complete_upload(
     request: CompleteUploadRequest,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Complete an upload session and finalize the document.
@@ -211,7 +226,7 @@ async def complete_upload(
     try:
         coordinator = UploadCoordinator(uow, s3_service)
         
-        response = coordinator.complete_upload(
+        response = await coordinator.complete_upload(
             document_id=request.document_id,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id
@@ -247,13 +262,14 @@ async def combined_upload(
     company_instance_name: Optional[str] = Form(None),
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Combined upload endpoint that handles initiate, upload, and complete in a single request.
     
-    This endpoint simplifies the upload process for smaller files by combining all three steps.
-    For files larger than the single-part upload limit, use the multi-step process.
+    This endpoint simplifies the upload process by combining all three steps.
+    Files larger than the single-part upload limit are split into parts and
+    uploaded concurrently server-side, up to the multipart upload limit.
     
     - **file**: The file to upload
     - **role**: Document role/category
@@ -262,13 +278,16 @@ async def combined_upload(
     - **company_instance_name**: Optional company instance name for filtering
     """
     try:
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        if file_size > s3_config.max_single_upload_size:
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, 2)
+            file_size = file.file.tell()
+        await file.seek(0)
+
+        if file_size > s3_config.max_multipart_upload_size:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size ({file_size} bytes) exceeds single-part upload limit ({s3_config.max_single_upload_size} bytes). Please use the multi-step upload process."
+                detail=f"File size ({file_size} bytes) exceeds upload limit ({s3_config.max_multipart_upload_size} bytes)."
             )
         
         if file_size == 0:
@@ -299,7 +318,7 @@ async def combined_upload(
             company_instance_name=company_instance_name
         )
         
-        initiate_response = coordinator.plan_upload(
+        initiate_response = await coordinator.plan_upload(
             request=initiate_request,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id,
@@ -310,22 +329,22 @@ async def combined_upload(
         
         document_id = initiate_response.document_id
         
-        file_obj = BytesIO(file_content)
-        
         if initiate_response.upload_strategy == "SINGLE":
-            coordinator.stream_single(
+            await coordinator.stream_single(
                 document_id=document_id,
                 tenant_id=auth.tenant_id,
-                fileobj=file_obj,
+                fileobj=file.file,
                 user_id=auth.user_id
             )
         else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Unexpected multipart mode for combined upload"
+            await coordinator.stream_multipart(
+                document_id=document_id,
+                tenant_id=auth.tenant_id,
+                stream=file,
+                user_id=auth.user_id
             )
         
-        complete_response = coordinator.complete_upload(
+        complete_response = await coordinator.complete_upload(
             document_id=document_id,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id
@@ -341,7 +360,7 @@ async def combined_upload(
             document_id=complete_response.document_id,
             verification=complete_response.verification,
             completed_at=complete_response.completed_at,
-            mode="single"
+            mode=initiate_response.upload_strategy.lower()
         )
         
     except HTTPException:
@@ -365,7 +384,7 @@ async def abort_upload(
     document_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     uow: UnitOfWork = Depends(get_uow),
-    s3_service: S3ManagementService = Depends(get_s3_service)
+    s3_service: AsyncS3Service = Depends(get_async_s3_service)
 ):
     """
     Abort an in-progress upload.
@@ -377,7 +396,7 @@ async def abort_upload(
     try:
         coordinator = UploadCoordinator(uow, s3_service)
         
-        coordinator.abort_upload(
+        await coordinator.abort_upload(
             document_id=document_id,
             tenant_id=auth.tenant_id,
             user_id=auth.user_id
@@ -36,6 +36,11 @@ class S3Config:
         self.read_timeout_seconds: int = 300
         self.max_retries: int = 3
 
+        # Threads dedicated to blocking boto3 calls made from async routes
+        self.io_threads: int = int(os.getenv("S3_IO_THREADS", 16))
+        # Parts of one server-side multipart upload buffered and sent at a time
+        self.multipart_upload_concurrency: int = int(os.getenv("S3_MULTIPART_UPLOAD_CONCURRENCY", 4))
+
 
 s3_config = S3Config()
 
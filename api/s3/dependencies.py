@@ -9,6 +9,7 @@ from settings.database import get_db
 from services.auth import verify_token, ResponseModel
 from api.s3.infra.db.uow import UnitOfWork
 from api.s3.infra.s3.s3_management_service import S3ManagementService
+from api.s3.infra.s3.async_s3_service import AsyncS3Service
 
 
 class AuthContext:
@@ -122,3 +123,19 @@ def get_s3_service() -> S3ManagementService:
         _s3_service = S3ManagementService()
     return _s3_service
 
+
+
+_async_s3_service = None
+
+
+def get_async_s3_service() -> AsyncS3Service:
+    """
+    Dependency to get the async S3 facade (singleton) used by async routes.
+
+    Returns:
+        AsyncS3Service wrapping the shared S3ManagementService
+    """
+    global _async_s3_service
+    if _async_s3_service is None:
+        _async_s3_service = AsyncS3Service(get_s3_service())
+    return _async_s3_service
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
@@ -5,7 +6,7 @@ from sqlalchemy import func
 import logging
 
 from api.s3.infra.db.uow import UnitOfWork
-from api.s3.infra.s3.s3_management_service import S3ManagementService
+from api.s3.infra.s3.async_s3_service import AsyncS3Service
 from api.s3.schemas.filesystem import FolderInfo, ListFolderResponse
 from api.s3.schemas.documents import DocumentResponse
 from models.s3 import DocumentStatus, Document, UploadModeV2
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 
 class FilesystemService:
-    def __init__(self, uow: UnitOfWork, s3_service: S3ManagementService):
+    def __init__(self, uow: UnitOfWork, s3_service: AsyncS3Service):
         self.uow = uow
         self.s3 = s3_service
 
@@ -123,7 +124,7 @@ class FilesystemService:
             raise ValueError("Path too long")
         return path
 
-    def delete_folder(
+    async def delete_folder(
         self,
         tenant_id: str,
         folder_path: str,
@@ -137,15 +138,24 @@ class FilesystemService:
             recursive=recursive
         )
 
-        count = 0
+        deletable = []
         for doc in documents:
             if doc.legal_hold:
                 logger.warning(f"Skipping document {doc.id} with legal hold")
                 continue  # Skip files with legal hold
+            deletable.append(doc)
+
+        # Delete from S3 concurrently on the S3 I/O pool
+        deletions = await asyncio.gather(
+            *(self.s3.delete_object(doc.key) for doc in deletable),
+            return_exceptions=True
+        )
 
+        count = 0
+        for doc, deletion in zip(deletable, deletions):
             try:
-                # Delete from S3
-                self.s3.delete_object(doc.key)
+                if isinstance(deletion, Exception):
+                    raise deletion
 
                 # Mark as deleted in DB
                 doc.status = DocumentStatus.DELETED
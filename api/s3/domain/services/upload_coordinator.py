@@ -1,11 +1,11 @@
 import uuid
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Optional
 from datetime import datetime
 import logging
 
 from models.s3 import Document, DocumentStatus, UploadMode
 from api.s3.infra.db.uow import UnitOfWork
-from api.s3.infra.s3.s3_management_service import S3ManagementService
+from api.s3.infra.s3.async_s3_service import AsyncS3Service, part_size_for
 from api.s3.config import s3_config, Constants
 from api.s3.schemas.uploads import (
     InitiateUploadRequest,
@@ -18,11 +18,11 @@ logger = logging.getLogger(__name__)
 
 
 class UploadCoordinator:
-    def __init__(self, uow: UnitOfWork, s3_service: S3ManagementService):
+    def __init__(self, uow: UnitOfWork, s3_service: AsyncS3Service):
         self.uow = uow
         self.s3 = s3_service
 
-    def plan_upload(
+    async def plan_upload(
         self,
         request: InitiateUploadRequest,
         tenant_id: str,
@@ -43,7 +43,7 @@ class UploadCoordinator:
         if request.declared_size_bytes <= s3_config.max_single_upload_size:
             return self._plan_single_upload(request, tenant_id, user_id, mode, folder_path, company_instance_name)
         else:
-            return self._plan_multipart_upload(request, tenant_id, user_id, mode, folder_path, company_instance_name)
+            return await self._plan_multipart_upload(request, tenant_id, user_id, mode, folder_path, company_instance_name)
 
     def _plan_single_upload(
         self,
@@ -116,7 +116,7 @@ class UploadCoordinator:
             max_parts=None
         )
 
-    def _plan_multipart_upload(
+    async def _plan_multipart_upload(
         self,
         request: InitiateUploadRequest,
         tenant_id: str,
@@ -153,7 +153,7 @@ class UploadCoordinator:
             'status': DocumentStatus.PLANNED.value
         }
 
-        multipart_upload = self.s3.create_multipart(
+        multipart_upload = await self.s3.create_multipart(
             key=key,
             tags=tags,
             content_type=request.content_type
@@ -227,7 +227,7 @@ class UploadCoordinator:
                 max_parts=max_parts
             )
 
-    def stream_single(
+    async def stream_single(
         self,
         document_id: uuid.UUID,
         tenant_id: str,
@@ -251,14 +251,14 @@ class UploadCoordinator:
             'status': DocumentStatus.UPLOADED.value
         }
 
-        result = self.s3.put_single(
+        result = await self.s3.put_single(
             key=document.key,
             fileobj=fileobj,
             tags=tags,
             content_type=document.declared_content_type
         )
 
-        verification = self.s3.head_object(document.key)
+        verification = await self.s3.head_object(document.key)
 
         document.status = DocumentStatus.UPLOADED
         document.observed_size_bytes = verification.content_length
@@ -277,14 +277,7 @@ class UploadCoordinator:
 
         logger.info(f"Single upload completed: document_id={document_id}, size={verification.content_length}")
 
-    def upload_part(
-        self,
-        document_id: uuid.UUID,
-        tenant_id: str,
-        part_number: int,
-        data: BinaryIO,
-        user_id: uuid.UUID
-    ) -> UploadPartResponse:
+    def _multipart_document(self, document_id: uuid.UUID, tenant_id: str) -> Document:
         document = self.uow.documents.get_by_id(document_id, tenant_id)
         if not document:
             raise ValueError(f"Document {document_id} not found")
@@ -298,7 +291,19 @@ class UploadCoordinator:
         if not document.upload_id:
             raise ValueError(f"Document {document_id} has no upload_id")
 
-        result = self.s3.upload_part(
+        return document
+
+    async def upload_part(
+        self,
+        document_id: uuid.UUID,
+        tenant_id: str,
+        part_number: int,
+        data: BinaryIO,
+        user_id: uuid.UUID
+    ) -> UploadPartResponse:
+        document = self._multipart_document(document_id, tenant_id)
+
+        result = await self.s3.upload_part(
             key=document.key,
             upload_id=document.upload_id,
             part_number=part_number,
@@ -325,7 +330,48 @@ class UploadCoordinator:
             document_id=document_id
         )
 
-    def complete_upload(
+    async def stream_multipart(
+        self,
+        document_id: uuid.UUID,
+        tenant_id: str,
+        stream: Any,
+        user_id: uuid.UUID
+    ) -> int:
+        """
+        Server-side multipart: split ``stream`` into parts and upload them
+        concurrently, then record every part. Returns the number of parts.
+        """
+        document = self._multipart_document(document_id, tenant_id)
+        part_size = part_size_for(document.declared_size_bytes)
+
+        results = await self.s3.upload_stream(
+            key=document.key,
+            upload_id=document.upload_id,
+            stream=stream,
+            part_size=part_size
+        )
+        if not results:
+            raise ValueError(f"No data received for document {document_id}")
+
+        for result in results:
+            self.uow.parts.upsert(
+                document_id=document_id,
+                part_number=result.part_number,
+                etag=result.etag
+            )
+
+        if document.status == DocumentStatus.PLANNED:
+            document.status = DocumentStatus.UPLOADED
+            self.uow.documents.update(document)
+
+        self.uow.commit()
+
+        logger.info(
+            f"Streamed multipart upload: document_id={document_id}, parts={len(results)}, part_size={part_size}"
+        )
+        return len(results)
+
+    async def complete_upload(
         self,
         document_id: uuid.UUID,
         tenant_id: str,
@@ -343,12 +389,12 @@ class UploadCoordinator:
             raise ValueError(f"Document {document_id} is not in UPLOADED state")
 
         if document.mode == UploadMode.MULTIPART:
-            return self._complete_multipart(document, user_id)
+            return await self._complete_multipart(document, user_id)
         else:
-            return self._complete_single(document, user_id)
+            return await self._complete_single(document, user_id)
 
-    def _complete_single(self, document: Document, user_id: uuid.UUID) -> CompleteUploadResponse:
-        verification = self.s3.head_object(document.key)
+    async def _complete_single(self, document: Document, user_id: uuid.UUID) -> CompleteUploadResponse:
+        verification = await self.s3.head_object(document.key)
 
         if verification.sse_algorithm != s3_config.sse_algorithm:
             raise ValueError(f"SSE algorithm mismatch: expected {s3_config.sse_algorithm}, got {verification.sse_algorithm}")
@@ -365,7 +411,7 @@ class UploadCoordinator:
 
         tags = verification.tags.copy()
         tags['status'] = DocumentStatus.READY.value
-        self.s3.put_tags(document.key, tags)
+        await self.s3.put_tags(document.key, tags)
 
         self.uow.audit_events.create(
             actor=user_id,
@@ -395,7 +441,7 @@ class UploadCoordinator:
             completed_at=document.completed_at
         )
 
-    def _complete_multipart(self, document: Document, user_id: uuid.UUID) -> CompleteUploadResponse:
+    async def _complete_multipart(self, document: Document, user_id: uuid.UUID) -> CompleteUploadResponse:
         parts = self.uow.parts.list_by_document(document.id)
         if not parts:
             raise ValueError(f"No parts found for document {document.id}")
@@ -405,13 +451,13 @@ class UploadCoordinator:
             for part in parts
         ]
 
-        self.s3.complete_multipart(
+        await self.s3.complete_multipart(
             key=document.key,
             upload_id=document.upload_id,
             parts=parts_list
         )
 
-        verification = self.s3.head_object(document.key)
+        verification = await self.s3.head_object(document.key)
 
         if verification.sse_algorithm != s3_config.sse_algorithm:
             raise ValueError(f"SSE algorithm mismatch: expected {s3_config.sse_algorithm}, got {verification.sse_algorithm}")
@@ -428,7 +474,7 @@ class UploadCoordinator:
 
         tags = verification.tags.copy()
         tags['status'] = DocumentStatus.READY.value
-        self.s3.put_tags(document.key, tags)
+        await self.s3.put_tags(document.key, tags)
 
         self.uow.audit_events.create(
             actor=user_id,
@@ -471,7 +517,7 @@ class UploadCoordinator:
             completed_at=document.completed_at or datetime.utcnow()
         )
 
-    def abort_upload(
+    async def abort_upload(
         self,
         document_id: uuid.UUID,
         tenant_id: str,
@@ -482,7 +528,7 @@ class UploadCoordinator:
             raise ValueError(f"Document {document_id} not found")
 
         if document.mode == UploadMode.MULTIPART and document.upload_id:
-            self.s3.abort_multipart(document.key, document.upload_id)
+            await self.s3.abort_multipart(document.key, document.upload_id)
 
         document.status = DocumentStatus.ABORTED
         self.uow.documents.update(document)
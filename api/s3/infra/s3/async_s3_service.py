@@ -0,0 +1,198 @@
+"""
+Async facade over S3ManagementService.
+
+boto3 calls block, so every call made from an async route runs on a dedicated,
+bounded thread pool rather than on the event loop or on Starlette's shared
+threadpool that also serves sync routes and dependencies.
+
+``upload_stream`` adds a server-side multipart mode: an incoming stream is cut
+into parts that are uploaded concurrently, with at most ``max_in_flight`` parts
+buffered in memory at any time.
+"""
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, BinaryIO
+import logging
+
+from api.s3.config import s3_config
+from api.s3.infra.s3.s3_management_service import (
+    S3ManagementService,
+    S3MultipartUpload,
+    S3PartResult,
+    S3PutResult,
+    S3Verification,
+)
+from models.s3 import UploadModeV2
+
+logger = logging.getLogger(__name__)
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+def part_size_for(size_bytes: Optional[int]) -> int:
+    """
+    Part size for a server-side multipart upload of ``size_bytes``: the
+    configured part size, grown in whole MiB when the object would otherwise
+    need more than S3's 10,000 parts.
+    """
+    part_size = max(s3_config.multipart_part_size, MIN_PART_SIZE)
+    if size_bytes and math.ceil(size_bytes / part_size) > MAX_PARTS:
+        mib = 1024 * 1024
+        part_size = math.ceil(size_bytes / MAX_PARTS / mib) * mib
+    return part_size
+
+
+class AsyncS3Service:
+    def __init__(self, s3_service: S3ManagementService, max_workers: int = s3_config.io_threads):
+        self.sync = s3_service
+        self.bucket = s3_service.bucket
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-io")
+
+    async def _run(self, fn: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def build_key(
+        self,
+        tenant_id: str,
+        mode: UploadModeV2,
+        folder_path: Optional[str] = None,
+        role: Optional[str] = None,
+        original_filename: str = None
+    ) -> str:
+        return self.sync.build_key(
+            tenant_id=tenant_id,
+            mode=mode,
+            folder_path=folder_path,
+            role=role,
+            original_filename=original_filename
+        )
+
+    async def put_single(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        metadata: Optional[Dict[str, str]] = None,
+        tags: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> S3PutResult:
+        return await self._run(
+            self.sync.put_single,
+            key=key,
+            fileobj=fileobj,
+            metadata=metadata,
+            tags=tags,
+            content_type=content_type
+        )
+
+    async def create_multipart(
+        self,
+        key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        tags: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> S3MultipartUpload:
+        return await self._run(
+            self.sync.create_multipart,
+            key=key,
+            metadata=metadata,
+            tags=tags,
+            content_type=content_type
+        )
+
+    async def upload_part(self, key: str, upload_id: str, part_number: int, data: BinaryIO) -> S3PartResult:
+        return await self._run(
+            self.sync.upload_part, key=key, upload_id=upload_id, part_number=part_number, data=data
+        )
+
+    async def complete_multipart(self, key: str, upload_id: str, parts: List[Dict[str, Any]]) -> S3PutResult:
+        return await self._run(self.sync.complete_multipart, key=key, upload_id=upload_id, parts=parts)
+
+    async def abort_multipart(self, key: str, upload_id: str) -> None:
+        await self._run(self.sync.abort_multipart, key, upload_id)
+
+    async def head_object(self, key: str) -> S3Verification:
+        return await self._run(self.sync.head_object, key)
+
+    async def get_tags(self, key: str) -> Dict[str, str]:
+        return await self._run(self.sync.get_tags, key)
+
+    async def put_tags(self, key: str, tags: Dict[str, str]) -> None:
+        await self._run(self.sync.put_tags, key, tags)
+
+    async def delete_object(self, key: str) -> None:
+        await self._run(self.sync.delete_object, key)
+
+    async def upload_stream(
+        self,
+        key: str,
+        upload_id: str,
+        stream: Any,
+        part_size: int,
+        max_in_flight: int = s3_config.multipart_upload_concurrency
+    ) -> List[S3PartResult]:
+        """
+        Read ``stream`` (anything with an async or sync ``read(n)``, such as an
+        ``UploadFile``) in ``part_size`` chunks and upload them as parts of
+        ``upload_id``, ``max_in_flight`` at a time. A part is read only once a
+        slot is free, so memory stays below ``max_in_flight * part_size``.
+        Returns the parts in order; the first failure cancels the rest and
+        aborts the multipart upload.
+        """
+        slots = asyncio.Semaphore(max_in_flight)
+        failed = asyncio.Event()
+        tasks: List[asyncio.Task] = []
+
+        async def send(part_number: int, chunk: bytes) -> S3PartResult:
+            try:
+                return await self.upload_part(key, upload_id, part_number, BytesIO(chunk))
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                slots.release()
+
+        try:
+            part_number = 0
+            while not failed.is_set():
+                await slots.acquire()
+                chunk = await _read_exactly(stream, part_size)
+                if not chunk:
+                    slots.release()
+                    break
+                part_number += 1
+                tasks.append(asyncio.create_task(send(part_number, chunk)))
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await self.abort_multipart(key, upload_id)
+            except Exception as e:
+                logger.error(f"Failed to abort multipart upload {upload_id} after a part failed: {e}")
+            raise
+
+
+async def _read_exactly(stream: Any, size: int) -> bytes:
+    """Read up to ``size`` bytes, short only at end of stream."""
+    async def read(n: int) -> bytes:
+        chunk = stream.read(n)
+        if asyncio.iscoroutine(chunk):
+            chunk = await chunk
+        return chunk
+
+    chunk = await read(size)
+    if not chunk or len(chunk) == size:
+        return chunk
+    buffer = bytearray(chunk)
+    while len(buffer) < size:
+        chunk = await read(size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
@@ -48,7 +48,8 @@ class S3ManagementService:
         boto_config = Config(
             connect_timeout=s3_config.connect_timeout_seconds,
             read_timeout=s3_config.read_timeout_seconds,
-            retries={'max_attempts': s3_config.max_retries, 'mode': 'adaptive'}
+            retries={'max_attempts': s3_config.max_retries, 'mode': 'adaptive'},
+            max_pool_connections=max(10, s3_config.io_threads)
         )
         
         # self.client = boto3.client(
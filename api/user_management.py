@@ -10,7 +10,7 @@ from schemas.user_management_schemas import (
     UpdateUserRequest, UpdateCompanyImagesRequest, CompanyImagesResponse,
     GetUsersRequest, PaginatedUserResponse, SSODetails
 )
-from services.auth import verify_token, ResponseModel
+from services.auth import revoke_user_tokens, verify_token, ResponseModel
 from settings.database import get_db
 from common.pagination import paginate
 from services.email_service import email_service
@@ -248,6 +248,8 @@ async def update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    access_before = (user.group, user.is_active, user.company_id)
+    
     if user_data.group is not None:
         if etter_user_obj.group == GroupType.SUPER_ADMIN:
             if user_data.group not in [GroupType.RESEARCHER, GroupType.REVIEWER, GroupType.ADMIN, GroupType.SUPER_ADMIN]:
@@ -290,6 +292,10 @@ async def update_user(
     db.commit()
     db.refresh(user)
     
+    if (user.group, user.is_active, user.company_id) != access_before:
+        # Deactivated or moved: cached token verifications must not outlive the change
+        revoke_user_tokens(user.email)
+    
     return CreateUserResponse(
         id=user.id,
         email=user.email,
@@ -1,16 +1,47 @@
-from typing import List, Any, Optional
+import base64
+import enum
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Any, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
 from math import ceil
+from sqlalchemy import and_, false, or_, tuple_
 from sqlalchemy.orm import Query
 from pydantic import BaseModel
 
+# How PaginatedResult.total is computed:
+# - exact: SELECT count(*) over the whole query;
+# - planner_estimate: the row estimate of EXPLAIN, exact when it is small or
+#   when the requested page turns out to be the last one;
+# - none: no total (total and total_pages are None).
+COUNT_EXACT = "exact"
+COUNT_PLANNER_ESTIMATE = "planner_estimate"
+COUNT_NONE = "none"
+COUNT_MODES = (COUNT_EXACT, COUNT_PLANNER_ESTIMATE, COUNT_NONE)
+
+# Planner estimates below this are replaced by an exact count, which is cheap at that size
+ESTIMATE_EXACT_BELOW = 1000
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class SortKey(NamedTuple):
+    """One key of a keyset sort order; the last key must be unique (e.g. the primary key)."""
+    expression: Any
+    descending: bool = False
+
+
 class PaginationParams(BaseModel):
     page: int = 1
     page_size: int = 50
-    
+
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
-    
+
     def validate(self):
         if self.page < 1:
             raise ValueError("Page must be >= 1")
@@ -19,34 +50,210 @@ class PaginationParams(BaseModel):
 
 class PaginatedResult(BaseModel):
     items: List[Any]
-    total: int
-    page: int
+    total: Optional[int]
+    page: Optional[int]
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 def paginate(
     query: Query,
     page: int = 1,
-    page_size: int = 50
+    page_size: int = 50,
+    count_mode: str = COUNT_EXACT,
+    sort_keys: Optional[Sequence[SortKey]] = None,
+    cursor: Optional[str] = None,
 ) -> PaginatedResult:
+    """
+    Paginate a query by page number (OFFSET) or, when a cursor is given, by keyset.
+
+    With sort_keys the query is ordered by them and every page that has a
+    next one returns next_cursor; passing it back fetches the rows after the
+    last row of that page with a WHERE on the sort keys instead of an OFFSET,
+    so deep pages cost the same as the first. The page number is ignored (and
+    returned as None) in cursor mode.
+    """
     params = PaginationParams(page=page, page_size=page_size)
     params.validate()
-    try:
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"count_mode must be one of {', '.join(COUNT_MODES)}")
+    if cursor is not None and not sort_keys:
+        raise ValueError("cursor pagination requires sort_keys")
+
+    if count_mode == COUNT_EXACT and not sort_keys:
         total = query.count()
-    except Exception as e:
-        print(e)
-    items = query.offset(params.offset).limit(page_size).all()
-    
-    total_pages = ceil(total / page_size) if total > 0 else 0
-    
+        items = query.offset(params.offset).limit(page_size).all()
+        total_pages = ceil(total / page_size) if total > 0 else 0
+        return PaginatedResult(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1
+        )
+
+    total, total_is_estimate = count_rows(query, count_mode)
+
+    page_query = query
+    if sort_keys:
+        page_query = page_query.order_by(None).order_by(*(_order_by(key) for key in sort_keys))
+    if cursor is not None:
+        page_query = page_query.filter(keyset_filter(sort_keys, decode_cursor(cursor, len(sort_keys))))
+    else:
+        page_query = page_query.offset(params.offset)
+
+    rows, key_values = _fetch(page_query, sort_keys, page_size + 1)
+    items = rows[:page_size]
+    if cursor is None and total is not None and not total_is_estimate:
+        has_next = params.offset + len(items) < total
+    else:
+        has_next = len(rows) > page_size
+
+    if total_is_estimate and cursor is None and not has_next and (items or page == 1):
+        # The last page pins the total down exactly
+        total, total_is_estimate = params.offset + len(items), False
+
     return PaginatedResult(
         items=items,
         total=total,
-        page=page,
+        page=None if cursor is not None else page,
         page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1
+        total_pages=(ceil(total / page_size) if total > 0 else 0) if total is not None else None,
+        has_next=has_next,
+        has_prev=cursor is not None or page > 1,
+        total_is_estimate=total_is_estimate,
+        next_cursor=encode_cursor(key_values[len(items) - 1]) if has_next and sort_keys and items else None,
     )
+
+
+def count_rows(query: Query, count_mode: str = COUNT_EXACT) -> Tuple[Optional[int], bool]:
+    """The row count of query under count_mode, and whether it is an estimate."""
+    if count_mode == COUNT_NONE:
+        return None, False
+    if count_mode == COUNT_PLANNER_ESTIMATE:
+        estimate = estimate_count(query)
+        if estimate >= ESTIMATE_EXACT_BELOW:
+            return estimate, True
+    return query.count(), False
+
+
+def estimate_count(query: Query) -> int:
+    """Postgres' row estimate for query, from EXPLAIN (nothing is executed)."""
+    statement = query.enable_eagerloads(False).order_by(None).statement
+    session = query.session
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def keyset_filter(sort_keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    Rows strictly after values in the sort_keys order (Postgres NULL ordering:
+    NULLs last ascending, first descending).
+    """
+    descending = {key.descending for key in sort_keys}
+    if len(descending) == 1 and None not in values and (
+        descending == {True} or not any(_nullable(key.expression) for key in sort_keys)
+    ):
+        # Row comparison, which a composite index on the keys can serve. Exact
+        # for descending keys even when nullable: NULLs sort first, so they are
+        # behind the cursor, and a NULL in the comparison excludes the row.
+        keys = tuple_(*(key.expression for key in sort_keys))
+        return keys < tuple_(*values) if sort_keys[0].descending else keys > tuple_(*values)
+
+    clauses = []
+    for i, (key, value) in enumerate(zip(sort_keys, values)):
+        earlier_equal = [
+            previous.expression.is_(None) if v is None else previous.expression == v
+            for previous, v in zip(sort_keys[:i], values[:i])
+        ]
+        clauses.append(and_(*earlier_equal, _after(key, value)))
+    return or_(*clauses)
+
+
+def _order_by(key: SortKey):
+    # Postgres' default NULL placement, spelled out so keyset_filter holds on any backend
+    if key.descending:
+        return key.expression.desc().nulls_first()
+    return key.expression.asc().nulls_last()
+
+
+def _after(key: SortKey, value: Any):
+    if key.descending:
+        return key.expression.isnot(None) if value is None else key.expression < value
+    if value is None:
+        return false()
+    if _nullable(key.expression):
+        return or_(key.expression > value, key.expression.is_(None))
+    return key.expression > value
+
+
+def _nullable(expression) -> bool:
+    column = getattr(expression, "expression", expression)
+    return getattr(column, "nullable", True)
+
+
+def _fetch(query: Query, sort_keys: Optional[Sequence[SortKey]], limit: int) -> Tuple[list, list]:
+    """Rows of query, and the sort key values of each row (selected alongside)."""
+    if not sort_keys:
+        return query.limit(limit).all(), []
+    entities = len(query.column_descriptions)
+    rows = query.add_columns(
+        *(key.expression.label(f"_sort_key_{i}") for i, key in enumerate(sort_keys))
+    ).limit(limit).all()
+    items = [row[0] if entities == 1 else tuple(row[:entities]) for row in rows]
+    return items, [tuple(row[entities:]) for row in rows]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, n_keys: int) -> List[Any]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = [_decode_value(v) for v in json.loads(payload)]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+    if len(values) != n_keys:
+        raise InvalidCursorError("Invalid cursor: does not match the sort order")
+    return values
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, enum.Enum):
+        # SQLAlchemy Enum columns bind members by name
+        return value.name
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        (tag, raw), = value.items()
+        return {
+            "dt": datetime.fromisoformat,
+            "d": date.fromisoformat,
+            "uuid": UUID,
+            "dec": Decimal,
+        }[tag](raw)
+    return value
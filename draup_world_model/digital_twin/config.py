@@ -161,6 +161,11 @@ class GenerationConfig:
     target_workflows_per_function: int = 8
     target_tasks_per_workflow: int = 12
 
+    # Scheduling (generators/scheduler.py)
+    max_concurrency: int = 4               # LLM calls in flight at once
+    token_budget: Optional[int] = None     # total prompt + completion tokens; None = unlimited
+    response_cache: bool = True            # replay responses to identical prompts from disk
+
 
 @dataclass
 class OutputConfig:
@@ -224,6 +229,11 @@ class OutputConfig:
     def workflows_file(self) -> Path:
         return self.base_dir / "workflows.json"
 
+    @property
+    def llm_cache_dir(self) -> Path:
+        """Prompt-hash cache of LLM responses, replayed on reruns."""
+        return self.base_dir / ".llm_cache"
+
     def ensure_dirs(self):
         """Create output directories including per-entity subdirectories."""
         self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -2,7 +2,8 @@
 Base generator with LLM integration.
 
 All generators inherit from this. Provides:
-- LLM invocation with retry
+- LLM invocation with retry, through a shared GenerationScheduler
+  (concurrency slots, token budget, prompt-hash response cache)
 - JSON parsing from LLM output
 - Batch prompt construction
 - File I/O for generated data
@@ -10,11 +11,17 @@ All generators inherit from this. Provides:
 
 import json
 import logging
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from draup_world_model.digital_twin.config import LLMConfig
+from draup_world_model.digital_twin.generators.scheduler import (
+    GenerationScheduler,
+    TokenBudgetExceeded,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +29,24 @@ logger = logging.getLogger(__name__)
 class BaseGenerator:
     """Base class for all data generators."""
 
-    def __init__(self, llm_config: Optional[LLMConfig] = None):
+    def __init__(
+        self,
+        llm_config: Optional[LLMConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
+    ):
         self.llm_config = llm_config or LLMConfig()
+        # Default scheduler: one call at a time, no budget, no cache
+        self.scheduler = scheduler or GenerationScheduler()
         self._llm = None
+        self._llm_lock = threading.Lock()
 
     @property
     def llm(self):
         """Lazy-load LLM instance."""
         if self._llm is None:
-            self._llm = self._init_llm()
+            with self._llm_lock:
+                if self._llm is None:
+                    self._llm = self._init_llm()
         return self._llm
 
     def _init_llm(self):
@@ -42,16 +58,42 @@ class BaseGenerator:
             max_tokens=self.llm_config.max_tokens,
         )
 
-    def invoke_llm(self, prompt: str, max_retries: int = 3) -> str:
-        """Call LLM with retry logic."""
+    def invoke_llm(self, prompt: str, max_retries: int = 3, fresh: bool = False) -> str:
+        """Call LLM with retry logic.
+
+        Served from the scheduler's response cache when the same prompt was
+        answered before (unless fresh); otherwise called within the
+        scheduler's concurrency slots and token budget, and cached.
+        """
+        cache = self.scheduler.cache
+        key = None
+        if cache is not None:
+            key = cache.key(
+                prompt,
+                model=self.llm_config.model,
+                temperature=self.llm_config.temperature,
+                max_tokens=self.llm_config.max_tokens,
+            )
+            if not fresh:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+
         for attempt in range(max_retries):
             try:
-                response = self.llm.invoke(prompt)
-                return response.content if hasattr(response, "content") else str(response)
+                response = self.scheduler.call(lambda: self.llm.invoke(prompt))
+            except TokenBudgetExceeded:
+                raise
             except Exception as e:
+                # Back off outside the concurrency slot so other calls keep going
                 wait = 2 ** (attempt + 1)
                 logger.warning(f"LLM call failed (attempt {attempt + 1}): {e}. Retrying in {wait}s.")
                 time.sleep(wait)
+                continue
+            text = response.content if hasattr(response, "content") else str(response)
+            if cache is not None:
+                cache.put(key, text)
+            return text
         raise RuntimeError(f"LLM call failed after {max_retries} attempts")
 
     def parse_json_response(self, text: str) -> Any:
@@ -92,7 +134,8 @@ class BaseGenerator:
         last_error = None
         last_response = ""
         for attempt in range(max_parse_retries + 1):
-            response_text = self.invoke_llm(prompt)
+            # Retries bypass the cache, which may hold the unparseable response
+            response_text = self.invoke_llm(prompt, fresh=attempt > 0)
             last_response = response_text
             try:
                 return self.parse_json_response(response_text)
@@ -157,12 +200,19 @@ class BaseGenerator:
 
         return None
 
+    @staticmethod
+    def _write_json(data: Any, path: Path) -> None:
+        """Write JSON atomically: concurrent readers and crash recovery never see a partial file."""
+        tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+
     @staticmethod
     def save_json(data: Any, path: Path) -> None:
         """Save data to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        BaseGenerator._write_json(data, path)
         logger.info(f"Saved {path} ({len(data) if isinstance(data, list) else 1} items)")
 
     @staticmethod
@@ -190,8 +240,7 @@ class BaseGenerator:
         stats: Dict[str, int] = {}
         for func_id, func_items in grouped.items():
             path = entity_dir / f"{func_id}.json"
-            with open(path, "w") as f:
-                json.dump(func_items, f, indent=2)
+            BaseGenerator._write_json(func_items, path)
             stats[func_id] = len(func_items)
             logger.info(f"  Saved {path.name}: {len(func_items)} items")
         return stats
@@ -5,7 +5,8 @@ Uses LLM to generate realistic roles for each job family,
 and job titles (career-banded) for each role.
 
 Batch strategy: One LLM call per function -> generates all roles
-for all job families within that function.
+for all job families within that function. Functions and title batches
+run concurrently under the generation scheduler.
 """
 
 import logging
@@ -19,6 +20,7 @@ from draup_world_model.digital_twin.config import (
     CAREER_BANDS,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -96,8 +98,9 @@ class RoleGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -123,80 +126,88 @@ class RoleGenerator(BaseGenerator):
         for jf in job_families:
             jf_by_jfg.setdefault(jf["job_family_group_id"], []).append(jf)
 
+        func_jobs = []
         for func in functions:
             func_jfs = []
             for sf in sf_by_func.get(func["id"], []):
                 for jfg in jfg_by_sf.get(sf["id"], []):
                     for jf in jf_by_jfg.get(jfg["id"], []):
                         func_jfs.append(jf)
+            if func_jfs:
+                func_jobs.append((func, func_jfs))
 
-            if not func_jfs:
-                continue
-
-            # Per-function resumability: skip if file already exists
-            func_file = self.output.function_file("roles", func["id"])
-            if func_file.exists():
-                existing = self.load_json(func_file)
-                all_roles.extend(existing)
-                logger.info(f"Loaded {len(existing)} existing roles for {func['name']}")
-                continue
-
-            jf_list_str = "\n".join(f"- {jf['name']}" for jf in func_jfs)
-
-            prompt = ROLE_GENERATION_PROMPT.format(
-                company_name=self.company.name,
-                company_desc=self.company.description,
-                function_name=func["name"],
-                job_families_list=jf_list_str,
-                roles_per_family=self.gen_config.target_roles_per_family,
-                function_headcount=func["headcount"],
-            )
-
-            logger.info(f"Generating roles for function: {func['name']} ({len(func_jfs)} families)")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate roles for {func['name']}: {e}")
-                continue
-
-            # Build jf name -> id lookup
-            jf_name_to_id = {jf["name"]: jf["id"] for jf in func_jfs}
-
-            func_roles = []
-            for role_data in batch_result:
-                jf_name = role_data.get("job_family", "")
-                jf_id = jf_name_to_id.get(jf_name, "")
-                if not jf_id:
-                    # Try fuzzy match
-                    for name, fid in jf_name_to_id.items():
-                        if name.lower() in jf_name.lower() or jf_name.lower() in name.lower():
-                            jf_id = fid
-                            break
-
-                role = {
-                    "id": self.make_id("role", role_data["name"]),
-                    "name": role_data["name"],
-                    "function_id": func["id"],
-                    "job_family_id": jf_id,
-                    "description": role_data.get("description", ""),
-                    "total_headcount": role_data.get("total_headcount", 0),
-                    "avg_salary": role_data.get("avg_salary", 0),
-                    "automation_score": role_data.get("automation_score", 0.0),
-                    "skill_ids": [],
-                    "technology_ids": [],
-                    "adjacency_role_ids": [],
-                }
-                func_roles.append(role)
-
-            # Save this function's roles immediately (failure-resilient)
-            if func_roles:
-                self.save_json(func_roles, func_file)
+        for func_roles in self.scheduler.map(lambda job: self._generate_function_roles(*job), func_jobs):
             all_roles.extend(func_roles)
 
         logger.info(f"Generated {len(all_roles)} roles across {len(functions)} functions")
         return all_roles
 
+    def _generate_function_roles(
+        self,
+        func: Dict[str, Any],
+        func_jfs: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Roles for one function: loaded from its file if present, else generated and saved."""
+        # Per-function resumability: skip if file already exists
+        func_file = self.output.function_file("roles", func["id"])
+        if func_file.exists():
+            existing = self.load_json(func_file)
+            logger.info(f"Loaded {len(existing)} existing roles for {func['name']}")
+            return existing
+
+        jf_list_str = "\n".join(f"- {jf['name']}" for jf in func_jfs)
+
+        prompt = ROLE_GENERATION_PROMPT.format(
+            company_name=self.company.name,
+            company_desc=self.company.description,
+            function_name=func["name"],
+            job_families_list=jf_list_str,
+            roles_per_family=self.gen_config.target_roles_per_family,
+            function_headcount=func["headcount"],
+        )
+
+        logger.info(f"Generating roles for function: {func['name']} ({len(func_jfs)} families)")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate roles for {func['name']}: {e}")
+            return []
+
+        # Build jf name -> id lookup
+        jf_name_to_id = {jf["name"]: jf["id"] for jf in func_jfs}
+
+        func_roles = []
+        for role_data in batch_result:
+            jf_name = role_data.get("job_family", "")
+            jf_id = jf_name_to_id.get(jf_name, "")
+            if not jf_id:
+                # Try fuzzy match
+                for name, fid in jf_name_to_id.items():
+                    if name.lower() in jf_name.lower() or jf_name.lower() in name.lower():
+                        jf_id = fid
+                        break
+
+            role = {
+                "id": self.make_id("role", role_data["name"]),
+                "name": role_data["name"],
+                "function_id": func["id"],
+                "job_family_id": jf_id,
+                "description": role_data.get("description", ""),
+                "total_headcount": role_data.get("total_headcount", 0),
+                "avg_salary": role_data.get("avg_salary", 0),
+                "automation_score": role_data.get("automation_score", 0.0),
+                "skill_ids": [],
+                "technology_ids": [],
+                "adjacency_role_ids": [],
+            }
+            func_roles.append(role)
+
+        # Save this function's roles immediately (failure-resilient)
+        if func_roles:
+            self.save_json(func_roles, func_file)
+        return func_roles
+
     def generate_job_titles(self, roles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate job titles for roles in batches, with incremental resumability.
 
@@ -221,57 +232,16 @@ class RoleGenerator(BaseGenerator):
             f"({len(existing_titles)} existing titles kept)"
         )
 
-        new_titles = []
         batch_size = self.gen_config.roles_per_batch
-
-        for i in range(0, len(pending_roles), batch_size):
-            batch_roles = pending_roles[i:i + batch_size]
-            roles_list_str = "\n".join(
-                f"- {r['name']} (headcount: {r['total_headcount']}, avg salary: ${r['avg_salary']:,})"
-                for r in batch_roles
-            )
-            career_bands_str = ", ".join(CAREER_BANDS[:6])  # up to director for most roles
-
-            prompt = JOB_TITLE_PROMPT.format(
-                company_name=self.company.name,
-                roles_list=roles_list_str,
-                titles_per_role=self.gen_config.target_titles_per_role,
-                career_bands=career_bands_str,
-            )
-
-            logger.info(f"Generating job titles for pending roles {i+1}-{i+len(batch_roles)}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate titles for batch {i}: {e}")
-                continue
-
-            role_name_to_id = {r["name"]: r["id"] for r in batch_roles}
-
-            for title_data in batch_result:
-                role_name = title_data.get("role", "")
-                role_id = role_name_to_id.get(role_name, "")
-                if not role_id:
-                    for name, rid in role_name_to_id.items():
-                        if name.lower() in role_name.lower() or role_name.lower() in name.lower():
-                            role_id = rid
-                            break
-
-                title = {
-                    "id": self.make_id("title", title_data["name"]),
-                    "name": title_data["name"],
-                    "role_id": role_id,
-                    "function_id": role_id_to_func.get(role_id, "unknown"),
-                    "career_band": title_data.get("career_band", "mid"),
-                    "level": CAREER_BANDS.index(title_data.get("career_band", "mid"))
-                    if title_data.get("career_band", "mid") in CAREER_BANDS
-                    else 1,
-                    "typical_experience_years": title_data.get("typical_experience_years", 3),
-                    "headcount": title_data.get("headcount", 0),
-                    "avg_salary": title_data.get("avg_salary", 0),
-                }
-                new_titles.append(title)
+        batches = [
+            (i, pending_roles[i:i + batch_size])
+            for i in range(0, len(pending_roles), batch_size)
+        ]
+        new_titles = []
+        for batch_titles in self.scheduler.map(
+            lambda batch: self._generate_batch_titles(*batch, role_id_to_func), batches,
+        ):
+            new_titles.extend(batch_titles)
 
         # Merge existing + new, then save per function
         all_titles = existing_titles + new_titles
@@ -282,6 +252,62 @@ class RoleGenerator(BaseGenerator):
         )
         return all_titles
 
+    def _generate_batch_titles(
+        self,
+        i: int,
+        batch_roles: List[Dict[str, Any]],
+        role_id_to_func: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        """Generate job titles for one batch of roles; empty on failure."""
+        roles_list_str = "\n".join(
+            f"- {r['name']} (headcount: {r['total_headcount']}, avg salary: ${r['avg_salary']:,})"
+            for r in batch_roles
+        )
+        career_bands_str = ", ".join(CAREER_BANDS[:6])  # up to director for most roles
+
+        prompt = JOB_TITLE_PROMPT.format(
+            company_name=self.company.name,
+            roles_list=roles_list_str,
+            titles_per_role=self.gen_config.target_titles_per_role,
+            career_bands=career_bands_str,
+        )
+
+        logger.info(f"Generating job titles for pending roles {i+1}-{i+len(batch_roles)}")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate titles for batch {i}: {e}")
+            return []
+
+        role_name_to_id = {r["name"]: r["id"] for r in batch_roles}
+
+        titles = []
+        for title_data in batch_result:
+            role_name = title_data.get("role", "")
+            role_id = role_name_to_id.get(role_name, "")
+            if not role_id:
+                for name, rid in role_name_to_id.items():
+                    if name.lower() in role_name.lower() or role_name.lower() in name.lower():
+                        role_id = rid
+                        break
+
+            title = {
+                "id": self.make_id("title", title_data["name"]),
+                "name": title_data["name"],
+                "role_id": role_id,
+                "function_id": role_id_to_func.get(role_id, "unknown"),
+                "career_band": title_data.get("career_band", "mid"),
+                "level": CAREER_BANDS.index(title_data.get("career_band", "mid"))
+                if title_data.get("career_band", "mid") in CAREER_BANDS
+                else 1,
+                "typical_experience_years": title_data.get("typical_experience_years", 3),
+                "headcount": title_data.get("headcount", 0),
+                "avg_salary": title_data.get("avg_salary", 0),
+            }
+            titles.append(title)
+        return titles
+
     def generate(self, taxonomy: Dict[str, Any]) -> Dict[str, List[Dict]]:
         """Generate all roles and job titles."""
         self.output.ensure_dirs()
@@ -0,0 +1,200 @@
+"""
+Generation scheduler: concurrent, budgeted, resumable LLM calls.
+
+Generators are independent at two levels: batches within a step (task
+batches, title batches, one workflow per function...) and whole steps
+(skills can run while workloads do). The scheduler runs both concurrently
+on threads while keeping the number of in-flight LLM calls under
+max_concurrency and the total tokens spent under an optional budget.
+
+Every response is stored in a prompt-hash cache on disk, so a rerun after
+a crash replays the calls that already succeeded instead of paying for
+them again. Per-function output files stay the unit of resumability;
+the cache covers work that had not reached a file yet.
+
+Design principle: the scheduler bounds LLM calls, not threads. Batch and
+step threads are cheap and may nest; only the LLM call itself waits for
+a slot, so nested fan-outs cannot deadlock.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised instead of an LLM call once the token budget is spent."""
+
+
+class ResponseCache:
+    """LLM responses on disk, keyed by a hash of the model settings and prompt.
+
+    Args:
+        cache_dir: Directory holding one JSON file per response.
+        read: When False, responses are written but never served
+            (used for forced regeneration).
+    """
+
+    def __init__(self, cache_dir: Path, read: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.read = read
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(prompt: str, **settings: Any) -> str:
+        payload = json.dumps({"prompt": prompt, **settings}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.read:
+            return None
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                text = json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, response: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash never leaves a truncated entry behind
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"response": response}, f)
+        os.replace(tmp, path)
+
+
+class GenerationScheduler:
+    """Bounds concurrent LLM calls and total tokens across all generators.
+
+    Args:
+        max_concurrency: Maximum LLM calls in flight at once.
+        token_budget: Maximum tokens (prompt + completion) to spend; None for no limit.
+            Checked before each call, so concurrent calls may overshoot it by
+            at most max_concurrency responses.
+        cache: Optional response cache shared by all generators.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        token_budget: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.token_budget = token_budget
+        self.cache = cache
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self.tokens_used = 0
+        self.llm_calls = 0
+
+    # ── LLM calls ────────────────────────────────────────────────
+
+    def call(self, invoke: Callable[[], Any]) -> Any:
+        """Run one LLM call in a concurrency slot, charging its tokens to the budget."""
+        self.check_budget()
+        with self._slots:
+            response = invoke()
+        tokens = self._count_tokens(response)
+        with self._lock:
+            self.tokens_used += tokens
+            self.llm_calls += 1
+        return response
+
+    def check_budget(self) -> None:
+        if self.token_budget is not None and self.tokens_used >= self.token_budget:
+            raise TokenBudgetExceeded(
+                f"Token budget exhausted ({self.tokens_used}/{self.token_budget} tokens used)"
+            )
+
+    @staticmethod
+    def _count_tokens(response: Any) -> int:
+        """Tokens reported by the LLM client, or an estimate from the text length."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        if usage:
+            return int(usage.get("input_tokens", 0)) + int(usage.get("output_tokens", 0))
+        text = response.content if hasattr(response, "content") else str(response)
+        return len(text) // 4
+
+    # ── Fan-out ──────────────────────────────────────────────────
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Apply fn to every item concurrently; results keep the input order."""
+        items = list(items)
+        if self.max_concurrency == 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def run_steps(
+        self,
+        steps: Sequence[str],
+        dependencies: Dict[str, Sequence[str]],
+        run_step: Callable[[str], Any],
+    ) -> None:
+        """Run steps as soon as the steps they depend on have finished.
+
+        Dependencies outside `steps` are treated as already satisfied. The
+        first failing step stops new steps from starting and is re-raised
+        once running steps finish.
+        """
+        if self.max_concurrency == 1:
+            # Sequential, in the given (dependency) order
+            for step in steps:
+                run_step(step)
+            return
+
+        pending = list(steps)
+        done = set()
+        with ThreadPoolExecutor(max_workers=max(1, len(pending))) as pool:
+            running = {}
+            while pending or running:
+                for step in list(pending):
+                    deps = [d for d in dependencies.get(step, ()) if d in steps]
+                    if all(d in done for d in deps):
+                        pending.remove(step)
+                        running[pool.submit(run_step, step)] = step
+                if not running:
+                    raise ValueError(f"Steps {pending} depend on each other; cannot schedule them")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        wait(running)
+                        raise error
+                    done.add(step)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "llm_calls": self.llm_calls,
+            "tokens_used": self.tokens_used,
+            "token_budget": self.token_budget,
+            "max_concurrency": self.max_concurrency,
+        }
+        if self.cache is not None:
+            stats["cache_hits"] = self.cache.hits
+            stats["cache_misses"] = self.cache.misses
+        return stats
@@ -5,7 +5,8 @@ Generates a comprehensive skill catalog for the insurance industry,
 then maps skills to roles.
 
 Batch strategy: 1-2 LLM calls for the full catalog, then 1 call per
-~15 roles for skill mapping.
+~15 roles for skill mapping. Category groups and mapping batches run
+concurrently under the generation scheduler.
 """
 
 import logging
@@ -20,6 +21,7 @@ from draup_world_model.digital_twin.config import (
     SKILL_LIFECYCLE,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -102,8 +104,9 @@ class SkillGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -120,48 +123,11 @@ class SkillGenerator(BaseGenerator):
         num_groups = len(self.CATEGORY_GROUPS)
         all_skills = []
 
-        for group_idx, categories in enumerate(self.CATEGORY_GROUPS):
-            # Distribute target evenly, remainder goes to earlier groups
-            batch_count = total // num_groups
-            if group_idx < total % num_groups:
-                batch_count += 1
-
-            categories_str = ", ".join(categories)
-            prompt = SKILL_CATALOG_PROMPT.format(
-                company_name=self.company.name,
-                company_desc=self.company.description,
-                target_count=batch_count,
-                categories=categories_str,
-                lifecycle_statuses=lifecycle_str,
-            )
-
-            logger.info(f"Generating ~{batch_count} skills for categories: {categories_str}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate skills for {categories_str}: {e}")
-                continue
-
-            for skill_data in batch_result:
-                category = skill_data.get("category", categories[0])
-                if category not in SKILL_CATEGORIES:
-                    category = categories[0]
-
-                lifecycle = skill_data.get("lifecycle_status", "stable")
-                if lifecycle not in SKILL_LIFECYCLE:
-                    lifecycle = "stable"
-
-                skill = {
-                    "id": self.make_id("skill", skill_data["name"]),
-                    "name": skill_data["name"],
-                    "category": category,
-                    "skill_type": skill_data.get("skill_type", "core"),
-                    "lifecycle_status": lifecycle,
-                    "description": skill_data.get("description", ""),
-                    "market_demand_trend": skill_data.get("market_demand_trend", "stable"),
-                }
-                all_skills.append(skill)
+        for group_skills in self.scheduler.map(
+            lambda group: self._generate_catalog_group(*group, total, num_groups, lifecycle_str),
+            list(enumerate(self.CATEGORY_GROUPS)),
+        ):
+            all_skills.extend(group_skills)
 
         # Deduplicate by name (LLM may repeat skills across groups)
         seen = set()
@@ -175,6 +141,59 @@ class SkillGenerator(BaseGenerator):
         logger.info(f"Generated {len(unique_skills)} unique skills")
         return unique_skills
 
+    def _generate_catalog_group(
+        self,
+        group_idx: int,
+        categories: List[str],
+        total: int,
+        num_groups: int,
+        lifecycle_str: str,
+    ) -> List[Dict[str, Any]]:
+        """Generate this category group's share of the catalog; empty on failure."""
+        # Distribute target evenly, remainder goes to earlier groups
+        batch_count = total // num_groups
+        if group_idx < total % num_groups:
+            batch_count += 1
+
+        categories_str = ", ".join(categories)
+        prompt = SKILL_CATALOG_PROMPT.format(
+            company_name=self.company.name,
+            company_desc=self.company.description,
+            target_count=batch_count,
+            categories=categories_str,
+            lifecycle_statuses=lifecycle_str,
+        )
+
+        logger.info(f"Generating ~{batch_count} skills for categories: {categories_str}")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate skills for {categories_str}: {e}")
+            return []
+
+        skills = []
+        for skill_data in batch_result:
+            category = skill_data.get("category", categories[0])
+            if category not in SKILL_CATEGORIES:
+                category = categories[0]
+
+            lifecycle = skill_data.get("lifecycle_status", "stable")
+            if lifecycle not in SKILL_LIFECYCLE:
+                lifecycle = "stable"
+
+            skill = {
+                "id": self.make_id("skill", skill_data["name"]),
+                "name": skill_data["name"],
+                "category": category,
+                "skill_type": skill_data.get("skill_type", "core"),
+                "lifecycle_status": lifecycle,
+                "description": skill_data.get("description", ""),
+                "market_demand_trend": skill_data.get("market_demand_trend", "stable"),
+            }
+            skills.append(skill)
+        return skills
+
     def map_skills_to_roles(
         self,
         roles: List[Dict[str, Any]],
@@ -185,30 +204,13 @@ class SkillGenerator(BaseGenerator):
         skill_names_str = ", ".join(s["name"] for s in skills)
         batch_size = self.gen_config.roles_per_batch
 
-        for i in range(0, len(roles), batch_size):
-            batch_roles = roles[i:i + batch_size]
-            roles_str = "\n".join(
-                f"- {r['name']}: {r['description']}"
-                for r in batch_roles
-            )
-
-            prompt = SKILL_MAPPING_PROMPT.format(
-                roles_list=roles_str,
-                skills_list=skill_names_str,
-            )
-
-            logger.info(f"Mapping skills to roles {i+1}-{i+len(batch_roles)}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to map skills for batch {i}: {e}")
-                continue
-
-            role_name_to_idx = {}
-            for idx, r in enumerate(roles):
-                role_name_to_idx[r["name"]] = idx
+        role_name_to_idx = {r["name"]: idx for idx, r in enumerate(roles)}
+        batches = [(i, roles[i:i + batch_size]) for i in range(0, len(roles), batch_size)]
 
+        # Batches only return their mappings; roles are updated here, in batch order
+        for batch_result in self.scheduler.map(
+            lambda batch: self._map_skills_batch(*batch, skill_names_str), batches,
+        ):
             for mapping in batch_result:
                 role_name = mapping.get("role", "")
                 if role_name in role_name_to_idx:
@@ -225,6 +227,31 @@ class SkillGenerator(BaseGenerator):
         logger.info("Updated roles with skill mappings")
         return roles
 
+    def _map_skills_batch(
+        self,
+        i: int,
+        batch_roles: List[Dict[str, Any]],
+        skill_names_str: str,
+    ) -> List[Dict[str, Any]]:
+        """LLM skill mappings for one batch of roles; empty on failure."""
+        roles_str = "\n".join(
+            f"- {r['name']}: {r['description']}"
+            for r in batch_roles
+        )
+
+        prompt = SKILL_MAPPING_PROMPT.format(
+            roles_list=roles_str,
+            skills_list=skill_names_str,
+        )
+
+        logger.info(f"Mapping skills to roles {i+1}-{i+len(batch_roles)}")
+
+        try:
+            return self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to map skills for batch {i}: {e}")
+            return []
+
     def generate(self, roles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate skill catalog and map to roles."""
         skills = self.generate_catalog()
@@ -6,6 +6,7 @@ Tasks are atomic units of work - the most granular level.
 This is where cascade simulation starts (technology -> task reclassification).
 
 Batch strategy: One LLM call per ~5 workloads -> generates all tasks for those workloads.
+Batches run concurrently under the generation scheduler.
 """
 
 import logging
@@ -20,6 +21,7 @@ from draup_world_model.digital_twin.config import (
     AUTOMATION_LEVELS,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +77,9 @@ class TaskGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -118,66 +121,16 @@ class TaskGenerator(BaseGenerator):
             f"({len(existing_tasks)} existing tasks kept)"
         )
 
-        new_tasks = []
         batch_size = self.gen_config.tasks_per_batch
-
-        for i in range(0, len(pending_wls), batch_size):
-            batch_wls = pending_wls[i:i + batch_size]
-            wls_str = "\n".join(
-                f"- Workload: \"{wl['name']}\" (Role: {role_id_to_name.get(wl['role_id'], 'Unknown')}, "
-                f"Effort: {wl['effort_allocation_pct']}%, Automation: {wl['automation_level']})"
-                for wl in batch_wls
-            )
-
-            prompt = TASK_PROMPT.format(
-                company_name=self.company.name,
-                workloads_list=wls_str,
-                tasks_per_workload=self.gen_config.target_tasks_per_workload,
-                automation_levels=", ".join(AUTOMATION_LEVELS),
-            )
-
-            logger.info(f"Generating tasks for pending workloads {i+1}-{i+len(batch_wls)}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate tasks for batch {i}: {e}")
-                continue
-
-            wl_name_to_id = {wl["name"]: wl["id"] for wl in batch_wls}
-
-            for task_data in batch_result:
-                wl_name = task_data.get("workload", "")
-                wl_id = wl_name_to_id.get(wl_name, "")
-                if not wl_id:
-                    for name, wid in wl_name_to_id.items():
-                        if name.lower() in wl_name.lower() or wl_name.lower() in name.lower():
-                            wl_id = wid
-                            break
-
-                classification = task_data.get("classification", "task_iteration")
-                if classification not in TASK_CLASSIFICATIONS:
-                    classification = "task_iteration"
-
-                auto_level = task_data.get("automation_level", "human_led")
-                if auto_level not in AUTOMATION_LEVELS:
-                    auto_level = "human_led"
-
-                task = {
-                    "id": self.make_id("task", wl_name, task_data["name"]),
-                    "name": task_data["name"],
-                    "workload_id": wl_id,
-                    "function_id": wl_id_to_func.get(wl_id, "unknown"),
-                    "description": task_data.get("description", ""),
-                    "classification": classification,
-                    "time_allocation_pct": task_data.get("time_allocation_pct", 15.0),
-                    "automation_potential": task_data.get("automation_potential", 30.0),
-                    "automation_level": auto_level,
-                    "current_tool_ids": [],
-                    "future_tool_ids": [],
-                    "skill_ids": [],
-                }
-                new_tasks.append(task)
+        batches = [
+            (i, pending_wls[i:i + batch_size])
+            for i in range(0, len(pending_wls), batch_size)
+        ]
+        new_tasks = []
+        for batch_tasks in self.scheduler.map(
+            lambda batch: self._generate_batch_tasks(*batch, role_id_to_name, wl_id_to_func), batches,
+        ):
+            new_tasks.extend(batch_tasks)
 
         # Merge existing + new, then save per function
         all_tasks = existing_tasks + new_tasks
@@ -187,3 +140,69 @@ class TaskGenerator(BaseGenerator):
             f"{len(all_tasks)} total ({len(existing_tasks)} existing)"
         )
         return all_tasks
+
+    def _generate_batch_tasks(
+        self,
+        i: int,
+        batch_wls: List[Dict[str, Any]],
+        role_id_to_name: Dict[str, str],
+        wl_id_to_func: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        """Generate tasks for one batch of workloads; empty on failure."""
+        wls_str = "\n".join(
+            f"- Workload: \"{wl['name']}\" (Role: {role_id_to_name.get(wl['role_id'], 'Unknown')}, "
+            f"Effort: {wl['effort_allocation_pct']}%, Automation: {wl['automation_level']})"
+            for wl in batch_wls
+        )
+
+        prompt = TASK_PROMPT.format(
+            company_name=self.company.name,
+            workloads_list=wls_str,
+            tasks_per_workload=self.gen_config.target_tasks_per_workload,
+            automation_levels=", ".join(AUTOMATION_LEVELS),
+        )
+
+        logger.info(f"Generating tasks for pending workloads {i+1}-{i+len(batch_wls)}")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate tasks for batch {i}: {e}")
+            return []
+
+        wl_name_to_id = {wl["name"]: wl["id"] for wl in batch_wls}
+
+        tasks = []
+        for task_data in batch_result:
+            wl_name = task_data.get("workload", "")
+            wl_id = wl_name_to_id.get(wl_name, "")
+            if not wl_id:
+                for name, wid in wl_name_to_id.items():
+                    if name.lower() in wl_name.lower() or wl_name.lower() in name.lower():
+                        wl_id = wid
+                        break
+
+            classification = task_data.get("classification", "task_iteration")
+            if classification not in TASK_CLASSIFICATIONS:
+                classification = "task_iteration"
+
+            auto_level = task_data.get("automation_level", "human_led")
+            if auto_level not in AUTOMATION_LEVELS:
+                auto_level = "human_led"
+
+            task = {
+                "id": self.make_id("task", wl_name, task_data["name"]),
+                "name": task_data["name"],
+                "workload_id": wl_id,
+                "function_id": wl_id_to_func.get(wl_id, "unknown"),
+                "description": task_data.get("description", ""),
+                "classification": classification,
+                "time_allocation_pct": task_data.get("time_allocation_pct", 15.0),
+                "automation_potential": task_data.get("automation_potential", 30.0),
+                "automation_level": auto_level,
+                "current_tool_ids": [],
+                "future_tool_ids": [],
+                "skill_ids": [],
+            }
+            tasks.append(task)
+        return tasks
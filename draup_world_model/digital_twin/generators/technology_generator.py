@@ -5,6 +5,8 @@ Generates a technology/tool catalog for the insurance industry,
 then maps technologies to roles and tasks.
 
 Batch strategy: 1-2 LLM calls for the full catalog, then mapping calls.
+Category groups and mapping batches run concurrently under the
+generation scheduler.
 """
 
 import logging
@@ -18,6 +20,7 @@ from draup_world_model.digital_twin.config import (
     TECHNOLOGY_CATEGORIES,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -104,8 +107,9 @@ class TechnologyGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -121,43 +125,11 @@ class TechnologyGenerator(BaseGenerator):
         num_groups = len(self.CATEGORY_GROUPS)
         all_technologies = []
 
-        for group_idx, categories in enumerate(self.CATEGORY_GROUPS):
-            batch_count = total // num_groups
-            if group_idx < total % num_groups:
-                batch_count += 1
-
-            categories_str = ", ".join(categories)
-            prompt = TECH_CATALOG_PROMPT.format(
-                company_name=self.company.name,
-                company_desc=self.company.description,
-                target_count=batch_count,
-                categories=categories_str,
-            )
-
-            logger.info(f"Generating ~{batch_count} technologies for categories: {categories_str}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate technologies for {categories_str}: {e}")
-                continue
-
-            for tech_data in batch_result:
-                category = tech_data.get("category", categories[0])
-                if category not in TECHNOLOGY_CATEGORIES:
-                    category = categories[0]
-
-                tech = {
-                    "id": self.make_id("tech", tech_data["name"]),
-                    "name": tech_data["name"],
-                    "category": category,
-                    "vendor": tech_data.get("vendor", ""),
-                    "description": tech_data.get("description", ""),
-                    "capabilities": tech_data.get("capabilities", []),
-                    "license_cost_tier": tech_data.get("license_cost_tier", "medium"),
-                    "adoption_stage": tech_data.get("adoption_stage", "mainstream"),
-                }
-                all_technologies.append(tech)
+        for group_technologies in self.scheduler.map(
+            lambda group: self._generate_catalog_group(*group, total, num_groups),
+            list(enumerate(self.CATEGORY_GROUPS)),
+        ):
+            all_technologies.extend(group_technologies)
 
         # Deduplicate by name
         seen = set()
@@ -171,6 +143,53 @@ class TechnologyGenerator(BaseGenerator):
         logger.info(f"Generated {len(unique_technologies)} unique technologies")
         return unique_technologies
 
+    def _generate_catalog_group(
+        self,
+        group_idx: int,
+        categories: List[str],
+        total: int,
+        num_groups: int,
+    ) -> List[Dict[str, Any]]:
+        """Generate this category group's share of the catalog; empty on failure."""
+        batch_count = total // num_groups
+        if group_idx < total % num_groups:
+            batch_count += 1
+
+        categories_str = ", ".join(categories)
+        prompt = TECH_CATALOG_PROMPT.format(
+            company_name=self.company.name,
+            company_desc=self.company.description,
+            target_count=batch_count,
+            categories=categories_str,
+        )
+
+        logger.info(f"Generating ~{batch_count} technologies for categories: {categories_str}")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate technologies for {categories_str}: {e}")
+            return []
+
+        technologies = []
+        for tech_data in batch_result:
+            category = tech_data.get("category", categories[0])
+            if category not in TECHNOLOGY_CATEGORIES:
+                category = categories[0]
+
+            tech = {
+                "id": self.make_id("tech", tech_data["name"]),
+                "name": tech_data["name"],
+                "category": category,
+                "vendor": tech_data.get("vendor", ""),
+                "description": tech_data.get("description", ""),
+                "capabilities": tech_data.get("capabilities", []),
+                "license_cost_tier": tech_data.get("license_cost_tier", "medium"),
+                "adoption_stage": tech_data.get("adoption_stage", "mainstream"),
+            }
+            technologies.append(tech)
+        return technologies
+
     def map_tech_to_roles(
         self,
         roles: List[Dict[str, Any]],
@@ -181,30 +200,13 @@ class TechnologyGenerator(BaseGenerator):
         tech_names_str = ", ".join(t["name"] for t in technologies)
         batch_size = self.gen_config.roles_per_batch
 
-        for i in range(0, len(roles), batch_size):
-            batch_roles = roles[i:i + batch_size]
-            roles_str = "\n".join(
-                f"- {r['name']}: {r['description']}"
-                for r in batch_roles
-            )
-
-            prompt = TECH_MAPPING_PROMPT.format(
-                roles_list=roles_str,
-                tech_list=tech_names_str,
-            )
-
-            logger.info(f"Mapping technologies to roles {i+1}-{i+len(batch_roles)}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to map tech for batch {i}: {e}")
-                continue
-
-            role_name_to_idx = {}
-            for idx, r in enumerate(roles):
-                role_name_to_idx[r["name"]] = idx
+        role_name_to_idx = {r["name"]: idx for idx, r in enumerate(roles)}
+        batches = [(i, roles[i:i + batch_size]) for i in range(0, len(roles), batch_size)]
 
+        # Batches only return their mappings; roles are updated here, in batch order
+        for batch_result in self.scheduler.map(
+            lambda batch: self._map_tech_batch(*batch, tech_names_str), batches,
+        ):
             for mapping in batch_result:
                 role_name = mapping.get("role", "")
                 if role_name in role_name_to_idx:
@@ -221,6 +223,31 @@ class TechnologyGenerator(BaseGenerator):
         logger.info("Updated roles with technology mappings")
         return roles
 
+    def _map_tech_batch(
+        self,
+        i: int,
+        batch_roles: List[Dict[str, Any]],
+        tech_names_str: str,
+    ) -> List[Dict[str, Any]]:
+        """LLM technology mappings for one batch of roles; empty on failure."""
+        roles_str = "\n".join(
+            f"- {r['name']}: {r['description']}"
+            for r in batch_roles
+        )
+
+        prompt = TECH_MAPPING_PROMPT.format(
+            roles_list=roles_str,
+            tech_list=tech_names_str,
+        )
+
+        logger.info(f"Mapping technologies to roles {i+1}-{i+len(batch_roles)}")
+
+        try:
+            return self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to map tech for batch {i}: {e}")
+            return []
+
     def generate(self, roles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate technology catalog and map to roles."""
         technologies = self.generate_catalog()
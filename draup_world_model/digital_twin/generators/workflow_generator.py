@@ -9,6 +9,8 @@ Generates cross-role business workflows with rich task-level detail:
 Two-phase LLM strategy per function (avoids token limit issues):
   Phase 1 (1 call): Generate workflow skeletons (names + metadata)
   Phase 2 (1 call per workflow): Generate tasks for each workflow individually
+Functions, and the workflows within a function, run concurrently under
+the generation scheduler.
 
 Derived analytics fields (summary, metrics, quick_wins, opportunities,
 patterns, recommendations) are computed deterministically from task data.
@@ -24,6 +26,7 @@ from draup_world_model.digital_twin.config import (
     OutputConfig,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -135,8 +138,9 @@ class WorkflowGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -175,44 +179,59 @@ class WorkflowGenerator(BaseGenerator):
 
         target = self.gen_config.target_workflows_per_function
 
-        for func in taxonomy["functions"]:
-            # Per-function resumability: skip if file already exists
-            func_file = self.output.function_file("workflows", func["id"])
-            if func_file.exists():
-                existing = self.load_json(func_file)
-                all_workflows.extend(existing)
-                logger.info(
-                    f"Loaded {len(existing)} existing workflows "
-                    f"for {func['name']}"
-                )
-                continue
+        skills_str = ", ".join(skill_names[:80])
+        for func_workflows in self.scheduler.map(
+            lambda func: self._load_or_generate_function(
+                func, roles_by_func, skills_str, role_name_to_id, target,
+            ),
+            taxonomy["functions"],
+        ):
+            all_workflows.extend(func_workflows)
 
-            func_roles = roles_by_func.get(func["id"], [])
-            if not func_roles:
-                logger.warning(
-                    f"No roles found for function {func['name']}, skipping"
-                )
-                continue
+        logger.info(
+            f"Generated {len(all_workflows)} workflows across "
+            f"{len(taxonomy['functions'])} functions"
+        )
+        return all_workflows
 
-            roles_str = "\n".join(
-                f"- {r['name']}: {r.get('description', '')}"
-                for r in func_roles
+    def _load_or_generate_function(
+        self,
+        func: Dict[str, Any],
+        roles_by_func: Dict[str, List[Dict]],
+        skills_str: str,
+        role_name_to_id: Dict[str, str],
+        target: int,
+    ) -> List[Dict[str, Any]]:
+        """Workflows for one function: loaded from its file if present, else generated and saved."""
+        # Per-function resumability: skip if file already exists
+        func_file = self.output.function_file("workflows", func["id"])
+        if func_file.exists():
+            existing = self.load_json(func_file)
+            logger.info(
+                f"Loaded {len(existing)} existing workflows "
+                f"for {func['name']}"
             )
-            skills_str = ", ".join(skill_names[:80])
+            return existing
 
-            func_workflows = self._generate_for_function(
-                func, roles_str, skills_str, role_name_to_id, target,
+        func_roles = roles_by_func.get(func["id"], [])
+        if not func_roles:
+            logger.warning(
+                f"No roles found for function {func['name']}, skipping"
             )
+            return []
 
-            if func_workflows:
-                self.save_json(func_workflows, func_file)
-            all_workflows.extend(func_workflows)
+        roles_str = "\n".join(
+            f"- {r['name']}: {r.get('description', '')}"
+            for r in func_roles
+        )
 
-        logger.info(
-            f"Generated {len(all_workflows)} workflows across "
-            f"{len(taxonomy['functions'])} functions"
+        func_workflows = self._generate_for_function(
+            func, roles_str, skills_str, role_name_to_id, target,
         )
-        return all_workflows
+
+        if func_workflows:
+            self.save_json(func_workflows, func_file)
+        return func_workflows
 
     def _generate_for_function(
         self,
@@ -243,8 +262,8 @@ class WorkflowGenerator(BaseGenerator):
         )
 
         # Phase 2: Generate tasks for each workflow
-        func_workflows = []
-        for i, skeleton in enumerate(skeletons, 1):
+        def build(indexed_skeleton):
+            i, skeleton = indexed_skeleton
             wf_name = skeleton.get("workflow_name", f"Workflow {i}")
             logger.info(
                 f"Phase 2: Generating tasks for workflow {i}/{len(skeletons)}"
@@ -256,10 +275,9 @@ class WorkflowGenerator(BaseGenerator):
             )
 
             skeleton["tasks"] = raw_tasks
-            workflow = self._build_workflow(skeleton, func, role_name_to_id)
-            func_workflows.append(workflow)
+            return self._build_workflow(skeleton, func, role_name_to_id)
 
-        return func_workflows
+        return self.scheduler.map(build, list(enumerate(skeletons, 1)))
 
     def _generate_workflow_skeletons(
         self,
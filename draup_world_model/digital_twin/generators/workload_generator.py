@@ -5,6 +5,7 @@ Generates 3-5 workloads per role using batch LLM calls.
 Workloads are coherent blocks of work that decompose a role's responsibilities.
 
 Batch strategy: One LLM call per ~10 roles -> generates all workloads for those roles.
+Batches run concurrently under the generation scheduler.
 """
 
 import logging
@@ -18,6 +19,7 @@ from draup_world_model.digital_twin.config import (
     AUTOMATION_LEVELS,
 )
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +61,9 @@ class WorkloadGenerator(BaseGenerator):
         gen_config: Optional[GenerationConfig] = None,
         company: Optional[CompanyProfile] = None,
         output: Optional[OutputConfig] = None,
+        scheduler: Optional[GenerationScheduler] = None,
     ):
-        super().__init__(llm_config)
+        super().__init__(llm_config, scheduler)
         self.gen_config = gen_config or GenerationConfig()
         self.company = company or CompanyProfile()
         self.output = output or OutputConfig()
@@ -91,53 +94,16 @@ class WorkloadGenerator(BaseGenerator):
             f"({len(existing_wls)} existing workloads kept)"
         )
 
-        new_workloads = []
         batch_size = self.gen_config.workloads_per_batch
-
-        for i in range(0, len(pending_roles), batch_size):
-            batch_roles = pending_roles[i:i + batch_size]
-            roles_str = "\n".join(
-                f"- {r['name']}: {r['description']} (automation score: {r['automation_score']})"
-                for r in batch_roles
-            )
-
-            prompt = WORKLOAD_PROMPT.format(
-                company_name=self.company.name,
-                roles_list=roles_str,
-                workloads_per_role=self.gen_config.target_workloads_per_role,
-                automation_levels=", ".join(AUTOMATION_LEVELS),
-            )
-
-            logger.info(f"Generating workloads for pending roles {i+1}-{i+len(batch_roles)}")
-
-            try:
-                batch_result = self.generate_batch(prompt)
-            except Exception as e:
-                logger.error(f"Failed to generate workloads for batch {i}: {e}")
-                continue
-
-            role_name_to_id = {r["name"]: r["id"] for r in batch_roles}
-
-            for wl_data in batch_result:
-                role_name = wl_data.get("role", "")
-                role_id = role_name_to_id.get(role_name, "")
-                if not role_id:
-                    for name, rid in role_name_to_id.items():
-                        if name.lower() in role_name.lower() or role_name.lower() in name.lower():
-                            role_id = rid
-                            break
-
-                workload = {
-                    "id": self.make_id("wl", role_name, wl_data["name"]),
-                    "name": wl_data["name"],
-                    "role_id": role_id,
-                    "function_id": role_id_to_func.get(role_id, "unknown"),
-                    "description": wl_data.get("description", ""),
-                    "effort_allocation_pct": wl_data.get("effort_allocation_pct", 25.0),
-                    "automation_level": wl_data.get("automation_level", "human_led"),
-                    "skill_ids": [],
-                }
-                new_workloads.append(workload)
+        batches = [
+            (i, pending_roles[i:i + batch_size])
+            for i in range(0, len(pending_roles), batch_size)
+        ]
+        new_workloads = []
+        for batch_workloads in self.scheduler.map(
+            lambda batch: self._generate_batch_workloads(*batch, role_id_to_func), batches,
+        ):
+            new_workloads.extend(batch_workloads)
 
         # Merge existing + new, then save per function
         all_workloads = existing_wls + new_workloads
@@ -147,3 +113,55 @@ class WorkloadGenerator(BaseGenerator):
             f"{len(all_workloads)} total ({len(existing_wls)} existing)"
         )
         return all_workloads
+
+    def _generate_batch_workloads(
+        self,
+        i: int,
+        batch_roles: List[Dict[str, Any]],
+        role_id_to_func: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        """Generate workloads for one batch of roles; empty on failure."""
+        roles_str = "\n".join(
+            f"- {r['name']}: {r['description']} (automation score: {r['automation_score']})"
+            for r in batch_roles
+        )
+
+        prompt = WORKLOAD_PROMPT.format(
+            company_name=self.company.name,
+            roles_list=roles_str,
+            workloads_per_role=self.gen_config.target_workloads_per_role,
+            automation_levels=", ".join(AUTOMATION_LEVELS),
+        )
+
+        logger.info(f"Generating workloads for pending roles {i+1}-{i+len(batch_roles)}")
+
+        try:
+            batch_result = self.generate_batch(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate workloads for batch {i}: {e}")
+            return []
+
+        role_name_to_id = {r["name"]: r["id"] for r in batch_roles}
+
+        workloads = []
+        for wl_data in batch_result:
+            role_name = wl_data.get("role", "")
+            role_id = role_name_to_id.get(role_name, "")
+            if not role_id:
+                for name, rid in role_name_to_id.items():
+                    if name.lower() in role_name.lower() or role_name.lower() in name.lower():
+                        role_id = rid
+                        break
+
+            workload = {
+                "id": self.make_id("wl", role_name, wl_data["name"]),
+                "name": wl_data["name"],
+                "role_id": role_id,
+                "function_id": role_id_to_func.get(role_id, "unknown"),
+                "description": wl_data.get("description", ""),
+                "effort_allocation_pct": wl_data.get("effort_allocation_pct", 25.0),
+                "automation_level": wl_data.get("automation_level", "human_led"),
+                "skill_ids": [],
+            }
+            workloads.append(workload)
+        return workloads
@@ -13,6 +13,8 @@ Aggregate metrics are the "stocks" that reveal system state at any level.
 import logging
 from typing import Dict, Any, List
 
+from draup_world_model.digital_twin.graph.version import bump_graph_version
+
 logger = logging.getLogger(__name__)
 
 
@@ -152,4 +154,5 @@ class AggregationEngine:
                 results[name] = 0
 
         logger.info(f"Aggregation complete: {results}")
+        bump_graph_version()
         return results
@@ -0,0 +1,227 @@
+"""
+Graph view service: node/edge payloads for the UI's interactive graph.
+
+Each scope query walks the taxonomy down to the nodes in view, then reads
+every node's outgoing DT_ relationships with a pattern comprehension. Edge
+discovery therefore costs one adjacency read per node, not a pairwise
+(a)-[r]->(b) probe over every node pair in the scope. Edges are kept when
+both ends are in view.
+
+Rendered payloads are cached per (scope_type, scope_name, node_types, limit)
+and dropped when the graph version moves (graph/version.py); the TTL covers
+loads run from another process.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from draup_world_model.digital_twin.graph.version import graph_version
+
+logger = logging.getLogger(__name__)
+
+GRAPH_VIEW_CACHE_TTL = float(os.environ.get("DT_GRAPH_VIEW_CACHE_TTL", 300))
+GRAPH_VIEW_CACHE_SIZE = int(os.environ.get("DT_GRAPH_VIEW_CACHE_SIZE", 64))
+MAX_GRAPH_NODES = 500
+
+# ──────────────────────────────────────────────────────────────
+# Scope traversal: each clause collects the scope's nodes as all_nodes
+# ──────────────────────────────────────────────────────────────
+
+_ROLE_CONTENT = """
+OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
+OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
+OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
+OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
+"""
+
+SCOPE_NODES = {
+    "role": """
+MATCH (role:DTRole {name: $scope_name})
+""" + _ROLE_CONTENT + """
+WITH collect(DISTINCT role) + collect(DISTINCT wl) +
+     collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+    "job_family": """
+MATCH (jf:DTJobFamily {name: $scope_name})
+OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
+""" + _ROLE_CONTENT + """
+WITH collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
+     collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+    "job_family_group": """
+MATCH (jfg:DTJobFamilyGroup {name: $scope_name})
+OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
+OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
+""" + _ROLE_CONTENT + """
+WITH collect(DISTINCT jfg) + collect(DISTINCT jf) + collect(DISTINCT role) +
+     collect(DISTINCT wl) + collect(DISTINCT task) +
+     collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+    "sub_function": """
+MATCH (sf:DTSubFunction {name: $scope_name})
+OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
+OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
+OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
+""" + _ROLE_CONTENT + """
+WITH collect(DISTINCT sf) + collect(DISTINCT jfg) +
+     collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
+     collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+    "function": """
+MATCH (f:DTFunction {name: $scope_name})
+OPTIONAL MATCH (f)-[:DT_CONTAINS]->(sf:DTSubFunction)
+OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
+OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
+OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
+""" + _ROLE_CONTENT + """
+WITH collect(DISTINCT f) + collect(DISTINCT sf) + collect(DISTINCT jfg) +
+     collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
+     collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+    # Organization-wide: taxonomy + roles + skills + technologies (no tasks/workloads for perf)
+    "organization": """
+MATCH (o:DTOrganization)-[:DT_CONTAINS]->(f:DTFunction)
+OPTIONAL MATCH (f)-[:DT_CONTAINS]->(sf:DTSubFunction)
+OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
+OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
+OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
+OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
+OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
+WITH collect(DISTINCT o) + collect(DISTINCT f) + collect(DISTINCT sf) +
+     collect(DISTINCT jfg) + collect(DISTINCT jf) + collect(DISTINCT role) +
+     collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
+""",
+}
+
+# One row per node in view, in traversal order, with its outgoing DT_ edges
+GRAPH_VIEW_TAIL = """
+UNWIND all_nodes AS n
+WITH DISTINCT n
+WHERE n IS NOT NULL AND n.id IS NOT NULL
+WITH n, [l IN labels(n) WHERE l STARTS WITH 'DT'][0] AS label
+WHERE size($node_types) = 0 OR label IN $node_types
+WITH n, label
+LIMIT $limit
+RETURN n.id AS id,
+       label,
+       n.name AS name,
+       COALESCE(n.computed_headcount, 0) AS headcount,
+       COALESCE(n.automation_potential, n.automation_score) AS automation,
+       n.description AS description,
+       [(n)-[r]->(m) WHERE type(r) STARTS WITH 'DT_' | {target: m.id, type: type(r)}] AS out_edges
+"""
+
+
+def resolve_scope(scope_type: str, scope_name: str) -> Tuple[str, str]:
+    """Scope the view actually shows: unknown types or a missing name mean the whole organization."""
+    if scope_type in SCOPE_NODES and scope_type != "organization" and scope_name:
+        return scope_type, scope_name
+    return "organization", ""
+
+
+class GraphViewService:
+    """Builds and caches node/edge payloads for the /graph endpoint."""
+
+    def __init__(self, neo4j_conn, ttl: float = GRAPH_VIEW_CACHE_TTL, max_entries: int = GRAPH_VIEW_CACHE_SIZE):
+        self.conn = neo4j_conn
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._version = graph_version()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        scope_type: str = "organization",
+        scope_name: str = "",
+        node_types: Optional[Sequence[str]] = None,
+        limit: int = 300,
+    ) -> Dict[str, Any]:
+        """Payload for a scope: {nodes, edges, node_types, edge_types}."""
+        scope_type, scope_name = resolve_scope(scope_type, scope_name)
+        node_types = tuple(sorted(set(node_types or ())))
+        limit = max(0, min(int(limit), MAX_GRAPH_NODES))
+        key = (scope_type, scope_name, node_types, limit)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        version = graph_version()
+        payload = self.build(scope_type, scope_name, node_types, limit)
+        with self._lock:
+            if version != graph_version():
+                return payload
+            self._cache[key] = (time.monotonic(), payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return payload
+
+    def _lookup(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._version != graph_version():
+                self._cache.clear()
+                self._version = graph_version()
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._cache[key]
+            self.misses += 1
+            return None
+
+    def build(
+        self, scope_type: str, scope_name: str, node_types: Sequence[str], limit: int,
+    ) -> Dict[str, Any]:
+        """Run the scope query and assemble the payload, bypassing the cache."""
+        query = SCOPE_NODES[scope_type] + GRAPH_VIEW_TAIL
+        params = {"node_types": list(node_types), "limit": limit}
+        if scope_name:
+            params["scope_name"] = scope_name
+        rows = self.conn.execute_read_query(query, params) or []
+        return assemble_payload(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses, "ttl": self.ttl}
+
+
+def assemble_payload(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn per-node rows into the UI payload, keeping edges whose ends are both in view."""
+    nodes = []
+    for row in rows:
+        nodes.append({
+            "id": row["id"],
+            "label": row.get("label"),
+            "name": row.get("name"),
+            "headcount": row.get("headcount", 0),
+            "automation": row.get("automation"),
+            "description": row.get("description"),
+        })
+    node_ids = {n["id"] for n in nodes}
+
+    edges = []
+    for row in rows:
+        for e in row.get("out_edges") or []:
+            if e.get("target") in node_ids:
+                edges.append({"source": row["id"], "target": e["target"], "type": e["type"]})
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "node_types": sorted(set(n["label"] for n in nodes if n.get("label"))),
+        "edge_types": sorted(set(e["type"] for e in edges if e.get("type"))),
+    }
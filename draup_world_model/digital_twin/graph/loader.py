@@ -28,6 +28,7 @@ from typing import Any, Dict, List, Optional
 
 from draup_world_model.digital_twin.config import OutputConfig
 from draup_world_model.digital_twin.graph import queries
+from draup_world_model.digital_twin.graph.version import bump_graph_version
 from draup_world_model.digital_twin.graph.schema import apply_schema
 
 logger = logging.getLogger(__name__)
@@ -350,4 +351,5 @@ class GraphLoader:
         logger.info("="*60)
         logger.info(f"LOAD COMPLETE: {self._stats}")
         logger.info("="*60)
+        bump_graph_version()
         return self._stats
@@ -0,0 +1,32 @@
+"""
+In-process version counter for the Digital Twin graph.
+
+Caches built from graph reads (graph views, simulation scopes) remember the
+version they were filled at and drop their entries once it moves.
+GraphLoader.load_all and AggregationEngine.run bump it when they finish.
+Loads run from another process (scripts/load_graph.py) cannot bump it, so
+those caches also expire entries by age.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_version = 0
+_lock = threading.Lock()
+
+
+def graph_version() -> int:
+    """Current graph version."""
+    return _version
+
+
+def bump_graph_version() -> int:
+    """Mark the graph as changed, invalidating every cache keyed on the version."""
+    global _version
+    with _lock:
+        _version += 1
+        version = _version
+    logger.info(f"Graph version bumped to {version}")
+    return version
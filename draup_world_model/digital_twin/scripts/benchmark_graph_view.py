@@ -0,0 +1,128 @@
+"""
+Benchmark the /graph endpoint's edge discovery against a loaded graph.
+
+Compares, per scope, the previous pairwise tail (UNWIND nodes AS a,
+UNWIND nodes AS b, OPTIONAL MATCH (a)-[r]->(b)) with the graph view
+service's per-node adjacency read, uncached and cached. Load the Acme
+data first (scripts/load_graph.py).
+
+Usage:
+    python -m draup_world_model.digital_twin.scripts.benchmark_graph_view
+    python -m draup_world_model.digital_twin.scripts.benchmark_graph_view --repeats 10
+    python -m draup_world_model.digital_twin.scripts.benchmark_graph_view --neo4j-uri bolt://host:7687
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+
+from draup_world_model.digital_twin.config import DTNeo4jConfig, get_dt_neo4j_connection
+from draup_world_model.digital_twin.graph.graph_view import SCOPE_NODES, GraphViewService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# The tail get_graph used before the graph view service
+LEGACY_TAIL = """
+UNWIND all_nodes AS n
+WITH DISTINCT n
+WHERE n IS NOT NULL
+WITH collect(n) AS nodes
+UNWIND nodes AS a
+UNWIND nodes AS b
+WITH nodes, a, b
+WHERE id(a) < id(b)
+OPTIONAL MATCH (a)-[r]->(b) WHERE type(r) STARTS WITH 'DT_'
+WITH nodes, collect({src: a.id, tgt: b.id, rel: type(r)}) AS rels_raw
+UNWIND nodes AS n
+WITH collect(DISTINCT {
+    id: n.id,
+    label: [l IN labels(n) WHERE l STARTS WITH 'DT'][0],
+    name: n.name,
+    headcount: COALESCE(n.computed_headcount, 0),
+    automation: COALESCE(n.automation_potential, n.automation_score),
+    description: n.description
+}) AS node_list,
+[r IN rels_raw WHERE r.rel IS NOT NULL] AS edge_list
+RETURN node_list, edge_list
+"""
+
+SCOPE_SAMPLES = {
+    "function": "MATCH (n:DTFunction) RETURN n.name AS name ORDER BY n.name LIMIT 1",
+    "sub_function": "MATCH (n:DTSubFunction) RETURN n.name AS name ORDER BY n.name LIMIT 1",
+    "job_family": "MATCH (n:DTJobFamily) RETURN n.name AS name ORDER BY n.name LIMIT 1",
+    "role": "MATCH (n:DTRole) RETURN n.name AS name ORDER BY n.name LIMIT 1",
+}
+
+
+def _timed(fn, repeats):
+    times = []
+    result = None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times), result
+
+
+def benchmark(conn, repeats: int, limit: int):
+    scopes = [("organization", "")]
+    for scope_type, query in SCOPE_SAMPLES.items():
+        rows = conn.execute_read_query(query)
+        if rows:
+            scopes.append((scope_type, rows[0]["name"]))
+
+    service = GraphViewService(conn)
+    print(f"{'scope':<40} {'nodes':>6} {'edges':>12} {'legacy ms':>10} {'view ms':>9} {'cached ms':>10}")
+    for scope_type, scope_name in scopes:
+        params = {"scope_name": scope_name} if scope_name else {}
+        legacy_ms, legacy = _timed(
+            lambda: conn.execute_read_query(SCOPE_NODES[scope_type] + LEGACY_TAIL, params), repeats,
+        )
+        view_ms, payload = _timed(lambda: service.build(scope_type, scope_name, (), limit), repeats)
+        service.clear()
+        service.get(scope_type, scope_name, limit=limit)
+        cached_ms, _ = _timed(lambda: service.get(scope_type, scope_name, limit=limit), repeats)
+
+        # The legacy tail only probed id(a) < id(b), so it misses edges pointing the other way
+        legacy_edges = len(legacy[0]["edge_list"]) if legacy else 0
+        label = f"{scope_type}:{scope_name}"[:40]
+        print(
+            f"{label:<40} {len(payload['nodes']):>6} {legacy_edges:>5} → {len(payload['edges']):<4}"
+            f" {legacy_ms:>10.1f} {view_ms:>9.1f} {cached_ms:>10.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /graph edge discovery")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per measurement (median reported)")
+    parser.add_argument("--limit", type=int, default=500, help="Node limit for the graph view")
+    parser.add_argument("--neo4j-uri", default=None, help="Neo4j bolt URI (default: DT_NEO4J_URI or bolt://localhost:7687)")
+    parser.add_argument("--neo4j-database", default=None, help="Neo4j database (default: DT_NEO4J_DATABASE or draup)")
+    args = parser.parse_args()
+
+    cfg = DTNeo4jConfig()
+    if args.neo4j_uri:
+        cfg.uri = args.neo4j_uri
+    if args.neo4j_database:
+        cfg.database = args.neo4j_database
+
+    try:
+        conn = get_dt_neo4j_connection(cfg)
+    except Exception as e:
+        logger.error(f"Cannot connect to Neo4j: {e}")
+        sys.exit(1)
+
+    try:
+        benchmark(conn, args.repeats, args.limit)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
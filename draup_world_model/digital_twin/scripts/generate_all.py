@@ -18,6 +18,13 @@ Output uses per-function directory structure for resilience:
 Generators with per-function output (roles, workflows) automatically
 skip functions that already have files, enabling incremental runs.
 
+Steps run as soon as the steps they depend on finish (STEP_DEPENDENCIES),
+so skills and technologies overlap with workloads and tasks. Batches within
+a step run concurrently too. A shared GenerationScheduler caps LLM calls
+in flight (--concurrency) and total tokens (--token-budget), and replays
+responses to prompts it has already answered from data/<company>/.llm_cache,
+so rerunning after a crash only pays for the calls that never finished.
+
 Supports partial generation via --functions or --num-functions to
 generate data for a subset of functions first, then expand later.
 
@@ -29,6 +36,7 @@ Usage:
     python -m draup_world_model.digital_twin.scripts.generate_all --step roles --clean
     python -m draup_world_model.digital_twin.scripts.generate_all --num-functions 3
     python -m draup_world_model.digital_twin.scripts.generate_all --functions "Claims Management,Underwriting"
+    python -m draup_world_model.digital_twin.scripts.generate_all --concurrency 8 --token-budget 2000000
 """
 
 import argparse
@@ -48,6 +56,7 @@ from draup_world_model.digital_twin.config import (
 from typing import Dict, List, Optional, Any
 
 from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import GenerationScheduler, ResponseCache
 from draup_world_model.digital_twin.generators.taxonomy_generator import TaxonomyGenerator
 from draup_world_model.digital_twin.generators.role_generator import RoleGenerator
 from draup_world_model.digital_twin.generators.workload_generator import WorkloadGenerator
@@ -69,6 +78,20 @@ STEPS = [
     "role_skill_mapping",
 ]
 
+# Steps each step must wait for (when they are part of the same run)
+STEP_DEPENDENCIES = {
+    "taxonomy": [],
+    "roles": ["taxonomy"],
+    "workloads": ["roles"],
+    "tasks": ["workloads"],
+    "skills": ["roles"],
+    # Skill and technology mapping both rewrite the role files
+    "technologies": ["skills"],
+    # Workflows read tasks and skills for context, and roles after both mappings
+    "workflows": ["tasks", "technologies"],
+    "role_skill_mapping": ["workflows"],
+}
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -268,10 +291,25 @@ def run_generation(
         label = function_names if function_names else f"first {num_functions}"
         logger.info(f"Function filter: {label}")
 
+    cache = None
+    if gen_config.response_cache:
+        # --clean forces fresh responses; they are still cached for the next rerun
+        cache = ResponseCache(output.llm_cache_dir, read=not clean)
+    scheduler = GenerationScheduler(
+        max_concurrency=gen_config.max_concurrency,
+        token_budget=gen_config.token_budget,
+        cache=cache,
+    )
+    logger.info(
+        f"Scheduler: {scheduler.max_concurrency} concurrent LLM calls, "
+        f"token budget {gen_config.token_budget or 'unlimited'}, "
+        f"response cache {'on' if cache else 'off'}"
+    )
+
     start_time = time.time()
     stats = {}
 
-    for current_step in steps_to_run:
+    def run_step(current_step: str) -> None:
         step_start = time.time()
         logger.info(f"\n{'='*60}")
         logger.info(f"STEP: {current_step.upper()}")
@@ -299,6 +337,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             result = gen.generate(taxonomy)
             stats["roles"] = len(result["roles"])
@@ -314,6 +353,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             workloads = gen.generate(roles)
             stats["workloads"] = len(workloads)
@@ -329,6 +369,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             tasks = gen.generate(workloads, roles or [])
             stats["tasks"] = len(tasks)
@@ -343,6 +384,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             result = gen.generate(roles)
             stats["skills"] = len(result["skills"])
@@ -357,6 +399,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             result = gen.generate(roles)
             stats["technologies"] = len(result["technologies"])
@@ -379,6 +422,7 @@ def run_generation(
                 gen_config=gen_config,
                 company=company,
                 output=output,
+                scheduler=scheduler,
             )
             workflows = gen.generate(
                 taxonomy, roles, tasks=tasks, skills=skills,
@@ -395,6 +439,9 @@ def run_generation(
         step_time = time.time() - step_start
         logger.info(f"Step '{current_step}' completed in {step_time:.1f}s")
 
+    scheduler.run_steps(steps_to_run, STEP_DEPENDENCIES, run_step)
+    stats["scheduler"] = scheduler.stats()
+
     total_time = time.time() - start_time
     logger.info(f"\n{'='*60}")
     logger.info("GENERATION COMPLETE")
@@ -449,6 +496,23 @@ def main():
         default=None,
         help="Generate for the first N functions only (e.g., 3 for Claims, Underwriting, Actuarial)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=GenerationConfig.max_concurrency,
+        help=f"Maximum LLM calls in flight (default: {GenerationConfig.max_concurrency}; 1 runs steps in sequence)",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Stop making LLM calls after this many tokens; unfinished work resumes on the next run",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the prompt-hash LLM response cache",
+    )
     parser.add_argument(
         "--fix-skill-type",
         action="store_true",
@@ -463,6 +527,11 @@ def main():
         return
 
     llm_config = LLMConfig(model=args.model, temperature=args.temperature)
+    gen_config = GenerationConfig(
+        max_concurrency=args.concurrency,
+        token_budget=args.token_budget,
+        response_cache=not args.no_cache,
+    )
     func_names = [n.strip() for n in args.functions.split(",")] if args.functions else None
 
     try:
@@ -473,6 +542,7 @@ def main():
             function_names=func_names,
             num_functions=args.num_functions,
             llm_config=llm_config,
+            gen_config=gen_config,
         )
     except Exception as e:
         logger.error(f"Generation failed: {e}", exc_info=True)
@@ -6,189 +6,197 @@ nodes and edges the cascade engine operates on.
 
 Scope types: organization, function, sub_function, job_family, role
 Each returns a self-contained data structure the cascade engine can process.
+
+A scope is materialized in one query: the scope's roles are matched, and
+each role row carries its titles, workloads → tasks → task skills, skills
+and technologies as nested pattern comprehensions. Materialized scopes are
+cached per (scope_type, scope_name) until the graph version moves
+(graph/version.py) or the entry outlives the TTL. Cached scope data is
+shared between callers: treat it as read-only and deep-copy before
+mutating (the cascade engine does mutate tasks).
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-
-logger = logging.getLogger(__name__)
-
-
-class ScopeSelector:
-    """Selects organizational scope and returns scoped data for simulation."""
-
-    def __init__(self, neo4j_conn):
-        self.conn = neo4j_conn
-
-    def select(
-        self,
-        scope_type: str,
-        scope_name: str,
-    ) -> Dict[str, Any]:
-        """
-        Select scope and return all entities within it.
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-        Args:
-            scope_type: 'organization', 'function', 'sub_function', 'job_family', 'role'
-            scope_name: Name of the entity to scope to
+from draup_world_model.digital_twin.graph.version import graph_version
 
-        Returns:
-            Dict with roles, titles, workloads, tasks, skills, technologies
-        """
-        logger.info(f"Selecting scope: {scope_type}={scope_name}")
+logger = logging.getLogger(__name__)
 
-        if scope_type == "function":
-            return self._scope_function(scope_name)
-        elif scope_type == "role":
-            return self._scope_role(scope_name)
-        elif scope_type == "organization":
-            return self._scope_organization(scope_name)
-        elif scope_type == "sub_function":
-            return self._scope_sub_function(scope_name)
-        elif scope_type == "job_family_group":
-            return self._scope_job_family_group(scope_name)
-        elif scope_type == "job_family":
-            return self._scope_job_family(scope_name)
-        else:
-            raise ValueError(f"Unsupported scope type: {scope_type}")
+SCOPE_CACHE_TTL = float(os.environ.get("DT_SCOPE_CACHE_TTL", 300))
+SCOPE_CACHE_SIZE = int(os.environ.get("DT_SCOPE_CACHE_SIZE", 32))
 
-    def _scope_function(self, function_name: str) -> Dict[str, Any]:
-        """Get all entities within a function."""
-        # Get roles
-        roles_query = """
-        MATCH (f:DTFunction {name: $name})
+# Role match per scope type; each binds r
+ROLE_MATCHES = {
+    "organization": """
+        MATCH (org:DTOrganization {name: $name})
+              -[:DT_CONTAINS]->(:DTFunction)
               -[:DT_CONTAINS]->(:DTSubFunction)
               -[:DT_CONTAINS]->(:DTJobFamilyGroup)
               -[:DT_CONTAINS]->(:DTJobFamily)
               -[:DT_HAS_ROLE]->(r:DTRole)
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(roles_query, {"name": function_name})
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
-
-        if not roles:
-            logger.warning(f"No roles found for function: {function_name}")
-            return self._empty_scope(function_name, "function")
-
-        return self._build_scope_data(function_name, "function", roles, role_ids)
-
-    def _scope_role(self, role_name: str) -> Dict[str, Any]:
-        """Get all entities for a single role."""
-        role_query = """
-        MATCH (r:DTRole {name: $name})
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(role_query, {"name": role_name})
-        if not role_records:
-            logger.warning(f"Role not found: {role_name}")
-            return self._empty_scope(role_name, "role")
-
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
-        return self._build_scope_data(role_name, "role", roles, role_ids)
-
-    def _scope_organization(self, org_name: str) -> Dict[str, Any]:
-        """Get all entities in the organization."""
-        roles_query = """
-        MATCH (org:DTOrganization {name: $name})
-              -[:DT_CONTAINS]->(:DTFunction)
+    """,
+    "function": """
+        MATCH (f:DTFunction {name: $name})
               -[:DT_CONTAINS]->(:DTSubFunction)
               -[:DT_CONTAINS]->(:DTJobFamilyGroup)
               -[:DT_CONTAINS]->(:DTJobFamily)
               -[:DT_HAS_ROLE]->(r:DTRole)
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(roles_query, {"name": org_name})
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
-        return self._build_scope_data(org_name, "organization", roles, role_ids)
-
-    def _scope_sub_function(self, sub_function_name: str) -> Dict[str, Any]:
-        """Get all entities within a sub-function."""
-        roles_query = """
+    """,
+    "sub_function": """
         MATCH (sf:DTSubFunction {name: $name})
               -[:DT_CONTAINS]->(:DTJobFamilyGroup)
               -[:DT_CONTAINS]->(:DTJobFamily)
               -[:DT_HAS_ROLE]->(r:DTRole)
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(
-            roles_query, {"name": sub_function_name}
-        )
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
-
-        if not roles:
-            logger.warning(f"No roles found for sub-function: {sub_function_name}")
-            return self._empty_scope(sub_function_name, "sub_function")
-
-        return self._build_scope_data(sub_function_name, "sub_function", roles, role_ids)
-
-    def _scope_job_family_group(self, jfg_name: str) -> Dict[str, Any]:
-        """Get all entities within a job family group."""
-        roles_query = """
+    """,
+    "job_family_group": """
         MATCH (jfg:DTJobFamilyGroup {name: $name})
               -[:DT_CONTAINS]->(:DTJobFamily)
               -[:DT_HAS_ROLE]->(r:DTRole)
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(
-            roles_query, {"name": jfg_name}
-        )
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
-
-        if not roles:
-            logger.warning(f"No roles found for job family group: {jfg_name}")
-            return self._empty_scope(jfg_name, "job_family_group")
-
-        return self._build_scope_data(jfg_name, "job_family_group", roles, role_ids)
-
-    def _scope_job_family(self, job_family_name: str) -> Dict[str, Any]:
-        """Get all entities within a job family."""
-        roles_query = """
+    """,
+    "job_family": """
         MATCH (jf:DTJobFamily {name: $name})
               -[:DT_HAS_ROLE]->(r:DTRole)
-        RETURN r
-        """
-        role_records = self.conn.execute_read_query(
-            roles_query, {"name": job_family_name}
-        )
-        roles = [self._node_to_dict(r["r"]) for r in role_records]
-        role_ids = [r["id"] for r in roles]
+    """,
+    "role": """
+        MATCH (r:DTRole {name: $name})
+    """,
+}
+
+# Everything a simulation needs from one role, in a single row
+ROLE_SCOPE_DATA = """
+        RETURN r,
+               [(r)-[:DT_HAS_TITLE]->(jt:DTJobTitle) | jt] AS titles,
+               [(r)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload) | {
+                   workload: wl,
+                   tasks: [(wl)-[:DT_CONTAINS_TASK]->(t:DTTask) | {
+                       task: t,
+                       skills: [(t)-[rel:DT_REQUIRES_SKILL]->(ts:DTSkill) |
+                                {skill_id: ts.id, skill_name: ts.name, relevance: rel.relevance}]
+                   }]
+               }] AS workloads,
+               [(r)-[:DT_REQUIRES_SKILL]->(rs:DTSkill) | rs] AS skills,
+               [(r)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology) | tech] AS technologies
+"""
+
 
-        if not roles:
-            logger.warning(f"No roles found for job family: {job_family_name}")
-            return self._empty_scope(job_family_name, "job_family")
+class ScopeSelector:
+    """Selects organizational scope and returns scoped data for simulation."""
 
-        return self._build_scope_data(job_family_name, "job_family", roles, role_ids)
+    def __init__(self, neo4j_conn, ttl: float = SCOPE_CACHE_TTL, max_entries: int = SCOPE_CACHE_SIZE):
+        self.conn = neo4j_conn
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._version = graph_version()
+        self._lock = threading.Lock()
 
-    def _build_scope_data(
+    def select(
         self,
-        scope_name: str,
         scope_type: str,
-        roles: List[Dict],
-        role_ids: List[str],
+        scope_name: str,
     ) -> Dict[str, Any]:
-        """Build the full scope data structure from a set of roles."""
-        # Get titles for these roles
-        titles = self._get_titles(role_ids)
-        # Get workloads
-        workloads = self._get_workloads(role_ids)
-        workload_ids = [wl["id"] for wl in workloads]
-        # Get tasks
-        tasks = self._get_tasks(workload_ids)
-        # Get task-skill mappings (DTTask → DTSkill with relevance)
-        task_ids = [t["id"] for t in tasks]
-        task_skill_mappings = self._get_task_skill_mappings(task_ids)
-        # Get skills
-        skills = self._get_skills(role_ids)
-        # Get technologies
-        technologies = self._get_technologies(role_ids)
-        # Enrich roles with skill_ids (skills are relationships, not node properties)
-        self._enrich_roles_with_skill_ids(roles, role_ids)
+        """
+        Select scope and return all entities within it.
+
+        Args:
+            scope_type: 'organization', 'function', 'sub_function', 'job_family', 'role'
+            scope_name: Name of the entity to scope to
+
+        Returns:
+            Dict with roles, titles, workloads, tasks, skills, technologies.
+            May be shared with other callers; copy before mutating.
+        """
+        if scope_type not in ROLE_MATCHES:
+            raise ValueError(f"Unsupported scope type: {scope_type}")
 
+        key = (scope_type, scope_name)
+        cached = self._lookup(key)
+        if cached is not None:
+            logger.info(f"Scope cache hit: {scope_type}={scope_name}")
+            return cached
+
+        logger.info(f"Selecting scope: {scope_type}={scope_name}")
+        version = graph_version()
+        scope = self._materialize(scope_type, scope_name)
+
+        # Empty scopes are not cached: the graph may still be loading elsewhere
+        if scope["roles"]:
+            with self._lock:
+                if version == graph_version():
+                    self._cache[key] = (time.monotonic(), scope)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+        return scope
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._version != graph_version():
+                self._cache.clear()
+                self._version = graph_version()
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _materialize(self, scope_type: str, scope_name: str) -> Dict[str, Any]:
+        """Fetch the scope's roles and everything under them in one round-trip."""
+        records = self.conn.execute_read_query(
+            ROLE_MATCHES[scope_type] + ROLE_SCOPE_DATA, {"name": scope_name}
+        )
+        if not records:
+            logger.warning(f"No roles found for {scope_type}: {scope_name}")
+            return self._empty_scope(scope_name, scope_type)
+
+        roles: List[Dict] = []
+        titles: List[Dict] = []
+        workloads: List[Dict] = []
+        tasks: List[Dict] = []
+        task_skill_mappings: Dict[str, List[Dict]] = {}
+        skills: Dict[str, Dict] = {}
+        technologies: Dict[str, Dict] = {}
+
+        for record in records:
+            role = self._node_to_dict(record["r"])
+            role_skills = [self._node_to_dict(s) for s in record["skills"]]
+            # Skills are DT_REQUIRES_SKILL relationships, not DTRole properties;
+            # attach skill_ids so downstream code (e.g. skills_strategy) can read them
+            role["skill_ids"] = [s["id"] for s in role_skills]
+            roles.append(role)
+
+            titles.extend(self._node_to_dict(jt) for jt in record["titles"])
+            for wl in record["workloads"]:
+                workloads.append(self._node_to_dict(wl["workload"]))
+                for t in wl["tasks"]:
+                    task = self._node_to_dict(t["task"])
+                    tasks.append(task)
+                    for m in t["skills"]:
+                        task_skill_mappings.setdefault(task["id"], []).append({
+                            "skill_id": m["skill_id"],
+                            "skill_name": m["skill_name"],
+                            "relevance": m.get("relevance", "SECONDARY"),
+                        })
+            for s in role_skills:
+                skills.setdefault(s["id"], s)
+            for tech in record["technologies"]:
+                tech = self._node_to_dict(tech)
+                technologies.setdefault(tech["id"], tech)
+
+        skills_list = list(skills.values())
+        tech_list = list(technologies.values())
         scope = {
             "scope_name": scope_name,
             "scope_type": scope_type,
@@ -197,114 +205,25 @@ class ScopeSelector:
             "workloads": workloads,
             "tasks": tasks,
             "task_skill_mappings": task_skill_mappings,
-            "skills": skills,
-            "technologies": technologies,
+            "skills": skills_list,
+            "technologies": tech_list,
             "summary": {
                 "role_count": len(roles),
                 "title_count": len(titles),
                 "workload_count": len(workloads),
                 "task_count": len(tasks),
-                "skill_count": len(skills),
-                "tech_count": len(technologies),
+                "skill_count": len(skills_list),
+                "tech_count": len(tech_list),
                 "total_headcount": sum(r.get("computed_headcount") or 0 for r in roles),
             },
         }
 
         logger.info(
             f"Scope selected: {scope_type}={scope_name}, "
-            f"{len(roles)} roles, {len(tasks)} tasks, {len(skills)} skills"
+            f"{len(roles)} roles, {len(tasks)} tasks, {len(skills_list)} skills"
         )
         return scope
 
-    def _get_titles(self, role_ids: List[str]) -> List[Dict]:
-        query = """
-        UNWIND $role_ids AS rid
-        MATCH (r:DTRole {id: rid})-[:DT_HAS_TITLE]->(jt:DTJobTitle)
-        RETURN jt
-        """
-        records = self.conn.execute_read_query(query, {"role_ids": role_ids})
-        return [self._node_to_dict(r["jt"]) for r in records]
-
-    def _get_workloads(self, role_ids: List[str]) -> List[Dict]:
-        query = """
-        UNWIND $role_ids AS rid
-        MATCH (r:DTRole {id: rid})-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-        RETURN wl
-        """
-        records = self.conn.execute_read_query(query, {"role_ids": role_ids})
-        return [self._node_to_dict(r["wl"]) for r in records]
-
-    def _get_tasks(self, workload_ids: List[str]) -> List[Dict]:
-        if not workload_ids:
-            return []
-        query = """
-        UNWIND $wl_ids AS wid
-        MATCH (wl:DTWorkload {id: wid})-[:DT_CONTAINS_TASK]->(t:DTTask)
-        RETURN t
-        """
-        records = self.conn.execute_read_query(query, {"wl_ids": workload_ids})
-        return [self._node_to_dict(r["t"]) for r in records]
-
-    def _get_task_skill_mappings(self, task_ids: List[str]) -> Dict[str, List[Dict]]:
-        """Fetch task-to-skill mappings via (DTTask)-[:DT_REQUIRES_SKILL]->(DTSkill).
-
-        Returns:
-            Dict mapping task_id to list of {skill_id, skill_name, relevance}
-        """
-        if not task_ids:
-            return {}
-        query = """
-        UNWIND $task_ids AS tid
-        MATCH (t:DTTask {id: tid})-[rel:DT_REQUIRES_SKILL]->(s:DTSkill)
-        RETURN t.id AS task_id, s.id AS skill_id, s.name AS skill_name,
-               rel.relevance AS relevance
-        """
-        records = self.conn.execute_read_query(query, {"task_ids": task_ids})
-        mappings: Dict[str, List[Dict]] = {}
-        for r in records:
-            mappings.setdefault(r["task_id"], []).append({
-                "skill_id": r["skill_id"],
-                "skill_name": r["skill_name"],
-                "relevance": r.get("relevance", "SECONDARY"),
-            })
-        return mappings
-
-    def _get_skills(self, role_ids: List[str]) -> List[Dict]:
-        query = """
-        UNWIND $role_ids AS rid
-        MATCH (r:DTRole {id: rid})-[:DT_REQUIRES_SKILL]->(s:DTSkill)
-        RETURN DISTINCT s
-        """
-        records = self.conn.execute_read_query(query, {"role_ids": role_ids})
-        return [self._node_to_dict(r["s"]) for r in records]
-
-    def _enrich_roles_with_skill_ids(self, roles: List[Dict], role_ids: List[str]):
-        """Add skill_ids list to each role dict.
-
-        Skills are stored as DT_REQUIRES_SKILL relationships, not as a property
-        on DTRole nodes. This method queries the relationships and attaches
-        skill_ids to each role so downstream code (e.g. skills_strategy) can
-        access role.skill_ids directly.
-        """
-        query = """
-        UNWIND $role_ids AS rid
-        MATCH (r:DTRole {id: rid})-[:DT_REQUIRES_SKILL]->(s:DTSkill)
-        RETURN r.id AS role_id, collect(s.id) AS skill_ids
-        """
-        records = self.conn.execute_read_query(query, {"role_ids": role_ids})
-        skill_map = {r["role_id"]: r["skill_ids"] for r in records}
-        for role in roles:
-            role["skill_ids"] = skill_map.get(role["id"], [])
-
-    def _get_technologies(self, role_ids: List[str]) -> List[Dict]:
-        query = """
-        UNWIND $role_ids AS rid
-        MATCH (r:DTRole {id: rid})-[:DT_USES_TECHNOLOGY]->(t:DTTechnology)
-        RETURN DISTINCT t
-        """
-        records = self.conn.execute_read_query(query, {"role_ids": role_ids})
-        return [self._node_to_dict(r["t"]) for r in records]
-
     @staticmethod
     def _node_to_dict(node) -> Dict[str, Any]:
         """Convert a Neo4j node to a plain dict."""
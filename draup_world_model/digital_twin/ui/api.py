@@ -39,11 +39,12 @@ dt_api = Blueprint("dt_api", __name__, url_prefix="/api/dt")
 _neo4j_conn = None
 _scenario_manager = None
 _chat_engine = None
+_graph_view = None
 
 
 def init_api(neo4j_conn):
     """Initialize API with a Neo4j connection. Called once at app startup."""
-    global _neo4j_conn, _scenario_manager, _chat_engine
+    global _neo4j_conn, _scenario_manager, _chat_engine, _graph_view
     _neo4j_conn = neo4j_conn
 
     from draup_world_model.digital_twin.simulation.scenario_manager import (
@@ -51,6 +52,9 @@ def init_api(neo4j_conn):
     )
     _scenario_manager = ScenarioManager(neo4j_conn)
 
+    from draup_world_model.digital_twin.graph.graph_view import GraphViewService
+    _graph_view = GraphViewService(neo4j_conn)
+
     # Initialize chat engine — load schema once at startup
     try:
         from draup_world_model.digital_twin.chat.schema import schema_context
@@ -76,6 +80,12 @@ def _get_manager():
     return _scenario_manager
 
 
+def _get_graph_view():
+    if _graph_view is None:
+        raise RuntimeError("API not initialized - call init_api() first")
+    return _graph_view
+
+
 # ── Readiness & Validation ──────────────────────────────────────────
 
 
@@ -378,9 +388,7 @@ def get_hierarchy():
 def get_scope(scope_type: str, scope_name: str):
     """Get all entities within an organizational scope."""
     try:
-        from draup_world_model.digital_twin.simulation.scope_selector import ScopeSelector
-        selector = ScopeSelector(_get_conn())
-        data = selector.select(scope_type, scope_name)
+        data = _get_manager().scope_selector.select(scope_type, scope_name)
         return jsonify({"scope": data})
     except Exception as e:
         logger.error(f"Scope selection failed: {e}")
@@ -679,165 +687,14 @@ def get_graph():
         limit       - Max nodes to return (default: 300)
     """
     try:
-        conn = _get_conn()
         scope_type = request.args.get("scope_type", "organization")
         scope_name = request.args.get("scope_name", "")
         node_types_param = request.args.get("node_types", "")
-        limit = min(int(request.args.get("limit", "300")), 500)
+        limit = int(request.args.get("limit", "300"))
 
         allowed_types = node_types_param.split(",") if node_types_param else []
 
-        # Common tail for all scope queries: collect nodes, find edges, return
-        _graph_tail = """
-            UNWIND all_nodes AS n
-            WITH DISTINCT n
-            WHERE n IS NOT NULL
-            WITH collect(n) AS nodes
-            UNWIND nodes AS a
-            UNWIND nodes AS b
-            WITH nodes, a, b
-            WHERE id(a) < id(b)
-            OPTIONAL MATCH (a)-[r]->(b) WHERE type(r) STARTS WITH 'DT_'
-            WITH nodes, collect({src: a.id, tgt: b.id, rel: type(r)}) AS rels_raw
-            UNWIND nodes AS n
-            WITH collect(DISTINCT {
-                id: n.id,
-                label: [l IN labels(n) WHERE l STARTS WITH 'DT'][0],
-                name: n.name,
-                headcount: COALESCE(n.computed_headcount, 0),
-                automation: COALESCE(n.automation_potential, n.automation_score),
-                description: n.description
-            }) AS node_list,
-            [r IN rels_raw WHERE r.rel IS NOT NULL] AS edge_list
-            RETURN node_list, edge_list
-        """
-
-        # Build the scope-specific query to collect nodes and relationships
-        if scope_type == "role" and scope_name:
-            query = """
-            MATCH (role:DTRole {name: $scope_name})
-            OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-            OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT role) + collect(DISTINCT wl) +
-                 collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {"scope_name": scope_name}
-        elif scope_type == "sub_function" and scope_name:
-            query = """
-            MATCH (sf:DTSubFunction {name: $scope_name})
-            OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
-            OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
-            OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
-            OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-            OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT sf) + collect(DISTINCT jfg) +
-                 collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
-                 collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {"scope_name": scope_name}
-        elif scope_type == "job_family_group" and scope_name:
-            query = """
-            MATCH (jfg:DTJobFamilyGroup {name: $scope_name})
-            OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
-            OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
-            OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-            OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT jfg) + collect(DISTINCT jf) + collect(DISTINCT role) +
-                 collect(DISTINCT wl) + collect(DISTINCT task) +
-                 collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {"scope_name": scope_name}
-        elif scope_type == "job_family" and scope_name:
-            query = """
-            MATCH (jf:DTJobFamily {name: $scope_name})
-            OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
-            OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-            OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
-                 collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {"scope_name": scope_name}
-        elif scope_type == "function" and scope_name:
-            query = """
-            MATCH (f:DTFunction {name: $scope_name})
-            OPTIONAL MATCH (f)-[:DT_CONTAINS]->(sf:DTSubFunction)
-            OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
-            OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
-            OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
-            OPTIONAL MATCH (role)-[:DT_HAS_WORKLOAD]->(wl:DTWorkload)
-            OPTIONAL MATCH (wl)-[:DT_CONTAINS_TASK]->(task:DTTask)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT f) + collect(DISTINCT sf) + collect(DISTINCT jfg) +
-                 collect(DISTINCT jf) + collect(DISTINCT role) + collect(DISTINCT wl) +
-                 collect(DISTINCT task) + collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {"scope_name": scope_name}
-        else:
-            # Organization-wide: taxonomy + roles + skills + technologies (no tasks/workloads for perf)
-            query = """
-            MATCH (o:DTOrganization)-[:DT_CONTAINS]->(f:DTFunction)
-            OPTIONAL MATCH (f)-[:DT_CONTAINS]->(sf:DTSubFunction)
-            OPTIONAL MATCH (sf)-[:DT_CONTAINS]->(jfg:DTJobFamilyGroup)
-            OPTIONAL MATCH (jfg)-[:DT_CONTAINS]->(jf:DTJobFamily)
-            OPTIONAL MATCH (jf)-[:DT_HAS_ROLE]->(role:DTRole)
-            OPTIONAL MATCH (role)-[:DT_REQUIRES_SKILL]->(skill:DTSkill)
-            OPTIONAL MATCH (role)-[:DT_USES_TECHNOLOGY]->(tech:DTTechnology)
-            WITH collect(DISTINCT o) + collect(DISTINCT f) + collect(DISTINCT sf) +
-                 collect(DISTINCT jfg) + collect(DISTINCT jf) + collect(DISTINCT role) +
-                 collect(DISTINCT skill) + collect(DISTINCT tech) AS all_nodes
-            """ + _graph_tail
-            params = {}
-
-        result = conn.execute_read_query(query, params)
-
-        if not result:
-            return jsonify({"nodes": [], "edges": [], "node_types": [], "edge_types": []})
-
-        row = result[0]
-        raw_nodes = row.get("node_list", [])
-        raw_edges = row.get("edge_list", [])
-
-        # Apply node_types filter and limit
-        nodes = []
-        node_ids = set()
-        for n in raw_nodes:
-            if not n.get("id"):
-                continue
-            if allowed_types and n.get("label") not in allowed_types:
-                continue
-            if len(nodes) >= limit:
-                break
-            nodes.append(n)
-            node_ids.add(n["id"])
-
-        # Filter edges to only include visible nodes
-        edges = []
-        for e in raw_edges:
-            if e.get("src") in node_ids and e.get("tgt") in node_ids:
-                edges.append({
-                    "source": e["src"],
-                    "target": e["tgt"],
-                    "type": e["rel"],
-                })
-
-        node_types = sorted(set(n["label"] for n in nodes if n.get("label")))
-        edge_types = sorted(set(e["type"] for e in edges if e.get("type")))
-
-        return jsonify({
-            "nodes": nodes,
-            "edges": edges,
-            "node_types": node_types,
-            "edge_types": edge_types,
-        })
+        return jsonify(_get_graph_view().get(scope_type, scope_name, allowed_types, limit))
 
     except Exception as e:
         logger.error(f"Graph fetch failed: {e}\n{traceback.format_exc()}")
@@ -6,21 +6,24 @@ Provides both:
   2. A standalone FastAPI app for independent development
 
 Stocks: Organization data (roles, tasks, skills, tools, human system)
-Flows:  Loaded once at startup per company, served via REST endpoints
+Flows:  Loaded per company into versioned snapshots (api/org_store.py), served via REST endpoints
 """
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Dict, Optional
+from typing import Optional
 
 from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 
-from services.auth import verify_token
+from services.auth import verify_token_async
 
-from workforce_twin_modeling.engine.loader import load_organization, OrganizationData
-from workforce_twin_modeling.engine.gap_engine import compute_snapshot, classify_task
+from workforce_twin_modeling.engine.loader import OrganizationData
+from workforce_twin_modeling.engine.cascade_cache import get_cascade_cache
+from workforce_twin_modeling.engine.executor import get_scenario_executor
+from workforce_twin_modeling.api.org_store import CompanyNotFound, OrgSnapshot, OrgStore
 
 logger = logging.getLogger("workforce_twin")
 
@@ -37,11 +40,7 @@ if _SKIP_AUTH:
     logger.info("Auth SKIPPED (WORKFORCE_TWIN_SKIP_AUTH=1)")
     logger.info(f"Default company: {_DEFAULT_COMPANY}")
 
-# ── Per-company cache ──────────────────────────────────────────────
-
-_org_cache: Dict[str, OrganizationData] = {}
-_snapshot_cache: Dict[str, object] = {}
-
+# ── Per-company org store ──────────────────────────────────────────
 
 def _available_companies() -> list:
     """List company directories under data/."""
@@ -81,13 +80,31 @@ def _resolve_data_dir(company: str) -> str:
     return ""
 
 
-def get_org(company: str) -> OrganizationData:
-    """Load and cache organization data for a company."""
-    if company in _org_cache:
-        return _org_cache[company]
+_org_store: Optional[OrgStore] = None
+
+
+def get_org_store() -> OrgStore:
+    """Process-wide org store, created on first use."""
+    global _org_store
+    if _org_store is None:
+        _org_store = OrgStore(_resolve_data_dir)
+    return _org_store
+
+
+def warm_org_store() -> None:
+    """Start loading every available company in the background."""
+    companies = _available_companies()
+    if _DEFAULT_COMPANY in companies:
+        companies.insert(0, companies.pop(companies.index(_DEFAULT_COMPANY)))
+    logger.info(f"Preloading companies: {companies}")
+    get_org_store().warm(companies)
+
 
-    data_dir = _resolve_data_dir(company)
-    if not data_dir:
+def get_org_snapshot(company: str) -> OrgSnapshot:
+    """The current snapshot of a company's org. Raises 404 if there is no data for it."""
+    try:
+        return get_org_store().get(company)
+    except CompanyNotFound:
         available = _available_companies()
         logger.error(f"Company data not found: '{company}'. Available: {available}")
         raise HTTPException(
@@ -95,30 +112,20 @@ def get_org(company: str) -> OrganizationData:
             detail=f"No data for company '{company}'. Available: {available}",
         )
 
-    logger.info(f"Loading data for company: {company} from {data_dir}")
-    org = load_organization(data_dir)
-    for task in org.tasks.values():
-        wl = org.workloads[task.workload_id]
-        role = org.roles[wl.role_id]
-        classify_task(task, org.tools, role.function)
-
-    _org_cache[company] = org
-    logger.info(
-        f"Loaded company '{company}': {len(org.roles)} roles, "
-        f"{len(org.tasks)} tasks, {len(org.tools)} tools"
-    )
-    return org
 
+async def get_org(company: str) -> OrganizationData:
+    """
+    Organization data for a company, loaded on first use and reloaded in the
+    background when its files change. Shared between requests: read only.
+    A first load takes seconds, so it runs on a worker thread.
+    """
+    return (await run_in_threadpool(get_org_snapshot, company)).org
 
-def get_snapshot(company: str):
-    """Compute and cache gap analysis snapshot for a company."""
-    if company in _snapshot_cache:
-        return _snapshot_cache[company]
 
-    snap = compute_snapshot(get_org(company))
-    _snapshot_cache[company] = snap
-    logger.info(f"Computed snapshot for company: {company}")
-    return snap
+async def get_snapshot(company: str):
+    """Gap analysis snapshot for the current version of a company's org."""
+    snapshot = await run_in_threadpool(get_org_snapshot, company)
+    return await run_in_threadpool(snapshot.gap_snapshot)
 
 
 # ── Company resolution dependency ──────────────────────────────────
@@ -127,9 +134,9 @@ async def _resolve_company_from_token(
     authorization: Optional[str] = Header(None),
 ) -> str:
     """
-    Extract company_name from the auth token via verify_token.
-    The verify_token dependency hits the Draup API and returns user details
-    including company info.
+    Extract company_name from the auth token via verify_token_async.
+    The verification result (user details including company info) is cached,
+    so repeating it after the router dependency does not hit the Draup API.
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing Authorization header")
@@ -142,7 +149,7 @@ async def _resolve_company_from_token(
     creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
 
     try:
-        result = verify_token(creds)
+        result = await verify_token_async(creds)
     except HTTPException:
         raise
 
@@ -188,7 +195,7 @@ from workforce_twin_modeling.api.routes import (
     organization, snapshot, cascade, simulate, scenarios, compare,
 )
 
-_auth_deps = [] if _SKIP_AUTH else [Depends(verify_token)]
+_auth_deps = [] if _SKIP_AUTH else [Depends(verify_token_async)]
 
 router = APIRouter(
     prefix="/v1/workforce-twin",
@@ -206,7 +213,7 @@ router.include_router(compare.router)
 
 @router.get("/health")
 async def health(company: str = Depends(resolve_company)):
-    org = get_org(company)
+    org = await get_org(company)
     return {
         "status": "ok",
         "company": company,
@@ -215,6 +222,8 @@ async def health(company: str = Depends(resolve_company)):
         "skills": len(org.skills),
         "tools": len(org.tools),
         "functions": org.functions,
+        "cascade_cache": get_cascade_cache().stats(),
+        "org_store": get_org_store().stats(),
     }
 
 
@@ -232,16 +241,10 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        companies = _available_companies()
-        logger.info(f"Available companies: {companies}")
-        if _DEFAULT_COMPANY in companies:
-            org = get_org(_DEFAULT_COMPANY)
-            get_snapshot(_DEFAULT_COMPANY)
-            logger.info(
-                f"Workforce Twin API ready — {_DEFAULT_COMPANY}: "
-                f"{len(org.roles)} roles, {len(org.tasks)} tasks"
-            )
+        warm_org_store()
         yield
+        get_org_store().shutdown()
+        get_scenario_executor().shutdown()
 
     standalone = FastAPI(
         title="Workforce Twin by Etter",
@@ -0,0 +1,251 @@
+"""
+Org Store
+=========
+Versioned, per-company cache of loaded organizations for the API.
+
+  - Each company is held as an OrgSnapshot: the loaded, classified org, the
+    version of the CSVs it came from, and its gap snapshot (computed on first
+    use). A snapshot is never modified once published; request handlers only
+    read it.
+  - A reload builds a complete new snapshot off to the side and publishes it
+    with one dict assignment. Requests already holding the old snapshot
+    finish on it.
+  - CSV changes are noticed on access, at most once per RELOAD_INTERVAL
+    seconds per company, and reloaded in the background: requests keep being
+    served from the current snapshot meanwhile.
+  - Companies are preloaded at startup in the background (``warm``). A
+    request for a company that is not loaded yet waits for its load; loads
+    of one company are never duplicated.
+  - Loaded orgs are kept within a memory budget. The least recently used
+    companies are evicted first, from this process, its cascade cache and
+    the scenario workers, and simply load again on their next request.
+
+Principle: one immutable snapshot per version — readers never see a
+           half-loaded or half-reloaded org.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from workforce_twin_modeling.engine.cascade_cache import get_cascade_cache
+from workforce_twin_modeling.engine.executor import get_scenario_executor, prepare_organization
+from workforce_twin_modeling.engine.gap_engine import OrgGapResult, compute_snapshot
+from workforce_twin_modeling.engine.loader import DATA_FILES, OrganizationData, data_version
+
+logger = logging.getLogger("workforce_twin")
+
+# Memory budget for loaded orgs, across companies
+ORG_CACHE_MB = int(os.environ.get("WORKFORCE_TWIN_ORG_CACHE_MB", 1024))
+# How often (seconds) a company's CSVs are checked for changes
+RELOAD_INTERVAL = float(os.environ.get("WORKFORCE_TWIN_RELOAD_INTERVAL", 30))
+# A loaded org takes roughly this many bytes per byte of CSV (measured on the Acme data)
+MEMORY_PER_CSV_BYTE = 8
+
+
+def estimate_size(data_dir: str) -> int:
+    """Approximate memory a loaded org from data_dir takes, in bytes."""
+    total = 0
+    for name in DATA_FILES:
+        try:
+            total += os.path.getsize(os.path.join(data_dir, name))
+        except OSError:
+            pass
+    return total * MEMORY_PER_CSV_BYTE
+
+
+@dataclass(eq=False)
+class OrgSnapshot:
+    """One loaded version of a company's org. Read-only once published."""
+    company: str
+    org: OrganizationData
+    size_bytes: int
+    loaded_at: float = field(default_factory=time.time)
+    _gap: Optional[OrgGapResult] = field(default=None, repr=False)
+    _gap_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def version(self) -> str:
+        return self.org.version
+
+    @property
+    def data_dir(self) -> str:
+        return self.org.data_dir
+
+    def gap_snapshot(self) -> OrgGapResult:
+        """The gap analysis of this version, computed once."""
+        if self._gap is None:
+            with self._gap_lock:
+                if self._gap is None:
+                    self._gap = compute_snapshot(self.org)
+        return self._gap
+
+
+class CompanyNotFound(LookupError):
+    pass
+
+
+class OrgStore:
+    """
+    Per-company OrgSnapshots, reloaded when their CSVs change and evicted
+    least recently used first when over budget.
+
+    resolve_data_dir maps a company name to its data directory ("" if none).
+    """
+
+    def __init__(
+        self,
+        resolve_data_dir: Callable[[str], str],
+        budget_bytes: int = ORG_CACHE_MB * 1024 * 1024,
+        reload_interval: float = RELOAD_INTERVAL,
+    ):
+        self._resolve = resolve_data_dir
+        self.budget_bytes = budget_bytes
+        self.reload_interval = reload_interval
+        self._snapshots: "OrderedDict[str, OrgSnapshot]" = OrderedDict()
+        self._checked: Dict[str, float] = {}
+        self._refreshing: Set[str] = set()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="org-store")
+
+    # ── Reads ──
+
+    def get(self, company: str) -> OrgSnapshot:
+        """The current snapshot of a company, loading it first if needed."""
+        with self._lock:
+            snapshot = self._snapshots.get(company)
+            if snapshot is not None:
+                self._snapshots.move_to_end(company)
+                due = time.monotonic() - self._checked.get(company, 0.0) >= self.reload_interval
+        if snapshot is None:
+            return self._load(company)
+        if due:
+            self._schedule_refresh(company)
+        return snapshot
+
+    def peek(self, company: str) -> Optional[OrgSnapshot]:
+        """The current snapshot of a company if it is loaded; never loads."""
+        with self._lock:
+            return self._snapshots.get(company)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "companies": {c: {"version": s.version, "size_mb": round(s.size_bytes / 2**20, 1)}
+                              for c, s in self._snapshots.items()},
+                "used_mb": round(sum(s.size_bytes for s in self._snapshots.values()) / 2**20, 1),
+                "budget_mb": round(self.budget_bytes / 2**20, 1),
+            }
+
+    # ── Loading ──
+
+    def _load(self, company: str, replace: Optional[OrgSnapshot] = None) -> OrgSnapshot:
+        """
+        Load a company and publish it. With replace, only publish if that
+        snapshot is still the current one (a reload); otherwise, only load if
+        nothing is published yet.
+        """
+        with self._lock:
+            load_lock = self._load_locks.setdefault(company, threading.Lock())
+        with load_lock:
+            current = self.peek(company)
+            if current is not None and current is not replace:
+                return current
+
+            data_dir = self._resolve(company)
+            if not data_dir:
+                raise CompanyNotFound(company)
+            started = time.perf_counter()
+            snapshot = OrgSnapshot(
+                company=company,
+                org=prepare_organization(data_dir),
+                size_bytes=estimate_size(data_dir),
+            )
+            get_scenario_executor().preload(data_dir, snapshot.version)
+            self._publish(company, snapshot, replaced=current)
+            logger.info(
+                f"Loaded company '{company}' version {snapshot.version} in "
+                f"{time.perf_counter() - started:.2f}s: {len(snapshot.org.roles)} roles, "
+                f"{len(snapshot.org.tasks)} tasks, {len(snapshot.org.tools)} tools"
+            )
+            return snapshot
+
+    def _publish(self, company: str, snapshot: OrgSnapshot, replaced: Optional[OrgSnapshot]) -> None:
+        evicted = []
+        with self._lock:
+            self._snapshots[company] = snapshot
+            self._snapshots.move_to_end(company)
+            self._checked[company] = time.monotonic()
+            used = sum(s.size_bytes for s in self._snapshots.values())
+            while used > self.budget_bytes and len(self._snapshots) > 1:
+                name, old = next(iter(self._snapshots.items()))
+                if name == company:
+                    break
+                del self._snapshots[name]
+                self._checked.pop(name, None)
+                used -= old.size_bytes
+                evicted.append(old)
+
+        cache = get_cascade_cache()
+        if replaced is not None and replaced.version != snapshot.version:
+            cache.invalidate(replaced.version)
+        for old in evicted:
+            cache.invalidate(old.version)
+            get_scenario_executor().evict(old.data_dir)
+            logger.info(
+                f"Evicted company '{old.company}' ({old.size_bytes / 2**20:.1f} MB) "
+                f"to stay within {self.budget_bytes / 2**20:.0f} MB"
+            )
+
+    # ── Reloading ──
+
+    def _schedule_refresh(self, company: str) -> None:
+        with self._lock:
+            if company in self._refreshing:
+                return
+            self._refreshing.add(company)
+        self._background.submit(self._refresh, company)
+
+    def _refresh(self, company: str) -> None:
+        try:
+            current = self.peek(company)
+            if current is None:
+                return
+            if data_version(current.data_dir) == current.version:
+                with self._lock:
+                    self._checked[company] = time.monotonic()
+                return
+            logger.info(f"Data for company '{company}' changed on disk; reloading")
+            self._load(company, replace=current)
+        except Exception as e:
+            logger.error(f"Reloading company '{company}' failed; still serving the old version: {e}")
+            with self._lock:
+                self._checked[company] = time.monotonic()
+        finally:
+            with self._lock:
+                self._refreshing.discard(company)
+
+    def refresh(self, company: str) -> OrgSnapshot:
+        """Reload a company now if its CSVs changed. Returns the current snapshot."""
+        self._refresh(company)
+        return self.get(company)
+
+    # ── Lifecycle ──
+
+    def warm(self, companies: Iterable[str]) -> List[Future]:
+        """Load companies in the background, e.g. at startup."""
+        return [self._background.submit(self._warm_one, company) for company in companies]
+
+    def _warm_one(self, company: str) -> None:
+        try:
+            self.get(company).gap_snapshot()
+        except Exception as e:
+            logger.warning(f"Could not preload company '{company}': {e}")
+
+    def shutdown(self) -> None:
+        self._background.shutdown(wait=False, cancel_futures=True)
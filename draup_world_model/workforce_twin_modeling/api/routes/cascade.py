@@ -27,7 +27,7 @@ class CascadeRequest(BaseModel):
 @router.post("/cascade")
 async def run_cascade_endpoint(req: CascadeRequest, company: str = Depends(resolve_company)):
     """Run the 9-step cascade for a given stimulus configuration."""
-    org = get_org(company)
+    org = await get_org(company)
 
     target_fns = req.target_functions if req.target_functions else org.functions
     stimulus = Stimulus(
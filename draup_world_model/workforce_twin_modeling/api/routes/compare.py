@@ -1,17 +1,25 @@
 """Multi-scenario comparison endpoint."""
-from typing import List, Optional
+import json
+import logging
+from contextlib import aclosing
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from workforce_twin_modeling.api.app import get_org, resolve_company
 from workforce_twin_modeling.api.serializers import serialize_fb_result, _r
 
 from workforce_twin_modeling.engine.cascade import Stimulus
+from workforce_twin_modeling.engine.executor import get_scenario_executor
 from workforce_twin_modeling.engine.feedback import FeedbackParams
 from workforce_twin_modeling.engine.rates import SimulationParams, RateParams, ALL_SCENARIOS
 from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback
 
+logger = logging.getLogger("workforce_twin")
+
 router = APIRouter(tags=["compare"])
 
 
@@ -35,78 +43,119 @@ class CompareRequest(BaseModel):
     """Request to compare multiple scenarios."""
     scenarios: List[CompareScenario]
     trace: bool = False
+    stream: bool = False  # server-sent events, one per scenario as it finishes
 
 
-@router.post("/compare")
-async def compare_scenarios(req: CompareRequest, company: str = Depends(resolve_company)):
-    """Run multiple scenarios and return comparison data."""
-    org = get_org(company)
-    results = []
-
-    for sc in req.scenarios:
-        scenario_name = sc.name
-        if sc.preset_id and sc.preset_id.upper() in ALL_SCENARIOS:
-            preset = ALL_SCENARIOS[sc.preset_id.upper()]
-            scenario_name = scenario_name or preset.scenario_name
-            stimulus = Stimulus(
-                name=scenario_name,
-                stimulus_type="technology_injection",
-                tools=sc.tools,
-                target_scope="ALL",
-                target_functions=org.functions,
-                policy=preset.policy,
-                absorption_factor=preset.absorption_factor,
-            )
-            sim_result = simulate_with_feedback(stimulus, org, preset, trace=req.trace)
-        else:
-            target_fns = sc.target_functions if sc.target_functions else org.functions
-            scenario_name = scenario_name or "Custom"
-            stimulus = Stimulus(
-                name=scenario_name,
-                stimulus_type="technology_injection",
-                tools=sc.tools,
-                target_scope="function" if len(target_fns) < len(org.functions) else "ALL",
-                target_functions=target_fns,
-                policy=sc.policy,
-                absorption_factor=0.35,
-            )
-            adopt = RateParams(alpha=sc.alpha_adopt, k=sc.k, midpoint=sc.midpoint)
-            expand = RateParams(alpha=sc.alpha_expand, k=sc.k, midpoint=sc.midpoint,
-                                delay_months=6) if sc.alpha_expand > 0 else None
-            extend = RateParams(alpha=sc.alpha_extend, k=sc.k, midpoint=sc.midpoint,
-                                delay_months=10) if sc.alpha_extend > 0 else None
-            params = SimulationParams(
-                scenario_id="CMP",
-                scenario_name=sc.name,
-                adoption=adopt, expansion=expand, extension=extend,
-                policy=sc.policy,
-                time_horizon_months=sc.time_horizon_months,
-                enable_workflow_automation=extend is not None,
-            )
-            sim_result = simulate_with_feedback(stimulus, org, params, trace=req.trace)
-
-        results.append({
-            "name": scenario_name,
-            "result": serialize_fb_result(sim_result),
-        })
-
-    # Build comparison matrix
-    metrics = [
-        "total_hc_reduced", "net_savings", "total_investment", "total_savings",
-        "payback_month", "final_proficiency", "final_trust", "final_readiness",
-        "productivity_valley_value", "avg_adoption_dampening",
-    ]
-    matrix = {m: [] for m in metrics}
+COMPARISON_METRICS = [
+    "total_hc_reduced", "net_savings", "total_investment", "total_savings",
+    "payback_month", "final_proficiency", "final_trust", "final_readiness",
+    "productivity_valley_value", "avg_adoption_dampening",
+]
+
+
+def _scenario_run(sc: CompareScenario, org) -> Tuple[str, dict]:
+    """Scenario name and the simulate_with_feedback arguments for one scenario."""
+    scenario_name = sc.name
+    if sc.preset_id and sc.preset_id.upper() in ALL_SCENARIOS:
+        preset = ALL_SCENARIOS[sc.preset_id.upper()]
+        scenario_name = scenario_name or preset.scenario_name
+        stimulus = Stimulus(
+            name=scenario_name,
+            stimulus_type="technology_injection",
+            tools=sc.tools,
+            target_scope="ALL",
+            target_functions=org.functions,
+            policy=preset.policy,
+            absorption_factor=preset.absorption_factor,
+        )
+        return scenario_name, {"stimulus": stimulus, "params": preset}
+
+    target_fns = sc.target_functions if sc.target_functions else org.functions
+    scenario_name = scenario_name or "Custom"
+    stimulus = Stimulus(
+        name=scenario_name,
+        stimulus_type="technology_injection",
+        tools=sc.tools,
+        target_scope="function" if len(target_fns) < len(org.functions) else "ALL",
+        target_functions=target_fns,
+        policy=sc.policy,
+        absorption_factor=0.35,
+    )
+    adopt = RateParams(alpha=sc.alpha_adopt, k=sc.k, midpoint=sc.midpoint)
+    expand = RateParams(alpha=sc.alpha_expand, k=sc.k, midpoint=sc.midpoint,
+                        delay_months=6) if sc.alpha_expand > 0 else None
+    extend = RateParams(alpha=sc.alpha_extend, k=sc.k, midpoint=sc.midpoint,
+                        delay_months=10) if sc.alpha_extend > 0 else None
+    params = SimulationParams(
+        scenario_id="CMP",
+        scenario_name=sc.name,
+        adoption=adopt, expansion=expand, extension=extend,
+        policy=sc.policy,
+        time_horizon_months=sc.time_horizon_months,
+        enable_workflow_automation=extend is not None,
+    )
+    return scenario_name, {"stimulus": stimulus, "params": params}
+
+
+def _comparison_matrix(results: List[dict]) -> dict:
+    matrix = {m: [] for m in COMPARISON_METRICS}
     for r in results:
         summary = r["result"]["summary"]
-        for m in metrics:
+        for m in COMPARISON_METRICS:
             matrix[m].append(summary.get(m, 0))
-
     return {
-        "scenarios": results,
-        "comparison_matrix": {
-            "metric_names": metrics,
-            "scenario_names": [r["name"] for r in results],
-            "values": matrix,
-        },
+        "metric_names": COMPARISON_METRICS,
+        "scenario_names": [r["name"] for r in results],
+        "values": matrix,
     }
+
+
+def _event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/compare")
+async def compare_scenarios(req: CompareRequest, company: str = Depends(resolve_company)):
+    """
+    Run multiple scenarios and return comparison data.
+
+    Scenarios run in parallel on the scenario executor. With ``stream: true``
+    the response is server-sent events: one ``scenario`` event per scenario
+    as it finishes (``failed`` if it raised), then a ``completed`` event with
+    the comparison matrix in request order.
+    """
+    org = await get_org(company)
+    runs = [_scenario_run(sc, org) for sc in req.scenarios]
+    scenarios = get_scenario_executor().stream(
+        org, simulate_with_feedback, [kwargs for _, kwargs in runs], trace=req.trace
+    )
+
+    if not req.stream:
+        results: List[Optional[dict]] = [None] * len(runs)
+        async with aclosing(scenarios):
+            async for index, future in scenarios:
+                result = await run_in_threadpool(serialize_fb_result, future.result())
+                results[index] = {"name": runs[index][0], "result": result}
+        return {"scenarios": results, "comparison_matrix": _comparison_matrix(results)}
+
+    async def events():
+        results: List[Optional[dict]] = [None] * len(runs)
+        async with aclosing(scenarios):
+            async for index, future in scenarios:
+                name = runs[index][0]
+                try:
+                    result = await run_in_threadpool(serialize_fb_result, future.result())
+                except Exception as e:
+                    logger.error(f"Compare scenario '{name}' failed: {e}", exc_info=True)
+                    yield _event("failed", {"index": index, "name": name, "error": str(e)})
+                    continue
+                results[index] = {"name": name, "result": result}
+                yield _event("scenario", {"index": index, **results[index]})
+        finished = [r for r in results if r is not None]
+        yield _event("completed", {"comparison_matrix": _comparison_matrix(finished)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
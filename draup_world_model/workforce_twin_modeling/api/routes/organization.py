@@ -10,19 +10,19 @@ router = APIRouter(tags=["organization"])
 @router.get("/org")
 async def get_organization(company: str = Depends(resolve_company)):
     """Full organization data — roles, workloads, tasks, skills, tools, human system."""
-    return serialize_org(get_org(company))
+    return serialize_org(await get_org(company))
 
 
 @router.get("/org/hierarchy")
 async def get_hierarchy(company: str = Depends(resolve_company)):
     """Org tree: function → sub_function → jfg → role."""
-    return serialize_org_hierarchy(get_org(company))
+    return serialize_org_hierarchy(await get_org(company))
 
 
 @router.get("/org/functions")
 async def get_functions(company: str = Depends(resolve_company)):
     """List of function names."""
-    org = get_org(company)
+    org = await get_org(company)
     result = []
     for fn in org.functions:
         role_ids = org.roles_by_function.get(fn, [])
@@ -42,7 +42,7 @@ async def get_functions(company: str = Depends(resolve_company)):
 @router.get("/org/roles/{role_id}")
 async def get_role_detail(role_id: str, company: str = Depends(resolve_company)):
     """Detailed role info with workloads, tasks, skills."""
-    org = get_org(company)
+    org = await get_org(company)
     role = org.roles.get(role_id)
     if not role:
         return {"error": f"Role {role_id} not found"}
@@ -102,7 +102,7 @@ async def get_role_detail(role_id: str, company: str = Depends(resolve_company))
 @router.get("/org/tools")
 async def get_tools(company: str = Depends(resolve_company)):
     """Available technology tools."""
-    org = get_org(company)
+    org = await get_org(company)
     return [
         {
             "tool_id": t.tool_id,
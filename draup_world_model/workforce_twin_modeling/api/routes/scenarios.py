@@ -1,12 +1,16 @@
 """Scenario catalog endpoints."""
+import json
 import os
+from contextlib import aclosing
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from workforce_twin_modeling.api.app import get_org, resolve_company, PROJECT_ROOT
 from workforce_twin_modeling.api.serializers import _r
 
-from workforce_twin_modeling.stages.scenario_executor import load_catalog, run_scenario, run_batch
+from workforce_twin_modeling.engine.executor import get_scenario_executor
+from workforce_twin_modeling.stages.scenario_executor import load_catalog, run_scenario, select_rows
 
 router = APIRouter(tags=["scenarios"])
 
@@ -25,43 +29,74 @@ async def get_catalog():
     }
 
 
+def _summary(r) -> dict:
+    return {
+        "scenario_id": r.scenario_id,
+        "scenario_name": r.scenario_name,
+        "family": r.family,
+        "direction": r.direction,
+        "status": "pass" if r.error is None else "fail",
+        "error": r.error,
+        "hc_reduced": r.hc_reduced,
+        "final_hc": r.final_hc,
+        "net_savings": _r(r.net_savings, 0),
+        "total_investment": _r(r.total_investment, 0),
+        "total_savings": _r(r.total_savings, 0),
+        "payback_month": r.payback_month,
+        "final_proficiency": _r(r.final_proficiency, 1),
+        "final_trust": _r(r.final_trust, 1),
+    }
+
+
+def _totals(results: list) -> dict:
+    return {
+        "total": len(results),
+        "passed": sum(1 for r in results if r["status"] == "pass"),
+        "failed": sum(1 for r in results if r["status"] == "fail"),
+    }
+
+
 @router.post("/scenarios/run")
 async def run_scenarios(
     scenario_ids: list[str] | None = None,
     families: list[str] | None = None,
+    stream: bool = False,
     company: str = Depends(resolve_company),
 ):
-    """Run a batch of scenarios from the catalog."""
+    """
+    Run a batch of scenarios from the catalog, in parallel on the scenario
+    executor. With ``stream=true`` the response is server-sent events: one
+    ``scenario`` event per scenario as it finishes, then a ``completed``
+    event with the totals.
+    """
     if not os.path.exists(CATALOG_PATH):
         return {"error": "Scenario catalog not found"}
 
-    org = get_org(company)
-    results = run_batch(CATALOG_PATH, org, scenario_ids=scenario_ids, families=families)
-
-    return {
-        "total": len(results),
-        "passed": sum(1 for r in results if r.error is None),
-        "failed": sum(1 for r in results if r.error is not None),
-        "results": [
-            {
-                "scenario_id": r.scenario_id,
-                "scenario_name": r.scenario_name,
-                "family": r.family,
-                "direction": r.direction,
-                "status": "pass" if r.error is None else "fail",
-                "error": r.error,
-                "hc_reduced": r.hc_reduced,
-                "final_hc": r.final_hc,
-                "net_savings": _r(r.net_savings, 0),
-                "total_investment": _r(r.total_investment, 0),
-                "total_savings": _r(r.total_savings, 0),
-                "payback_month": r.payback_month,
-                "final_proficiency": _r(r.final_proficiency, 1),
-                "final_trust": _r(r.final_trust, 1),
-            }
-            for r in results
-        ],
-    }
+    org = await get_org(company)
+    rows = select_rows(CATALOG_PATH, scenario_ids=scenario_ids, families=families)
+    scenarios = get_scenario_executor().stream(org, run_scenario, [{"row": row} for row in rows])
+
+    if not stream:
+        results = [None] * len(rows)
+        async with aclosing(scenarios):
+            async for index, future in scenarios:
+                results[index] = _summary(future.result())
+        return {**_totals(results), "results": results}
+
+    async def events():
+        results = []
+        async with aclosing(scenarios):
+            async for index, future in scenarios:
+                summary = _summary(future.result())
+                results.append(summary)
+                yield f"event: scenario\ndata: {json.dumps({'index': index, **summary})}\n\n"
+        yield f"event: completed\ndata: {json.dumps(_totals(results))}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/scenarios/run-single/{scenario_id}")
@@ -70,14 +105,14 @@ async def run_single_scenario(scenario_id: str, trace: bool = False, company: st
     if not os.path.exists(CATALOG_PATH):
         return {"error": "Scenario catalog not found"}
 
-    org = get_org(company)
+    org = await get_org(company)
     rows = load_catalog(CATALOG_PATH)
     row = next((r for r in rows if r["scenario_id"] == scenario_id), None)
     if not row:
         return {"error": f"Scenario '{scenario_id}' not found in catalog"}
 
     from api.serializers import serialize_fb_result
-    result = run_scenario(row, org, trace=trace)
+    result = await get_scenario_executor().call(org, run_scenario, row=row, trace=trace)
 
     if result.error:
         return {"error": result.error, "scenario_id": scenario_id}
@@ -1,15 +1,16 @@
 """Time-series simulation endpoints (with feedback loops)."""
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from workforce_twin_modeling.api.app import get_org, resolve_company
 from workforce_twin_modeling.api.serializers import serialize_fb_result, serialize_sim_params
+from workforce_twin_modeling.api.trace_store import get_trace_store
 
 from workforce_twin_modeling.engine.cascade import Stimulus
 from workforce_twin_modeling.engine.feedback import FeedbackParams, HumanSystemState
-from workforce_twin_modeling.engine.inverse_solver import solve_inverse
+from workforce_twin_modeling.engine.inverse_solver import params_for_alpha, solve_inverse
 from workforce_twin_modeling.engine.rates import (
     SimulationParams, RateParams, ALL_SCENARIOS,
     P1_CAUTIOUS, P2_BALANCED, P3_AGGRESSIVE, P4_CAPABILITY_FIRST, P5_ACCELERATED,
@@ -93,6 +94,7 @@ class SimulationRequest(BaseModel):
 
     # Trace
     trace: bool = False
+    trace_inline: bool = True   # False: return only trace_run_id, page via /simulate/trace/{run_id}
 
 
 @router.post("/simulate")
@@ -101,11 +103,11 @@ async def run_simulation(req: SimulationRequest, company: str = Depends(resolve_
 
     For target-based stimulus types (headcount_target, budget_constraint,
     automation_target, competitive), the engine runs inverse propagation:
-    binary search on adoption alpha to find the value that produces the
+    a batched grid search on adoption alpha for the value that produces the
     target outcome. The response includes an 'inverse_solve' section with
     solver metadata alongside the standard simulation result.
     """
-    org = get_org(company)
+    org = await get_org(company)
 
     target_fns = req.target_functions if req.target_functions else org.functions
 
@@ -165,15 +167,16 @@ async def run_simulation(req: SimulationRequest, company: str = Depends(resolve_
             fb_params=fb_params,
         )
         if solve_result is not None:
-            # Re-run the solved result with trace enabled if requested
+            # The solver's batched runs record no trace: re-run the solved alpha if one was requested
             if req.trace:
-                final_result = _rerun_with_trace(
-                    solve_result.solved_alpha, stimulus, org, params, fb_params,
+                final_result = simulate_with_feedback(
+                    stimulus, org, params_for_alpha(params, solve_result.solved_alpha), fb_params,
+                    trace=req.trace_inline, record_trace=True,
                 )
             else:
                 final_result = solve_result.simulation_result
 
-            response = serialize_fb_result(final_result)
+            response = _traced_response(final_result, company, req.trace_inline)
             response["inverse_solve"] = {
                 "solved": solve_result.solved,
                 "solved_alpha": round(solve_result.solved_alpha, 4),
@@ -190,8 +193,10 @@ async def run_simulation(req: SimulationRequest, company: str = Depends(resolve_
             return response
 
     # ── Standard forward simulation ──
-    result = simulate_with_feedback(stimulus, org, params, fb_params, trace=req.trace)
-    return serialize_fb_result(result)
+    result = simulate_with_feedback(
+        stimulus, org, params, fb_params, trace=req.trace and req.trace_inline, record_trace=req.trace,
+    )
+    return _traced_response(result, company, req.trace_inline)
 
 
 def _get_inverse_target(req: SimulationRequest) -> Optional[float]:
@@ -205,60 +210,26 @@ def _get_inverse_target(req: SimulationRequest) -> Optional[float]:
     return None
 
 
-def _rerun_with_trace(
-    solved_alpha: float,
-    stimulus: Stimulus,
-    org,
-    base_params: SimulationParams,
-    fb_params: FeedbackParams,
-):
-    """Re-run the simulation at the solved alpha with tracing enabled."""
-    adopt = RateParams(
-        alpha=solved_alpha,
-        k=base_params.adoption.k if base_params.adoption else 0.3,
-        midpoint=base_params.adoption.midpoint if base_params.adoption else 4.0,
-        delay_months=base_params.adoption.delay_months if base_params.adoption else 0,
-    )
-    scale = solved_alpha / max(0.01, base_params.adoption.alpha) if base_params.adoption else 1.0
-    expand = None
-    if base_params.expansion:
-        expand = RateParams(
-            alpha=min(1.0, base_params.expansion.alpha * scale),
-            k=base_params.expansion.k,
-            midpoint=base_params.expansion.midpoint,
-            delay_months=base_params.expansion.delay_months,
-        )
-    extend = None
-    if base_params.extension:
-        extend = RateParams(
-            alpha=min(1.0, base_params.extension.alpha * scale),
-            k=base_params.extension.k,
-            midpoint=base_params.extension.midpoint,
-            delay_months=base_params.extension.delay_months,
-        )
-    params = SimulationParams(
-        scenario_id=base_params.scenario_id,
-        scenario_name=base_params.scenario_name,
-        adoption=adopt,
-        expansion=expand,
-        extension=extend,
-        policy=base_params.policy,
-        absorption_factor=base_params.absorption_factor,
-        training_cost_per_person=base_params.training_cost_per_person,
-        time_horizon_months=base_params.time_horizon_months,
-        hc_review_frequency=base_params.hc_review_frequency,
-        reskilling_delay_months=base_params.reskilling_delay_months,
-        reskilling_rate=base_params.reskilling_rate,
-        enable_workflow_automation=base_params.enable_workflow_automation,
-        workflow_automation_bonus=base_params.workflow_automation_bonus,
-    )
-    return simulate_with_feedback(stimulus, org, params, fb_params, trace=True)
+def _traced_response(result, company: str, trace_inline: bool) -> dict:
+    """
+    Serialize result. A traced run is kept in the trace store and the
+    response carries its trace_run_id; without trace_inline, "trace" holds
+    only the metadata needed to page through it.
+    """
+    response = serialize_fb_result(result)
+    if result.compact_trace is not None:
+        response["trace_run_id"] = get_trace_store().put(company, result.compact_trace)
+        if not trace_inline:
+            response["trace"] = result.compact_trace.describe()
+    return response
 
 
 @router.post("/simulate/preset/{preset_id}")
-async def run_preset_simulation(preset_id: str, trace: bool = False, company: str = Depends(resolve_company)):
+async def run_preset_simulation(
+    preset_id: str, trace: bool = False, trace_inline: bool = True, company: str = Depends(resolve_company),
+):
     """Run a preset scenario (P1-P5) with default parameters."""
-    org = get_org(company)
+    org = await get_org(company)
     preset = ALL_SCENARIOS.get(preset_id.upper())
     if not preset:
         return {"error": f"Preset '{preset_id}' not found. Available: P1, P2, P3, P4, P5"}
@@ -273,8 +244,34 @@ async def run_preset_simulation(preset_id: str, trace: bool = False, company: st
         absorption_factor=preset.absorption_factor,
     )
 
-    result = simulate_with_feedback(stimulus, org, preset, trace=trace)
-    return serialize_fb_result(result)
+    result = simulate_with_feedback(stimulus, org, preset, trace=trace and trace_inline, record_trace=trace)
+    return _traced_response(result, company, trace_inline)
+
+
+@router.get("/simulate/trace/{run_id}")
+async def get_simulation_trace(
+    run_id: str,
+    start: int = Query(0, ge=0, description="First month"),
+    end: Optional[int] = Query(None, ge=0, description="Last month (inclusive); default the last"),
+    fields: Optional[str] = Query(None, description="Comma-separated raw fields; default the full MonthTraces"),
+    company: str = Depends(resolve_company),
+):
+    """A slice of a traced run, by the trace_run_id its simulation returned.
+
+    With fields, returns those raw per-month values as columns (see
+    "fields" in the run's trace metadata). Without, returns the full
+    MonthTrace of each month in the range.
+    """
+    trace = get_trace_store().get(company, run_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace '{run_id}' not found or expired; re-run the simulation")
+    if fields:
+        try:
+            columns = trace.columns([f.strip() for f in fields.split(",") if f.strip()], start, end)
+        except KeyError as e:
+            raise HTTPException(status_code=400, detail=str(e.args[0]))
+        return {"run_id": run_id, "columns": columns}
+    return {"run_id": run_id, **trace.to_trace(start, end).to_dict()}
 
 
 @router.get("/simulate/presets")
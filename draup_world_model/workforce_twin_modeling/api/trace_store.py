@@ -0,0 +1,82 @@
+"""
+Trace Store
+===========
+Recent simulation traces, kept by run id so clients can page through them.
+
+A traced simulation returns a ``trace_run_id``. The CompactTrace behind it
+stays here, and ``GET /simulate/trace/{run_id}`` serves month ranges or
+chosen fields from it without re-running the simulation. Traces are held
+within a memory budget, least recently used first out. An evicted run id
+simply answers 404; the client re-runs the simulation.
+
+Principle: a run id only resolves for the company that produced it.
+"""
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from workforce_twin_modeling.engine.trace_compact import CompactTrace
+
+logger = logging.getLogger("workforce_twin")
+
+# Memory budget for stored traces
+TRACE_CACHE_MB = int(os.environ.get("WORKFORCE_TWIN_TRACE_CACHE_MB", 64))
+
+
+class TraceStore:
+    """Thread-safe LRU of CompactTraces keyed by run id, within a byte budget."""
+
+    def __init__(self, budget_bytes: int = TRACE_CACHE_MB * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._traces: "OrderedDict[str, Tuple[str, CompactTrace]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def put(self, company: str, trace: CompactTrace) -> str:
+        """Store a trace for company and return its new run id."""
+        run_id = uuid.uuid4().hex
+        with self._lock:
+            self._traces[run_id] = (company, trace)
+            self._bytes += trace.nbytes
+            # The newest trace is always kept, even when it alone exceeds the budget
+            while self._bytes > self.budget_bytes and len(self._traces) > 1:
+                _, (_, evicted) = self._traces.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+        return run_id
+
+    def get(self, company: str, run_id: str) -> Optional[CompactTrace]:
+        """The trace of run_id, or None if unknown, evicted or owned by another company."""
+        with self._lock:
+            entry = self._traces.get(run_id)
+            if entry is None or entry[0] != company:
+                return None
+            self._traces.move_to_end(run_id)
+            return entry[1]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "runs": len(self._traces),
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+                "evictions": self.evictions,
+            }
+
+
+_store: Optional[TraceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_trace_store() -> TraceStore:
+    """Process-wide trace store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TraceStore()
+    return _store
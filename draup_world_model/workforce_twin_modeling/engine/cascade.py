@@ -18,7 +18,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from workforce_twin_modeling.models.organization import Task, Role, Workload, Skill, Tool, HumanSystem
 from workforce_twin_modeling.engine.loader import OrganizationData
-from workforce_twin_modeling.engine.gap_engine import CATEGORY_AUTOMATION_POTENTIAL, classify_task
+from workforce_twin_modeling.engine.gap_engine import CATEGORY_AUTOMATION_POTENTIAL, classify_tasks
 
 
 # ============================================================
@@ -317,34 +317,26 @@ def step1_resolve_scope(stimulus: Stimulus, org: OrganizationData) -> Step1_Scop
     addressable_task_ids = []
     compliance_count = 0
 
-    # Build tool lookup for matching
-    stimulus_tools = {t: org.tools[tid]
-                      for tid, t_obj in org.tools.items()
-                      for t in stimulus.tools
-                      if t_obj.tool_name == t}
-    # Simpler: find tool objects by name
-    tool_objs = [t for t in org.tools.values() if t.tool_name in stimulus.tools]
+    # (function, category) pairs some stimulus tool is deployed to and addresses
+    stimulus_names = set(stimulus.tools)
+    covered = {
+        scope for scope, tools in org.tools_by_scope.items()
+        if any(tool.tool_name in stimulus_names for tool in tools)
+    }
 
     for rid in affected_role_ids:
-        for wl_id in org.workloads_by_role.get(rid, []):
-            affected_wl_ids.append(wl_id)
-            for tid in org.tasks_by_workload.get(wl_id, []):
-                task = org.tasks[tid]
-                all_task_ids.append(tid)
-
-                if task.compliance_mandated_human:
-                    compliance_count += 1
-                    continue
+        function = org.roles[rid].function
+        affected_wl_ids.extend(org.workloads_by_role.get(rid, []))
+        for tid in org.task_ids_by_role.get(rid, []):
+            task = org.tasks[tid]
+            all_task_ids.append(tid)
+
+            if task.compliance_mandated_human:
+                compliance_count += 1
+                continue
 
-                # Check if any stimulus tool addresses this task
-                for tool in tool_objs:
-                    role = org.roles[rid]
-                    deployed = ("All" in tool.deployed_to_functions or
-                                role.function in tool.deployed_to_functions)
-                    cat_match = task.category in tool.task_categories_addressed
-                    if deployed and cat_match:
-                        addressable_task_ids.append(tid)
-                        break
+            if (function, task.category) in covered:
+                addressable_task_ids.append(tid)
 
     functions_affected = sorted(set(org.roles[rid].function for rid in affected_role_ids))
     total_hc = sum(org.roles[rid].headcount for rid in affected_role_ids)
@@ -388,55 +380,56 @@ def step2_reclassify_tasks(
 
     addressable_set = set(scope.affected_tasks)
 
+    # First stimulus tool (in stimulus order) addressing each category
+    tool_for_category: Dict[str, str] = {}
+    for tn in stimulus.tools:
+        tool = org.tools_by_name.get(tn)
+        if tool is not None:
+            for category in tool.task_categories_addressed:
+                tool_for_category.setdefault(category, tn)
+
     # Walk all tasks in scope
     for rid in scope.affected_roles:
-        for wl_id in org.workloads_by_role.get(rid, []):
-            for tid in org.tasks_by_workload.get(wl_id, []):
-                task = org.tasks[tid]
-
-                if tid in addressable_set and not task.compliance_mandated_human:
-                    # Determine new state based on category
-                    if task.category in AI_CATEGORIES:
-                        new_state = "ai"
-                        tasks_to_ai += 1
-                    elif task.category in HUMAN_AI_CATEGORIES:
-                        new_state = "human_ai"
-                        tasks_to_human_ai += 1
-                    else:
-                        new_state = "human"
-                        tasks_unchanged += 1
-                        continue
-
-                    freed_pct = AUTOMATION_FREED_PCT.get(task.category, 0.0) * stimulus.alpha
-                    freed_hours = task.effort_hours_month * (freed_pct / 100.0)
-                    total_freed_pp += freed_hours
-
-                    # Determine which tool
-                    tool_used = ""
-                    for tn in stimulus.tools:
-                        for tool in org.tools.values():
-                            if tool.tool_name == tn and task.category in tool.task_categories_addressed:
-                                tool_used = tn
-                                break
-                        if tool_used:
-                            break
-
-                    reclassified.append(TaskReclassification(
-                        task_id=tid,
-                        task_name=task.task_name,
-                        workload_id=wl_id,
-                        role_id=rid,
-                        category=task.category,
-                        effort_hours=task.effort_hours_month,
-                        previous_state="human",
-                        new_state=new_state,
-                        automation_pct=freed_pct,
-                        freed_hours=freed_hours,
-                        tool_used=tool_used,
-                        compliance_blocked=False,
-                    ))
+        for tid in org.task_ids_by_role.get(rid, []):
+            task = org.tasks[tid]
+            wl_id = task.workload_id
+
+            if tid in addressable_set and not task.compliance_mandated_human:
+                # Determine new state based on category
+                if task.category in AI_CATEGORIES:
+                    new_state = "ai"
+                    tasks_to_ai += 1
+                elif task.category in HUMAN_AI_CATEGORIES:
+                    new_state = "human_ai"
+                    tasks_to_human_ai += 1
                 else:
+                    new_state = "human"
                     tasks_unchanged += 1
+                    continue
+
+                freed_pct = AUTOMATION_FREED_PCT.get(task.category, 0.0) * stimulus.alpha
+                freed_hours = task.effort_hours_month * (freed_pct / 100.0)
+                total_freed_pp += freed_hours
+
+                # Determine which tool
+                tool_used = tool_for_category.get(task.category, "")
+
+                reclassified.append(TaskReclassification(
+                    task_id=tid,
+                    task_name=task.task_name,
+                    workload_id=wl_id,
+                    role_id=rid,
+                    category=task.category,
+                    effort_hours=task.effort_hours_month,
+                    previous_state="human",
+                    new_state=new_state,
+                    automation_pct=freed_pct,
+                    freed_hours=freed_hours,
+                    tool_used=tool_used,
+                    compliance_blocked=False,
+                ))
+            else:
+                tasks_unchanged += 1
 
     return Step2_ReclassificationResult(
         reclassified_tasks=reclassified,
@@ -487,12 +480,7 @@ def step3_compute_capacity(
         total_net_freed = net_freed_pp * role.headcount
 
         # Freed % of total effort
-        wl_ids = org.workloads_by_role.get(rid, [])
-        total_effort = sum(
-            org.tasks[tid].effort_hours_month
-            for wl_id in wl_ids
-            for tid in org.tasks_by_workload.get(wl_id, [])
-        )
+        total_effort = org.effort_by_role.get(rid, 0.0)
         freed_pct = (gross_freed_pp / total_effort * 100) if total_effort > 0 else 0
 
         role_capacities.append(RoleCapacity(
@@ -697,10 +685,9 @@ def step6_compute_financial_impact(
     # Investment: licensing for all affected headcount
     annual_license = 0.0
     for tool_name in stimulus.tools:
-        for tool in org.tools.values():
-            if tool.tool_name == tool_name:
-                annual_license += tool.license_cost_per_user_month * 12 * scope.total_headcount
-                break
+        tool = org.tools_by_name.get(tool_name)
+        if tool is not None:
+            annual_license += tool.license_cost_per_user_month * 12 * scope.total_headcount
 
     training = stimulus.training_cost_per_person * scope.total_headcount
     change_mgmt = training * 0.5  # rule of thumb: change mgmt ≈ 50% of training
@@ -985,10 +972,7 @@ def run_cascade(stimulus: Stimulus, org: OrganizationData) -> CascadeResult:
     Each step feeds into the next. Pure computation, no side effects.
     """
     # Ensure all tasks are classified (from Stage 0)
-    for task in org.tasks.values():
-        wl = org.workloads[task.workload_id]
-        role = org.roles[wl.role_id]
-        classify_task(task, org.tools, role.function)
+    classify_tasks(org)
 
     step1 = step1_resolve_scope(stimulus, org)
     step2 = step2_reclassify_tasks(step1, stimulus, org)
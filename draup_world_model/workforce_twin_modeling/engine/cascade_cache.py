@@ -0,0 +1,134 @@
+"""
+Cascade Ceiling Cache
+=====================
+Every simulation starts with a full cascade at alpha=1.0 to find its
+ceilings. The inverse solver runs the forward simulation 15+ times with the
+same stimulus, and sensitivity sweeps and /compare repeat the same ceilings
+across scenarios, so the same cascade is computed over and over.
+
+This cache keeps recent cascade results, keyed by the org version and the
+stimulus fields the cascade actually reads (tools, target functions/roles,
+policy, absorption factor, alpha, training cost). Name, type and scope only
+label the result, so scenarios that differ only in those share one entry.
+
+Principle: a result is only reused for the org version it was computed
+           from. Reloading an org's data never serves stale ceilings.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Hashable, Optional, Tuple
+
+from workforce_twin_modeling.engine.cascade import CascadeResult, Stimulus, run_cascade
+from workforce_twin_modeling.engine.loader import OrganizationData
+
+logger = logging.getLogger("workforce_twin")
+
+# Cascade results kept per process; 0 disables the cache
+CACHE_SIZE = int(os.environ.get("WORKFORCE_TWIN_CASCADE_CACHE_SIZE", 128))
+
+
+def cascade_key(stimulus: Stimulus, org: OrganizationData) -> Optional[Tuple[Hashable, ...]]:
+    """Cache key for a cascade run, or None when the org has no version (built in memory)."""
+    if not org.version:
+        return None
+    return (
+        org.version,
+        tuple(stimulus.tools),
+        tuple(stimulus.target_functions),
+        tuple(stimulus.target_roles),
+        stimulus.policy,
+        stimulus.absorption_factor,
+        stimulus.alpha,
+        stimulus.training_cost_per_person,
+    )
+
+
+class CascadeCache:
+    """Thread-safe LRU of cascade results with hit/miss counters."""
+
+    def __init__(self, max_size: int = CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, CascadeResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def run(self, stimulus: Stimulus, org: OrganizationData) -> CascadeResult:
+        """
+        ``run_cascade(stimulus, org)``, served from the cache when possible.
+        Cached step results are shared between callers and must not be mutated.
+        """
+        key = cascade_key(stimulus, org) if self.max_size > 0 else None
+        if key is None:
+            return run_cascade(stimulus, org)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is not None:
+            return replace(cached, stimulus=stimulus)
+
+        # Computed outside the lock: two threads missing on the same key both
+        # compute it, which is cheaper than serializing every miss
+        result = run_cascade(stimulus, org)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """Drop the entries of one org version, or all of them. Returns how many were dropped."""
+        with self._lock:
+            if version is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [key for key in self._entries if key[0] == version]
+                for key in stale:
+                    del self._entries[key]
+                dropped = len(stale)
+        if dropped:
+            logger.info(f"Cascade cache: dropped {dropped} result(s) for version {version or 'ALL'}")
+        return dropped
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: Optional[CascadeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cascade_cache() -> CascadeCache:
+    """Process-wide cascade cache (each scenario worker process has its own)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CascadeCache()
+    return _cache
+
+
+def run_cascade_cached(stimulus: Stimulus, org: OrganizationData) -> CascadeResult:
+    """Drop-in for ``run_cascade`` that goes through the process-wide cache."""
+    return get_cascade_cache().run(stimulus, org)
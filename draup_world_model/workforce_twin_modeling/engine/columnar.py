@@ -0,0 +1,636 @@
+"""
+Columnar Organization + Vectorized Cascade (Steps 1–6)
+======================================================
+OrganizationData keeps one dataclass per CSV row and the cascade walks them
+with nested loops — fine for hundreds of tasks, slow for an enterprise with
+hundreds of thousands. ColumnarOrg holds the same data as NumPy arrays:
+
+  roles      function code, headcount, salary, productive hours
+  workloads  role foreign key
+  tasks      effort, category code, workload/role foreign keys, compliance flag
+  skills     workload foreign key, sunrise/sunset/current flags, proficiency
+  tools      license cost, (tool × function) and (tool × category) masks
+
+plus role → task and role → workload index arrays in the order the
+dataclass path walks them (workload order, then task order).
+
+run_columnar_cascade computes cascade Steps 1–6 as masks, gathers and
+group-by reductions (np.bincount) over those arrays. ColumnarCascade.to_steps()
+turns the result into the Step1..Step6 dataclasses of engine/cascade.py, with
+the same values as run_cascade. Only sunset/sunrise skills come out in
+workload order, where the dataclass path follows set iteration order.
+
+Principle: same inputs, same numbers — only the data layout changes.
+"""
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from workforce_twin_modeling.engine.cascade import (
+    Stimulus, AUTOMATION_FREED_PCT, AI_CATEGORIES, HUMAN_AI_CATEGORIES,
+    PRODUCTIVE_HOURS_PCT, GROSS_HOURS_MONTH,
+    Step1_ScopeResult, Step2_ReclassificationResult, TaskReclassification,
+    Step3_CapacityResult, RoleCapacity, Step4_SkillResult, SkillImpact,
+    Step5_WorkforceResult, RoleWorkforceImpact, Step6_FinancialResult,
+)
+from workforce_twin_modeling.engine.loader import OrganizationData, _parse_bool, _parse_list
+
+# Task states in Step 2
+STATE_HUMAN, STATE_HUMAN_AI, STATE_AI = 0, 1, 2
+_STATE_NAMES = {STATE_HUMAN: "human", STATE_HUMAN_AI: "human_ai", STATE_AI: "ai"}
+
+
+# ============================================================
+# Columnar Organization
+# ============================================================
+
+@dataclass(eq=False)
+class ColumnarOrg:
+    """Organization data as parallel arrays, one row per entity."""
+    # Roles
+    role_ids: List[str]
+    role_names: List[str]
+    role_function: np.ndarray               # int32 → functions
+    role_headcount: np.ndarray              # int64
+    role_salary: np.ndarray                 # float64
+    role_hours: np.ndarray                  # productive hours per person per month
+
+    # Workloads
+    workload_ids: List[str]
+    workload_role: np.ndarray               # int32 → roles
+
+    # Tasks
+    task_ids: List[str]
+    task_names: List[str]
+    task_workload: np.ndarray               # int32 → workloads
+    task_role: np.ndarray                   # int32 → roles
+    task_category: np.ndarray               # int32 → categories
+    task_effort: np.ndarray                 # float64, hours per person per month
+    task_compliance: np.ndarray             # bool, mandated human
+
+    # Skills
+    skill_ids: List[str]
+    skill_names: List[str]
+    skill_workload: np.ndarray              # int32 → workloads
+    skill_sunset: np.ndarray                # bool
+    skill_sunrise: np.ndarray               # bool
+    skill_current: np.ndarray               # bool, skill_type == "current"
+    skill_proficiency: np.ndarray           # int64
+
+    # Tools
+    tool_names: List[str]
+    tool_license: np.ndarray                # float64, per user per month
+    tool_functions: np.ndarray              # bool (tools × functions), "All" expanded
+    tool_categories: np.ndarray             # bool (tools × categories)
+
+    # Code tables
+    functions: List[str]
+    categories: List[str]
+
+    # Derived in __post_init__
+    # Role → tasks / workloads, CSR style: role r owns idx[ptr[r]:ptr[r + 1]]
+    role_task_ptr: np.ndarray = field(init=False)
+    role_task_idx: np.ndarray = field(init=False)
+    role_workload_ptr: np.ndarray = field(init=False)
+    role_workload_idx: np.ndarray = field(init=False)
+    role_effort: np.ndarray = field(init=False)             # total task hours per person
+    category_freed_pct: np.ndarray = field(init=False)      # AUTOMATION_FREED_PCT per category
+    category_state: np.ndarray = field(init=False)          # STATE_* a category moves to
+    role_index: Dict[str, int] = field(init=False)
+    tool_index: Dict[str, int] = field(init=False)          # name → first tool with it
+
+    def __post_init__(self):
+        self.role_index = {rid: i for i, rid in enumerate(self.role_ids)}
+        self.tool_index = {}
+        for i, name in enumerate(self.tool_names):
+            self.tool_index.setdefault(name, i)
+
+        n_roles = len(self.role_ids)
+        # Stable sort by (role, workload) keeps task order within each workload
+        self.role_task_idx = np.lexsort((self.task_workload, self.task_role)).astype(np.int64)
+        self.role_task_ptr = _ptr(self.task_role, n_roles)
+        self.role_workload_idx = np.argsort(self.workload_role, kind="stable").astype(np.int64)
+        self.role_workload_ptr = _ptr(self.workload_role, n_roles)
+        self.role_effort = np.bincount(
+            self.task_role[self.role_task_idx],
+            weights=self.task_effort[self.role_task_idx],
+            minlength=n_roles,
+        )
+
+        # Per-category constants
+        self.category_freed_pct = np.array(
+            [AUTOMATION_FREED_PCT.get(c, 0.0) for c in self.categories], dtype=np.float64
+        )
+        self.category_state = np.array([
+            STATE_AI if c in AI_CATEGORIES else STATE_HUMAN_AI if c in HUMAN_AI_CATEGORIES else STATE_HUMAN
+            for c in self.categories
+        ], dtype=np.int8)
+
+    @property
+    def total_tasks(self) -> int:
+        return len(self.task_ids)
+
+    @classmethod
+    def from_organization(cls, org: OrganizationData) -> "ColumnarOrg":
+        """Convert a loaded OrganizationData."""
+        return cls._build(
+            roles=[(r.role_id, r.role_name, r.function, r.headcount, r.avg_salary, r.management_level)
+                   for r in org.roles.values()],
+            workloads=[(w.workload_id, w.role_id) for w in org.workloads.values()],
+            tasks=[(t.task_id, t.task_name, t.workload_id, t.category, t.effort_hours_month,
+                    t.compliance_mandated_human) for t in org.tasks.values()],
+            skills=[(s.skill_id, s.skill_name, s.workload_id, s.is_sunset, s.is_sunrise,
+                     s.skill_type, s.proficiency_required) for s in org.skills.values()],
+            tools=[(t.tool_name, t.license_cost_per_user_month, t.deployed_to_functions,
+                    t.task_categories_addressed) for t in org.tools.values()],
+        )
+
+    @classmethod
+    def _build(cls, roles, workloads, tasks, skills, tools) -> "ColumnarOrg":
+        functions = list(dict.fromkeys(r[2] for r in roles))
+        function_code = {f: i for i, f in enumerate(functions)}
+        categories = list(dict.fromkeys(
+            [t[3] for t in tasks] + [c for t in tools for c in t[3]] + list(AUTOMATION_FREED_PCT)
+        ))
+        category_code = {c: i for i, c in enumerate(categories)}
+
+        role_code = {r[0]: i for i, r in enumerate(roles)}
+        workload_role = np.array([role_code[w[1]] for w in workloads], dtype=np.int32)
+        workload_code = {w[0]: i for i, w in enumerate(workloads)}
+        task_workload = np.array([workload_code[t[2]] for t in tasks], dtype=np.int32)
+        # A skill whose workload is unknown can never be affected
+        skills = [s for s in skills if s[2] in workload_code]
+
+        tool_functions = np.zeros((len(tools), len(functions)), dtype=bool)
+        tool_categories = np.zeros((len(tools), len(categories)), dtype=bool)
+        for i, (_, _, deployed, addressed) in enumerate(tools):
+            if "All" in deployed:
+                tool_functions[i, :] = True
+            else:
+                tool_functions[i, [function_code[f] for f in deployed if f in function_code]] = True
+            tool_categories[i, [category_code[c] for c in addressed]] = True
+
+        return cls(
+            role_ids=[r[0] for r in roles],
+            role_names=[r[1] for r in roles],
+            role_function=np.array([function_code[r[2]] for r in roles], dtype=np.int32),
+            role_headcount=np.array([r[3] for r in roles], dtype=np.int64),
+            role_salary=np.array([r[4] for r in roles], dtype=np.float64),
+            role_hours=np.array(
+                [GROSS_HOURS_MONTH * PRODUCTIVE_HOURS_PCT.get(r[5], 0.80) for r in roles], dtype=np.float64
+            ),
+            workload_ids=[w[0] for w in workloads],
+            workload_role=workload_role,
+            task_ids=[t[0] for t in tasks],
+            task_names=[t[1] for t in tasks],
+            task_workload=task_workload,
+            task_role=workload_role[task_workload],
+            task_category=np.array([category_code[t[3]] for t in tasks], dtype=np.int32),
+            task_effort=np.array([t[4] for t in tasks], dtype=np.float64),
+            task_compliance=np.array([t[5] for t in tasks], dtype=bool),
+            skill_ids=[s[0] for s in skills],
+            skill_names=[s[1] for s in skills],
+            skill_workload=np.array([workload_code[s[2]] for s in skills], dtype=np.int32),
+            skill_sunset=np.array([s[3] for s in skills], dtype=bool),
+            skill_sunrise=np.array([s[4] for s in skills], dtype=bool),
+            skill_current=np.array([s[5] == "current" for s in skills], dtype=bool),
+            skill_proficiency=np.array([s[6] for s in skills], dtype=np.int64),
+            tool_names=[t[0] for t in tools],
+            tool_license=np.array([t[1] for t in tools], dtype=np.float64),
+            tool_functions=tool_functions,
+            tool_categories=tool_categories,
+            functions=functions,
+            categories=categories,
+        )
+
+
+def _ptr(owner: np.ndarray, n_owners: int) -> np.ndarray:
+    """CSR offsets from a foreign-key column."""
+    ptr = np.zeros(n_owners + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owner, minlength=n_owners), out=ptr[1:])
+    return ptr
+
+
+def _gather(ptr: np.ndarray, idx: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Concatenate idx[ptr[r]:ptr[r + 1]] for every r in rows, in order, without a Python loop."""
+    starts = ptr[rows]
+    lengths = ptr[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=idx.dtype)
+    run_starts = np.cumsum(lengths) - lengths
+    return idx[np.repeat(starts - run_starts, lengths) + np.arange(total)]
+
+
+def _read_rows(path: Path, key: str) -> List[dict]:
+    """CSV rows, last one winning per key — the same rows load_organization keeps."""
+    with open(path, newline='') as f:
+        return list({row[key]: row for row in csv.DictReader(f)}.values())
+
+
+def load_columnar_organization(data_dir: str) -> ColumnarOrg:
+    """
+    Load the CSV files of data_dir straight into a ColumnarOrg, without
+    building a dataclass per row. Same files and parsing as load_organization.
+    """
+    data_path = Path(data_dir)
+    roles = _read_rows(data_path / "roles.csv", "role_id")
+    workloads = _read_rows(data_path / "workloads.csv", "workload_id")
+    tasks = _read_rows(data_path / "tasks.csv", "task_id")
+    skills = _read_rows(data_path / "skills.csv", "skill_id")
+    tools = _read_rows(data_path / "tech_stack.csv", "tool_id")
+
+    return ColumnarOrg._build(
+        roles=[(r["role_id"], r["role_name"], r["function"], int(r["headcount"]),
+                float(r["avg_salary"]), r["management_level"]) for r in roles],
+        workloads=[(w["workload_id"], w["role_id"]) for w in workloads],
+        tasks=[(t["task_id"], t["task_name"], t["workload_id"], t["category"],
+                float(t["effort_hours_month"]),
+                _parse_bool(t.get("compliance_mandated_human", "False"))) for t in tasks],
+        skills=[(s["skill_id"], s["skill_name"], s["workload_id"],
+                 _parse_bool(s.get("is_sunset", "False")), _parse_bool(s.get("is_sunrise", "False")),
+                 s["skill_type"], int(s["proficiency_required"])) for s in skills],
+        tools=[(t["tool_name"], float(t["license_cost_per_user_month"]),
+                _parse_list(t["deployed_to_function"]), _parse_list(t["task_categories_addressed"]))
+               for t in tools],
+    )
+
+
+# ============================================================
+# Vectorized Cascade Result
+# ============================================================
+
+@dataclass(eq=False)
+class ColumnarCascade:
+    """Steps 1–6 as arrays. Role arrays follow `roles` (affected roles, in scope order)."""
+    corg: ColumnarOrg
+    stimulus: Stimulus
+
+    # Step 1: scope
+    roles: np.ndarray                       # affected role indexes
+    workloads: np.ndarray                   # affected workload indexes
+    scope_tasks: np.ndarray                 # task indexes in scope, walk order
+    addressable: np.ndarray                 # bool per scope task
+    compliance_protected: int
+    total_headcount: int
+    total_hours_month: float
+
+    # Step 2: reclassification (rows = scope tasks)
+    state: np.ndarray                       # STATE_* per scope task (human when not reclassified)
+    reclassified: np.ndarray                # bool per scope task
+    automation_pct: np.ndarray              # per scope task
+    freed_hours: np.ndarray                 # per scope task, per person
+    tool_used: np.ndarray                   # index into stimulus.tools, -1 for none
+
+    # Step 3: capacity (rows = roles)
+    gross_freed_pp: np.ndarray
+    redistributed_pp: np.ndarray
+    net_freed_pp: np.ndarray
+    total_net_freed: np.ndarray
+    freed_pct: np.ndarray
+
+    # Step 4: skills (indexes into corg.skill_*)
+    sunset_skills: np.ndarray
+    sunset_confirmed: np.ndarray            # bool per sunset skill: flagged sunset (vs current skill)
+    sunrise_skills: np.ndarray
+    unchanged_skills: int
+
+    # Step 5: workforce (rows = roles)
+    net_freed_ftes: np.ndarray
+    reducible: np.ndarray
+    residual_hours: np.ndarray
+
+    # Step 6: financial
+    license_cost_annual: float
+    salary_savings: np.ndarray              # per role
+    productivity_savings: np.ndarray        # per role
+
+    @property
+    def tasks_to_ai(self) -> int:
+        return int(np.count_nonzero(self.reclassified & (self.state == STATE_AI)))
+
+    @property
+    def tasks_to_human_ai(self) -> int:
+        return int(np.count_nonzero(self.reclassified & (self.state == STATE_HUMAN_AI)))
+
+    @property
+    def total_gross_freed_hours(self) -> float:
+        return float(np.sum(self.gross_freed_pp * self.corg.role_headcount[self.roles]))
+
+    @property
+    def total_reducible(self) -> int:
+        return int(self.reducible.sum())
+
+    def to_steps(self):
+        """Materialize Step1..Step6 dataclasses, as run_cascade returns them."""
+        return (self._step1(), self._step2(), self._step3(), self._step4(), self._step5(), self._step6())
+
+    # ── materialization ──
+
+    def _step1(self) -> Step1_ScopeResult:
+        c = self.corg
+        addressable_ids = [c.task_ids[t] for t in self.scope_tasks[self.addressable]]
+        return Step1_ScopeResult(
+            affected_roles=[c.role_ids[r] for r in self.roles],
+            affected_workloads=[c.workload_ids[w] for w in self.workloads],
+            affected_tasks=addressable_ids,
+            total_tasks_in_scope=len(self.scope_tasks),
+            addressable_tasks=len(set(addressable_ids)),
+            compliance_protected=self.compliance_protected,
+            total_headcount=self.total_headcount,
+            total_hours_month=self.total_hours_month,
+            functions_affected=sorted({c.functions[f] for f in c.role_function[self.roles]}),
+        )
+
+    def _step2(self) -> Step2_ReclassificationResult:
+        c = self.corg
+        rows = np.flatnonzero(self.reclassified)
+        tasks = self.scope_tasks[rows]
+        reclassified = [
+            TaskReclassification(
+                task_id=c.task_ids[t],
+                task_name=c.task_names[t],
+                workload_id=c.workload_ids[c.task_workload[t]],
+                role_id=c.role_ids[c.task_role[t]],
+                category=c.categories[c.task_category[t]],
+                effort_hours=float(c.task_effort[t]),
+                previous_state="human",
+                new_state=_STATE_NAMES[int(self.state[row])],
+                automation_pct=float(self.automation_pct[row]),
+                freed_hours=float(self.freed_hours[row]),
+                tool_used=self.stimulus.tools[self.tool_used[row]] if self.tool_used[row] >= 0 else "",
+                compliance_blocked=False,
+            )
+            for row, t in zip(rows, tasks)
+        ]
+        tasks_to_ai, tasks_to_human_ai = self.tasks_to_ai, self.tasks_to_human_ai
+        return Step2_ReclassificationResult(
+            reclassified_tasks=reclassified,
+            tasks_to_ai=tasks_to_ai,
+            tasks_to_human_ai=tasks_to_human_ai,
+            tasks_unchanged=len(self.scope_tasks) - tasks_to_ai - tasks_to_human_ai,
+            total_freed_hours_per_person=float(self.freed_hours.sum()),
+        )
+
+    def _step3(self) -> Step3_CapacityResult:
+        c = self.corg
+        hc = c.role_headcount[self.roles]
+        total_gross = float(np.sum(self.gross_freed_pp * hc))
+        total_net = float(self.total_net_freed.sum())
+        return Step3_CapacityResult(
+            role_capacities=[
+                RoleCapacity(
+                    role_id=c.role_ids[r],
+                    role_name=c.role_names[r],
+                    headcount=int(c.role_headcount[r]),
+                    gross_freed_hours_pp=float(self.gross_freed_pp[i]),
+                    redistributed_hours_pp=float(self.redistributed_pp[i]),
+                    net_freed_hours_pp=float(self.net_freed_pp[i]),
+                    total_net_freed_hours=float(self.total_net_freed[i]),
+                    freed_pct=float(self.freed_pct[i]),
+                )
+                for i, r in enumerate(self.roles)
+            ],
+            total_gross_freed_hours=total_gross,
+            total_redistributed_hours=float(np.sum(self.redistributed_pp * hc)),
+            total_net_freed_hours=total_net,
+            absorption_factor=self.stimulus.absorption_factor,
+            dampening_ratio=total_net / total_gross if total_gross > 0 else 0,
+        )
+
+    def _step4(self) -> Step4_SkillResult:
+        c = self.corg
+
+        def impact(s: int, direction: str, reason: str) -> SkillImpact:
+            return SkillImpact(
+                skill_id=c.skill_ids[s],
+                skill_name=c.skill_names[s],
+                workload_id=c.workload_ids[c.skill_workload[s]],
+                direction=direction,
+                reason=reason,
+            )
+
+        sunset, critical = [], []
+        for s, confirmed in zip(self.sunset_skills, self.sunset_confirmed):
+            if confirmed:
+                item = impact(s, "sunset", "Workload tasks automated → skill demand declining")
+                if c.skill_proficiency[s] >= 70:
+                    critical.append(item)
+            else:
+                item = impact(s, "sunset", "Current skill in automated workload → demand declining")
+            sunset.append(item)
+        sunrise = [
+            impact(s, "sunrise", "AI tools deployed → new skill needed for AI collaboration")
+            for s in self.sunrise_skills
+        ]
+        return Step4_SkillResult(
+            sunset_skills=sunset,
+            sunrise_skills=sunrise,
+            unchanged_skills=self.unchanged_skills,
+            net_skill_gap=len(sunrise) - len(sunset),
+            critical_sunset=critical,
+        )
+
+    def _step5(self) -> Step5_WorkforceResult:
+        c = self.corg
+        hc = c.role_headcount[self.roles]
+        total_current = int(hc.sum())
+        total_reducible = self.total_reducible
+        return Step5_WorkforceResult(
+            role_impacts=[
+                RoleWorkforceImpact(
+                    role_id=c.role_ids[r],
+                    role_name=c.role_names[r],
+                    current_hc=int(hc[i]),
+                    net_freed_ftes=float(self.net_freed_ftes[i]),
+                    reducible_ftes=int(self.reducible[i]),
+                    residual_hours=float(self.residual_hours[i]),
+                    projected_hc=int(hc[i] - self.reducible[i]),
+                    reduction_pct=(int(self.reducible[i]) / int(hc[i]) * 100) if hc[i] > 0 else 0,
+                )
+                for i, r in enumerate(self.roles)
+            ],
+            total_current_hc=total_current,
+            total_reducible_ftes=total_reducible,
+            total_projected_hc=total_current - total_reducible,
+            total_reduction_pct=(total_reducible / total_current * 100) if total_current > 0 else 0,
+            policy_applied=self.stimulus.policy,
+        )
+
+    def _step6(self) -> Step6_FinancialResult:
+        c = self.corg
+        training = self.stimulus.training_cost_per_person * self.total_headcount
+        change_mgmt = training * 0.5
+        total_investment = self.license_cost_annual + training + change_mgmt
+        salary_savings = float(self.salary_savings.sum())
+        productivity_savings = float(self.productivity_savings.sum())
+        total_savings = salary_savings + productivity_savings
+        net_annual = total_savings - total_investment
+        monthly_savings = total_savings / 12.0
+        return Step6_FinancialResult(
+            license_cost_annual=self.license_cost_annual,
+            training_cost=training,
+            change_management_cost=change_mgmt,
+            total_investment=total_investment,
+            salary_savings_annual=salary_savings,
+            productivity_savings_annual=productivity_savings,
+            total_savings_annual=total_savings,
+            net_annual=net_annual,
+            payback_months=total_investment / monthly_savings if monthly_savings > 0 else float('inf'),
+            roi_pct=(net_annual / total_investment * 100) if total_investment > 0 else 0,
+            role_savings=[
+                {
+                    "role_id": c.role_ids[r],
+                    "role_name": c.role_names[r],
+                    "hc_reduced": int(self.reducible[i]),
+                    "salary_savings": float(self.salary_savings[i]),
+                    "productivity_savings": float(self.productivity_savings[i]),
+                }
+                for i, r in enumerate(self.roles)
+            ],
+        )
+
+
+# ============================================================
+# Vectorized Cascade (Steps 1–6)
+# ============================================================
+
+def _affected_roles(stimulus: Stimulus, c: ColumnarOrg) -> np.ndarray:
+    """Step 1 role selection, in the dataclass path's order (duplicates kept)."""
+    if stimulus.target_roles:
+        return np.array([c.role_index[rid] for rid in stimulus.target_roles], dtype=np.int64)
+    if stimulus.target_functions:
+        codes = {f: i for i, f in enumerate(c.functions)}
+        return np.concatenate([np.zeros(0, dtype=np.int64)] + [
+            np.flatnonzero(c.role_function == codes[fn]) for fn in stimulus.target_functions if fn in codes
+        ])
+    return np.arange(len(c.role_ids), dtype=np.int64)
+
+
+def _apply_policy(policy: str, ftes: np.ndarray, hc: np.ndarray) -> np.ndarray:
+    """Step 5 reducible FTEs per role for an HC policy, before the staffing floor."""
+    if policy in ("no_layoffs", "no_change"):
+        return np.zeros(len(ftes), dtype=np.int64)
+    if policy == "natural_attrition":
+        max_attrition = np.maximum(1, (hc * 0.007).astype(np.int64))
+        return np.minimum(np.floor(ftes).astype(np.int64), max_attrition)
+    if policy == "active_reduction":
+        return np.round(ftes).astype(np.int64)      # half to even, like round()
+    if policy == "rapid_redeployment":
+        return np.where(ftes >= 0.5, np.ceil(ftes), 0).astype(np.int64)
+    return np.floor(ftes).astype(np.int64)          # moderate_reduction and unknown policies
+
+
+def run_columnar_cascade(stimulus: Stimulus, corg: ColumnarOrg) -> ColumnarCascade:
+    """Cascade Steps 1–6 over a ColumnarOrg. See ColumnarCascade.to_steps for dataclasses."""
+    c = corg
+
+    # ── Step 1: scope ──
+    roles = _affected_roles(stimulus, c)
+    workloads = _gather(c.role_workload_ptr, c.role_workload_idx, roles)
+    scope_tasks = _gather(c.role_task_ptr, c.role_task_idx, roles)
+    hc = c.role_headcount[roles]
+
+    stimulus_names = set(stimulus.tools)
+    stimulus_tools = [i for i, name in enumerate(c.tool_names) if name in stimulus_names]
+    # (function × category) cells some stimulus tool is deployed to and addresses
+    covered = (c.tool_functions[stimulus_tools].T.astype(np.int32)
+               @ c.tool_categories[stimulus_tools].astype(np.int32)) > 0
+    compliance = c.task_compliance[scope_tasks]
+    categories = c.task_category[scope_tasks]
+    addressable = ~compliance & covered[c.role_function[c.task_role[scope_tasks]], categories]
+
+    # ── Step 2: reclassification ──
+    state = c.category_state[categories]
+    reclassified = addressable & (state != STATE_HUMAN)
+    automation_pct = np.where(reclassified, c.category_freed_pct[categories] * stimulus.alpha, 0.0)
+    freed_hours = c.task_effort[scope_tasks] * (automation_pct / 100.0)
+
+    # First stimulus tool (in stimulus order) addressing each category
+    tool_for_category = np.full(len(c.categories), -1, dtype=np.int64)
+    for pos in reversed(range(len(stimulus.tools))):
+        tool = c.tool_index.get(stimulus.tools[pos])
+        if tool is not None:
+            tool_for_category[c.tool_categories[tool]] = pos
+    tool_used = np.where(reclassified, tool_for_category[categories], -1)
+
+    # ── Step 3: capacity ──
+    freed_by_role = np.bincount(
+        c.task_role[scope_tasks][reclassified], weights=freed_hours[reclassified], minlength=len(c.role_ids)
+    )
+    gross = freed_by_role[roles]
+    redistributed = gross * stimulus.absorption_factor
+    net = gross - redistributed
+    total_net = net * hc
+    effort = c.role_effort[roles]
+    freed_pct = np.divide(gross, effort, out=np.zeros(len(roles)), where=effort > 0) * 100
+
+    # ── Step 4: skills ──
+    reclassified_workloads = c.task_workload[scope_tasks][reclassified]
+    reclassified_state = state[reclassified]
+    n_workloads = len(c.workload_ids)
+    has_ai = np.bincount(reclassified_workloads[reclassified_state == STATE_AI], minlength=n_workloads) > 0
+    has_human_ai = np.bincount(
+        reclassified_workloads[reclassified_state == STATE_HUMAN_AI], minlength=n_workloads
+    ) > 0
+    skills = np.flatnonzero((has_ai | has_human_ai)[c.skill_workload])
+    skills = skills[np.argsort(c.skill_workload[skills], kind="stable")]
+    skill_ai = has_ai[c.skill_workload[skills]]
+    skill_any = skill_ai | has_human_ai[c.skill_workload[skills]]
+    confirmed = c.skill_sunset[skills] & skill_ai
+    sunrise = ~confirmed & c.skill_sunrise[skills] & skill_any
+    current = ~confirmed & ~sunrise & c.skill_current[skills] & skill_ai
+    sunset = confirmed | current
+
+    # ── Step 5: workforce ──
+    role_hours = c.role_hours[roles]
+    ftes = total_net / role_hours
+    reducible = _apply_policy(stimulus.policy, ftes, hc)
+    min_staffing = np.maximum(1, np.ceil(hc * 0.20).astype(np.int64))
+    reducible = np.minimum(reducible, np.maximum(0, hc - min_staffing))
+    residual = total_net - reducible * role_hours
+
+    # ── Step 6: financial ──
+    total_headcount = int(hc.sum())
+    license_annual = 0.0
+    for name in stimulus.tools:
+        tool = c.tool_index.get(name)
+        if tool is not None:
+            license_annual += float(c.tool_license[tool]) * 12 * total_headcount
+    salary = c.role_salary[roles]
+    residual_ftes = np.where(residual > 0, residual / 160.0, 0.0)
+
+    return ColumnarCascade(
+        corg=c,
+        stimulus=stimulus,
+        roles=roles,
+        workloads=workloads,
+        scope_tasks=scope_tasks,
+        addressable=addressable,
+        compliance_protected=int(np.count_nonzero(compliance)),
+        total_headcount=total_headcount,
+        total_hours_month=float(np.sum(hc * role_hours)),
+        state=state,
+        reclassified=reclassified,
+        automation_pct=automation_pct,
+        freed_hours=freed_hours,
+        tool_used=tool_used,
+        gross_freed_pp=gross,
+        redistributed_pp=redistributed,
+        net_freed_pp=net,
+        total_net_freed=total_net,
+        freed_pct=freed_pct,
+        sunset_skills=skills[sunset],
+        sunset_confirmed=confirmed[sunset],
+        sunrise_skills=skills[sunrise],
+        unchanged_skills=int(np.count_nonzero(~sunset & ~sunrise)),
+        net_freed_ftes=ftes,
+        reducible=reducible,
+        residual_hours=residual,
+        license_cost_annual=license_annual,
+        salary_savings=reducible * salary,
+        productivity_savings=residual_ftes * salary * 0.5,
+    )
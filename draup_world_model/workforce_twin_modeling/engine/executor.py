@@ -0,0 +1,230 @@
+"""
+Scenario Executor
+==================
+Runs scenario simulations on a pool of worker processes, so CPU-bound
+``simulate_with_feedback`` calls neither block the API event loop nor run
+one after another.
+
+Each worker keeps its own copy of every organization it has simulated, keyed
+by data directory: an org is loaded once per worker, not pickled with every
+scenario, and reloaded when the parent has moved on to a newer version.
+The parent also tracks which orgs it holds (``preload`` / ``evict``); every
+task carries a generation number of that set, and a worker that sees a newer
+generation drops the orgs the parent evicted and loads the ones it added.
+An org built in memory (no data_dir) is sent along with each task instead.
+
+Principle: the pool knows nothing about scenarios. It calls
+           ``fn(org=<worker-local org>, **item, **kwargs)`` for each item.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from workforce_twin_modeling.engine.gap_engine import classify_tasks
+from workforce_twin_modeling.engine.loader import load_organization, OrganizationData
+
+logger = logging.getLogger("workforce_twin")
+
+# Worker processes; 0 runs scenarios on a single background thread instead
+WORKERS = int(os.environ.get("WORKFORCE_TWIN_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+# Scenarios one request may have in flight at once, so one large compare
+# cannot hold every worker
+REQUEST_CONCURRENCY = int(os.environ.get("WORKFORCE_TWIN_REQUEST_CONCURRENCY", 4))
+
+
+def prepare_organization(data_dir: str) -> OrganizationData:
+    """Load an org and classify its tasks against its tools, as the API serves it."""
+    org = load_organization(data_dir)
+    classify_tasks(org)
+    return org
+
+
+# ── Worker side ──────────────────────────────────────────────────
+
+_worker_orgs: Dict[str, OrganizationData] = {}
+_worker_generation = 0
+
+# (generation, ((data_dir, version), ...)) of the orgs the parent holds
+OrgSet = Tuple[int, Tuple[Tuple[str, str], ...]]
+
+
+def _worker_org(source: Union[str, Tuple[str, str], OrganizationData]) -> OrganizationData:
+    if isinstance(source, OrganizationData):
+        return source
+    data_dir, version = source if isinstance(source, tuple) else (source, None)
+    org = _worker_orgs.get(data_dir)
+    if org is None or (version is not None and org.version != version):
+        org = _worker_orgs[data_dir] = prepare_organization(data_dir)
+    return org
+
+
+def _sync_worker(orgs: OrgSet) -> None:
+    """Drop the orgs the parent no longer holds and load the ones it added, once per generation."""
+    global _worker_generation
+    generation, live = orgs
+    if generation <= _worker_generation:
+        return
+    _worker_generation = generation
+    live_dirs = {data_dir for data_dir, _ in live}
+    for data_dir in [d for d in _worker_orgs if d not in live_dirs]:
+        del _worker_orgs[data_dir]
+    for source in live:
+        try:
+            _worker_org(source)
+        except Exception as e:
+            logger.warning(f"Could not preload organization from {source[0]}: {e}")
+
+
+def _run_task(
+    source: Union[Tuple[str, str], OrganizationData], fn: Callable, kwargs: Dict[str, Any], orgs: OrgSet,
+) -> Any:
+    _sync_worker(orgs)
+    return fn(org=_worker_org(source), **kwargs)
+
+
+# ── Executor ─────────────────────────────────────────────────────
+
+class ScenarioExecutor:
+    """
+    Process pool for scenario runs. ``run`` and ``stream`` yield
+    ``(index, future)`` pairs as each call finishes; call ``future.result()``
+    to get the value or the exception of that one call.
+    """
+
+    def __init__(self, max_workers: int = WORKERS):
+        self.max_workers = max_workers
+        self._orgs: Dict[str, str] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+
+    def preload(self, data_dir: str, version: str) -> None:
+        """Have every worker hold this version of the org, loading it ahead of work."""
+        self._update_orgs(data_dir, version)
+
+    def evict(self, data_dir: str) -> None:
+        """Have every worker drop the org loaded from data_dir."""
+        self._update_orgs(data_dir, None)
+
+    def _update_orgs(self, data_dir: str, version: Optional[str]) -> None:
+        if not data_dir:
+            return
+        with self._lock:
+            if self._orgs.get(data_dir) == version:
+                return
+            if version is None:
+                del self._orgs[data_dir]
+            else:
+                self._orgs[data_dir] = version
+            self._generation += 1
+            pool = self._pool
+        if pool is not None:
+            # Idle workers pick the change up now rather than on their next scenario
+            for _ in range(max(1, self.max_workers)):
+                pool.submit(_sync_worker, self._org_set())
+
+    def _org_set(self) -> OrgSet:
+        with self._lock:
+            return self._generation, tuple(self._orgs.items())
+
+    def _ensure_pool(self) -> Executor:
+        if self._pool is None:
+            if self.max_workers > 0:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workforce-twin")
+            logger.info(f"Scenario executor started: {self.max_workers} worker(s), orgs {list(self._orgs)}")
+        return self._pool
+
+    def submit(self, org: OrganizationData, fn: Callable, **kwargs) -> Future:
+        """Run ``fn(org=org, **kwargs)`` on a worker."""
+        source = (org.data_dir, org.version) if org.data_dir else org
+        return self._ensure_pool().submit(_run_task, source, fn, kwargs, self._org_set())
+
+    async def call(self, org: OrganizationData, fn: Callable, **kwargs) -> Any:
+        """Await ``fn(org=org, **kwargs)`` run on a worker."""
+        return await asyncio.wrap_future(self.submit(org, fn, **kwargs))
+
+    def run(
+        self,
+        org: OrganizationData,
+        fn: Callable,
+        items: Sequence[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[int, Future]]:
+        """
+        Blocking: call ``fn`` for every item, at most ``max_in_flight`` at a
+        time (default: enough to keep every worker busy).
+        """
+        max_in_flight = max_in_flight or max(1, self.max_workers) * 2
+        queue = iter(enumerate(items))
+        pending: Dict[Future, int] = {}
+        try:
+            while True:
+                for index, item in queue:
+                    pending[self.submit(org, fn, **item, **kwargs)] = index
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def stream(
+        self,
+        org: OrganizationData,
+        fn: Callable,
+        items: Sequence[Dict[str, Any]],
+        max_in_flight: int = REQUEST_CONCURRENCY,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[int, asyncio.Future]]:
+        """
+        ``run`` for async callers. Closing the iterator early (e.g. the client
+        disconnected) cancels the calls that have not started yet.
+        """
+        queue = iter(enumerate(items))
+        pending: Dict[asyncio.Future, int] = {}
+        try:
+            while True:
+                for index, item in queue:
+                    pending[asyncio.wrap_future(self.submit(org, fn, **item, **kwargs))] = index
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_executor: Optional[ScenarioExecutor] = None
+
+
+def get_scenario_executor() -> ScenarioExecutor:
+    """Process-wide scenario executor, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ScenarioExecutor()
+    return _executor
@@ -52,10 +52,17 @@ def _tool_covers_task(tool: Tool, task: Task, role_function: str) -> bool:
     return deployed and category_match and tool_match
 
 
-def classify_task(task: Task, tools: Dict[str, Tool], role_function: str) -> Task:
+def classify_task(
+    task: Task,
+    tools: Dict[str, Tool],
+    role_function: str,
+    candidates: Optional[List[Tool]] = None,
+) -> Task:
     """
     Compute three-layer classification for a single task.
     This is the atomic operation — everything else aggregates from here.
+
+    candidates: tools to check instead of all of ``tools`` (see classify_tasks).
     """
     # L1: Etter theoretical potential (from category)
     task.l1_etter_potential = CATEGORY_AUTOMATION_POTENTIAL.get(task.category, 0.0)
@@ -66,7 +73,7 @@ def classify_task(task: Task, tools: Dict[str, Tool], role_function: str) -> Tas
 
     # L2: Achievable — is there a deployed tool that matches?
     matching_tool = None
-    for tool in tools.values():
+    for tool in (tools.values() if candidates is None else candidates):
         if _tool_covers_task(tool, task, role_function):
             matching_tool = tool
             break
@@ -85,6 +92,24 @@ def classify_task(task: Task, tools: Dict[str, Tool], role_function: str) -> Tas
     return task
 
 
+def classify_tasks(org: OrganizationData, force: bool = False) -> None:
+    """
+    Classify every task in the org. A task can only be covered by the tool it
+    names, so that one tool is the only candidate checked.
+
+    Classification depends only on the org's own tasks and tools, so it runs
+    once: later calls return straight away unless force=True (e.g. after
+    editing tools). Shared orgs are therefore never written to by readers.
+    """
+    if org.classified and not force:
+        return
+    for task in org.tasks.values():
+        function = org.roles[org.workloads[task.workload_id].role_id].function
+        tool = org.tools_by_name.get(task.automatable_by_tool) if task.automatable_by_tool else None
+        classify_task(task, org.tools, function, candidates=[tool] if tool is not None else [])
+    org.classified = True
+
+
 # ============================================================
 # Aggregation Data Structures
 # ============================================================
@@ -260,10 +285,7 @@ def compute_snapshot(org: OrganizationData) -> OrgGapResult:
     Same pattern at every scale. Classify at leaf, aggregate upward.
     """
     # Phase 1: Classify every task
-    for task in org.tasks.values():
-        wl = org.workloads[task.workload_id]
-        role = org.roles[wl.role_id]
-        classify_task(task, org.tools, role.function)
+    classify_tasks(org)
 
     # Phase 2: Aggregate tasks → workloads
     workload_results = {}
@@ -2,27 +2,31 @@
 Inverse Solver Engine
 =====================
 Given a TARGET outcome (e.g., "reduce HC by 15%"), find the adoption parameters
-that produce it. Uses binary search on the adoption alpha parameter, running
-the forward simulation at each candidate to evaluate the cost function.
+that produce it. Searches a grid of adoption alphas, running the forward
+simulation for the whole grid in one batch, then refines the grid around the
+target.
 
 Supported inverse modes:
   - headcount_target:   find alpha that produces target HC reduction %
   - budget_constraint:  find max alpha where cumulative investment ≤ budget
   - automation_target:  find alpha that produces target peak adoption %
 
-Design: Each solver wraps the same binary search core with a different
-        metric extraction function. The forward sim is called N times
-        (typically 8-12 iterations for 2% tolerance).
+Design: Each solver wraps the same grid search core with a different
+        metric extraction function. Each round is one simulate_batch call
+        over 33 alphas (typically 1-2 rounds for 2% tolerance).
 """
 import math
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
 
 from workforce_twin_modeling.engine.cascade import Stimulus
 from workforce_twin_modeling.engine.loader import OrganizationData
 from workforce_twin_modeling.engine.rates import SimulationParams, RateParams
 from workforce_twin_modeling.engine.feedback import FeedbackParams, HumanSystemState
-from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback, FBSimulationResult
+from workforce_twin_modeling.engine.simulator_fb import FBSimulationResult
+from workforce_twin_modeling.engine.simulator_batch import BatchSimulationResult, simulate_batch
 
 
 # ============================================================
@@ -37,47 +41,54 @@ class InverseSolveResult:
     achieved_value: float               # actual metric value at solved_alpha
     target_value: float                 # requested target
     error_pct: float                    # |achieved - target| / target * 100
-    iterations: int                     # binary search iterations used
+    iterations: int                     # forward simulations evaluated
     simulation_result: FBSimulationResult  # full sim result at solved_alpha
     feasibility_range: Tuple[float, float]  # (min_achievable, max_achievable)
     message: str                        # human-readable explanation
 
 
 # ============================================================
-# Generic Binary Search Solver
+# Generic Grid Search Solver
 # ============================================================
 
-def _binary_search_alpha(
-    run_forward: Callable[[float], FBSimulationResult],
-    extract_metric: Callable[[FBSimulationResult], float],
+def _grid_search_alpha(
+    run_batch: Callable[[Sequence[float]], BatchSimulationResult],
+    extract_metric: Callable[[BatchSimulationResult], np.ndarray],
     target_value: float,
     alpha_lo: float = 0.05,
     alpha_hi: float = 0.95,
     tolerance: float = 0.02,
-    max_iterations: int = 15,
+    grid_size: int = 33,
+    max_rounds: int = 2,
     monotonic: str = "increasing",
 ) -> InverseSolveResult:
     """
-    Binary search on adoption alpha to find the value that produces the target metric.
+    Grid search on adoption alpha to find the value that produces the target metric.
+
+    Each round evaluates grid_size alphas in one batched simulation, then
+    narrows the grid to the interval where the metric crosses the target.
 
     Args:
-        run_forward: function that takes alpha and returns a simulation result
-        extract_metric: function that pulls the target metric from a sim result
+        run_batch: function that takes a list of alphas and returns a batch result
+        extract_metric: function that pulls the target metric per variant of a batch
         target_value: the desired metric value
         alpha_lo: lower bound of search range
         alpha_hi: upper bound of search range
         tolerance: acceptable relative error (0.02 = 2%)
-        max_iterations: max binary search iterations
+        grid_size: alphas evaluated per round
+        max_rounds: max refinement rounds after the first grid
         monotonic: "increasing" if metric grows with alpha, "decreasing" if it shrinks
 
     Returns:
         InverseSolveResult with the best alpha found
     """
-    # First, establish feasibility range by evaluating at boundaries
-    result_lo = run_forward(alpha_lo)
-    result_hi = run_forward(alpha_hi)
-    metric_lo = extract_metric(result_lo)
-    metric_hi = extract_metric(result_hi)
+    # First round spans the whole range, so its ends give the feasibility range
+    alphas = np.linspace(alpha_lo, alpha_hi, grid_size)
+    batch = run_batch(alphas)
+    metrics = extract_metric(batch)
+    iterations = len(alphas)
+    metric_lo = float(metrics[0])
+    metric_hi = float(metrics[-1])
 
     feasibility_range = (
         min(metric_lo, metric_hi),
@@ -93,8 +104,8 @@ def _binary_search_alpha(
                 achieved_value=metric_hi,
                 target_value=target_value,
                 error_pct=abs(metric_hi - target_value) / max(abs(target_value), 0.01) * 100,
-                iterations=2,
-                simulation_result=result_hi,
+                iterations=iterations,
+                simulation_result=batch.result(len(alphas) - 1),
                 feasibility_range=feasibility_range,
                 message=(
                     f"Target {target_value:.1f} exceeds maximum achievable "
@@ -109,8 +120,8 @@ def _binary_search_alpha(
                 achieved_value=metric_lo,
                 target_value=target_value,
                 error_pct=abs(metric_lo - target_value) / max(abs(target_value), 0.01) * 100,
-                iterations=2,
-                simulation_result=result_lo,
+                iterations=iterations,
+                simulation_result=batch.result(0),
                 feasibility_range=feasibility_range,
                 message=(
                     f"Target {target_value:.1f} is below minimum "
@@ -126,62 +137,54 @@ def _binary_search_alpha(
                 achieved_value=metric_hi,
                 target_value=target_value,
                 error_pct=abs(metric_hi - target_value) / max(abs(target_value), 0.01) * 100,
-                iterations=2,
-                simulation_result=result_hi,
+                iterations=iterations,
+                simulation_result=batch.result(len(alphas) - 1),
                 feasibility_range=feasibility_range,
                 message=f"Target {target_value:.1f} not achievable. Best: {metric_hi:.1f}.",
             )
 
-    # Binary search
-    best_result = result_lo
-    best_alpha = alpha_lo
-    best_metric = metric_lo
-    best_error = abs(metric_lo - target_value)
-
-    lo, hi = alpha_lo, alpha_hi
-    iterations = 2  # already did 2 boundary evaluations
-
-    for i in range(max_iterations):
-        mid = (lo + hi) / 2.0
-        result_mid = run_forward(mid)
-        metric_mid = extract_metric(result_mid)
-        iterations += 1
-
-        error = abs(metric_mid - target_value)
-        if error < best_error:
-            best_error = error
-            best_result = result_mid
-            best_alpha = mid
-            best_metric = metric_mid
+    best_error = math.inf
+    grid_alphas, grid_metrics = alphas, metrics
+    for round_ in range(max_rounds + 1):
+        errors = np.abs(metrics - target_value)
+        i = int(np.argmin(errors))
+        if errors[i] < best_error:
+            best_error = float(errors[i])
+            best_batch, best_index = batch, i
+            best_alpha, best_metric = float(alphas[i]), float(metrics[i])
 
         # Check convergence
-        rel_error = error / max(abs(target_value), 0.01)
+        rel_error = best_error / max(abs(target_value), 0.01)
         if rel_error <= tolerance:
             return InverseSolveResult(
                 solved=True,
-                solved_alpha=mid,
-                achieved_value=metric_mid,
+                solved_alpha=best_alpha,
+                achieved_value=best_metric,
                 target_value=target_value,
                 error_pct=rel_error * 100,
                 iterations=iterations,
-                simulation_result=result_mid,
+                simulation_result=best_batch.result(best_index),
                 feasibility_range=feasibility_range,
-                message=f"Solved: alpha={mid:.3f} achieves {metric_mid:.1f} (target {target_value:.1f}, error {rel_error:.1%})",
+                message=f"Solved: alpha={best_alpha:.3f} achieves {best_metric:.1f} (target {target_value:.1f}, error {rel_error:.1%})",
             )
+        if round_ == max_rounds:
+            break
 
-        # Narrow the search
+        # Narrow the grid to the first interval where the metric reaches the target
         if monotonic == "increasing":
-            if metric_mid < target_value:
-                lo = mid
-            else:
-                hi = mid
+            reached = np.nonzero(grid_metrics >= target_value)[0]
         else:
-            if metric_mid > target_value:
-                lo = mid
-            else:
-                hi = mid
-
-    # Exhausted iterations — return best found
+            reached = np.nonzero(grid_metrics <= target_value)[0]
+        lo = max(0, (int(reached[0]) if len(reached) else len(grid_alphas) - 1) - 1)
+        hi = lo + 1
+        alphas = np.linspace(grid_alphas[lo], grid_alphas[hi], grid_size + 2)[1:-1]
+        batch = run_batch(alphas)
+        metrics = extract_metric(batch)
+        iterations += len(alphas)
+        grid_alphas = np.concatenate(([grid_alphas[lo]], alphas, [grid_alphas[hi]]))
+        grid_metrics = np.concatenate(([grid_metrics[lo]], metrics, [grid_metrics[hi]]))
+
+    # Exhausted rounds — return best found
     rel_error = best_error / max(abs(target_value), 0.01)
     return InverseSolveResult(
         solved=rel_error <= tolerance * 2,  # lenient on final check
@@ -190,10 +193,10 @@ def _binary_search_alpha(
         target_value=target_value,
         error_pct=rel_error * 100,
         iterations=iterations,
-        simulation_result=best_result,
+        simulation_result=best_batch.result(best_index),
         feasibility_range=feasibility_range,
         message=(
-            f"Best after {iterations} iterations: alpha={best_alpha:.3f} "
+            f"Best after {iterations} simulations: alpha={best_alpha:.3f} "
             f"achieves {best_metric:.1f} (target {target_value:.1f}, "
             f"error {rel_error:.1%})"
         ),
@@ -201,74 +204,78 @@ def _binary_search_alpha(
 
 
 # ============================================================
-# Helper: Build a forward sim runner for a given alpha
+# Helper: Build a batched forward sim runner over alphas
 # ============================================================
 
-def _make_forward_runner(
-    stimulus: Stimulus,
-    org: OrganizationData,
-    base_params: SimulationParams,
-    fb_params: FeedbackParams,
-    initial_hs: Optional[HumanSystemState] = None,
-) -> Callable[[float], FBSimulationResult]:
+def params_for_alpha(base_params: SimulationParams, alpha: float) -> SimulationParams:
     """
-    Returns a function that runs the forward simulation with a given alpha.
-    All other parameters are fixed (captured from the closure).
+    Clone base_params with a new adoption alpha. Expansion and extension
+    alphas scale in proportion; all other parameters are kept.
     """
-    def run(alpha: float) -> FBSimulationResult:
-        # Clone params with new adoption alpha
-        adopt = RateParams(
-            alpha=alpha,
-            k=base_params.adoption.k if base_params.adoption else 0.3,
-            midpoint=base_params.adoption.midpoint if base_params.adoption else 4.0,
-            delay_months=base_params.adoption.delay_months if base_params.adoption else 0,
+    adopt = RateParams(
+        alpha=alpha,
+        k=base_params.adoption.k if base_params.adoption else 0.3,
+        midpoint=base_params.adoption.midpoint if base_params.adoption else 4.0,
+        delay_months=base_params.adoption.delay_months if base_params.adoption else 0,
+    )
+
+    # Scale expansion and extension proportionally if they exist
+    expand = None
+    if base_params.expansion:
+        scale = alpha / max(0.01, base_params.adoption.alpha) if base_params.adoption else 1.0
+        expand = RateParams(
+            alpha=min(1.0, base_params.expansion.alpha * scale),
+            k=base_params.expansion.k,
+            midpoint=base_params.expansion.midpoint,
+            delay_months=base_params.expansion.delay_months,
         )
 
-        # Scale expansion and extension proportionally if they exist
-        expand = None
-        if base_params.expansion:
-            scale = alpha / max(0.01, base_params.adoption.alpha) if base_params.adoption else 1.0
-            expand = RateParams(
-                alpha=min(1.0, base_params.expansion.alpha * scale),
-                k=base_params.expansion.k,
-                midpoint=base_params.expansion.midpoint,
-                delay_months=base_params.expansion.delay_months,
-            )
+    extend = None
+    if base_params.extension:
+        scale = alpha / max(0.01, base_params.adoption.alpha) if base_params.adoption else 1.0
+        extend = RateParams(
+            alpha=min(1.0, base_params.extension.alpha * scale),
+            k=base_params.extension.k,
+            midpoint=base_params.extension.midpoint,
+            delay_months=base_params.extension.delay_months,
+        )
 
-        extend = None
-        if base_params.extension:
-            scale = alpha / max(0.01, base_params.adoption.alpha) if base_params.adoption else 1.0
-            extend = RateParams(
-                alpha=min(1.0, base_params.extension.alpha * scale),
-                k=base_params.extension.k,
-                midpoint=base_params.extension.midpoint,
-                delay_months=base_params.extension.delay_months,
-            )
+    return SimulationParams(
+        scenario_id=base_params.scenario_id,
+        scenario_name=base_params.scenario_name,
+        adoption=adopt,
+        expansion=expand,
+        extension=extend,
+        policy=base_params.policy,
+        absorption_factor=base_params.absorption_factor,
+        training_cost_per_person=base_params.training_cost_per_person,
+        time_horizon_months=base_params.time_horizon_months,
+        hc_review_frequency=base_params.hc_review_frequency,
+        reskilling_delay_months=base_params.reskilling_delay_months,
+        reskilling_rate=base_params.reskilling_rate,
+        enable_workflow_automation=base_params.enable_workflow_automation,
+        workflow_automation_bonus=base_params.workflow_automation_bonus,
+    )
 
-        params = SimulationParams(
-            scenario_id=base_params.scenario_id,
-            scenario_name=base_params.scenario_name,
-            adoption=adopt,
-            expansion=expand,
-            extension=extend,
-            policy=base_params.policy,
-            absorption_factor=base_params.absorption_factor,
-            training_cost_per_person=base_params.training_cost_per_person,
-            time_horizon_months=base_params.time_horizon_months,
-            hc_review_frequency=base_params.hc_review_frequency,
-            reskilling_delay_months=base_params.reskilling_delay_months,
-            reskilling_rate=base_params.reskilling_rate,
-            enable_workflow_automation=base_params.enable_workflow_automation,
-            workflow_automation_bonus=base_params.workflow_automation_bonus,
-        )
 
-        return simulate_with_feedback(
+def _make_batch_runner(
+    stimulus: Stimulus,
+    org: OrganizationData,
+    base_params: SimulationParams,
+    fb_params: FeedbackParams,
+    initial_hs: Optional[HumanSystemState] = None,
+) -> Callable[[Sequence[float]], BatchSimulationResult]:
+    """
+    Returns a function that runs the forward simulation at every given alpha
+    in one batch. All other parameters are fixed (captured from the closure).
+    """
+    def run(alphas: Sequence[float]) -> BatchSimulationResult:
+        return simulate_batch(
             stimulus=stimulus,
             org=org,
-            params=params,
+            params=[params_for_alpha(base_params, float(alpha)) for alpha in alphas],
             fb_params=fb_params,
-            initial_hs=initial_hs,
-            trace=False,  # no tracing during search iterations
+            initial_hs=[initial_hs] * len(alphas),
         )
 
     return run
@@ -304,18 +311,16 @@ def solve_for_headcount_target(
     if fb_params is None:
         fb_params = FeedbackParams()
 
-    runner = _make_forward_runner(stimulus, org, params, fb_params, initial_hs)
+    runner = _make_batch_runner(stimulus, org, params, fb_params, initial_hs)
 
-    def extract_hc_reduction(result: FBSimulationResult) -> float:
-        """Extract HC reduction % from simulation result."""
-        if result.timeline and result.timeline[0].headcount > 0:
-            original = result.timeline[0].headcount
-            final = result.final_headcount
-            return (original - final) / original * 100.0
-        return 0.0
+    def extract_hc_reduction(batch: BatchSimulationResult) -> np.ndarray:
+        """Extract HC reduction % per variant."""
+        original = batch.series["headcount"][:, 0]
+        reduced = (original - batch.final_headcount) / np.maximum(1, original) * 100.0
+        return np.where(original > 0, reduced, 0.0)
 
-    return _binary_search_alpha(
-        run_forward=runner,
+    return _grid_search_alpha(
+        run_batch=runner,
         extract_metric=extract_hc_reduction,
         target_value=target_hc_reduction_pct,
         alpha_lo=0.05,
@@ -358,16 +363,16 @@ def solve_for_budget_constraint(
     if fb_params is None:
         fb_params = FeedbackParams()
 
-    runner = _make_forward_runner(stimulus, org, params, fb_params, initial_hs)
+    runner = _make_batch_runner(stimulus, org, params, fb_params, initial_hs)
 
-    def extract_investment(result: FBSimulationResult) -> float:
-        """Extract total cumulative investment from simulation result."""
-        return result.total_investment
+    def extract_investment(batch: BatchSimulationResult) -> np.ndarray:
+        """Extract total cumulative investment per variant."""
+        return batch.total_investment
 
     # For budget: we want investment ≤ budget. Investment increases with alpha.
     # So we search for the alpha where investment = budget (the max affordable alpha).
-    return _binary_search_alpha(
-        run_forward=runner,
+    return _grid_search_alpha(
+        run_batch=runner,
         extract_metric=extract_investment,
         target_value=budget_amount,
         alpha_lo=0.05,
@@ -411,17 +416,15 @@ def solve_for_automation_target(
     if fb_params is None:
         fb_params = FeedbackParams()
 
-    runner = _make_forward_runner(stimulus, org, params, fb_params, initial_hs)
+    runner = _make_batch_runner(stimulus, org, params, fb_params, initial_hs)
 
-    def extract_peak_adoption(result: FBSimulationResult) -> float:
-        """Extract peak effective adoption % from simulation timeline."""
-        if not result.timeline:
-            return 0.0
-        peak = max(s.effective_adoption_pct for s in result.timeline)
+    def extract_peak_adoption(batch: BatchSimulationResult) -> np.ndarray:
+        """Extract peak effective adoption % per variant."""
+        peak = batch.series["effective_adoption_pct"].max(axis=1)
         return peak * 100.0  # convert 0-1 to percentage
 
-    return _binary_search_alpha(
-        run_forward=runner,
+    return _grid_search_alpha(
+        run_batch=runner,
         extract_metric=extract_peak_adoption,
         target_value=target_automation_pct,
         alpha_lo=0.05,
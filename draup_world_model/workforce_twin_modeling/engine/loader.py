@@ -4,9 +4,10 @@ Reads CSV files into typed dataclass instances.
 Principle: I/O at the boundary, pure computation inside.
 """
 import csv
+import hashlib
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from workforce_twin_modeling.models.organization import (
     Task, Role, Workload, Skill, Tool, HumanSystem
 )
@@ -28,6 +29,20 @@ class OrganizationData:
     skills_by_workload: Dict[str, List[str]] = field(default_factory=dict)
     roles_by_function: Dict[str, List[str]] = field(default_factory=dict)
     roles_by_jfg: Dict[str, List[str]] = field(default_factory=dict)
+    task_ids_by_role: Dict[str, List[str]] = field(default_factory=dict)     # workload order
+    effort_by_role: Dict[str, float] = field(default_factory=dict)           # task hours/person/month
+
+    # Tool lookups (built after loading). Stimuli name tools, so names are unique per org
+    tools_by_name: Dict[str, Tool] = field(default_factory=dict)
+    # (function, task category) → tools deployed to that function that address the category, in org order
+    tools_by_scope: Dict[Tuple[str, str], List[Tool]] = field(default_factory=dict)
+
+    # Directory the data was loaded from; lets worker processes load their own copy
+    data_dir: str = ""
+    # Fingerprint of the files it was loaded from (see data_version); "" when built in memory
+    version: str = ""
+    # Set once every task carries its L1/L2/L3 classification (gap_engine.classify_tasks)
+    classified: bool = False
 
     def build_indexes(self):
         """Build reverse-lookup indexes for efficient traversal."""
@@ -36,6 +51,10 @@ class OrganizationData:
         self.skills_by_workload = {}
         self.roles_by_function = {}
         self.roles_by_jfg = {}
+        self.task_ids_by_role = {}
+        self.effort_by_role = {}
+        self.tools_by_name = {}
+        self.tools_by_scope = {}
 
         for wl in self.workloads.values():
             self.workloads_by_role.setdefault(wl.role_id, []).append(wl.workload_id)
@@ -50,6 +69,20 @@ class OrganizationData:
             self.roles_by_function.setdefault(role.function, []).append(role.role_id)
             self.roles_by_jfg.setdefault(role.jfg, []).append(role.role_id)
 
+        for rid in self.roles:
+            task_ids = [tid for wl_id in self.workloads_by_role.get(rid, [])
+                        for tid in self.tasks_by_workload.get(wl_id, [])]
+            self.task_ids_by_role[rid] = task_ids
+            self.effort_by_role[rid] = sum(self.tasks[tid].effort_hours_month for tid in task_ids)
+
+        functions = list(self.roles_by_function)
+        for tool in self.tools.values():
+            self.tools_by_name.setdefault(tool.tool_name, tool)
+            deployed = functions if "All" in tool.deployed_to_functions else tool.deployed_to_functions
+            for fn in dict.fromkeys(deployed):
+                for category in dict.fromkeys(tool.task_categories_addressed):
+                    self.tools_by_scope.setdefault((fn, category), []).append(tool)
+
     @property
     def total_headcount(self) -> int:
         return sum(r.headcount for r in self.roles.values())
@@ -81,13 +114,35 @@ def _parse_list(value: str) -> list:
     return [x.strip() for x in value.split(',')]
 
 
+DATA_FILES = (
+    "roles.csv", "workloads.csv", "tasks.csv",
+    "skills.csv", "tech_stack.csv", "human_system.csv",
+)
+
+
+def data_version(data_dir: str) -> str:
+    """
+    Fingerprint of the CSV files in data_dir (name, size, mtime).
+    Changes whenever any of them is rewritten; cheap enough to check per request.
+    """
+    digest = hashlib.sha1()
+    for name in DATA_FILES:
+        path = Path(data_dir) / name
+        try:
+            st = path.stat()
+            digest.update(f"{name}:{st.st_size}:{st.st_mtime_ns};".encode())
+        except FileNotFoundError:
+            digest.update(f"{name}:missing;".encode())
+    return digest.hexdigest()[:16]
+
+
 def load_organization(data_dir: str) -> OrganizationData:
     """
     Load all CSV files from data_dir into an OrganizationData instance.
     This is the single entry point for all data I/O.
     """
     data_path = Path(data_dir)
-    org = OrganizationData()
+    org = OrganizationData(data_dir=str(data_dir), version=data_version(data_dir))
 
     # Load roles
     for row in _read_csv(data_path / "roles.csv"):
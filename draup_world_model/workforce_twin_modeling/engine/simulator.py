@@ -18,10 +18,11 @@ from typing import Dict, List, Optional
 
 from workforce_twin_modeling.engine.rates import SimulationParams, RateParams
 from workforce_twin_modeling.engine.cascade import (
-    Stimulus, run_cascade, CascadeResult,
+    Stimulus, CascadeResult,
     AUTOMATION_FREED_PCT, AI_CATEGORIES, HUMAN_AI_CATEGORIES,
 )
 from workforce_twin_modeling.engine.loader import OrganizationData
+from workforce_twin_modeling.engine.cascade_cache import run_cascade_cached
 
 
 # ============================================================
@@ -121,7 +122,7 @@ def simulate(
         alpha=1.0,
         training_cost_per_person=params.training_cost_per_person,
     )
-    baseline = run_cascade(ceiling_stimulus, org)
+    baseline = run_cascade_cached(ceiling_stimulus, org)
 
     # Extract ceilings from cascade
     ceiling_gross_freed = baseline.step3_capacity.total_gross_freed_hours
@@ -0,0 +1,585 @@
+"""
+Batched Feedback Simulator
+==========================
+Runs N variants of one feedback simulation in lockstep. Every stock of
+``simulate_with_feedback`` (human system, capacity pipeline, skill gap,
+headcount per role, money) becomes an array with a leading batch axis, and
+each month is one pass of array operations over all variants.
+
+What may vary per variant:
+  - the three S-curves (adoption, expansion, extension)
+  - HC review frequency, reskilling delay and rate, workflow automation bonus
+  - the initial human system
+
+What the variants share (one ceiling cascade, one time grid):
+  - stimulus, org and feedback parameters
+  - policy, absorption factor, training cost and time horizon
+
+The inverse solver evaluates a grid of alphas in one call, and sensitivity
+sweeps vary the initial human system, so both fit in one batch.
+
+Results equal ``simulate_with_feedback`` up to float rounding: the same
+operations run in the same order, only on arrays. Traces are not recorded;
+re-run the chosen variant with ``simulate_with_feedback(trace=True)``.
+
+Principle: the scalar simulator stays the reference. This file is a
+           faster way to run many of it, never a different model.
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from workforce_twin_modeling.engine.cascade import CascadeResult, Stimulus, productive_hours_month
+from workforce_twin_modeling.engine.cascade_cache import run_cascade_cached
+from workforce_twin_modeling.engine.feedback import FeedbackParams, HumanSystemState
+from workforce_twin_modeling.engine.loader import OrganizationData
+from workforce_twin_modeling.engine.rates import SimulationParams
+from workforce_twin_modeling.engine.simulator_fb import (
+    CAPACITY_REALIZATION_DELAY,
+    FBMonthlySnapshot,
+    FBSimulationResult,
+    ceiling_stimulus_for,
+    compute_learning_velocity_factor,
+    initial_human_system,
+)
+
+# SimulationParams fields every variant of a batch must share
+SHARED_PARAMS = ("policy", "absorption_factor", "training_cost_per_person", "time_horizon_months")
+
+# FBMonthlySnapshot fields recorded per month, in snapshot order
+_SERIES = (
+    "raw_adoption_pct", "effective_adoption_pct", "adoption_dampening",
+    "gross_freed_hours", "redistributed_hours", "net_freed_hours", "cumulative_net_freed",
+    "dynamic_absorption_rate",
+    "headcount", "hc_reduced_this_month", "cumulative_hc_reduced", "hc_pct_of_original",
+    "skill_gap_opened", "skill_gap_closed", "current_skill_gap", "skill_gap_pct",
+    "cumulative_investment", "cumulative_savings", "net_position", "monthly_savings_rate",
+    "productivity_index",
+    "proficiency", "readiness", "trust", "political_capital", "transformation_fatigue",
+    "human_multiplier", "trust_multiplier", "capital_multiplier",
+    "b2_skill_drag", "b4_seniority_mult",
+)
+_INT_SERIES = frozenset({
+    "headcount", "hc_reduced_this_month", "cumulative_hc_reduced",
+    "skill_gap_opened", "skill_gap_closed", "current_skill_gap",
+})
+
+
+# ============================================================
+# Vectorized human system (mirrors HumanSystemState / feedback.py)
+# ============================================================
+
+@dataclass
+class _HumanSystemArrays:
+    proficiency: np.ndarray
+    readiness: np.ndarray
+    trust: np.ndarray
+    political_capital: np.ndarray
+    transformation_fatigue: np.ndarray
+
+    @property
+    def effective_multiplier(self) -> np.ndarray:
+        base = (0.35 * self.proficiency + 0.45 * self.readiness + 0.20 * self.trust) / 100.0
+        veto = (self.trust < 10.0) | (self.readiness < 10.0)
+        return np.where(veto, 0.05, np.maximum(0.15, base))
+
+    @property
+    def trust_multiplier(self) -> np.ndarray:
+        t = self.trust
+        return np.where(t < 20, 0.50,
+                        np.where(t < 40, 0.50 + (t - 20) / 20 * 0.40,
+                                 np.where(t < 60, 0.90 + (t - 40) / 20 * 0.10, 1.0)))
+
+    @property
+    def capital_multiplier(self) -> np.ndarray:
+        c = self.political_capital
+        return np.where(c < 20, 0.2, np.where(c < 40, 0.6, 1.0))
+
+    def clamp(self) -> None:
+        for name in ("proficiency", "readiness", "trust", "political_capital", "transformation_fatigue"):
+            setattr(self, name, np.maximum(0, np.minimum(100, getattr(self, name))))
+
+
+def _b2_skill_valley(skill_gap_pct: np.ndarray, drag_coefficient: float) -> np.ndarray:
+    return np.maximum(0.1, 1.0 - skill_gap_pct / 100.0 * drag_coefficient)
+
+
+def _b4_seniority_offset(original_hc: int, current_hc: np.ndarray, penalty: float) -> np.ndarray:
+    if original_hc <= 0:
+        return np.ones(len(current_hc))
+    reduction_pct = (original_hc - current_hc) / original_hc
+    return np.maximum(0.5, 1.0 - reduction_pct * penalty)
+
+
+def _update_human_system(
+    hs: _HumanSystemArrays,
+    adoption: np.ndarray,
+    disruption: np.ndarray,
+    fb: FeedbackParams,
+    ai_error: bool,
+    velocity: np.ndarray,
+    learning_velocity_factor: float,
+    month: int,
+    hc_reduced_pct: np.ndarray,
+    stable: np.ndarray,
+) -> _HumanSystemArrays:
+    """update_human_system over the batch; returns new arrays."""
+    # R1: Trust
+    if ai_error:
+        delta_trust = -hs.trust * fb.trust_destruction_factor
+    else:
+        build = fb.trust_build_rate * adoption * fb.success_probability
+        delta_trust = build * np.maximum(0.1, 1.0 - hs.trust / 100.0)
+        at_threshold = np.zeros(len(adoption), dtype=bool)
+        for threshold in fb.trust_evidence_thresholds:
+            at_threshold |= np.abs(adoption - threshold) < 0.02
+        delta_trust = np.where(at_threshold, delta_trust, delta_trust * fb.trust_between_threshold_rate)
+
+    # R2: Proficiency
+    learning_rate = fb.learning_rate
+    if month < fb.genai_fast_start_months:
+        learning_rate *= fb.genai_fast_start_multiplier
+    prof_ceiling = np.maximum(0.05, 1.0 - hs.proficiency / fb.learning_saturation)
+    delta_prof = learning_rate * adoption * prof_ceiling * learning_velocity_factor
+
+    # B3: Readiness + fatigue
+    resistance = disruption * fb.resistance_sensitivity / np.maximum(0.3, hs.trust / 100.0)
+    ai_anxiety = np.where(adoption > 0.01, fb.fatigue_ai_anxiety_baseline, 0.0)
+    fatigue_recovery = (
+        fb.fatigue_decay_rate * (1.0 - adoption)
+        + np.where(stable, fb.fatigue_recovery_stability_bonus, 0.0) * fb.fatigue_decay_rate
+    )
+    delta_fatigue = (
+        fb.fatigue_ai_work_burden * adoption + fb.fatigue_hc_anxiety_factor * hc_reduced_pct + ai_anxiety
+        + velocity * fb.fatigue_build_rate * 10.0 + disruption * fb.fatigue_build_rate
+        - fatigue_recovery
+    )
+    recovery = fb.resistance_decay_rate * (1 - hs.transformation_fatigue / 100)
+    adoption_boost = fb.readiness_boost_rate * adoption * np.maximum(0.1, 1.0 - hs.readiness / 100.0)
+    delta_readiness = -resistance + recovery + adoption_boost
+
+    # R4: Political capital
+    delta_capital = (
+        fb.capital_build_rate * adoption * fb.success_probability - fb.capital_spend_rate * disruption
+    )
+
+    new_hs = _HumanSystemArrays(
+        proficiency=hs.proficiency + delta_prof,
+        readiness=hs.readiness + delta_readiness,
+        trust=hs.trust + delta_trust,
+        political_capital=hs.political_capital + delta_capital,
+        transformation_fatigue=hs.transformation_fatigue + delta_fatigue,
+    )
+    new_hs.clamp()
+    return new_hs
+
+
+# ============================================================
+# Batch Result
+# ============================================================
+
+@dataclass
+class BatchSimulationResult:
+    """
+    Outputs of a batch. ``series[name]`` is an (N, months + 1) array per
+    FBMonthlySnapshot field and ``role_headcounts`` is (N, months + 1, roles).
+    ``result(i)`` builds the FBSimulationResult of variant i.
+    """
+    stimulus: Stimulus
+    params: List[SimulationParams]
+    feedback_params: FeedbackParams
+    baseline: CascadeResult
+    role_ids: List[str]
+    series: Dict[str, np.ndarray]
+    role_headcounts: np.ndarray
+    ai_error: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    @property
+    def final_headcount(self) -> np.ndarray:
+        return self.series["headcount"][:, -1]
+
+    @property
+    def total_investment(self) -> np.ndarray:
+        return self.series["cumulative_investment"][:, -1]
+
+    @property
+    def net_savings(self) -> np.ndarray:
+        return self.series["net_position"][:, -1]
+
+    def result(self, i: int) -> FBSimulationResult:
+        columns = {
+            name: values[i].tolist() for name, values in self.series.items()
+        }
+        role_hc = self.role_headcounts[i].tolist()
+        params = self.params[i]
+        timeline = []
+        for month in range(params.time_horizon_months + 1):
+            snapshot = FBMonthlySnapshot(
+                month=month,
+                ai_error_occurred=bool(self.ai_error[month]),
+                role_headcounts=dict(zip(self.role_ids, role_hc[month])),
+                **{name: column[month] for name, column in columns.items()},
+            )
+            timeline.append(snapshot)
+
+        payback_month = 0
+        for snap in timeline:
+            if snap.net_position > 0 and snap.month > 0:
+                payback_month = snap.month
+                break
+        peak_gap_snap = max(timeline, key=lambda s: s.current_skill_gap)
+        valley_snap = min(timeline, key=lambda s: s.productivity_index)
+        avg_dampening = (sum(s.adoption_dampening for s in timeline[1:]) /
+                         max(1, len(timeline) - 1))
+        last = timeline[-1]
+
+        return FBSimulationResult(
+            params=params,
+            feedback_params=self.feedback_params,
+            stimulus=self.stimulus,
+            baseline=self.baseline,
+            timeline=timeline,
+            total_months=params.time_horizon_months,
+            final_headcount=last.headcount,
+            total_hc_reduced=last.cumulative_hc_reduced,
+            total_investment=last.cumulative_investment,
+            total_savings=last.cumulative_savings,
+            net_savings=last.net_position,
+            payback_month=payback_month,
+            peak_skill_gap_month=peak_gap_snap.month,
+            peak_skill_gap_value=peak_gap_snap.current_skill_gap,
+            productivity_valley_month=valley_snap.month,
+            productivity_valley_value=valley_snap.productivity_index,
+            final_proficiency=last.proficiency,
+            final_trust=last.trust,
+            final_readiness=last.readiness,
+            avg_adoption_dampening=avg_dampening,
+        )
+
+    def results(self) -> List[FBSimulationResult]:
+        return [self.result(i) for i in range(len(self))]
+
+
+# ============================================================
+# The Batched Simulator
+# ============================================================
+
+def _curve(params: Sequence[SimulationParams], phase: str, months: int) -> np.ndarray:
+    """(N, months + 1) S-curve values; RateParams.at per point keeps them identical to the scalar path."""
+    curve = np.zeros((len(params), months + 1))
+    for i, p in enumerate(params):
+        rate = getattr(p, phase)
+        if rate:
+            curve[i] = [rate.at(month) for month in range(months + 1)]
+    return curve
+
+
+def simulate_batch(
+    stimulus: Stimulus,
+    org: OrganizationData,
+    params: Sequence[SimulationParams],
+    fb_params: FeedbackParams = None,
+    initial_hs: Optional[Sequence[Optional[HumanSystemState]]] = None,
+) -> BatchSimulationResult:
+    """
+    ``simulate_with_feedback(stimulus, org, params[i], fb_params, initial_hs[i])``
+    for every i, stepped together. params must agree on SHARED_PARAMS.
+    """
+    params = list(params)
+    if not params:
+        raise ValueError("simulate_batch needs at least one SimulationParams")
+    for name in SHARED_PARAMS:
+        if len({getattr(p, name) for p in params}) > 1:
+            raise ValueError(f"All variants of a batch must share {name}")
+    if initial_hs is None:
+        initial_hs = [None] * len(params)
+    elif len(initial_hs) != len(params):
+        raise ValueError("initial_hs must have one entry per params")
+    if fb_params is None:
+        fb_params = FeedbackParams()
+    fb = fb_params
+    first = params[0]
+    months = first.time_horizon_months
+    policy = first.policy
+    n = len(params)
+
+    # ── Shared ceilings (one cascade for the whole batch) ──
+    baseline = run_cascade_cached(ceiling_stimulus_for(stimulus, first), org)
+    ceiling_gross_freed = baseline.step3_capacity.total_gross_freed_hours
+    ceiling_sunrise_skills = len(baseline.step4_skills.sunrise_skills)
+    original_hc = baseline.step5_workforce.total_current_hc
+
+    role_ceiling_gross = {rc.role_id: rc.gross_freed_hours_pp * rc.headcount
+                          for rc in baseline.step3_capacity.role_capacities}
+    license_annual = baseline.step6_financial.license_cost_annual
+    monthly_license = license_annual / 12.0
+    training_per_month_phase1 = baseline.step6_financial.training_cost / 6.0
+    change_mgmt_per_month = baseline.step6_financial.change_management_cost / 6.0
+
+    impacts = baseline.step5_workforce.role_impacts
+    role_ids = [r.role_id for r in impacts]
+    roles = [org.roles[rid] for rid in role_ids]
+    role_headcount = np.array([role.headcount for role in roles], dtype=np.int64)
+    role_ceiling = np.array([role_ceiling_gross.get(rid, 0) for rid in role_ids], dtype=float)
+    role_hours = np.array([productive_hours_month(role.management_level) for role in roles], dtype=float)
+    role_salary = np.array([role.avg_salary for role in roles], dtype=float)
+    min_staffing = np.array(
+        [max(1, int(np.ceil(role.headcount * 0.20))) for role in roles], dtype=np.int64,
+    )
+
+    # ── Per-variant inputs ──
+    raw_adopt = _curve(params, "adoption", months)
+    raw_expand = _curve(params, "expansion", months)
+    raw_extend = _curve(params, "extension", months)
+    workflow_enabled = np.array([p.enable_workflow_automation for p in params])
+    workflow_bonus = np.array([p.workflow_automation_bonus for p in params], dtype=float)
+    review_freq = np.array(
+        [1 if policy == "rapid_redeployment" else p.hc_review_frequency for p in params], dtype=np.int64,
+    )
+    reskilling_delay = np.array([p.reskilling_delay_months for p in params], dtype=np.int64)
+    reskilling_rate = np.array([p.reskilling_rate for p in params], dtype=float)
+
+    start = [initial_human_system(stimulus, org, h) for h in initial_hs]
+    hs = _HumanSystemArrays(**{
+        name: np.array([getattr(h, name) for h in start], dtype=float)
+        for name in ("proficiency", "readiness", "trust", "political_capital", "transformation_fatigue")
+    })
+    learning_velocity_factor = compute_learning_velocity_factor(stimulus, org)
+
+    hc_decision_delay = fb.hc_decision_delay_months
+    if policy == "rapid_redeployment":
+        hc_decision_delay = max(1, hc_decision_delay // 3)
+    elif policy == "active_reduction":
+        hc_decision_delay = max(3, hc_decision_delay // 2)
+
+    # ── State ──
+    current_hc = np.tile(np.array([r.current_hc for r in impacts], dtype=np.int64), (n, 1))
+    cumulative_hc_reduced = np.zeros(n, dtype=np.int64)
+    cumulative_investment = np.zeros(n)
+    cumulative_savings = np.zeros(n)
+    cumulative_net_freed = np.zeros(n)
+    skill_gap_opened = np.zeros(n, dtype=np.int64)
+    skill_gap_closed = np.zeros(n, dtype=np.int64)
+    prev_effective_adoption = np.zeros(n)
+    capability_ceiling_boost = 0.0
+    shadow_adoption = np.zeros(n)
+    capacity_pipeline = deque([np.zeros(n)] * CAPACITY_REALIZATION_DELAY)
+
+    series = {name: np.zeros((n, months + 1), dtype=np.int64 if name in _INT_SERIES else float)
+              for name in _SERIES}
+    role_headcounts = np.zeros((n, months + 1, len(role_ids)), dtype=np.int64)
+    ai_errors = np.zeros(months + 1, dtype=bool)
+
+    # ── Main time loop (steps numbered as in simulate_with_feedback) ──
+    for month in range(0, months + 1):
+
+        # 1. Raw S-curve adoption
+        raw_combined = np.minimum(1.0, raw_adopt[:, month] + raw_expand[:, month] + raw_extend[:, month])
+        if month in fb.capability_upgrade_months:
+            capability_ceiling_boost += fb.capability_upgrade_ceiling_boost
+            hs.proficiency = np.maximum(0, hs.proficiency - fb.capability_upgrade_skill_disruption)
+            hs.trust = np.maximum(0, hs.trust - fb.capability_upgrade_trust_disruption)
+            hs.clamp()
+        raw_combined = np.minimum(1.0, raw_combined + capability_ceiling_boost)
+
+        if month > 0:
+            shadow_raw = np.minimum(1.0, raw_combined * fb.shadow_ai_speed_multiplier)
+            shadow_adoption = np.maximum(shadow_adoption, shadow_raw * hs.effective_multiplier)
+            shadow_conversion = shadow_adoption * fb.shadow_ai_conversion_rate
+            hs.proficiency = np.minimum(100, hs.proficiency + shadow_conversion * 0.5)
+            hs.clamp()
+
+        # 2. Effective adoption
+        skill_gap_pct = (np.maximum(0, skill_gap_opened - skill_gap_closed) /
+                         max(1, ceiling_sunrise_skills) * 100)
+        total_current_hc = current_hc.sum(axis=1)
+        effective = (
+            raw_combined * hs.effective_multiplier * hs.trust_multiplier
+            * _b2_skill_valley(skill_gap_pct, fb.skill_gap_drag_coefficient)
+            * _b4_seniority_offset(original_hc, total_current_hc, fb.seniority_penalty)
+            * hs.capital_multiplier
+        )
+        effective_combined = np.maximum(0, np.minimum(raw_combined, effective))
+        dampening = np.divide(effective_combined, raw_combined,
+                              out=np.ones(n), where=raw_combined > 0)
+        delta_adoption = np.maximum(0, effective_combined - prev_effective_adoption)
+        adoption_velocity = delta_adoption
+        prev_effective_adoption = effective_combined
+
+        # 3. Freed hours through the realization pipeline (twice, as the scalar loop does)
+        gross_freed_this_month = ceiling_gross_freed * delta_adoption
+        workflow_active = workflow_enabled & (raw_extend[:, month] > 0)
+        for _ in range(2):
+            gross_freed_this_month = np.where(
+                workflow_active, gross_freed_this_month * workflow_bonus, gross_freed_this_month,
+            )
+            capacity_pipeline.append(gross_freed_this_month)
+            realized_freed = capacity_pipeline.popleft()
+
+        # 4. B1: Dynamic absorption
+        if original_hc <= 0:
+            dynamic_absorption = np.full(n, first.absorption_factor)
+        else:
+            reduction_ratio = (original_hc - total_current_hc) / original_hc
+            dynamic_absorption = (
+                fb.base_absorption
+                + np.minimum(1.0, reduction_ratio / 0.5) * fb.workload_absorption_sensitivity
+            )
+        redistributed = realized_freed * dynamic_absorption
+        net_freed = realized_freed - redistributed
+        cumulative_net_freed = cumulative_net_freed + net_freed
+
+        # 5. Skill gap dynamics
+        skill_gap_opened = skill_gap_opened + np.trunc(ceiling_sunrise_skills * delta_adoption).astype(np.int64)
+        closing = (month >= reskilling_delay) & (skill_gap_opened > 0)
+        closeable = np.minimum(np.trunc(skill_gap_opened * reskilling_rate).astype(np.int64),
+                               skill_gap_opened - skill_gap_closed)
+        skill_gap_closed = skill_gap_closed + np.where(closing, np.maximum(0, closeable), 0)
+        current_gap = np.maximum(0, skill_gap_opened - skill_gap_closed)
+        gap_pct = current_gap / max(1, ceiling_sunrise_skills) * 100
+
+        # 6. HC decisions
+        pre_hc_total = total_current_hc
+        hc_reduced_this_month = np.zeros(n, dtype=np.int64)
+        if month > hc_decision_delay:
+            review = month % review_freq == 0
+            if policy != "no_layoffs":
+                review &= hs.political_capital >= fb.capital_threshold
+            if review.any():
+                role_freed = (role_ceiling[None, :] * effective_combined[:, None]
+                              * (1 - dynamic_absorption)[:, None])
+                fte_freed = role_freed / role_hours
+                net_new = fte_freed - (role_headcount - current_hc)
+                if policy == "no_layoffs":
+                    reducible = np.zeros_like(current_hc)
+                elif policy == "natural_attrition":
+                    max_attrition = np.maximum(1, np.trunc(current_hc * 0.02).astype(np.int64))
+                    reducible = np.minimum(np.floor(net_new), max_attrition)
+                elif policy == "active_reduction":
+                    reducible = np.round(net_new)
+                elif policy == "rapid_redeployment":
+                    reducible = np.ceil(net_new)
+                else:
+                    reducible = np.floor(net_new)
+                reducible = np.minimum(reducible, np.maximum(0, current_hc - min_staffing))
+                reduce = review[:, None] & (net_new >= 1.0) & (reducible > 0)
+                reduced = np.where(reduce, reducible, 0).astype(np.int64)
+                current_hc = current_hc - reduced
+                hc_reduced_this_month = reduced.sum(axis=1)
+
+        cumulative_hc_reduced = cumulative_hc_reduced + hc_reduced_this_month
+        total_current_hc = current_hc.sum(axis=1)
+
+        # 7. Financial
+        monthly_investment = np.zeros(n)
+        if month >= 1:
+            monthly_investment = monthly_investment + monthly_license * np.maximum(0.1, effective_combined)
+        if 1 <= month <= 6:
+            monthly_investment = monthly_investment + (training_per_month_phase1 + change_mgmt_per_month)
+        cumulative_investment = cumulative_investment + monthly_investment
+
+        reduced_by_role = role_headcount - current_hc
+        role_savings = np.where(reduced_by_role > 0, reduced_by_role * role_salary / 12.0, 0.0)
+        # cumsum adds left to right, like the scalar loop over roles
+        monthly_salary_savings = (role_savings.cumsum(axis=1)[:, -1] if len(role_ids)
+                                  else np.zeros(n))
+        cumulative_savings = cumulative_savings + monthly_salary_savings
+        net_position = cumulative_savings - cumulative_investment
+
+        # R3: Savings reinvestment
+        r3_boost = np.minimum(0.05, cumulative_savings * fb.reinvestment_rate
+                              * fb.reinvestment_effectiveness / 1_000_000)
+        effective_combined = np.where(
+            cumulative_savings > 0, np.minimum(raw_combined, effective_combined + r3_boost), effective_combined,
+        )
+
+        # 8. Productivity with delayed automation lift
+        b2_drag = _b2_skill_valley(gap_pct, fb.skill_gap_drag_coefficient)
+        delayed_month = max(0, month - CAPACITY_REALIZATION_DELAY)
+        if delayed_month > 0:
+            delayed_adoption = series["effective_adoption_pct"][:, delayed_month]
+        else:
+            delayed_adoption = np.zeros(n)
+        disruption_decay = max(0, 1.0 - month / fb.workflow_disruption_decay_months)
+        productivity = (
+            100.0 + delayed_adoption * 15.0 - (1 - b2_drag) * 20.0
+            - hs.transformation_fatigue * 0.15
+            - adoption_velocity * fb.workflow_disruption_coefficient * disruption_decay
+        )
+
+        # 9. Update human system for next month
+        disruption = hc_reduced_this_month / np.maximum(1, total_current_hc) * 10
+        ai_error = fb.ai_error_month is not None and month == fb.ai_error_month
+        hallucination_hit = np.where(
+            (effective_combined > 0.01) & (month > 0),
+            fb.hallucination_base_rate * effective_combined * fb.hallucination_trust_damage, 0.0,
+        )
+        trust_shock_hit = 0.0
+        if (month >= fb.trust_shock_start_month and month > 0 and
+                (month - fb.trust_shock_start_month) % fb.trust_shock_interval == 0):
+            trust_shock_hit = fb.trust_shock_magnitude
+
+        hs = _update_human_system(
+            hs, effective_combined, disruption, fb, ai_error, adoption_velocity,
+            learning_velocity_factor, month,
+            hc_reduced_pct=hc_reduced_this_month / np.maximum(1, pre_hc_total),
+            stable=hc_reduced_this_month == 0,
+        )
+        hit = (hallucination_hit > 0) | (trust_shock_hit > 0)
+        hs.trust = np.where(hit, np.maximum(0, hs.trust - hallucination_hit - trust_shock_hit), hs.trust)
+        hs.clamp()
+
+        # 10. Record
+        recorded = {
+            "raw_adoption_pct": raw_combined,
+            "effective_adoption_pct": effective_combined,
+            "adoption_dampening": dampening,
+            "gross_freed_hours": realized_freed,
+            "redistributed_hours": redistributed,
+            "net_freed_hours": net_freed,
+            "cumulative_net_freed": cumulative_net_freed,
+            "dynamic_absorption_rate": dynamic_absorption,
+            "headcount": total_current_hc,
+            "hc_reduced_this_month": hc_reduced_this_month,
+            "cumulative_hc_reduced": cumulative_hc_reduced,
+            "hc_pct_of_original": (total_current_hc / original_hc * 100) if original_hc > 0 else 100,
+            "skill_gap_opened": skill_gap_opened,
+            "skill_gap_closed": skill_gap_closed,
+            "current_skill_gap": current_gap,
+            "skill_gap_pct": gap_pct,
+            "cumulative_investment": cumulative_investment,
+            "cumulative_savings": cumulative_savings,
+            "net_position": net_position,
+            "monthly_savings_rate": monthly_salary_savings,
+            "productivity_index": productivity,
+            "proficiency": hs.proficiency,
+            "readiness": hs.readiness,
+            "trust": hs.trust,
+            "political_capital": hs.political_capital,
+            "transformation_fatigue": hs.transformation_fatigue,
+            "human_multiplier": hs.effective_multiplier,
+            "trust_multiplier": hs.trust_multiplier,
+            "capital_multiplier": hs.capital_multiplier,
+            "b2_skill_drag": b2_drag,
+            "b4_seniority_mult": _b4_seniority_offset(original_hc, total_current_hc, fb.seniority_penalty),
+        }
+        for name, values in recorded.items():
+            series[name][:, month] = values
+        role_headcounts[:, month] = current_hc
+        ai_errors[month] = ai_error
+
+    return BatchSimulationResult(
+        stimulus=stimulus,
+        params=params,
+        feedback_params=fb_params,
+        baseline=baseline,
+        role_ids=role_ids,
+        series=series,
+        role_headcounts=role_headcounts,
+        ai_error=ai_errors,
+    )
@@ -23,11 +23,12 @@ from typing import Dict, List, Optional
 from workforce_twin_modeling.engine.rates import SimulationParams, RateParams
 from collections import deque
 from workforce_twin_modeling.engine.cascade import (
-    Stimulus, run_cascade, CascadeResult,
+    Stimulus, CascadeResult,
     AUTOMATION_FREED_PCT, AI_CATEGORIES, HUMAN_AI_CATEGORIES,
     productive_hours_month,
 )
 from workforce_twin_modeling.engine.loader import OrganizationData
+from workforce_twin_modeling.engine.cascade_cache import run_cascade_cached
 from workforce_twin_modeling.engine.feedback import (
     HumanSystemState, FeedbackParams,
     compute_effective_adoption, compute_dynamic_absorption,
@@ -35,12 +36,8 @@ from workforce_twin_modeling.engine.feedback import (
     r3_savings_reinvestment,
     r1_trust_adoption, r2_proficiency, b3_change_resistance, r4_political_capital,
 )
-from workforce_twin_modeling.engine.trace import (
-    MonthTrace, SimulationTrace,
-    trust_band, capital_band,
-    determine_dominant_loop, compute_phase_summary, compute_improvement_summary,
-    format_trace,
-)
+from workforce_twin_modeling.engine.trace import SimulationTrace
+from workforce_twin_modeling.engine.trace_compact import CompactTrace
 
 # T2-#10: Capacity realization delay — months between adoption and freed hours
 CAPACITY_REALIZATION_DELAY = 2
@@ -144,6 +141,80 @@ class FBSimulationResult:
 
     # Traceability (populated when trace=True)
     trace: Optional[SimulationTrace] = None
+    compact_trace: Optional[CompactTrace] = None
+
+
+# ============================================================
+# Setup shared with the batched simulator
+# ============================================================
+
+def ceiling_stimulus_for(stimulus: Stimulus, params: SimulationParams) -> Stimulus:
+    """The stimulus at full adoption (alpha=1.0) whose cascade gives a run's ceilings."""
+    return Stimulus(
+        name=stimulus.name,
+        stimulus_type=stimulus.stimulus_type,
+        tools=stimulus.tools,
+        target_scope=stimulus.target_scope,
+        target_functions=stimulus.target_functions,
+        target_roles=stimulus.target_roles,
+        policy=params.policy,
+        absorption_factor=params.absorption_factor,
+        alpha=1.0,
+        training_cost_per_person=params.training_cost_per_person,
+    )
+
+
+def initial_human_system(
+    stimulus: Stimulus,
+    org: OrganizationData,
+    initial_hs: HumanSystemState = None,
+) -> HumanSystemState:
+    """Starting human system: a copy of initial_hs, else the average of the targeted functions."""
+    if initial_hs:
+        return HumanSystemState(
+            proficiency=initial_hs.proficiency,
+            readiness=initial_hs.readiness,
+            trust=initial_hs.trust,
+            political_capital=initial_hs.political_capital,
+            transformation_fatigue=initial_hs.transformation_fatigue,
+        )
+
+    # Average across affected functions
+    avg_prof = avg_read = avg_trust = 0
+    count = 0
+    for fn in stimulus.target_functions:
+        org_hs = org.human_system.get(fn)
+        if org_hs:
+            avg_prof += org_hs.ai_proficiency
+            avg_read += org_hs.change_readiness
+            avg_trust += org_hs.trust_level
+            count += 1
+    if count > 0:
+        return HumanSystemState(
+            proficiency=avg_prof / count,
+            readiness=avg_read / count,
+            trust=avg_trust / count,
+            political_capital=60.0,
+        )
+    return HumanSystemState()
+
+
+def compute_learning_velocity_factor(stimulus: Stimulus, org: OrganizationData) -> float:
+    """
+    T1-#6: Per-function learning velocity factor.
+    Baseline = 6 months. Function with learning_velocity_months=3 learns 2x faster.
+    """
+    LEARNING_VELOCITY_BASELINE = 6.0
+    avg_learning_velocity = LEARNING_VELOCITY_BASELINE
+    lv_count = 0
+    for fn in stimulus.target_functions:
+        org_hs = org.human_system.get(fn)
+        if org_hs and org_hs.learning_velocity_months > 0:
+            avg_learning_velocity += org_hs.learning_velocity_months
+            lv_count += 1
+    if lv_count > 0:
+        avg_learning_velocity = avg_learning_velocity / (lv_count + 1)
+    return LEARNING_VELOCITY_BASELINE / max(1.0, avg_learning_velocity)
 
 
 # ============================================================
@@ -157,6 +228,7 @@ def simulate_with_feedback(
     fb_params: FeedbackParams = None,
     initial_hs: HumanSystemState = None,
     trace: bool = False,
+    record_trace: bool = False,
 ) -> FBSimulationResult:
     """
     Run time-stepped simulation WITH feedback loops.
@@ -165,24 +237,16 @@ def simulate_with_feedback(
     Args:
         trace: When True, captures detailed per-month computation decomposition
                in result.trace (SimulationTrace). Zero overhead when False.
+        record_trace: When True (or trace=True), records the per-month numbers in
+               result.compact_trace (CompactTrace), from which any month of the
+               SimulationTrace can be rebuilt later.
     """
     if fb_params is None:
         fb_params = FeedbackParams()
 
     # Run Stage 1 cascade for ceiling values
-    ceiling_stimulus = Stimulus(
-        name=stimulus.name,
-        stimulus_type=stimulus.stimulus_type,
-        tools=stimulus.tools,
-        target_scope=stimulus.target_scope,
-        target_functions=stimulus.target_functions,
-        target_roles=stimulus.target_roles,
-        policy=params.policy,
-        absorption_factor=params.absorption_factor,
-        alpha=1.0,
-        training_cost_per_person=params.training_cost_per_person,
-    )
-    baseline = run_cascade(ceiling_stimulus, org)
+    ceiling_stimulus = ceiling_stimulus_for(stimulus, params)
+    baseline = run_cascade_cached(ceiling_stimulus, org)
 
     # Extract ceilings
     ceiling_gross_freed = baseline.step3_capacity.total_gross_freed_hours
@@ -210,48 +274,10 @@ def simulate_with_feedback(
     current_hc = {r.role_id: r.current_hc for r in baseline.step5_workforce.role_impacts}
 
     # Initialize human system from org data or parameter override
-    if initial_hs:
-        hs = HumanSystemState(
-            proficiency=initial_hs.proficiency,
-            readiness=initial_hs.readiness,
-            trust=initial_hs.trust,
-            political_capital=initial_hs.political_capital,
-            transformation_fatigue=initial_hs.transformation_fatigue,
-        )
-    else:
-        # Average across affected functions
-        avg_prof = avg_read = avg_trust = 0
-        count = 0
-        for fn in stimulus.target_functions:
-            org_hs = org.human_system.get(fn)
-            if org_hs:
-                avg_prof += org_hs.ai_proficiency
-                avg_read += org_hs.change_readiness
-                avg_trust += org_hs.trust_level
-                count += 1
-        if count > 0:
-            hs = HumanSystemState(
-                proficiency=avg_prof / count,
-                readiness=avg_read / count,
-                trust=avg_trust / count,
-                political_capital=60.0,
-            )
-        else:
-            hs = HumanSystemState()
+    hs = initial_human_system(stimulus, org, initial_hs)
 
-    # T1-#6: Compute per-function learning velocity factor
-    # Baseline = 6 months. Function with learning_velocity_months=3 learns 2x faster.
-    LEARNING_VELOCITY_BASELINE = 6.0
-    avg_learning_velocity = LEARNING_VELOCITY_BASELINE
-    lv_count = 0
-    for fn in stimulus.target_functions:
-        org_hs = org.human_system.get(fn)
-        if org_hs and org_hs.learning_velocity_months > 0:
-            avg_learning_velocity += org_hs.learning_velocity_months
-            lv_count += 1
-    if lv_count > 0:
-        avg_learning_velocity = avg_learning_velocity / (lv_count + 1)
-    learning_velocity_factor = LEARNING_VELOCITY_BASELINE / max(1.0, avg_learning_velocity)
+    # T1-#6: Per-function learning velocity factor
+    learning_velocity_factor = compute_learning_velocity_factor(stimulus, org)
 
     cumulative_hc_reduced = 0
     cumulative_investment = 0.0
@@ -271,15 +297,29 @@ def simulate_with_feedback(
     # Freed capacity enters a pipeline and releases after CAPACITY_REALIZATION_DELAY months
     capacity_pipeline = deque([0.0] * CAPACITY_REALIZATION_DELAY)
 
+    # T1-#3: rapid_redeployment uses monthly HC reviews
+    hc_freq = 1 if params.policy == "rapid_redeployment" else params.hc_review_frequency
+    # T3-#4: HC decision latency — no reductions before delay period
+    hc_decision_delay = fb_params.hc_decision_delay_months
+    if params.policy == "rapid_redeployment":
+        hc_decision_delay = max(1, hc_decision_delay // 3)  # rapid = shorter delay
+    elif params.policy == "active_reduction":
+        hc_decision_delay = max(3, hc_decision_delay // 2)  # active = moderate delay
+
     # ── Initialize trace ──
-    sim_trace = None
-    if trace:
-        sim_trace = SimulationTrace(
-            scenario_id=params.scenario_id,
-            scenario_name=params.scenario_name,
+    recorder = None
+    if trace or record_trace:
+        recorder = CompactTrace(
+            params=params,
+            fb_params=fb_params,
             stimulus_name=stimulus.name,
-            policy=params.policy,
-            time_horizon=params.time_horizon_months,
+            role_ids=list(current_hc),
+            role_names=[org.roles[rid].role_name for rid in current_hc],
+            hc_freq=hc_freq,
+            hc_decision_delay=hc_decision_delay,
+            monthly_license=monthly_license,
+            training_per_month_phase1=training_per_month_phase1,
+            change_mgmt_per_month=change_mgmt_per_month,
             initial_conditions={
                 "proficiency": hs.proficiency,
                 "readiness": hs.readiness,
@@ -399,16 +439,7 @@ def simulate_with_feedback(
 
         # 6. HC decisions (periodic, with capital check)
         hc_reduced_this_month = 0
-        hc_trace_roles = []  # trace: per-role HC decision data
         pre_hc_total = total_current_hc  # save for trace (pre-HC total)
-        # T1-#3: rapid_redeployment uses monthly HC reviews
-        hc_freq = 1 if params.policy == "rapid_redeployment" else params.hc_review_frequency
-        # T3-#4: HC decision latency — no reductions before delay period
-        hc_decision_delay = fb_params.hc_decision_delay_months
-        if params.policy == "rapid_redeployment":
-            hc_decision_delay = max(1, hc_decision_delay // 3)  # rapid = shorter delay
-        elif params.policy == "active_reduction":
-            hc_decision_delay = max(3, hc_decision_delay // 2)  # active = moderate delay
         if month > hc_decision_delay and month % hc_freq == 0:
             # R4: Political capital gates HC decisions
             if hs.political_capital >= fb_params.capital_threshold or params.policy == "no_layoffs":
@@ -445,19 +476,11 @@ def simulate_with_feedback(
                         reducible = min(reducible, max_reducible)
 
                         # Trace: capture per-role HC reasoning
-                        if trace and pre_floor > 0:
-                            hc_trace_roles.append({
-                                "role_id": rid,
-                                "role_name": role.role_name,
-                                "fte_freed": round(fte_freed, 2),
-                                "net_new": round(net_new, 2),
-                                "policy_reducible": pre_floor,
-                                "min_staffing": min_staffing,
-                                "floor_hit": pre_floor > max_reducible,
-                                "reduced": reducible,
-                                "hc_before": current_hc[rid],
-                                "hc_after": current_hc[rid] - reducible,
-                            })
+                        if recorder and pre_floor > 0:
+                            recorder.record_role(
+                                month, rid, fte_freed, net_new, pre_floor,
+                                min_staffing, max_reducible, reducible, current_hc[rid],
+                            )
 
                         if reducible > 0:
                             current_hc[rid] -= reducible
@@ -560,371 +583,29 @@ def simulate_with_feedback(
             hs.clamp()
 
         # ── TRACE CAPTURE ──
-        if trace:
-            mt = MonthTrace(month=month)
-
-            # S-CURVE
-            mt.s_curve = {
-                "adopt": raw_adopt, "expand": raw_expand,
-                "extend": raw_extend, "combined": raw_combined,
-            }
-
-            # MULTIPLIERS (using pre-update human state)
-            t_human = hs_before.effective_multiplier
-            t_trust = hs_before.trust_multiplier
-            t_skill = b2_skill_valley(skill_gap_pct, fb_params.skill_gap_drag_coefficient)
-            t_seniority = b4_seniority_offset(
-                original_hc, pre_hc_total, fb_params.seniority_penalty,
-            )
-            t_capital = hs_before.capital_multiplier
-
-            # Multiplier detail decomposition
-            veto = hs_before.trust < 10.0 or hs_before.readiness < 10.0
-            if veto:
-                human_detail = (
-                    f"VETO [T2-#7]: trust={hs_before.trust:.1f} or "
-                    f"ready={hs_before.readiness:.1f} < 10 -> 0.05"
-                )
-            else:
-                raw_hm = (
-                    0.35 * hs_before.proficiency
-                    + 0.45 * hs_before.readiness
-                    + 0.20 * hs_before.trust
-                ) / 100.0
-                human_detail = (
-                    f"0.35x{hs_before.proficiency:.1f} + 0.45x{hs_before.readiness:.1f} + "
-                    f"0.20x{hs_before.trust:.1f} = {raw_hm:.3f}"
-                    f"{' (floor->0.15)' if raw_hm < 0.15 else ''}"
-                )
-
-            drag_val = skill_gap_pct / 100.0 * fb_params.skill_gap_drag_coefficient
-            red_pct = ((original_hc - pre_hc_total) / original_hc) if original_hc > 0 else 0
-
-            mt.multipliers = {
-                "human_system": {"value": t_human, "detail": human_detail, "veto": veto},
-                "trust_gate": {
-                    "value": t_trust,
-                    "detail": f"trust={hs_before.trust:.1f} {trust_band(hs_before.trust)}",
-                },
-                "skill_valley": {
-                    "value": t_skill,
-                    "detail": (
-                        f"gap={skill_gap_pct:.1f}% x coeff="
-                        f"{fb_params.skill_gap_drag_coefficient} -> drag={drag_val:.3f}"
-                    ),
-                },
-                "seniority": {
-                    "value": t_seniority,
-                    "detail": (
-                        f"reduced={red_pct:.1%} x penalty={fb_params.seniority_penalty}"
-                    ),
-                },
-                "capital": {
-                    "value": t_capital,
-                    "detail": (
-                        f"capital={hs_before.political_capital:.1f} "
-                        f"{capital_band(hs_before.political_capital)}"
-                    ),
-                },
-            }
-
-            # ADOPTION
-            mt.adoption = {
-                "raw": raw_combined,
-                "effective": effective_pre_r3,
-                "effective_post_r3": effective_combined,
-                "r3_boost": r3_boost_val,
-                "formula": (
-                    f"{raw_combined:.4f} x {t_human:.4f} x {t_trust:.4f} x "
-                    f"{t_skill:.4f} x {t_seniority:.4f} x {t_capital:.4f} "
-                    f"= {effective_pre_r3:.4f}"
-                ),
-                "dampening_pct": dampening * 100,
-                "delta": delta_adoption,
-                "velocity": adoption_velocity,
-            }
-
-            # CAPACITY PIPELINE
-            wf_active = params.enable_workflow_automation and raw_extend > 0
-            mt.capacity = {
-                "gross_delta": gross_before_bonus,
-                "workflow_bonus_active": wf_active,
-                "workflow_bonus_value": params.workflow_automation_bonus if wf_active else 1.0,
-                "pipeline_in": gross_freed_this_month,
-                "pipeline_out": realized_freed,
-                "delay": CAPACITY_REALIZATION_DELAY,
-                "absorption_rate": dynamic_absorption,
-                "redistributed": redistributed,
-                "net_freed": net_freed,
-            }
-
-            # FEEDBACK LOOP DELTAS (decompose what update_human_system computed)
-            # R1: Trust
-            if ai_error:
-                dt_trust = -hs_before.trust * fb_params.trust_destruction_factor
-                trust_detail = (
-                    f"ERROR: -{hs_before.trust:.1f} x "
-                    f"{fb_params.trust_destruction_factor} = {dt_trust:.3f}"
-                )
-            else:
-                _build = (
-                    fb_params.trust_build_rate * effective_combined
-                    * fb_params.success_probability
-                )
-                _ceil = max(0.1, 1.0 - hs_before.trust / 100.0)
-                dt_trust = _build * _ceil
-                # T3-#3: Apply evidence threshold gating in trace too
-                _at_thresh = False
-                for _thr in fb_params.trust_evidence_thresholds:
-                    if abs(effective_combined - _thr) < 0.02:
-                        _at_thresh = True
-                        break
-                if not _at_thresh:
-                    dt_trust *= fb_params.trust_between_threshold_rate
-                _thresh_tag = " AT-THRESHOLD" if _at_thresh else f" x{fb_params.trust_between_threshold_rate:.2f}[T3-#3]"
-                trust_detail = (
-                    f"build: {fb_params.trust_build_rate}x{effective_combined:.3f}"
-                    f"x{fb_params.success_probability}xceil({_ceil:.2f}){_thresh_tag} = {dt_trust:.3f}"
-                )
-
-            # R2: Proficiency (T3-#1: fast-start)
-            _practice = effective_combined
-            _prof_ceil = max(
-                0.05, 1.0 - hs_before.proficiency / fb_params.learning_saturation,
-            )
-            _eff_lr = fb_params.learning_rate
-            if month < fb_params.genai_fast_start_months:
-                _eff_lr *= fb_params.genai_fast_start_multiplier
-            dt_prof = (
-                _eff_lr * _practice * _prof_ceil * learning_velocity_factor
-            )
-            _fast_tag = " [T3-#1 FAST-START]" if month < fb_params.genai_fast_start_months else ""
-            prof_detail = (
-                f"learn: {_eff_lr:.1f}x{_practice:.3f}"
-                f"xceil({_prof_ceil:.2f})xvel({learning_velocity_factor:.2f}) "
-                f"= {dt_prof:.3f}{_fast_tag}"
-            )
-
-            # B3: Readiness + Fatigue (T3-#5: restructured fatigue)
-            _trust_damp = max(0.3, hs_before.trust / 100.0)
-            _resistance = disruption * fb_params.resistance_sensitivity / _trust_damp
-            # T3-#5: New fatigue decomposition
-            _ai_work_fatigue = fb_params.fatigue_ai_work_burden * effective_combined
-            _hc_anxiety = fb_params.fatigue_hc_anxiety_factor * hc_reduced_pct
-            _ai_anxiety = fb_params.fatigue_ai_anxiety_baseline if effective_combined > 0.01 else 0.0
-            _pace_fatigue = adoption_velocity * fb_params.fatigue_build_rate * 10.0
-            _disr_fatigue = disruption * fb_params.fatigue_build_rate
-            _base_decay = fb_params.fatigue_decay_rate * (1.0 - effective_combined)
-            _stab_bonus = fb_params.fatigue_recovery_stability_bonus if is_stable_month else 0.0
-            _fat_recovery = _base_decay + _stab_bonus * fb_params.fatigue_decay_rate
-            dt_fatigue = (
-                _ai_work_fatigue + _hc_anxiety + _ai_anxiety +
-                _pace_fatigue + _disr_fatigue - _fat_recovery
+        if recorder:
+            recorder.record_month(
+                month,
+                raw_adopt=raw_adopt, raw_expand=raw_expand, raw_extend=raw_extend, raw_combined=raw_combined,
+                proficiency_before=hs_before.proficiency, readiness_before=hs_before.readiness,
+                trust_before=hs_before.trust, capital_before=hs_before.political_capital,
+                fatigue_before=hs_before.transformation_fatigue,
+                skill_gap_pct=skill_gap_pct, effective_pre_r3=effective_pre_r3, effective=effective_combined,
+                r3_boost=r3_boost_val, dampening=dampening, delta_adoption=delta_adoption,
+                shadow_adoption=shadow_adoption,
+                gross_before_bonus=gross_before_bonus, pipeline_in=gross_freed_this_month,
+                pipeline_out=realized_freed, absorption_rate=dynamic_absorption,
+                redistributed=redistributed, net_freed=net_freed,
+                pre_hc_total=pre_hc_total, hc_reduced=hc_reduced_this_month, hc_reduced_pct=hc_reduced_pct,
+                disruption=disruption, ai_error=ai_error,
+                hallucination_hit=hallucination_trust_hit, trust_shock_hit=trust_shock_hit,
+                automation_lift=automation_lift, skill_drag=skill_drag, fatigue_drag=fatigue_drag,
+                workflow_disruption_drag=workflow_disruption_drag, productivity=productivity,
+                delayed_adoption=delayed_adoption, b2_drag=b2_drag,
+                monthly_investment=monthly_investment, monthly_savings=monthly_salary_savings,
+                net_position=net_position,
             )
 
-            _recovery = fb_params.resistance_decay_rate * (
-                1 - hs_before.transformation_fatigue / 100
-            )
-            _ready_ceil = max(0.1, 1.0 - hs_before.readiness / 100.0)
-            _adopt_boost = (
-                fb_params.readiness_boost_rate * effective_combined * _ready_ceil
-            )
-            dt_readiness = -_resistance + _recovery + _adopt_boost
-
-            # R4: Capital
-            _cap_build = (
-                fb_params.capital_build_rate * effective_combined
-                * fb_params.success_probability
-            )
-            _cap_spend = fb_params.capital_spend_rate * disruption
-            dt_capital = _cap_build - _cap_spend
-
-            mt.loop_deltas = {
-                "R1_trust": {
-                    "value": dt_trust,
-                    "detail": trust_detail,
-                    "hallucination_hit": hallucination_trust_hit,
-                    "trust_shock_hit": trust_shock_hit,
-                },
-                "R2_proficiency": {"value": dt_prof, "detail": prof_detail},
-                "B3_readiness": {
-                    "value": dt_readiness,
-                    "detail": (
-                        f"resist={-_resistance:.3f} + recov={_recovery:.3f} "
-                        f"+ boost={_adopt_boost:.3f}"
-                    ),
-                },
-                "B3_fatigue": {
-                    "value": dt_fatigue,
-                    "detail": (
-                        f"ai_work={_ai_work_fatigue:.3f} + hc_anx={_hc_anxiety:.3f} "
-                        f"+ ai_anx={_ai_anxiety:.3f} + pace={_pace_fatigue:.3f} "
-                        f"+ disrupt={_disr_fatigue:.3f} - recovery={_fat_recovery:.3f} "
-                        f"[T3-#5]"
-                    ),
-                },
-                "R4_capital": {
-                    "value": dt_capital,
-                    "detail": f"build={_cap_build:.3f} - spend={_cap_spend:.3f}",
-                },
-            }
-
-            # HC DECISION
-            is_review = month > hc_decision_delay and month % hc_freq == 0
-            cap_ok = (
-                hs_before.political_capital >= fb_params.capital_threshold
-                or params.policy == "no_layoffs"
-            )
-            mt.hc_decision = {
-                "review_month": is_review,
-                "freq": hc_freq,
-                "policy": params.policy,
-                "capital_value": hs_before.political_capital,
-                "capital_threshold": fb_params.capital_threshold,
-                "capital_check": cap_ok if is_review else None,
-                "roles": hc_trace_roles,
-                "total_reduced": hc_reduced_this_month,
-                "reason": (
-                    "month 0" if month == 0 else
-                    f"HC decision delay [T3-#4]: month {month} <= {hc_decision_delay}" if month <= hc_decision_delay else
-                    "not review month" if not is_review else
-                    "capital below threshold" if is_review and not cap_ok else
-                    f"review executed, {hc_reduced_this_month} reduced"
-                ),
-            }
-
-            # PRODUCTIVITY (T3-#2: workflow disruption added)
-            mt.productivity = {
-                "automation_lift": automation_lift,
-                "skill_drag": skill_drag,
-                "fatigue_drag": fatigue_drag,
-                "workflow_disruption_drag": workflow_disruption_drag,
-                "index": productivity,
-                "delayed_month": delayed_month,
-                "delayed_adoption": delayed_adoption,
-                "b2_drag_mult": b2_drag,
-                "formula": (
-                    f"100.0 + {automation_lift:.1f}(auto, M{delayed_month}) "
-                    f"- {skill_drag:.1f}(skill) "
-                    f"- {fatigue_drag:.1f}(fatigue) "
-                    f"- {workflow_disruption_drag:.1f}(disruption[T3-#2]) "
-                    f"= {productivity:.1f}"
-                ),
-            }
-
-            # FINANCIAL
-            license_this = (
-                monthly_license * max(0.1, effective_combined) if month >= 1 else 0
-            )
-            train_this = training_per_month_phase1 if 1 <= month <= 6 else 0
-            cm_this = change_mgmt_per_month if 1 <= month <= 6 else 0
-            mt.financial = {
-                "monthly_investment": monthly_investment,
-                "investment_detail": (
-                    f"license=${license_this:,.0f}"
-                    f"[T1-#5 x{max(0.1, effective_combined):.3f}]"
-                    f" + train=${train_this:,.0f} + cm=${cm_this:,.0f}"
-                ),
-                "license_scale_factor": (
-                    max(0.1, effective_combined) if month >= 1 else 0
-                ),
-                "monthly_savings": monthly_salary_savings,
-                "cumulative_net": net_position,
-            }
-
-            # IMPROVEMENTS ACTIVE THIS MONTH
-            imps = []
-            imps.append(
-                f"T1-#1: Productivity valley — delayed lift "
-                f"{CAPACITY_REALIZATION_DELAY}mo, "
-                f"delayed_adoption={delayed_adoption:.4f}"
-            )
-            if _pace_fatigue > 0.001:
-                imps.append(
-                    f"T1-#2: Fatigue from pace — "
-                    f"velocity={adoption_velocity:.4f}, "
-                    f"pace_fatigue={_pace_fatigue:.4f}"
-                )
-            if params.policy == "rapid_redeployment":
-                imps.append("T1-#3: Rapid redeployment — monthly HC reviews")
-            if wf_active:
-                imps.append(
-                    f"T1-#4: Workflow bonus "
-                    f"x{params.workflow_automation_bonus:.1f} applied"
-                )
-            if month >= 1:
-                imps.append(
-                    f"T1-#5: License scaled "
-                    f"x{max(0.1, effective_combined):.3f}"
-                )
-            if abs(learning_velocity_factor - 1.0) > 0.01:
-                imps.append(
-                    f"T1-#6: Learning velocity x{learning_velocity_factor:.2f}"
-                )
-            if veto:
-                imps.append("T2-#7: Trust VETO active")
-            imps.append("T2-#8: Productive hours by level")
-            floor_hits = sum(
-                1 for r in hc_trace_roles if r.get("floor_hit")
-            )
-            if floor_hits > 0:
-                imps.append(
-                    f"T2-#9: Min staffing floor hit for {floor_hits} roles"
-                )
-            imps.append(
-                f"T2-#10: Capacity pipeline delay "
-                f"{CAPACITY_REALIZATION_DELAY}mo, "
-                f"releasing={realized_freed:.1f}h"
-            )
-            imps.append("T2-#11: Shadow work tax 10%")
-            # T3 improvements
-            if month < fb_params.genai_fast_start_months:
-                imps.append(
-                    f"T3-#1: GenAI fast-start x{fb_params.genai_fast_start_multiplier:.1f} "
-                    f"(month {month}/{fb_params.genai_fast_start_months})"
-                )
-            if workflow_disruption_drag > 0.01:
-                imps.append(
-                    f"T3-#2: Workflow disruption drag={workflow_disruption_drag:.2f}"
-                )
-            if not _at_thresh:
-                imps.append(
-                    f"T3-#3: Trust between thresholds — rate x{fb_params.trust_between_threshold_rate:.2f}"
-                )
-            if trust_shock_hit > 0:
-                imps.append(
-                    f"T3-#3b: Trust shock -{trust_shock_hit:.1f}pts"
-                )
-            if month <= hc_decision_delay and month > 0:
-                imps.append(
-                    f"T3-#4: HC decision delay — no reductions until M{hc_decision_delay}"
-                )
-            if _ai_work_fatigue > 0.01 or _hc_anxiety > 0.01 or _ai_anxiety > 0.01:
-                imps.append(
-                    f"T3-#5: Fatigue restructured — "
-                    f"ai_work={_ai_work_fatigue:.2f} hc_anx={_hc_anxiety:.2f} "
-                    f"ai_anx={_ai_anxiety:.2f}"
-                )
-            if hallucination_trust_hit > 0.001:
-                imps.append(
-                    f"T3-#6: Hallucination trust damage={hallucination_trust_hit:.3f}/mo"
-                )
-            if month in fb_params.capability_upgrade_months:
-                imps.append(
-                    f"T3-#7: Capability upgrade — ceiling +{fb_params.capability_upgrade_ceiling_boost:.0%}, "
-                    f"prof -{fb_params.capability_upgrade_skill_disruption:.0f}, "
-                    f"trust -{fb_params.capability_upgrade_trust_disruption:.0f}"
-                )
-            if shadow_adoption > 0.01:
-                imps.append(
-                    f"T3-#8: Shadow AI adoption={shadow_adoption:.1%} "
-                    f"(official={effective_combined:.1%})"
-                )
-            mt.improvements = imps
-
-            mt.dominant_loop = determine_dominant_loop(mt)
-            sim_trace.months.append(mt)
-
         # 10. Record snapshot
         b4_mult = b4_seniority_offset(original_hc, total_current_hc, fb_params.seniority_penalty)
 
@@ -978,10 +659,11 @@ def simulate_with_feedback(
     avg_dampening = (sum(s.adoption_dampening for s in timeline[1:]) /
                      max(1, len(timeline) - 1))
 
-    # ── Compute trace summaries ──
-    if trace and sim_trace:
-        sim_trace.phase_summary = compute_phase_summary(sim_trace)
-        sim_trace.improvement_summary = compute_improvement_summary(sim_trace)
+    # ── Expand the full trace ──
+    sim_trace = None
+    if recorder:
+        recorder.finish()
+        sim_trace = recorder.to_trace() if trace else None
 
     return FBSimulationResult(
         params=params,
@@ -1005,4 +687,5 @@ def simulate_with_feedback(
         final_readiness=timeline[-1].readiness,
         avg_adoption_dampening=avg_dampening,
         trace=sim_trace,
+        compact_trace=recorder,
     )
@@ -0,0 +1,705 @@
+"""
+Compact Trace Recorder
+======================
+``simulate_with_feedback`` used to build one MonthTrace per month while it
+ran: nested dicts, per-role dicts and dozens of formatted strings, most of
+which nobody reads. The compact trace records only the numbers the simulator
+already computed, into arrays preallocated for the whole horizon:
+
+  - MONTH_FIELDS:  one value per month each, with a fixed dtype
+  - ROLE_FIELDS:   one row per role the HC decision considered in a month
+
+Everything else (multipliers, loop deltas, detail strings, improvement
+annotations, dominant loop) is derived from those numbers on demand, so
+``month_trace(m)`` and ``to_trace()`` give exactly what the inline capture
+produced, for one month or a range, without re-running the simulation.
+
+Enable:
+    result = simulate_with_feedback(..., record_trace=True)
+    result.compact_trace.columns(["trust_before"], start=0, end=12)
+    result.compact_trace.to_trace(start=6, end=12)
+
+Principle: record cheap numbers while simulating, explain them when asked.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from workforce_twin_modeling.engine.feedback import (
+    FeedbackParams, HumanSystemState, b2_skill_valley, b4_seniority_offset,
+)
+from workforce_twin_modeling.engine.rates import SimulationParams
+from workforce_twin_modeling.engine.trace import (
+    MonthTrace, SimulationTrace,
+    trust_band, capital_band,
+    determine_dominant_loop, compute_phase_summary, compute_improvement_summary,
+)
+
+# Per-month values recorded by the simulator, with their dtype
+MONTH_FIELDS: Dict[str, type] = {
+    # S-curve
+    "raw_adopt": np.float64,
+    "raw_expand": np.float64,
+    "raw_extend": np.float64,
+    "raw_combined": np.float64,
+    # Human system before this month's update
+    "proficiency_before": np.float64,
+    "readiness_before": np.float64,
+    "trust_before": np.float64,
+    "capital_before": np.float64,
+    "fatigue_before": np.float64,
+    # Adoption
+    "skill_gap_pct": np.float64,
+    "effective_pre_r3": np.float64,
+    "effective": np.float64,
+    "r3_boost": np.float64,
+    "dampening": np.float64,
+    "delta_adoption": np.float64,
+    "shadow_adoption": np.float64,
+    # Capacity pipeline
+    "gross_before_bonus": np.float64,
+    "pipeline_in": np.float64,
+    "pipeline_out": np.float64,
+    "absorption_rate": np.float64,
+    "redistributed": np.float64,
+    "net_freed": np.float64,
+    # HC decision and disruption
+    "pre_hc_total": np.int64,
+    "hc_reduced": np.int64,
+    "hc_reduced_pct": np.float64,
+    "disruption": np.float64,
+    "ai_error": np.bool_,
+    "hallucination_hit": np.float64,
+    "trust_shock_hit": np.float64,
+    # Productivity
+    "automation_lift": np.float64,
+    "skill_drag": np.float64,
+    "fatigue_drag": np.float64,
+    "workflow_disruption_drag": np.float64,
+    "productivity": np.float64,
+    "delayed_adoption": np.float64,
+    "b2_drag": np.float64,
+    # Financial
+    "monthly_investment": np.float64,
+    "monthly_savings": np.float64,
+    "net_position": np.float64,
+}
+
+# Per-role HC decision rows, with their dtype
+ROLE_FIELDS: Dict[str, type] = {
+    "month": np.int32,
+    "role": np.int32,               # index into CompactTrace.role_ids
+    "fte_freed": np.float64,
+    "net_new": np.float64,
+    "policy_reducible": np.int64,
+    "min_staffing": np.int64,
+    "max_reducible": np.int64,
+    "reduced": np.int64,
+    "hc_before": np.int64,
+}
+
+
+class CompactTrace:
+    """Array-backed trace of one feedback simulation."""
+
+    def __init__(
+        self,
+        params: SimulationParams,
+        fb_params: FeedbackParams,
+        stimulus_name: str,
+        initial_conditions: Dict[str, Any],
+        role_ids: Sequence[str],
+        role_names: Sequence[str],
+        hc_freq: int,
+        hc_decision_delay: int,
+        monthly_license: float,
+        training_per_month_phase1: float,
+        change_mgmt_per_month: float,
+    ):
+        self.params = params
+        self.fb_params = fb_params
+        self.stimulus_name = stimulus_name
+        self.initial_conditions = initial_conditions
+        self.role_ids = list(role_ids)
+        self.role_names = list(role_names)
+        self.hc_freq = hc_freq
+        self.hc_decision_delay = hc_decision_delay
+        self.monthly_license = monthly_license
+        self.training_per_month_phase1 = training_per_month_phase1
+        self.change_mgmt_per_month = change_mgmt_per_month
+
+        n_months = params.time_horizon_months + 1
+        self.n_months = 0
+        self.month_values = {name: np.zeros(n_months, dtype=dtype) for name, dtype in MONTH_FIELDS.items()}
+        # At most one row per role per month
+        self.n_role_rows = 0
+        self.role_values = {
+            name: np.zeros(n_months * len(self.role_ids), dtype=dtype) for name, dtype in ROLE_FIELDS.items()
+        }
+        self._role_index = {rid: i for i, rid in enumerate(self.role_ids)}
+        self._summaries: Optional[tuple] = None
+
+    # ── Recording (called by the simulator) ──
+
+    def record_role(
+        self, month: int, role_id: str, fte_freed: float, net_new: float, policy_reducible: int,
+        min_staffing: int, max_reducible: int, reduced: int, hc_before: int,
+    ) -> None:
+        i = self.n_role_rows
+        values = self.role_values
+        values["month"][i] = month
+        values["role"][i] = self._role_index[role_id]
+        values["fte_freed"][i] = fte_freed
+        values["net_new"][i] = net_new
+        values["policy_reducible"][i] = policy_reducible
+        values["min_staffing"][i] = min_staffing
+        values["max_reducible"][i] = max_reducible
+        values["reduced"][i] = reduced
+        values["hc_before"][i] = hc_before
+        self.n_role_rows = i + 1
+
+    def record_month(self, month: int, **values: Any) -> None:
+        for name, value in values.items():
+            self.month_values[name][month] = value
+        self.n_months = month + 1
+
+    def finish(self) -> None:
+        """Release the unused part of the role rows once the run is over."""
+        n = self.n_role_rows
+        self.role_values = {name: values[:n].copy() for name, values in self.role_values.items()}
+
+    # ── Access ──
+
+    @property
+    def nbytes(self) -> int:
+        return (sum(a.nbytes for a in self.month_values.values())
+                + sum(a.nbytes for a in self.role_values.values()))
+
+    def _range(self, start: int, end: Optional[int]) -> range:
+        """Months start..end inclusive, clipped to the recorded horizon."""
+        last = self.n_months - 1 if end is None else min(end, self.n_months - 1)
+        return range(max(0, start), last + 1)
+
+    def columns(
+        self, fields: Optional[Sequence[str]] = None, start: int = 0, end: Optional[int] = None,
+    ) -> Dict[str, List[Any]]:
+        """Raw per-month values of the given MONTH_FIELDS (all by default) for months start..end."""
+        fields = list(MONTH_FIELDS) if fields is None else list(fields)
+        unknown = [name for name in fields if name not in MONTH_FIELDS]
+        if unknown:
+            raise KeyError(f"Unknown trace fields: {', '.join(unknown)}")
+        months = self._range(start, end)
+        data = {"month": list(months)}
+        for name in fields:
+            data[name] = self.month_values[name][months.start:months.stop].tolist()
+        return data
+
+    def _roles_by_month(self, months: range) -> Dict[int, List[dict]]:
+        """HC decision role dicts of the given months, in recorded order."""
+        n = self.n_role_rows
+        month_of_row = self.role_values["month"][:n]
+        rows = np.nonzero((month_of_row >= months.start) & (month_of_row < months.stop))[0]
+        columns = {name: values[rows].tolist() for name, values in self.role_values.items()}
+        by_month: Dict[int, List[dict]] = {m: [] for m in months}
+        for i in range(len(rows)):
+            role = columns["role"][i]
+            policy_reducible, reduced, hc_before = (
+                columns["policy_reducible"][i], columns["reduced"][i], columns["hc_before"][i],
+            )
+            by_month[columns["month"][i]].append({
+                "role_id": self.role_ids[role],
+                "role_name": self.role_names[role],
+                "fte_freed": round(columns["fte_freed"][i], 2),
+                "net_new": round(columns["net_new"][i], 2),
+                "policy_reducible": policy_reducible,
+                "min_staffing": columns["min_staffing"][i],
+                "floor_hit": policy_reducible > columns["max_reducible"][i],
+                "reduced": reduced,
+                "hc_before": hc_before,
+                "hc_after": hc_before - reduced,
+            })
+        return by_month
+
+    def _at_evidence_threshold(self, month: int) -> bool:
+        """Whether effective adoption sat at a trust evidence threshold (T3-#3) in the last non-error month."""
+        while month >= 0 and self.month_values["ai_error"][month]:
+            month -= 1
+        if month < 0:
+            return False
+        effective = self.month_values["effective"][month].item()
+        return any(abs(effective - threshold) < 0.02 for threshold in self.fb_params.trust_evidence_thresholds)
+
+    def month_trace(self, month: int) -> MonthTrace:
+        """The MonthTrace the simulator used to build inline for this month."""
+        if not 0 <= month < self.n_months:
+            raise IndexError(f"Month {month} outside the recorded 0..{self.n_months - 1}")
+        values = {name: values[month].item() for name, values in self.month_values.items()}
+        return self._month_trace(month, values, self._roles_by_month(range(month, month + 1))[month])
+
+    def _month_trace(self, month: int, v: Dict[str, Any], hc_trace_roles: List[dict]) -> MonthTrace:
+        params = self.params
+        fb_params = self.fb_params
+        learning_velocity_factor = self.initial_conditions["learning_velocity_factor"]
+        original_hc = self.initial_conditions["original_hc"]
+        capacity_delay = self.initial_conditions["capacity_delay"]
+        hc_freq = self.hc_freq
+        hc_decision_delay = self.hc_decision_delay
+        monthly_license = self.monthly_license
+        training_per_month_phase1 = self.training_per_month_phase1
+        change_mgmt_per_month = self.change_mgmt_per_month
+
+        hs_before = HumanSystemState(
+            proficiency=v["proficiency_before"],
+            readiness=v["readiness_before"],
+            trust=v["trust_before"],
+            political_capital=v["capital_before"],
+            transformation_fatigue=v["fatigue_before"],
+        )
+        raw_adopt, raw_expand, raw_extend = v["raw_adopt"], v["raw_expand"], v["raw_extend"]
+        raw_combined = v["raw_combined"]
+        skill_gap_pct = v["skill_gap_pct"]
+        pre_hc_total = v["pre_hc_total"]
+        effective_pre_r3 = v["effective_pre_r3"]
+        effective_combined = v["effective"]
+        r3_boost_val = v["r3_boost"]
+        dampening = v["dampening"]
+        delta_adoption = adoption_velocity = v["delta_adoption"]
+        shadow_adoption = v["shadow_adoption"]
+        gross_before_bonus = v["gross_before_bonus"]
+        gross_freed_this_month = v["pipeline_in"]
+        realized_freed = v["pipeline_out"]
+        dynamic_absorption = v["absorption_rate"]
+        redistributed = v["redistributed"]
+        net_freed = v["net_freed"]
+        hc_reduced_this_month = v["hc_reduced"]
+        hc_reduced_pct = v["hc_reduced_pct"]
+        is_stable_month = hc_reduced_this_month == 0
+        disruption = v["disruption"]
+        ai_error = v["ai_error"]
+        hallucination_trust_hit = v["hallucination_hit"]
+        trust_shock_hit = v["trust_shock_hit"]
+        automation_lift = v["automation_lift"]
+        skill_drag = v["skill_drag"]
+        fatigue_drag = v["fatigue_drag"]
+        workflow_disruption_drag = v["workflow_disruption_drag"]
+        productivity = v["productivity"]
+        delayed_month = max(0, month - capacity_delay)
+        delayed_adoption = v["delayed_adoption"]
+        b2_drag = v["b2_drag"]
+        monthly_investment = v["monthly_investment"]
+        monthly_salary_savings = v["monthly_savings"]
+        net_position = v["net_position"]
+
+        mt = MonthTrace(month=month)
+
+        # S-CURVE
+        mt.s_curve = {
+            "adopt": raw_adopt, "expand": raw_expand,
+            "extend": raw_extend, "combined": raw_combined,
+        }
+
+        # MULTIPLIERS (using pre-update human state)
+        t_human = hs_before.effective_multiplier
+        t_trust = hs_before.trust_multiplier
+        t_skill = b2_skill_valley(skill_gap_pct, fb_params.skill_gap_drag_coefficient)
+        t_seniority = b4_seniority_offset(
+            original_hc, pre_hc_total, fb_params.seniority_penalty,
+        )
+        t_capital = hs_before.capital_multiplier
+
+        # Multiplier detail decomposition
+        veto = hs_before.trust < 10.0 or hs_before.readiness < 10.0
+        if veto:
+            human_detail = (
+                f"VETO [T2-#7]: trust={hs_before.trust:.1f} or "
+                f"ready={hs_before.readiness:.1f} < 10 -> 0.05"
+            )
+        else:
+            raw_hm = (
+                0.35 * hs_before.proficiency
+                + 0.45 * hs_before.readiness
+                + 0.20 * hs_before.trust
+            ) / 100.0
+            human_detail = (
+                f"0.35x{hs_before.proficiency:.1f} + 0.45x{hs_before.readiness:.1f} + "
+                f"0.20x{hs_before.trust:.1f} = {raw_hm:.3f}"
+                f"{' (floor->0.15)' if raw_hm < 0.15 else ''}"
+            )
+
+        drag_val = skill_gap_pct / 100.0 * fb_params.skill_gap_drag_coefficient
+        red_pct = ((original_hc - pre_hc_total) / original_hc) if original_hc > 0 else 0
+
+        mt.multipliers = {
+            "human_system": {"value": t_human, "detail": human_detail, "veto": veto},
+            "trust_gate": {
+                "value": t_trust,
+                "detail": f"trust={hs_before.trust:.1f} {trust_band(hs_before.trust)}",
+            },
+            "skill_valley": {
+                "value": t_skill,
+                "detail": (
+                    f"gap={skill_gap_pct:.1f}% x coeff="
+                    f"{fb_params.skill_gap_drag_coefficient} -> drag={drag_val:.3f}"
+                ),
+            },
+            "seniority": {
+                "value": t_seniority,
+                "detail": (
+                    f"reduced={red_pct:.1%} x penalty={fb_params.seniority_penalty}"
+                ),
+            },
+            "capital": {
+                "value": t_capital,
+                "detail": (
+                    f"capital={hs_before.political_capital:.1f} "
+                    f"{capital_band(hs_before.political_capital)}"
+                ),
+            },
+        }
+
+        # ADOPTION
+        mt.adoption = {
+            "raw": raw_combined,
+            "effective": effective_pre_r3,
+            "effective_post_r3": effective_combined,
+            "r3_boost": r3_boost_val,
+            "formula": (
+                f"{raw_combined:.4f} x {t_human:.4f} x {t_trust:.4f} x "
+                f"{t_skill:.4f} x {t_seniority:.4f} x {t_capital:.4f} "
+                f"= {effective_pre_r3:.4f}"
+            ),
+            "dampening_pct": dampening * 100,
+            "delta": delta_adoption,
+            "velocity": adoption_velocity,
+        }
+
+        # CAPACITY PIPELINE
+        wf_active = params.enable_workflow_automation and raw_extend > 0
+        mt.capacity = {
+            "gross_delta": gross_before_bonus,
+            "workflow_bonus_active": wf_active,
+            "workflow_bonus_value": params.workflow_automation_bonus if wf_active else 1.0,
+            "pipeline_in": gross_freed_this_month,
+            "pipeline_out": realized_freed,
+            "delay": capacity_delay,
+            "absorption_rate": dynamic_absorption,
+            "redistributed": redistributed,
+            "net_freed": net_freed,
+        }
+
+        # FEEDBACK LOOP DELTAS (decompose what update_human_system computed)
+        # R1: Trust
+        if ai_error:
+            dt_trust = -hs_before.trust * fb_params.trust_destruction_factor
+            trust_detail = (
+                f"ERROR: -{hs_before.trust:.1f} x "
+                f"{fb_params.trust_destruction_factor} = {dt_trust:.3f}"
+            )
+            # No threshold check in an error month: the flag stays as it was last month
+            _at_thresh = self._at_evidence_threshold(month - 1)
+        else:
+            _build = (
+                fb_params.trust_build_rate * effective_combined
+                * fb_params.success_probability
+            )
+            _ceil = max(0.1, 1.0 - hs_before.trust / 100.0)
+            dt_trust = _build * _ceil
+            # T3-#3: Apply evidence threshold gating in trace too
+            _at_thresh = False
+            for _thr in fb_params.trust_evidence_thresholds:
+                if abs(effective_combined - _thr) < 0.02:
+                    _at_thresh = True
+                    break
+            if not _at_thresh:
+                dt_trust *= fb_params.trust_between_threshold_rate
+            _thresh_tag = " AT-THRESHOLD" if _at_thresh else f" x{fb_params.trust_between_threshold_rate:.2f}[T3-#3]"
+            trust_detail = (
+                f"build: {fb_params.trust_build_rate}x{effective_combined:.3f}"
+                f"x{fb_params.success_probability}xceil({_ceil:.2f}){_thresh_tag} = {dt_trust:.3f}"
+            )
+
+        # R2: Proficiency (T3-#1: fast-start)
+        _practice = effective_combined
+        _prof_ceil = max(
+            0.05, 1.0 - hs_before.proficiency / fb_params.learning_saturation,
+        )
+        _eff_lr = fb_params.learning_rate
+        if month < fb_params.genai_fast_start_months:
+            _eff_lr *= fb_params.genai_fast_start_multiplier
+        dt_prof = (
+            _eff_lr * _practice * _prof_ceil * learning_velocity_factor
+        )
+        _fast_tag = " [T3-#1 FAST-START]" if month < fb_params.genai_fast_start_months else ""
+        prof_detail = (
+            f"learn: {_eff_lr:.1f}x{_practice:.3f}"
+            f"xceil({_prof_ceil:.2f})xvel({learning_velocity_factor:.2f}) "
+            f"= {dt_prof:.3f}{_fast_tag}"
+        )
+
+        # B3: Readiness + Fatigue (T3-#5: restructured fatigue)
+        _trust_damp = max(0.3, hs_before.trust / 100.0)
+        _resistance = disruption * fb_params.resistance_sensitivity / _trust_damp
+        # T3-#5: New fatigue decomposition
+        _ai_work_fatigue = fb_params.fatigue_ai_work_burden * effective_combined
+        _hc_anxiety = fb_params.fatigue_hc_anxiety_factor * hc_reduced_pct
+        _ai_anxiety = fb_params.fatigue_ai_anxiety_baseline if effective_combined > 0.01 else 0.0
+        _pace_fatigue = adoption_velocity * fb_params.fatigue_build_rate * 10.0
+        _disr_fatigue = disruption * fb_params.fatigue_build_rate
+        _base_decay = fb_params.fatigue_decay_rate * (1.0 - effective_combined)
+        _stab_bonus = fb_params.fatigue_recovery_stability_bonus if is_stable_month else 0.0
+        _fat_recovery = _base_decay + _stab_bonus * fb_params.fatigue_decay_rate
+        dt_fatigue = (
+            _ai_work_fatigue + _hc_anxiety + _ai_anxiety +
+            _pace_fatigue + _disr_fatigue - _fat_recovery
+        )
+
+        _recovery = fb_params.resistance_decay_rate * (
+            1 - hs_before.transformation_fatigue / 100
+        )
+        _ready_ceil = max(0.1, 1.0 - hs_before.readiness / 100.0)
+        _adopt_boost = (
+            fb_params.readiness_boost_rate * effective_combined * _ready_ceil
+        )
+        dt_readiness = -_resistance + _recovery + _adopt_boost
+
+        # R4: Capital
+        _cap_build = (
+            fb_params.capital_build_rate * effective_combined
+            * fb_params.success_probability
+        )
+        _cap_spend = fb_params.capital_spend_rate * disruption
+        dt_capital = _cap_build - _cap_spend
+
+        mt.loop_deltas = {
+            "R1_trust": {
+                "value": dt_trust,
+                "detail": trust_detail,
+                "hallucination_hit": hallucination_trust_hit,
+                "trust_shock_hit": trust_shock_hit,
+            },
+            "R2_proficiency": {"value": dt_prof, "detail": prof_detail},
+            "B3_readiness": {
+                "value": dt_readiness,
+                "detail": (
+                    f"resist={-_resistance:.3f} + recov={_recovery:.3f} "
+                    f"+ boost={_adopt_boost:.3f}"
+                ),
+            },
+            "B3_fatigue": {
+                "value": dt_fatigue,
+                "detail": (
+                    f"ai_work={_ai_work_fatigue:.3f} + hc_anx={_hc_anxiety:.3f} "
+                    f"+ ai_anx={_ai_anxiety:.3f} + pace={_pace_fatigue:.3f} "
+                    f"+ disrupt={_disr_fatigue:.3f} - recovery={_fat_recovery:.3f} "
+                    f"[T3-#5]"
+                ),
+            },
+            "R4_capital": {
+                "value": dt_capital,
+                "detail": f"build={_cap_build:.3f} - spend={_cap_spend:.3f}",
+            },
+        }
+
+        # HC DECISION
+        is_review = month > hc_decision_delay and month % hc_freq == 0
+        cap_ok = (
+            hs_before.political_capital >= fb_params.capital_threshold
+            or params.policy == "no_layoffs"
+        )
+        mt.hc_decision = {
+            "review_month": is_review,
+            "freq": hc_freq,
+            "policy": params.policy,
+            "capital_value": hs_before.political_capital,
+            "capital_threshold": fb_params.capital_threshold,
+            "capital_check": cap_ok if is_review else None,
+            "roles": hc_trace_roles,
+            "total_reduced": hc_reduced_this_month,
+            "reason": (
+                "month 0" if month == 0 else
+                f"HC decision delay [T3-#4]: month {month} <= {hc_decision_delay}" if month <= hc_decision_delay else
+                "not review month" if not is_review else
+                "capital below threshold" if is_review and not cap_ok else
+                f"review executed, {hc_reduced_this_month} reduced"
+            ),
+        }
+
+        # PRODUCTIVITY (T3-#2: workflow disruption added)
+        mt.productivity = {
+            "automation_lift": automation_lift,
+            "skill_drag": skill_drag,
+            "fatigue_drag": fatigue_drag,
+            "workflow_disruption_drag": workflow_disruption_drag,
+            "index": productivity,
+            "delayed_month": delayed_month,
+            "delayed_adoption": delayed_adoption,
+            "b2_drag_mult": b2_drag,
+            "formula": (
+                f"100.0 + {automation_lift:.1f}(auto, M{delayed_month}) "
+                f"- {skill_drag:.1f}(skill) "
+                f"- {fatigue_drag:.1f}(fatigue) "
+                f"- {workflow_disruption_drag:.1f}(disruption[T3-#2]) "
+                f"= {productivity:.1f}"
+            ),
+        }
+
+        # FINANCIAL
+        license_this = (
+            monthly_license * max(0.1, effective_combined) if month >= 1 else 0
+        )
+        train_this = training_per_month_phase1 if 1 <= month <= 6 else 0
+        cm_this = change_mgmt_per_month if 1 <= month <= 6 else 0
+        mt.financial = {
+            "monthly_investment": monthly_investment,
+            "investment_detail": (
+                f"license=${license_this:,.0f}"
+                f"[T1-#5 x{max(0.1, effective_combined):.3f}]"
+                f" + train=${train_this:,.0f} + cm=${cm_this:,.0f}"
+            ),
+            "license_scale_factor": (
+                max(0.1, effective_combined) if month >= 1 else 0
+            ),
+            "monthly_savings": monthly_salary_savings,
+            "cumulative_net": net_position,
+        }
+
+        # IMPROVEMENTS ACTIVE THIS MONTH
+        imps = []
+        imps.append(
+            f"T1-#1: Productivity valley — delayed lift "
+            f"{capacity_delay}mo, "
+            f"delayed_adoption={delayed_adoption:.4f}"
+        )
+        if _pace_fatigue > 0.001:
+            imps.append(
+                f"T1-#2: Fatigue from pace — "
+                f"velocity={adoption_velocity:.4f}, "
+                f"pace_fatigue={_pace_fatigue:.4f}"
+            )
+        if params.policy == "rapid_redeployment":
+            imps.append("T1-#3: Rapid redeployment — monthly HC reviews")
+        if wf_active:
+            imps.append(
+                f"T1-#4: Workflow bonus "
+                f"x{params.workflow_automation_bonus:.1f} applied"
+            )
+        if month >= 1:
+            imps.append(
+                f"T1-#5: License scaled "
+                f"x{max(0.1, effective_combined):.3f}"
+            )
+        if abs(learning_velocity_factor - 1.0) > 0.01:
+            imps.append(
+                f"T1-#6: Learning velocity x{learning_velocity_factor:.2f}"
+            )
+        if veto:
+            imps.append("T2-#7: Trust VETO active")
+        imps.append("T2-#8: Productive hours by level")
+        floor_hits = sum(
+            1 for r in hc_trace_roles if r.get("floor_hit")
+        )
+        if floor_hits > 0:
+            imps.append(
+                f"T2-#9: Min staffing floor hit for {floor_hits} roles"
+            )
+        imps.append(
+            f"T2-#10: Capacity pipeline delay "
+            f"{capacity_delay}mo, "
+            f"releasing={realized_freed:.1f}h"
+        )
+        imps.append("T2-#11: Shadow work tax 10%")
+        # T3 improvements
+        if month < fb_params.genai_fast_start_months:
+            imps.append(
+                f"T3-#1: GenAI fast-start x{fb_params.genai_fast_start_multiplier:.1f} "
+                f"(month {month}/{fb_params.genai_fast_start_months})"
+            )
+        if workflow_disruption_drag > 0.01:
+            imps.append(
+                f"T3-#2: Workflow disruption drag={workflow_disruption_drag:.2f}"
+            )
+        if not _at_thresh:
+            imps.append(
+                f"T3-#3: Trust between thresholds — rate x{fb_params.trust_between_threshold_rate:.2f}"
+            )
+        if trust_shock_hit > 0:
+            imps.append(
+                f"T3-#3b: Trust shock -{trust_shock_hit:.1f}pts"
+            )
+        if month <= hc_decision_delay and month > 0:
+            imps.append(
+                f"T3-#4: HC decision delay — no reductions until M{hc_decision_delay}"
+            )
+        if _ai_work_fatigue > 0.01 or _hc_anxiety > 0.01 or _ai_anxiety > 0.01:
+            imps.append(
+                f"T3-#5: Fatigue restructured — "
+                f"ai_work={_ai_work_fatigue:.2f} hc_anx={_hc_anxiety:.2f} "
+                f"ai_anx={_ai_anxiety:.2f}"
+            )
+        if hallucination_trust_hit > 0.001:
+            imps.append(
+                f"T3-#6: Hallucination trust damage={hallucination_trust_hit:.3f}/mo"
+            )
+        if month in fb_params.capability_upgrade_months:
+            imps.append(
+                f"T3-#7: Capability upgrade — ceiling +{fb_params.capability_upgrade_ceiling_boost:.0%}, "
+                f"prof -{fb_params.capability_upgrade_skill_disruption:.0f}, "
+                f"trust -{fb_params.capability_upgrade_trust_disruption:.0f}"
+            )
+        if shadow_adoption > 0.01:
+            imps.append(
+                f"T3-#8: Shadow AI adoption={shadow_adoption:.1%} "
+                f"(official={effective_combined:.1%})"
+            )
+        mt.improvements = imps
+
+        mt.dominant_loop = determine_dominant_loop(mt)
+        return mt
+
+    def _month_traces(self, months: range) -> List[MonthTrace]:
+        columns = {name: values[months.start:months.stop].tolist() for name, values in self.month_values.items()}
+        roles = self._roles_by_month(months)
+        return [
+            self._month_trace(month, {name: column[i] for name, column in columns.items()}, roles[month])
+            for i, month in enumerate(months)
+        ]
+
+    def to_trace(self, start: int = 0, end: Optional[int] = None) -> SimulationTrace:
+        """
+        SimulationTrace for months start..end (the whole run by default).
+        Phase and improvement summaries always describe the whole run.
+        """
+        months = self._range(start, end)
+        month_traces = self._month_traces(months)
+        if self._summaries is None:
+            full = SimulationTrace(
+                initial_conditions=self.initial_conditions,
+                months=(month_traces if len(months) == self.n_months
+                        else self._month_traces(self._range(0, None))),
+            )
+            self._summaries = (compute_phase_summary(full), compute_improvement_summary(full))
+        phase_summary, improvement_summary = self._summaries
+        return SimulationTrace(
+            scenario_id=self.params.scenario_id,
+            scenario_name=self.params.scenario_name,
+            stimulus_name=self.stimulus_name,
+            policy=self.params.policy,
+            time_horizon=self.params.time_horizon_months,
+            initial_conditions=self.initial_conditions,
+            months=month_traces,
+            phase_summary=dict(phase_summary),
+            improvement_summary=dict(improvement_summary),
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        """Metadata for clients that page through the trace instead of loading it whole."""
+        return {
+            "scenario_id": self.params.scenario_id,
+            "scenario_name": self.params.scenario_name,
+            "stimulus": self.stimulus_name,
+            "policy": self.params.policy,
+            "time_horizon": self.params.time_horizon_months,
+            "months": self.n_months,
+            "fields": list(MONTH_FIELDS),
+            "initial_conditions": self.initial_conditions,
+        }
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Cascade Scaling Benchmark
+=========================
+Builds synthetic organizations of 5k to 50k tasks and times one full
+run_cascade on each (best of --repeat). With the task–tool indexes built by
+OrganizationData.build_indexes, the time per 1k tasks should stay flat as
+the org grows, and not depend on how many tools the org has.
+
+--columnar also times Steps 1–6 on both data layouts: the dataclass steps of
+engine/cascade.py against run_columnar_cascade over a ColumnarOrg.
+
+Usage:
+    python scripts/benchmark_cascade.py
+    python scripts/benchmark_cascade.py --sizes 10000 50000 --tools 200
+    python scripts/benchmark_cascade.py --columnar --sizes 50000 200000
+"""
+import sys
+import os
+import argparse
+import random
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from workforce_twin_modeling.engine.cascade import (
+    Stimulus, run_cascade,
+    step1_resolve_scope, step2_reclassify_tasks, step3_compute_capacity,
+    step4_compute_skill_impact, step5_compute_workforce_impact, step6_compute_financial_impact,
+)
+from workforce_twin_modeling.engine.columnar import ColumnarOrg, run_columnar_cascade
+from workforce_twin_modeling.engine.gap_engine import CATEGORY_AUTOMATION_POTENTIAL
+from workforce_twin_modeling.engine.loader import OrganizationData
+from workforce_twin_modeling.models.organization import (
+    Task, Role, Workload, Skill, Tool, HumanSystem,
+)
+
+CATEGORIES = list(CATEGORY_AUTOMATION_POTENTIAL)
+LEVELS = ["Individual Contributor", "Manager", "Director"]
+WORKLOADS_PER_ROLE = 5
+TASKS_PER_WORKLOAD = 10
+
+
+def synthetic_org(n_tasks: int, n_tools: int, n_functions: int = 8, seed: int = 7) -> OrganizationData:
+    """An org of n_tasks tasks spread over n_functions functions, indexed as if loaded."""
+    rng = random.Random(seed)
+    functions = [f"Function {i}" for i in range(n_functions)]
+    org = OrganizationData()
+
+    for i in range(n_tools):
+        name = f"Tool {i}"
+        org.tools[f"T-{i}"] = Tool(
+            tool_id=f"T-{i}",
+            tool_name=name,
+            deployed_to_functions=["All"] if i % 5 == 0 else rng.sample(functions, 2),
+            task_categories_addressed=rng.sample(CATEGORIES, 3),
+            license_cost_per_user_month=rng.uniform(10, 80),
+            current_adoption_pct=rng.uniform(0, 60),
+        )
+
+    n_roles = max(1, n_tasks // (WORKLOADS_PER_ROLE * TASKS_PER_WORKLOAD))
+    task_no = 0
+    for r in range(n_roles):
+        rid = f"R-{r}"
+        org.roles[rid] = Role(
+            role_id=rid, role_name=f"Role {r}", function=functions[r % n_functions],
+            sub_function="", jfg="", job_family="", management_level=LEVELS[r % len(LEVELS)],
+            headcount=rng.randint(5, 200), avg_salary=rng.uniform(60_000, 180_000),
+            automation_score=0.0, augmentation_score=0.0, quantification_score=0.0,
+        )
+        for w in range(WORKLOADS_PER_ROLE):
+            wl_id = f"W-{r}-{w}"
+            org.workloads[wl_id] = Workload(
+                workload_id=wl_id, role_id=rid, workload_name=wl_id, time_pct=20.0,
+                directive_pct=20.0, feedback_loop_pct=20.0, task_iteration_pct=20.0,
+                learning_pct=15.0, validation_pct=15.0, negligibility_pct=10.0,
+            )
+            for _ in range(TASKS_PER_WORKLOAD):
+                tid = f"TK-{task_no}"
+                task_no += 1
+                org.tasks[tid] = Task(
+                    task_id=tid, workload_id=wl_id, task_name=tid,
+                    category=rng.choice(CATEGORIES),
+                    effort_hours_month=rng.uniform(1, 20),
+                    automatable_by_tool=f"Tool {rng.randrange(n_tools)}",
+                    compliance_mandated_human=rng.random() < 0.05,
+                )
+            for s in range(2):
+                sid = f"SK-{r}-{w}-{s}"
+                org.skills[sid] = Skill(
+                    skill_id=sid, workload_id=wl_id, skill_name=sid,
+                    skill_type=rng.choice(["current", "sunrise", "sunset"]),
+                    proficiency_required=rng.randint(20, 90),
+                    is_sunrise=s == 0, is_sunset=s == 1,
+                )
+
+    for fn in functions:
+        org.human_system[fn] = HumanSystem(
+            function=fn, ai_proficiency=40.0, change_readiness=50.0, trust_level=45.0,
+            political_capital=60.0, transformation_fatigue=2.0, learning_velocity_months=6.0,
+        )
+
+    org.build_indexes()
+    return org
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best-of-`repeat` wall time of fn(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def dataclass_steps(stimulus: Stimulus, org: OrganizationData) -> None:
+    """Steps 1–6 of run_cascade, without task classification and Steps 7–9."""
+    s1 = step1_resolve_scope(stimulus, org)
+    s2 = step2_reclassify_tasks(s1, stimulus, org)
+    s3 = step3_compute_capacity(s1, s2, stimulus, org)
+    step4_compute_skill_impact(s2, org)
+    s5 = step5_compute_workforce_impact(s3, stimulus, org)
+    step6_compute_financial_impact(s1, s3, s5, stimulus, org)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time run_cascade on synthetic orgs of growing size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 10_000, 25_000, 50_000])
+    parser.add_argument("--tools", type=int, default=40, help="Tools in the org's tech stack")
+    parser.add_argument("--stimulus-tools", type=int, default=5, help="Tools the stimulus deploys")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--columnar", action="store_true", help="Also compare Steps 1–6 on a ColumnarOrg")
+    args = parser.parse_args()
+
+    stimulus = Stimulus(
+        name="Benchmark rollout",
+        stimulus_type="technology_injection",
+        tools=[f"Tool {i}" for i in range(args.stimulus_tools)],
+        target_scope="ALL",
+    )
+
+    header = f"{'Tasks':>8} {'Roles':>6} {'Build (s)':>10} {'Cascade (s)':>12} {'ms / 1k tasks':>14}"
+    if args.columnar:
+        header += f" {'Steps 1-6 (s)':>14} {'Columnar (s)':>13} {'Speedup':>8}"
+    print(header)
+    for n_tasks in args.sizes:
+        start = time.perf_counter()
+        org = synthetic_org(n_tasks, args.tools)
+        build = time.perf_counter() - start
+        elapsed = best_of(lambda: run_cascade(stimulus, org), args.repeat)
+        line = (f"{len(org.tasks):>8} {len(org.roles):>6} {build:>10.2f} {elapsed:>12.3f} "
+                f"{elapsed / len(org.tasks) * 1e6:>14.2f}")
+        if args.columnar:
+            corg = ColumnarOrg.from_organization(org)
+            steps = best_of(lambda: dataclass_steps(stimulus, org), args.repeat)
+            columnar = best_of(lambda: run_columnar_cascade(stimulus, corg), args.repeat)
+            line += f" {steps:>14.3f} {columnar:>13.4f} {steps / columnar:>7.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
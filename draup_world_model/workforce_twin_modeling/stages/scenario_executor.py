@@ -29,6 +29,7 @@ from workforce_twin_modeling.engine.cascade import Stimulus
 from workforce_twin_modeling.engine.rates import SimulationParams, RateParams
 from workforce_twin_modeling.engine.feedback import HumanSystemState, FeedbackParams
 from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback, FBSimulationResult
+from workforce_twin_modeling.engine.executor import get_scenario_executor
 
 
 # ============================================================
@@ -231,6 +232,21 @@ def load_catalog(catalog_path: str) -> list:
         return list(csv.DictReader(f))
 
 
+def select_rows(
+    catalog_path: str,
+    scenario_ids: list = None,
+    families: list = None,
+) -> list:
+    """Catalog rows filtered by IDs or families. None = all rows."""
+    rows = load_catalog(catalog_path)
+
+    if scenario_ids:
+        rows = [r for r in rows if r["scenario_id"] in scenario_ids]
+    if families:
+        rows = [r for r in rows if r["scenario_family"] in families]
+    return rows
+
+
 def run_batch(
     catalog_path: str,
     org: OrganizationData,
@@ -240,23 +256,17 @@ def run_batch(
     """
     Run a batch of scenarios.
     Filter by IDs or families. None = run all.
+    Scenarios run in parallel on the scenario executor; results keep catalog order.
     """
-    rows = load_catalog(catalog_path)
-
-    if scenario_ids:
-        rows = [r for r in rows if r["scenario_id"] in scenario_ids]
-    if families:
-        rows = [r for r in rows if r["scenario_family"] in families]
+    rows = select_rows(catalog_path, scenario_ids, families)
 
-    results = []
-    for row in rows:
-        sid = row.get("scenario_id", "?")
-        sname = row.get("scenario_name", "?")[:50]
-        print(f"    {sid:<10} {sname:<50}", end="", flush=True)
-        sr = run_scenario(row, org)
+    results: List[Optional[ScenarioResult]] = [None] * len(rows)
+    for index, future in get_scenario_executor().run(org, run_scenario, [{"row": row} for row in rows]):
+        sr = future.result()
+        sname = sr.scenario_name[:50]
         status = "✓" if sr.error is None else f"✗ {sr.error[:40]}"
-        print(f" {status}")
-        results.append(sr)
+        print(f"    {sr.scenario_id:<10} {sname:<50} {status}", flush=True)
+        results[index] = sr
 
     return results
 
@@ -34,6 +34,7 @@ from workforce_twin_modeling.engine.rates import (
     P1_CAUTIOUS, P2_BALANCED, P3_AGGRESSIVE, P4_CAPABILITY_FIRST, P5_ACCELERATED,
 )
 from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback, FBSimulationResult
+from workforce_twin_modeling.engine.simulator_batch import simulate_batch
 from workforce_twin_modeling.engine.feedback import HumanSystemState, FeedbackParams
 from workforce_twin_modeling.engine.cascade import Stimulus
 
@@ -99,21 +100,39 @@ def compute_risk_score(result: FBSimulationResult) -> dict:
 
 def run_sensitivity(stimulus, org, base_params, fb_params, base_hs, param_name, deltas):
     """Run simulation at base ± delta for a given human system parameter."""
-    results = []
-    for delta in deltas:
-        modified_hs = HumanSystemState(
-            proficiency=base_hs.proficiency,
-            readiness=base_hs.readiness,
-            trust=base_hs.trust,
-            political_capital=base_hs.political_capital,
-        )
-        current_val = getattr(modified_hs, param_name)
-        new_val = max(5, min(95, current_val + delta))
-        setattr(modified_hs, param_name, new_val)
-        label = f"{param_name} {delta:+.0f} ({new_val:.0f})"
-        result = simulate_with_feedback(stimulus, org, base_params, fb_params, modified_hs)
-        results.append((label, delta, result))
-    return results
+    return run_sensitivity_sweep(
+        stimulus, org, base_params, fb_params, base_hs, [param_name], deltas,
+    )[param_name]
+
+
+def run_sensitivity_sweep(stimulus, org, base_params, fb_params, base_hs, param_names, deltas):
+    """
+    run_sensitivity for every parameter in param_names, as one batched
+    simulation (e.g. all bars of a tornado chart). Returns {param_name: results}.
+    """
+    variants = []
+    for param_name in param_names:
+        for delta in deltas:
+            modified_hs = HumanSystemState(
+                proficiency=base_hs.proficiency,
+                readiness=base_hs.readiness,
+                trust=base_hs.trust,
+                political_capital=base_hs.political_capital,
+            )
+            current_val = getattr(modified_hs, param_name)
+            new_val = max(5, min(95, current_val + delta))
+            setattr(modified_hs, param_name, new_val)
+            label = f"{param_name} {delta:+.0f} ({new_val:.0f})"
+            variants.append((param_name, label, delta, modified_hs))
+
+    batch = simulate_batch(
+        stimulus, org, [base_params] * len(variants), fb_params,
+        initial_hs=[hs for _, _, _, hs in variants],
+    )
+    sweep = {param_name: [] for param_name in param_names}
+    for i, (param_name, label, delta, _) in enumerate(variants):
+        sweep[param_name].append((label, delta, batch.result(i)))
+    return sweep
 
 
 # ============================================================
@@ -10,6 +10,8 @@ Usage:
 
 Cron setup (daily at 2 AM):
     0 2 * * * cd /path/to/etter-backend && python -m jobs.task_autocomplete_refresh
+
+Combinations are refreshed TASK_AUTOCOMPLETE_BATCH_CONCURRENCY at a time (default 4).
 """
 
 import sys
@@ -57,8 +59,16 @@ def main():
         logger.info(f"Total combinations: {result.get('total_combinations', 0)}")
         logger.info(f"Successful: {result.get('successful', 0)}")
         logger.info(f"Failed: {result.get('failed', 0)}")
+        logger.info(f"Duration: {result.get('duration_seconds', 0)}s")
         logger.info("=" * 80)
 
+        for item in result.get('results', []):
+            logger.info(f"  {item.get('company')}+{item.get('role')}: {item.get('status')} "
+                        f"in {item.get('duration_seconds')}s ({item.get('tasks_cached', 0)} tasks)")
+        logger.info("Slowest company+role combinations:")
+        for item in result.get('slowest', []):
+            logger.info(f"  - {item.get('company')}+{item.get('role')}: {item.get('duration_seconds')}s")
+
         # Log failed items if any
         if result.get('failed', 0) > 0:
             logger.warning("Failed to refresh the following company+role combinations:")
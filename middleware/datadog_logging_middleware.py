@@ -1,6 +1,9 @@
 """
 Middleware to log HTTP requests to Datadog with structured fields.
 This provides detailed request/response logging similar to Jaeger traces.
+
+One record per request: the completion (or error) record carries every
+request field plus status and duration, so no separate start record is logged.
 """
 import time
 import logging
@@ -32,21 +35,8 @@ class DatadogLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
         
-        # Log request start (using extra dict for structured logging)
-        logger.info(
-            f"{method} {path}",
-            extra={
-                "http.method": method,
-                "http.url": path,
-                "http.url_details.path": path,
-                "http.url_details.query_string": query_params,
-                "http.client_ip": client_ip,
-                "http.client_port": client_port,
-                "http.request_id": request.headers.get("X-Request-ID", ""),
-                "event_type": "http_request_start",
-            }
-        )
-        
+        request_id = request.headers.get("X-Request-ID", "")
+
         # Process request
         try:
             response = await call_next(request)
@@ -64,7 +54,7 @@ class DatadogLoggingMiddleware(BaseHTTPMiddleware):
                     "http.status_code": status_code,
                     "http.client_ip": client_ip,
                     "http.client_port": client_port,
-                    "http.request_id": request.headers.get("X-Request-ID", ""),
+                    "http.request_id": request_id,
                     "duration_ms": round(duration_ms, 2),
                     "event_type": "http_request_complete",
                 }
@@ -86,6 +76,7 @@ class DatadogLoggingMiddleware(BaseHTTPMiddleware):
                     "http.status_code": status_code,
                     "http.client_ip": client_ip,
                     "http.client_port": client_port,
+                    "http.request_id": request_id,
                     "duration_ms": round(duration_ms, 2),
                     "error.message": str(e),
                     "error.type": type(e).__name__,
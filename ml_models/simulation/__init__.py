@@ -1,8 +1,19 @@
 from .agent import Employee
 from .store import SimulationRequestData, SimulationStore, Store
-from .engine import SimulationEngine, get_simulation_engine
+from .engine import (
+    SimulationEngine,
+    get_simulation_engine,
+    run_simulation_iteration,
+    run_simulation_trajectory,
+)
+from .aggregation import SimulationAggregator, trajectory_metric_names
 from .model import AutomationImpactOrganizationModel, EmployeeGroupProfile
 from .role_provider import RoleDataProvider, Workload, InMemoryRoleDataProvider
+from .vectorized import (
+    VectorizedAutomationImpactModel,
+    run_vectorized_simulation,
+    run_vectorized_trajectories,
+)
 
 __all__ = [
     "SimulationRequestData",
@@ -14,6 +25,13 @@ __all__ = [
     "EmployeeGroupProfile",
     "RoleDataProvider",
     "get_simulation_engine",
+    "run_simulation_iteration",
+    "run_simulation_trajectory",
+    "SimulationAggregator",
+    "trajectory_metric_names",
     "Workload",
     "InMemoryRoleDataProvider",
+    "VectorizedAutomationImpactModel",
+    "run_vectorized_simulation",
+    "run_vectorized_trajectories",
 ]
@@ -82,8 +82,7 @@ class Employee(Agent):
         if not np.any(automatable_mask):
             return
 
-        # Use numpy random for consistency and potential speed
-        if np.random.random() > self.automation_incentive:
+        if self.model.rng.random() > self.automation_incentive:
             return
 
         # Find index of max time among automatable workloads
@@ -105,5 +104,5 @@ class Employee(Agent):
         """Advance the employee by one step"""
         self.update_task()
         self.complete_workloads()
-        if np.random.poisson(lam=self.knowledge_gaining_rate) > self.knowledge_gaining_rate:
+        if self.model.rng.poisson(lam=self.knowledge_gaining_rate) > self.knowledge_gaining_rate:
             self.gain_knowledge()
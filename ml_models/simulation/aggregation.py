@@ -0,0 +1,169 @@
+"""
+Online aggregation of simulation results
+
+``SimulationAggregator`` folds iteration trajectories, step by step, into a
+running sum, min and max per (step, metric) held in preallocated arrays, and
+builds the same ``results`` and ``yearly_metrics`` payloads as
+``transform_simulation_results`` without materialising a row for every
+(iteration, step). Its memory is O(steps x metrics) whatever the number of
+iterations, and partial aggregators built by different workers merge.
+
+A trajectory is an array of shape (steps, metrics), with metrics ordered as
+``trajectory_metric_names(role_groups)``.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .model import EmployeeGroupProfile
+
+MODEL_METRICS = [
+    "avg_automation_rate",
+    "total_employees",
+    "avg_time_per_employee",
+    "total_salary_of_employees",
+    "avg_unused_output_capacity",
+]
+ROLE_METRICS = [
+    "count",
+    "avg_automation_rate",
+    "avg_time_per_employee",
+    "total_salary_of_employee",
+    "avg_unused_output_capacity",
+]
+STEPS_PER_YEAR = 12
+
+
+def trajectory_metric_names(role_groups: Sequence[EmployeeGroupProfile]) -> List[str]:
+    """Model variables kept per step, in trajectory column order"""
+    return MODEL_METRICS + [
+        f"{group['role']}_{metric}" for group in role_groups for metric in ROLE_METRICS
+    ]
+
+
+class SimulationAggregator:
+    def __init__(self, role_groups: Sequence[EmployeeGroupProfile], n_steps: int):
+        self.role_groups = list(role_groups)
+        self.names = trajectory_metric_names(self.role_groups)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.n_steps = n_steps
+        self.n_iterations = 0
+
+        shape = (n_steps, len(self.names))
+        self._sum = np.zeros(shape)
+        self._min = np.full(shape, np.inf)
+        self._max = np.full(shape, -np.inf)
+        self._count = np.zeros(n_steps, dtype=np.int64)
+        # Step-0 values of the first iteration: the baseline savings are measured against
+        self._baseline: Optional[np.ndarray] = None
+
+    def update_step(self, step: int, values: np.ndarray) -> None:
+        """Fold the values of one step for one or more iterations, shape (metrics,) or (k, metrics)."""
+        values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+        if step == 0 and self._baseline is None:
+            self._baseline = values[0].copy()
+        self._sum[step] += values.sum(axis=0)
+        np.minimum(self._min[step], values.min(axis=0), out=self._min[step])
+        np.maximum(self._max[step], values.max(axis=0), out=self._max[step])
+        self._count[step] += len(values)
+
+    def update(self, trajectories: np.ndarray) -> None:
+        """Fold whole trajectories, shape (steps, metrics) or (k, steps, metrics)."""
+        trajectories = np.asarray(trajectories, dtype=np.float64)
+        if trajectories.ndim == 2:
+            trajectories = trajectories[None]
+        if len(trajectories) == 0:
+            return
+        steps = min(self.n_steps, trajectories.shape[1])
+        trajectories = trajectories[:, :steps]
+        if self._baseline is None:
+            self._baseline = trajectories[0, 0].copy()
+        self._sum[:steps] += trajectories.sum(axis=0)
+        np.minimum(self._min[:steps], trajectories.min(axis=0), out=self._min[:steps])
+        np.maximum(self._max[:steps], trajectories.max(axis=0), out=self._max[:steps])
+        self._count[:steps] += len(trajectories)
+        self.n_iterations += len(trajectories)
+
+    def merge(self, other: "SimulationAggregator") -> None:
+        self._sum += other._sum
+        np.minimum(self._min, other._min, out=self._min)
+        np.maximum(self._max, other._max, out=self._max)
+        self._count += other._count
+        self.n_iterations += other.n_iterations
+        if self._baseline is None:
+            self._baseline = other._baseline
+
+    def _statistics(self):
+        """Per-step (mean, min, max) columns in the order of the results payload."""
+        steps = np.nonzero(self._count)[0]
+        count = self._count[steps, None]
+        mean, low, high = self._sum[steps] / count, self._min[steps], self._max[steps]
+
+        total_employees = sum(group["count"] for group in self.role_groups)
+        total_salary = sum(group["salary"] * group["count"] for group in self.role_groups)
+        scale = np.ones(len(self.names))
+        scale[self._index["total_employees"]] = total_employees
+        scale[self._index["total_salary_of_employees"]] = total_salary
+        mean, low, high = mean * scale, low * scale, high * scale
+        baseline = self._baseline * scale
+
+        def column(name: str):
+            i = self._index[name]
+            return mean[:, i], low[:, i], high[:, i]
+
+        def savings(name: str):
+            i = self._index[name]
+            return baseline[i] - mean[:, i], baseline[i] - high[:, i], baseline[i] - low[:, i]
+
+        columns = [
+            ("automation", column("avg_automation_rate")),
+            ("employees", column("total_employees")),
+            ("avg_time_per_employee", column("avg_time_per_employee")),
+            ("total_salary_of_employees", column("total_salary_of_employees")),
+            ("cost_savings", savings("total_salary_of_employees")),
+            ("avg_unused_output_capacity", column("avg_unused_output_capacity")),
+            ("headcount_savings", savings("total_employees")),
+        ]
+        for group in self.role_groups:
+            role = group["role"]
+            columns += [
+                (f"{role}_count", column(f"{role}_count")),
+                (f"{role}_cost_savings", savings(f"{role}_total_salary_of_employee")),
+                (f"{role}_avg_automation_rate", column(f"{role}_avg_automation_rate")),
+                (f"{role}_avg_time_per_employee", column(f"{role}_avg_time_per_employee")),
+                (f"{role}_total_salary_of_employee", column(f"{role}_total_salary_of_employee")),
+                (f"{role}_avg_unused_output_capacity", column(f"{role}_avg_unused_output_capacity")),
+            ]
+
+        names = []
+        values = []
+        for label, stats in columns:
+            for suffix, series in zip(("mean", "min", "max"), stats):
+                names.append(f"{label}_{suffix}")
+                values.append(series)
+        return steps, names, np.stack(values, axis=1)
+
+    def results(self) -> List[Dict]:
+        """Per-step mean/min/max records, as ``transform_simulation_results`` returns them"""
+        if not self.n_iterations:
+            return []
+        steps, names, values = self._statistics()
+        return [
+            {"Step": int(step), **dict(zip(names, row.tolist()))}
+            for step, row in zip(steps, values)
+        ]
+
+    def yearly_metrics(self) -> List[Dict]:
+        """Year-over-year deltas of the per-step statistics, as ``compute_yearly_metrics`` returns them"""
+        if not self.n_iterations:
+            return []
+        _, names, values = self._statistics()
+        starts = values[::STEPS_PER_YEAR]
+        ends = values[STEPS_PER_YEAR::STEPS_PER_YEAR]
+        n_years = min(len(starts), len(ends))
+        deltas = ends[:n_years] - starts[:n_years]
+        return [
+            {**dict(zip(names, row.tolist())), "Year": year + 1}
+            for year, row in enumerate(deltas)
+        ]
@@ -1,7 +1,10 @@
 import os
 import asyncio
-from typing import List, Optional, Tuple, Dict
+from functools import partial
+from multiprocessing import Pool
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Dict, Union
 
+import numpy as np
 from mesa.batchrunner import batch_run
 from pandas import DataFrame
 
@@ -11,7 +14,9 @@ from .role_provider import InMemoryRoleDataProvider
 from .model import (
     EmployeeGroupProfile,
     AutomationImpactOrganizationModel,
+    iteration_rng,
 )
+from .vectorized import VectorizedAutomationImpactModel
 
 
 class SimulationEngine:
@@ -19,9 +24,15 @@ class SimulationEngine:
         self,
         role_provider: Optional[RoleDataProvider] = None,
         number_of_months: int = 120,
+        vectorized: bool = False,
     ):
-        """Initialize the simulation engine"""
+        """
+        Initialize the simulation engine. With ``vectorized`` the iterations
+        run on ``VectorizedAutomationImpactModel`` instead of one Mesa model
+        per iteration.
+        """
         self.n_months: int = number_of_months
+        self.vectorized = vectorized
         self.role_provider: RoleDataProvider
         if role_provider is None:
             self.role_provider = InMemoryRoleDataProvider(DEFAULT_ROLES)
@@ -36,22 +47,16 @@ class SimulationEngine:
         role_groups: List[EmployeeGroupProfile],
         company: str = "",
         automation_factor: float = 0.2,
+        role_workload_map: Optional[List[Dict[str, str | List[Workload]]]] = None,
     ) -> Tuple[DataFrame, List[Dict[str, str | List[Workload]]]]:
         assert self.role_provider is not None
-        role_workload_map: List[Dict[str, str | List[Workload]]] = [
-            {
-                "role": group["role"],
-                "workloads": self.role_provider.get_responsibilities_from_role(
-                    group["role"], company
-                ),
-            }
-            for group in role_groups
-        ]
+        if role_workload_map is None:
+            role_workload_map = self.get_role_workload_map(role_groups, company)
 
         model = AutomationImpactOrganizationModel(
             company=company,
             role_groups=role_groups,
-            role_provider=self.role_provider,
+            role_provider=self.build_local_role_provider(role_groups, company, role_workload_map),
             automation_factor=automation_factor,
         )
 
@@ -94,6 +99,23 @@ class SimulationEngine:
         ]
         return role_workload_map
 
+    def build_local_role_provider(
+        self,
+        role_groups: List[EmployeeGroupProfile],
+        company: str = "",
+        role_workload_map: Optional[List[Dict[str, str | List[Workload]]]] = None,
+    ) -> InMemoryRoleDataProvider:
+        """
+        Snapshot the workloads of every role into an in-memory provider that
+        can be shipped to worker processes. An already fetched
+        ``role_workload_map`` is reused instead of asking the provider again.
+        """
+        if role_workload_map is None:
+            role_workload_map = self.get_role_workload_map(role_groups, company)
+        return InMemoryRoleDataProvider(
+            {company: {item["role"]: item["workloads"] for item in role_workload_map}}
+        )
+
     def run_multiple_simulations(
         self,
         role_groups: List[EmployeeGroupProfile],
@@ -101,16 +123,57 @@ class SimulationEngine:
         automation_factor: float = 0.2,
         n_simulations: int = 10,
         data_collection_period: int = 1,
+        seed: Optional[int] = None,
+        iterations: Optional[Sequence[int]] = None,
+        role_workload_map: Optional[List[Dict[str, str | List[Workload]]]] = None,
     ) -> Tuple[DataFrame]:
-        role_workload_map = {
-            company: {
-                group["role"]: self.role_provider.get_responsibilities_from_role(
-                    group["role"], company
-                )
-                for group in role_groups
-            }
-        }
-        local_role_provider = InMemoryRoleDataProvider(role_workload_map)
+        """
+        Run the Monte-Carlo iterations and return their rows. With a ``seed``
+        iteration ``i`` always draws from ``iteration_rng(seed, i)``, so a
+        run is reproducible and any subset of ``iterations`` (default
+        ``range(n_simulations)``) gives the same rows as the full run.
+        Pass the ``role_workload_map`` the caller already fetched so no role
+        is looked up again.
+        """
+        local_role_provider = self.build_local_role_provider(
+            role_groups, company, role_workload_map
+        )
+        if iterations is None:
+            iterations = range(n_simulations)
+
+        if self.vectorized:
+            model = VectorizedAutomationImpactModel(
+                role_groups=role_groups,
+                role_provider=local_role_provider,
+                company=company,
+                automation_factor=automation_factor,
+                seed=seed,
+                iterations=iterations,
+            )
+            return model.run(self.n_months, data_collection_period=data_collection_period)
+
+        # Use all available CPU cores for parallel processing
+        num_processes = min(len(iterations), os.cpu_count() or 1)
+
+        if seed is not None or list(iterations) != list(range(len(iterations))):
+            # batch_run cannot hand each iteration its own generator
+            run_iteration = partial(
+                _run_seeded_iteration,
+                role_groups,
+                local_role_provider,
+                company,
+                automation_factor,
+                self.n_months,
+                seed,
+                data_collection_period,
+            )
+            if num_processes > 1:
+                with Pool(num_processes) as pool:
+                    runs = pool.map(run_iteration, iterations)
+            else:
+                runs = [run_iteration(iteration) for iteration in iterations]
+            return DataFrame([row for run in runs for row in run])
+
         fixed_params = {
             "role_groups": [role_groups],
             "role_provider": local_role_provider,
@@ -118,9 +181,6 @@ class SimulationEngine:
             "company": company,
         }
 
-        # Use all available CPU cores for parallel processing
-        num_processes = min(n_simulations, os.cpu_count() or 1)
-
         results = batch_run(
             AutomationImpactOrganizationModel,
             parameters=fixed_params,
@@ -135,6 +195,135 @@ class SimulationEngine:
         return results
 
 
+class QueueProgressReporter:
+    """
+    Picklable ``progress`` callback for ``run_simulation_iteration`` and the
+    vectorized kernel that forwards ``(job_id, iterations, step)`` to a
+    multiprocessing queue, one message per step for a whole chunk.
+    """
+
+    def __init__(self, queue: Any, job_id: str):
+        self.queue = queue
+        self.job_id = job_id
+
+    def __call__(self, iterations: Union[int, Sequence[int]], step: int) -> None:
+        if isinstance(iterations, int):
+            iterations = (iterations,)
+        self.queue.put((self.job_id, tuple(iterations), step))
+
+
+def run_simulation_iteration(
+    role_groups: List[EmployeeGroupProfile],
+    role_provider: RoleDataProvider,
+    company: str,
+    automation_factor: float,
+    max_steps: int,
+    run_id: int = 0,
+    iteration: int = 0,
+    data_collection_period: int = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run one Monte-Carlo iteration and return its rows in the same shape as
+    ``mesa.batch_run``. Module level so it can be sent to worker processes.
+    ``progress(iteration, step)`` is called after every model step, and the
+    model draws from ``iteration_rng(seed, iteration)``.
+    """
+    kwargs = {
+        "role_groups": role_groups,
+        "role_provider": role_provider,
+        "automation_factor": automation_factor,
+        "company": company,
+    }
+    model = AutomationImpactOrganizationModel(**kwargs, rng=iteration_rng(seed, iteration))
+    for _ in _step_model(model, max_steps, iteration, progress):
+        pass
+
+    steps = list(range(0, model.steps, data_collection_period))
+    if not steps or steps[-1] != model.steps - 1:
+        steps.append(model.steps - 1)
+
+    model_vars = model.datacollector.model_vars
+    return [
+        {
+            "RunId": run_id,
+            "iteration": iteration,
+            "Step": step,
+            **kwargs,
+            **{name: values[step] for name, values in model_vars.items()},
+        }
+        for step in steps
+    ]
+
+
+def run_simulation_trajectory(
+    role_groups: List[EmployeeGroupProfile],
+    role_provider: RoleDataProvider,
+    company: str,
+    automation_factor: float,
+    max_steps: int,
+    metric_names: Sequence[str],
+    iteration: int = 0,
+    progress: Optional[Callable[[int, int], None]] = None,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Run one Monte-Carlo iteration like ``run_simulation_iteration`` but
+    return only ``metric_names``, written step by step into a preallocated
+    (steps, metrics) array instead of one row dict per step.
+    """
+    model = AutomationImpactOrganizationModel(
+        role_groups=role_groups,
+        role_provider=role_provider,
+        automation_factor=automation_factor,
+        company=company,
+        rng=iteration_rng(seed, iteration),
+    )
+    trajectory = np.empty((max_steps + 1, len(metric_names)))
+    model_vars = model.datacollector.model_vars
+    for step in _step_model(model, max_steps, iteration, progress):
+        trajectory[step] = [model_vars[name][-1] for name in metric_names]
+    return trajectory[: model.steps]
+
+
+def _step_model(
+    model: AutomationImpactOrganizationModel,
+    max_steps: int,
+    iteration: int,
+    progress: Optional[Callable[[int, int], None]],
+) -> Iterator[int]:
+    """Step ``model`` the way ``mesa.batch_run`` does, yielding each collected step."""
+    while model.running and model.steps <= max_steps:
+        model.step()
+        if progress is not None:
+            progress(iteration, model.steps)
+        yield model.steps - 1
+
+
+def _run_seeded_iteration(
+    role_groups: List[EmployeeGroupProfile],
+    role_provider: RoleDataProvider,
+    company: str,
+    automation_factor: float,
+    max_steps: int,
+    seed: Optional[int],
+    data_collection_period: int,
+    iteration: int,
+) -> List[Dict[str, Any]]:
+    return run_simulation_iteration(
+        role_groups,
+        role_provider,
+        company,
+        automation_factor,
+        max_steps,
+        run_id=iteration,
+        iteration=iteration,
+        data_collection_period=data_collection_period,
+        seed=seed,
+    )
+
+
 # Module-level singleton instance
 _engine_instance: Optional[SimulationEngine] = None
 
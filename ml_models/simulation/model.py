@@ -1,9 +1,9 @@
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 from typing_extensions import TypedDict
 from itertools import product
 
 import pandas as pd
-from numpy.random import random
+from numpy.random import Generator, SeedSequence, default_rng
 from numpy import mean, empty, float64
 from mesa import Model, DataCollector
 
@@ -24,6 +24,17 @@ class EmployeeGroupProfile(TypedDict):
     salary: float
 
 
+def iteration_rng(seed: Optional[int], iteration: int) -> Generator:
+    """
+    Random generator for one Monte-Carlo iteration. The same (seed, iteration)
+    always gives the same stream, independent of how many iterations run or
+    in which process; without a seed the stream comes from OS entropy.
+    """
+    if seed is None:
+        return default_rng()
+    return default_rng(SeedSequence([seed, iteration]))
+
+
 class AutomationImpactOrganizationModel(Model):
     def __init__(
         self,
@@ -31,6 +42,7 @@ class AutomationImpactOrganizationModel(Model):
         role_provider: RoleDataProvider,
         company: str = "",
         automation_factor: float = 0.2,
+        rng: Optional[Generator] = None,
     ):
         self.automation_factor = automation_factor
 
@@ -48,7 +60,8 @@ class AutomationImpactOrganizationModel(Model):
         self.company = company
         self.role_provider = role_provider
         assert self.role_provider is not None
-        super().__init__()
+        # All randomness, including the agent shuffle, is drawn from ``self.rng``
+        super().__init__(rng=rng)
 
         self.role_salaries = {
             role_group["role"]: role_group["salary"] for role_group in role_groups
@@ -284,7 +297,7 @@ class AutomationImpactOrganizationModel(Model):
         """Advance the model by one step"""
         self.agents.shuffle_do("step")
         self._compute_metrics()
-        if random() <= self.automation_factor:
+        if self.rng.random() <= self.automation_factor:
             self._reduce_workforce()
         self.datacollector.collect(self)
 
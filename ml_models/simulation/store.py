@@ -8,6 +8,7 @@ class SimulationRequestData(TypedDict):
     roles: List[Dict]
     company: str
     automation_factor: float
+    seed: Optional[int]
 
 
 class Store(ABC):
@@ -0,0 +1,412 @@
+"""
+Vectorized automation impact model
+
+An agent-free counterpart of ``AutomationImpactOrganizationModel`` that
+follows the same rules and reports the same statistics. Instead of one Mesa
+``Employee`` per head, every role keeps its employees in arrays with shape
+(iterations, employees, workloads), and all Monte-Carlo iterations advance
+together along the first axis.
+
+Employees of a role are kept compacted: the first ``count[i]`` rows of
+iteration ``i`` are the employees still on the payroll, in the order the
+agent model keeps them in ``model.employees[role]``.
+
+Every iteration draws from its own ``iteration_rng(seed, iteration)``, so
+iteration ``i`` of a seeded run is the same whichever other iterations run
+alongside it.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from pandas import DataFrame
+
+from .role_provider import RoleDataProvider
+from .model import EmployeeGroupProfile, iteration_rng
+
+KNOWLEDGE_GAINING_RATE = 2
+KNOWLEDGE_INCREMENT = 0.20
+
+
+class _RoleWorkforce:
+    """Employees of one role across all iterations."""
+
+    def __init__(
+        self,
+        role: str,
+        count: int,
+        salary: float,
+        workloads: List[Dict[str, Any]],
+        n_iterations: int,
+    ):
+        self.role = role
+        self.salary = salary
+        self.initial_count = count
+        self.n_workloads = len(workloads)
+
+        self.workload_times = np.array([w["Time"] for w in workloads], dtype=np.float64)
+        self.workload_skills = np.array([w["Skill"] for w in workloads], dtype=np.float64)
+        self.auto_mask = np.array([w["Type"] == "Auto" for w in workloads], dtype=bool)
+
+        self.count = np.full(n_iterations, count, dtype=np.int64)
+        self.knowledge = np.zeros((n_iterations, count, self.n_workloads), dtype=np.float64)
+        self.expected_output = np.ones((n_iterations, count), dtype=np.float64)
+
+        # Per-step values, as ``Employee.complete_workloads`` leaves them
+        self.automation_rate = np.zeros((n_iterations, count), dtype=np.float64)
+        self.time_to_complete = np.ones((n_iterations, count), dtype=np.float64)
+        self.time_savings = np.zeros((n_iterations, count), dtype=np.float64)
+        self.unused_output_capacity = np.zeros((n_iterations, count), dtype=np.float64)
+        self._manual_mask = np.ones((n_iterations, count, self.n_workloads), dtype=bool)
+
+    @property
+    def alive(self) -> np.ndarray:
+        return np.arange(self.initial_count)[None, :] < self.count[:, None]
+
+    def complete_workloads(self) -> None:
+        """``Employee.update_task`` and ``complete_workloads`` for every employee."""
+        is_automated = self.auto_mask & (self.workload_skills <= self.knowledge)
+        self._manual_mask = ~is_automated
+
+        if self.n_workloads > 0:
+            self.automation_rate = is_automated.sum(axis=-1) / self.n_workloads
+        else:
+            self.automation_rate = np.zeros_like(self.expected_output)
+
+        time_unit_work = np.where(self._manual_mask, self.workload_times, 0.0).sum(axis=-1)
+        self.time_to_complete = time_unit_work * self.expected_output
+        self.time_savings = 1.0 - self.time_to_complete
+        with np.errstate(divide="ignore"):
+            self.unused_output_capacity = np.where(
+                time_unit_work > 0, 1.0 / time_unit_work - self.expected_output, 0.0
+            )
+
+    def gain_knowledge(
+        self, rngs: Sequence[np.random.Generator], automation_incentive: float
+    ) -> None:
+        """``Employee.gain_knowledge``: learn the longest still-manual automatable workload."""
+        if self.initial_count == 0 or self.n_workloads == 0 or not rngs:
+            return
+        size = self.initial_count
+        automatable = self._manual_mask & self.auto_mask
+        tries = np.stack([rng.poisson(lam=KNOWLEDGE_GAINING_RATE, size=size) for rng in rngs])
+        draws = np.stack([rng.random(size) for rng in rngs])
+        learns = (
+            (tries > KNOWLEDGE_GAINING_RATE)
+            & (draws <= automation_incentive)
+            & automatable.any(axis=-1)
+            & self.alive
+        )
+        iterations, employees = np.nonzero(learns)
+        if iterations.size == 0:
+            return
+        target = np.argmax(np.where(automatable, self.workload_times, -1.0), axis=-1)[learns]
+        self.knowledge[iterations, employees, target] = np.minimum(
+            self.knowledge[iterations, employees, target] + KNOWLEDGE_INCREMENT, 1.0
+        )
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """Per-iteration sums over the employees still on the payroll."""
+        alive = self.alive
+        return {
+            "count": self.count,
+            "automation_rate": np.where(alive, self.automation_rate, 0.0).sum(axis=-1),
+            "time_to_complete": np.where(alive, self.time_to_complete, 0.0).sum(axis=-1),
+            "unused_output_capacity": np.where(alive, self.unused_output_capacity, 0.0).sum(axis=-1),
+        }
+
+    def reduce_workforce(self, reducing: np.ndarray) -> None:
+        """
+        ``AutomationImpactOrganizationModel._reduce_workforce`` for the
+        iterations flagged in ``reducing``.
+        """
+        if self.initial_count == 0:
+            return
+        n_employees = self.initial_count
+        positions = np.arange(n_employees)
+        alive = self.alive
+
+        # Stable sort by (time_savings, expected_output) descending, with the
+        # employees already let go kept at the end.
+        order = np.lexsort(
+            (-self.expected_output, np.where(alive, -self.time_savings, np.inf)), axis=-1
+        )
+        order = np.where(reducing[:, None], order, positions[None, :])
+        for name in (
+            "expected_output",
+            "automation_rate",
+            "time_to_complete",
+            "time_savings",
+            "unused_output_capacity",
+        ):
+            setattr(self, name, np.take_along_axis(getattr(self, name), order, axis=-1))
+        self.knowledge = np.take_along_axis(self.knowledge, order[:, :, None], axis=1)
+
+        # One to one replacement: the k-th best employee absorbs the k-th worst
+        # for as long as its unused capacity covers the other's output.
+        count = self.count
+        bottom_index = np.clip(count[:, None] - 1 - positions[None, :], 0, n_employees - 1)
+        bottom_output = np.take_along_axis(self.expected_output, bottom_index, axis=-1)
+        replaces = (
+            reducing[:, None]
+            & (2 * positions[None, :] < count[:, None] - 1)
+            & (self.unused_output_capacity >= bottom_output)
+        )
+        replaces = np.logical_and.accumulate(replaces, axis=-1)
+        self.expected_output = np.where(
+            replaces, self.expected_output + bottom_output, self.expected_output
+        )
+        self.count = count - replaces.sum(axis=-1)
+
+        # Many to one replacement: consecutive employees with spare capacity
+        # pool it until it covers the output of the worst remaining one.
+        for iteration in np.nonzero(reducing)[0]:
+            self._pool_replacement(iteration)
+
+    def _pool_replacement(self, iteration: int) -> None:
+        n_remaining = int(self.count[iteration])
+        unused = self.unused_output_capacity[iteration, :n_remaining]
+        expected = self.expected_output[iteration, :n_remaining]
+
+        negative = np.nonzero(unused < 0)[0]
+        eligible = int(negative[0]) if negative.size else n_remaining
+        pooled = np.cumsum(unused[:eligible])
+
+        start, removed = 0, 0
+        while True:
+            reach = min(n_remaining - 1 - removed, eligible)
+            if start >= reach:
+                break
+            base = pooled[start - 1] if start > 0 else 0.0
+            end = max(
+                int(np.searchsorted(pooled, base + expected[n_remaining - 1 - removed])), start
+            )
+            if end >= reach:
+                break
+            removed += 1
+            start = end + 1
+
+        if removed:
+            expected[:start] += unused[:start]
+            self.count[iteration] = n_remaining - removed
+
+
+class VectorizedAutomationImpactModel:
+    """
+    Runs independent copies of the automation impact model at once, one per
+    entry of ``iterations`` (default ``range(n_iterations)``). ``run``
+    returns rows in the same shape as ``mesa.batch_run`` over
+    ``AutomationImpactOrganizationModel``.
+    """
+
+    def __init__(
+        self,
+        role_groups: List[EmployeeGroupProfile],
+        role_provider: RoleDataProvider,
+        company: str = "",
+        automation_factor: float = 0.2,
+        n_iterations: int = 1,
+        seed: Optional[int] = None,
+        iterations: Optional[Sequence[int]] = None,
+    ):
+        self.role_groups = role_groups
+        self.role_provider = role_provider
+        self.company = company
+        self.automation_factor = automation_factor
+        self.iterations = np.asarray(
+            iterations if iterations is not None else range(n_iterations), dtype=np.int64
+        )
+        self.n_iterations = len(self.iterations)
+        self.rngs = [iteration_rng(seed, int(iteration)) for iteration in self.iterations]
+        self.steps = 0
+
+        self.workforces: List[_RoleWorkforce] = []
+        for group in role_groups:
+            workloads = role_provider.get_responsibilities_from_role(group["role"], company)
+            if workloads is None:
+                raise ValueError(f"Role {group['role']} not found in role provider")
+            self.workforces.append(
+                _RoleWorkforce(
+                    group["role"], group["count"], group["salary"], workloads, self.n_iterations
+                )
+            )
+
+        self.initial_employee_population = sum(group["count"] for group in role_groups)
+        self.initial_employee_salaries = sum(
+            group["salary"] * group["count"] for group in role_groups
+        )
+        self.model_vars: Dict[str, List[np.ndarray]] = {}
+
+    def step(self) -> None:
+        """Advance every iteration by one step"""
+        for workforce in self.workforces:
+            workforce.complete_workloads()
+            workforce.gain_knowledge(self.rngs, self.automation_factor)
+        self._collect(self._compute_metrics())
+
+        reducing = np.array([rng.random() for rng in self.rngs]) <= self.automation_factor
+        if reducing.any():
+            for workforce in self.workforces:
+                workforce.reduce_workforce(reducing)
+        self.steps += 1
+
+    def _compute_metrics(self) -> Dict[str, np.ndarray]:
+        shape = (self.n_iterations,)
+        total_employees = np.zeros(shape, dtype=np.int64)
+        total_salary = np.zeros(shape)
+        total_automation_rate = np.zeros(shape)
+        total_time_to_complete = np.zeros(shape)
+        total_unused_output_capacity = np.zeros(shape)
+        report: Dict[str, np.ndarray] = {}
+
+        for workforce in self.workforces:
+            sums = workforce.metrics()
+            count = sums["count"]
+            safe_count = np.maximum(count, 1)
+            total_employees += count
+            total_salary += count * workforce.salary
+            total_automation_rate += sums["automation_rate"]
+            total_time_to_complete += sums["time_to_complete"]
+            total_unused_output_capacity += sums["unused_output_capacity"]
+
+            role = workforce.role
+            report[f"{role}_count"] = count.copy()
+            report[f"{role}_total_salary_of_employee"] = count * workforce.salary
+            report[f"{role}_avg_automation_rate"] = np.where(
+                count > 0, sums["automation_rate"] / safe_count, 0.0
+            )
+            report[f"{role}_avg_time_per_employee"] = np.where(
+                count > 0, sums["time_to_complete"] / safe_count, 0.0
+            )
+            report[f"{role}_avg_unused_output_capacity"] = np.where(
+                count > 0, sums["unused_output_capacity"] / safe_count, 0.0
+            )
+
+        safe_total = np.maximum(total_employees, 1)
+        has_employees = total_employees > 0
+        return {
+            "total_time": np.full(shape, float(self.initial_employee_population)),
+            "total_employees": total_employees / self.initial_employee_population,
+            "avg_time_per_employee": np.where(has_employees, total_time_to_complete / safe_total, 0.0),
+            "avg_automation_rate": np.where(has_employees, total_automation_rate / safe_total, 0.0),
+            "total_salary_of_employees": total_salary / self.initial_employee_salaries,
+            "avg_unused_output_capacity": np.where(
+                has_employees, total_unused_output_capacity / safe_total, 0.0
+            ),
+            **report,
+        }
+
+    def _collect(self, metrics: Dict[str, np.ndarray]) -> None:
+        for name, values in metrics.items():
+            self.model_vars.setdefault(name, []).append(values)
+
+    def run(
+        self,
+        max_steps: int,
+        data_collection_period: int = 1,
+        progress: Optional[Callable[[Sequence[int], int], None]] = None,
+    ) -> DataFrame:
+        """
+        Step until ``max_steps`` like ``mesa.batch_run`` does and return one
+        row per iteration and collected step. ``progress(iterations, step)``
+        is called once per step with all of the model's iterations.
+        """
+        self._advance(max_steps, progress)
+
+        steps = list(range(0, self.steps, data_collection_period))
+        if not steps or steps[-1] != self.steps - 1:
+            steps.append(self.steps - 1)
+
+        n_rows = self.n_iterations * len(steps)
+        iterations = np.repeat(self.iterations, len(steps))
+        columns: Dict[str, Any] = {
+            "RunId": iterations,
+            "iteration": iterations,
+            "Step": np.tile(steps, self.n_iterations),
+            "role_groups": [self.role_groups] * n_rows,
+            "role_provider": [self.role_provider] * n_rows,
+            "automation_factor": self.automation_factor,
+            "company": self.company,
+        }
+        for name, values in self.model_vars.items():
+            # (steps, iterations) -> iteration-major rows
+            columns[name] = np.stack(values)[steps].T.reshape(-1)
+        return DataFrame(columns)
+
+    def run_trajectories(
+        self,
+        max_steps: int,
+        metric_names: Sequence[str],
+        progress: Optional[Callable[[Sequence[int], int], None]] = None,
+    ) -> np.ndarray:
+        """
+        Step like ``run`` and return the collected ``metric_names`` as an
+        array of shape (iterations, steps, metrics) instead of rows.
+        """
+        self._advance(max_steps, progress)
+        trajectories = np.empty((self.n_iterations, self.steps, len(metric_names)))
+        for i, name in enumerate(metric_names):
+            trajectories[:, :, i] = np.stack(self.model_vars[name]).T
+        return trajectories
+
+    def _advance(self, max_steps: int, progress: Optional[Callable[[Sequence[int], int], None]]) -> None:
+        iterations = tuple(int(iteration) for iteration in self.iterations)
+        while self.steps <= max_steps:
+            self.step()
+            if progress is not None:
+                progress(iterations, self.steps)
+
+
+def run_vectorized_simulation(
+    role_groups: List[EmployeeGroupProfile],
+    role_provider: RoleDataProvider,
+    company: str,
+    automation_factor: float,
+    max_steps: int,
+    n_iterations: int,
+    data_collection_period: int = 1,
+    progress: Optional[Callable[[Sequence[int], int], None]] = None,
+    seed: Optional[int] = None,
+    iterations: Optional[Sequence[int]] = None,
+) -> DataFrame:
+    """
+    Run the iterations with the vectorized model. Module level so it can be
+    sent to worker processes.
+    """
+    model = VectorizedAutomationImpactModel(
+        role_groups=role_groups,
+        role_provider=role_provider,
+        company=company,
+        automation_factor=automation_factor,
+        n_iterations=n_iterations,
+        seed=seed,
+        iterations=iterations,
+    )
+    return model.run(max_steps, data_collection_period=data_collection_period, progress=progress)
+
+
+def run_vectorized_trajectories(
+    role_groups: List[EmployeeGroupProfile],
+    role_provider: RoleDataProvider,
+    company: str,
+    automation_factor: float,
+    max_steps: int,
+    iterations: Sequence[int],
+    metric_names: Sequence[str],
+    progress: Optional[Callable[[Sequence[int], int], None]] = None,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Run ``iterations`` with the vectorized model and return their
+    (iterations, steps, metrics) trajectories. Module level so it can be
+    sent to worker processes.
+    """
+    model = VectorizedAutomationImpactModel(
+        role_groups=role_groups,
+        role_provider=role_provider,
+        company=company,
+        automation_factor=automation_factor,
+        seed=seed,
+        iterations=iterations,
+    )
+    return model.run_trajectories(max_steps, metric_names, progress=progress)
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import jwt
+
+from services import draup_world_token
+from services.draup_world_token import TOKEN_REFRESH_MARGIN_SECONDS, DraupWorldTokenManager
+
+BASE_URL = "https://draup-world.test/api"
+
+
+def make_token(n: int, expires_in: int = 3600) -> str:
+    return jwt.encode({"n": n, "exp": int(time.time()) + expires_in}, "secret", algorithm="HS256")
+
+
+class FakeLogin:
+    """The /login endpoint: returns a new token per call, optionally after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.tokens = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        time.sleep(self.delay)
+        with self._lock:
+            token = make_token(len(self.tokens))
+            self.tokens.append(token)
+        return MagicMock(status_code=200, json=MagicMock(return_value={"token": token}))
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+class TestDraupWorldTokenManager(TestCase):
+    def setUp(self):
+        self.login = FakeLogin()
+        patcher = patch.object(draup_world_token.requests, "post", side_effect=self.login)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_callers_share_one_login(self):
+        self.login.delay = 0.05
+        manager = DraupWorldTokenManager(BASE_URL, use_redis=False)
+        barrier = threading.Barrier(8)
+        tokens = []
+
+        def get():
+            barrier.wait()
+            tokens.append(manager.get_token())
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.login.tokens), 1)
+        self.assertEqual(tokens, self.login.tokens * 8)
+        self.assertEqual(manager.get_token(), self.login.tokens[0])
+        self.assertEqual(len(self.login.tokens), 1)
+
+    def test_token_within_the_refresh_margin_is_replaced(self):
+        manager = DraupWorldTokenManager(BASE_URL, use_redis=False)
+        manager._token = "old-token"
+        manager._expires_at = time.time() + TOKEN_REFRESH_MARGIN_SECONDS - 10
+
+        self.assertEqual(manager.get_token(), self.login.tokens[0])
+        self.assertEqual(len(self.login.tokens), 1)
+        self.assertGreater(manager._expires_at, time.time() + TOKEN_REFRESH_MARGIN_SECONDS)
+
+    def test_token_is_shared_through_redis(self):
+        redis_client = FakeRedis()
+        with patch.object(draup_world_token, "get_redis_client", return_value=redis_client):
+            first = DraupWorldTokenManager(BASE_URL).get_token()
+            second = DraupWorldTokenManager(BASE_URL)
+            self.assertEqual(second.get_token(), first)
+            self.assertEqual(second.stats()["redis_hits"], 1)
+            self.assertEqual(len(self.login.tokens), 1)
+
+            second.invalidate(first)
+        self.assertNotIn(second.redis_key, redis_client.values)
+
+    def test_401_refreshes_the_token_once_and_retries(self):
+        manager = DraupWorldTokenManager(BASE_URL, use_redis=False)
+        stale = manager.get_token()
+        sent = []
+
+        def upstream(method, url, headers=None, **kwargs):
+            sent.append(headers["Authorization"])
+            return MagicMock(status_code=401 if len(sent) == 1 else 200)
+
+        with patch.object(draup_world_token.requests, "request", side_effect=upstream):
+            response = manager.request("GET", f"{BASE_URL}/roles")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sent, [f"Token {stale}", f"Token {self.login.tokens[1]}"])
+        self.assertEqual(len(self.login.tokens), 2)
+
+    def test_401_on_the_retry_is_returned_without_another_refresh(self):
+        manager = DraupWorldTokenManager(BASE_URL, use_redis=False)
+        with patch.object(draup_world_token.requests, "request", return_value=MagicMock(status_code=401)) as send:
+            response = manager.request("GET", f"{BASE_URL}/roles")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(len(self.login.tokens), 2)
+
+    def test_async_401_refreshes_the_token_once_and_retries(self):
+        manager = DraupWorldTokenManager(BASE_URL, use_redis=False)
+        sent = []
+
+        class FakeUpstream:
+            async def request(self, method, url, upstream=None, headers=None, **kwargs):
+                sent.append(headers["Authorization"])
+                response = MagicMock(status_code=401 if len(sent) == 1 else 200)
+                response.aclose = MagicMock(side_effect=lambda: asyncio.sleep(0))
+                return response
+
+        with patch.object(draup_world_token, "get_upstream_client", return_value=FakeUpstream()):
+            response = asyncio.run(manager.request_async("POST", f"{BASE_URL}/workflows", json={}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sent, [f"Token {token}" for token in self.login.tokens])
+        self.assertEqual(len(self.login.tokens), 2)
+        self.assertEqual(manager.stats()["invalidations"], 1)
@@ -0,0 +1,154 @@
+import asyncio
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import jwt
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from services import auth
+from services import token_cache as token_cache_module
+from services.token_cache import (
+    SOURCE_MEMORY,
+    SOURCE_REDIS,
+    TOKEN_CACHE_DEFAULT_TTL_SECONDS,
+    TOKEN_CACHE_MAX_TTL_SECONDS,
+    TOKEN_CACHE_NEGATIVE_TTL_SECONDS,
+    TokenVerificationCache,
+    token_ttl_seconds,
+)
+
+
+def make_token(expires_in: int) -> str:
+    return jwt.encode({"sub": "jane", "exp": int(time.time()) + expires_in}, "secret", algorithm="HS256")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return self.sets.get(key, set())
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.sets.pop(key, None)
+
+
+class TestTokenTtl(TestCase):
+    def test_ttl_follows_the_exp_claim(self):
+        self.assertAlmostEqual(token_ttl_seconds(make_token(600)), 600, delta=2)
+        self.assertEqual(token_ttl_seconds(make_token(-60)), 0)
+
+    def test_ttl_is_capped_and_defaults_without_exp(self):
+        self.assertEqual(token_ttl_seconds(make_token(TOKEN_CACHE_MAX_TTL_SECONDS * 2)), TOKEN_CACHE_MAX_TTL_SECONDS)
+        self.assertEqual(token_ttl_seconds(jwt.encode({"sub": "jane"}, "secret")), TOKEN_CACHE_DEFAULT_TTL_SECONDS)
+        self.assertEqual(token_ttl_seconds("not-a-jwt"), TOKEN_CACHE_DEFAULT_TTL_SECONDS)
+
+    def test_expired_tokens_are_not_cached(self):
+        cache = TokenVerificationCache(use_redis=False)
+        cache.store(make_token(-60), {"email": "jane@example.com"})
+        self.assertEqual(len(cache), 0)
+
+
+class TestNegativeCache(TestCase):
+    def test_rejected_tokens_are_cached_for_the_negative_ttl(self):
+        cache = TokenVerificationCache(use_redis=False)
+        token = make_token(3600)
+        cache.store_rejected(token)
+        self.assertEqual(cache.lookup(token), (SOURCE_MEMORY, None))
+
+        expires_at = time.time() + TOKEN_CACHE_NEGATIVE_TTL_SECONDS
+        with patch.object(token_cache_module.time, "time", return_value=expires_at + 1):
+            self.assertIsNone(cache.lookup(token))
+
+
+class TestRedisTier(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch.object(token_cache_module, "get_redis_qa_login_client", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_redis_hit_fills_the_memory_tier(self):
+        token = make_token(3600)
+        TokenVerificationCache().store(token, {"email": "jane@example.com"})
+
+        other_worker = TokenVerificationCache()
+        self.assertIsNone(other_worker.lookup(token, include_redis=False))
+        self.assertEqual(other_worker.lookup(token), (SOURCE_REDIS, {"email": "jane@example.com"}))
+        self.redis.values.clear()
+        self.assertEqual(other_worker.lookup(token), (SOURCE_MEMORY, {"email": "jane@example.com"}))
+
+    def test_rejections_are_shared_with_the_negative_ttl(self):
+        token = make_token(3600)
+        TokenVerificationCache().store_rejected(token)
+        self.assertEqual(list(self.redis.ttls.values()), [TOKEN_CACHE_NEGATIVE_TTL_SECONDS])
+        self.assertEqual(TokenVerificationCache().lookup(token), (SOURCE_REDIS, None))
+
+
+class TestTokenRevocation(TestCase):
+    def test_revoking_a_user_drops_all_of_their_cached_tokens(self):
+        cache = TokenVerificationCache(use_redis=False)
+        cache.store("token-a", {"email": "Jane@Example.com", "user_id": 7})
+        cache.store("token-b", {"email": "jane@example.com"})
+        cache.store("token-c", {"email": "other@example.com"})
+
+        cache.revoke_user(" JANE@example.com")
+
+        self.assertIsNone(cache.lookup("token-a"))
+        self.assertIsNone(cache.lookup("token-b"))
+        self.assertEqual(cache.lookup("token-c")[1], {"email": "other@example.com"})
+
+
+class TestVerifyTokenAsync(TestCase):
+    def setUp(self):
+        self.upstream = MagicMock()
+        patchers = (
+            patch.object(auth, "token_cache", TokenVerificationCache(use_redis=False)),
+            patch.object(auth, "get_upstream_client", return_value=self.upstream),
+        )
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def respond(self, status_code, payload=None):
+        async def request(method, **kwargs):
+            return MagicMock(status_code=status_code, json=MagicMock(return_value=payload))
+
+        self.upstream.request = MagicMock(side_effect=request)
+
+    def verify(self, token):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        return asyncio.run(auth.verify_token_async(credentials))
+
+    def test_repeated_tokens_are_verified_remotely_once(self):
+        self.respond(200, {"email": "jane@example.com"})
+        token = make_token(3600)
+        for _ in range(3):
+            self.assertEqual(self.verify(token).data, {"email": "jane@example.com"})
+        self.assertEqual(self.upstream.request.call_count, 1)
+
+    def test_rejected_tokens_are_verified_remotely_once(self):
+        self.respond(401)
+        token = make_token(3600)
+        for _ in range(3):
+            with self.assertRaises(HTTPException):
+                self.verify(token)
+        self.assertEqual(self.upstream.request.call_count, 1)
@@ -0,0 +1,161 @@
+import random
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy.dialects import postgresql
+
+from models.extraction import RoleTaxonomy
+from services import autocomplete_service
+from services.autocomplete_index import AutocompleteIndex, AutocompleteIndexManager
+from services.autocomplete_service import (
+    ALL,
+    PREFIX,
+    REST,
+    _escape_like,
+    _match_filters,
+    _ranked,
+)
+
+TITLES = [
+    "Data Engineer", "Senior Data Engineer", "Data Scientist", "Big Data Architect",
+    "Engineer", "Software Engineer", "Engineering Manager", "Metadata Analyst",
+    "HR Generalist", "Payroll Specialist", "DATA ANALYST", "Analyst",
+]
+
+
+def reference_search(values, term, limit):
+    """What the SQL path returns: substring matches, prefix first, then by length."""
+    term = term.lower()
+    matches = sorted({v for v in values if term in v.lower()}, key=lambda v: (not v.lower().startswith(term), len(v), v))
+    return matches[:limit]
+
+
+class TestAutocompleteIndex(TestCase):
+    def test_prefix_matches_rank_first_then_length(self):
+        index = AutocompleteIndex(TITLES)
+        self.assertEqual(
+            index.search("data", 10),
+            ["DATA ANALYST", "Data Engineer", "Data Scientist",
+             "Metadata Analyst", "Big Data Architect", "Senior Data Engineer"],
+        )
+        self.assertEqual(index.search("ENGINEER", 3), ["Engineer", "Engineering Manager", "Data Engineer"])
+
+    def test_short_terms_empty_terms_and_misses(self):
+        index = AutocompleteIndex(TITLES)
+        self.assertEqual(index.search("an", 3), ["Analyst", "DATA ANALYST", "Metadata Analyst"])
+        self.assertEqual(index.search("", 2), ["Analyst", "Engineer"])
+        self.assertEqual(index.search("zzz", 5), [])
+        self.assertEqual(index.search("data", 0), [])
+
+    def test_matches_reference_ranking_on_random_values(self):
+        rng = random.Random(0)
+        syllables = ["an", "ta", "ko", "ri", "ser", "vi", "lo", "mar", "en", "da"]
+        values = [
+            " ".join("".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 3)))
+            for _ in range(3000)
+        ]
+        index = AutocompleteIndex(values)
+        for term in ["a", "an", "ant", "ser", "ta ko", "mar", "rim", "xq", "Da", "en en", "vilo"]:
+            for limit in (1, 10, 50):
+                expected = reference_search(values, term, limit)
+                got = index.search(term, limit)
+                # Same ranks; ties of equal length may come back in any order
+                self.assertEqual(
+                    [(not v.lower().startswith(term.lower()), len(v)) for v in got],
+                    [(not v.lower().startswith(term.lower()), len(v)) for v in expected],
+                    term,
+                )
+                self.assertTrue(all(term.lower() in v.lower() for v in got))
+
+
+class TestAutocompleteIndexManager(TestCase):
+    def _wait(self, manager, key, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            index = manager.get(key)
+            if index is not None:
+                return index
+            time.sleep(0.01)
+        self.fail("index did not load")
+
+    def test_loads_in_background_and_refreshes_while_serving(self):
+        versions = {"job_role": ["Data Engineer"]}
+        release = threading.Event()
+        release.set()
+
+        def loader(key):
+            release.wait()
+            return list(versions[key])
+
+        manager = AutocompleteIndexManager(loader, refresh_seconds=0)
+        self.addCleanup(manager.shutdown)
+
+        self.assertIsNone(manager.get("job_role"))
+        self.assertEqual(self._wait(manager, "job_role").search("data", 5), ["Data Engineer"])
+
+        # A slow reload keeps serving the previous index
+        release.clear()
+        versions["job_role"] = ["Data Engineer", "Data Scientist"]
+        manager.refresh_due()
+        self.assertEqual(manager.get("job_role").search("data", 5), ["Data Engineer"])
+        release.set()
+        deadline = time.monotonic() + 5
+        while len(manager.get("job_role")) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(manager.get("job_role").search("data", 5), ["Data Engineer", "Data Scientist"])
+
+    def test_failed_load_keeps_falling_back(self):
+        def loader(key):
+            raise RuntimeError("db down")
+
+        manager = AutocompleteIndexManager(loader)
+        self.addCleanup(manager.shutdown)
+        self.assertIsNone(manager.get("company"))
+        time.sleep(0.1)
+        self.assertIsNone(manager.get("company"))
+        self.assertEqual(manager.stats()["indexes"], {})
+
+
+class TestSqlSearch(TestCase):
+    def test_short_terms_run_prefix_then_rest(self):
+        calls = []
+
+        def run(phase, limit):
+            calls.append((phase, limit))
+            return {PREFIX: ["ab"], REST: ["cab", "dab"], ALL: ["abc"]}[phase][:limit]
+
+        self.assertEqual(_ranked(run, "ab", 3), ["ab", "cab", "dab"])
+        self.assertEqual(calls, [(PREFIX, 3), (REST, 2)])
+
+        calls.clear()
+        self.assertEqual(_ranked(run, "abc", 3), ["abc"])
+        self.assertEqual(calls, [(ALL, 3)])
+
+    def test_like_wildcards_are_escaped(self):
+        self.assertEqual(_escape_like("50%_off\\"), "50\\%\\_off\\\\")
+        contains, not_prefix = (
+            clause.compile(dialect=postgresql.dialect())
+            for clause in _match_filters(RoleTaxonomy.job_title, "R_D", REST)
+        )
+        self.assertIn("ILIKE", str(contains))
+        self.assertEqual(list(contains.params.values()), ["%R\\_D%"])
+        self.assertIn("lower(etter.etter_role_taxonomy.job_title) NOT LIKE", str(not_prefix))
+        self.assertEqual(list(not_prefix.params.values()), ["r\\_d%"])
+
+    def test_memory_index_results_keep_the_entry_response_shape(self):
+        index = AutocompleteIndex(["Acme Corp", "Acme"])
+        manager = AutocompleteIndexManager(lambda key: [])
+        self.addCleanup(manager.shutdown)
+        with patch.object(manager, "get", return_value=index), \
+                patch.object(autocomplete_service, "get_autocomplete_index_manager", return_value=manager), \
+                patch.object(autocomplete_service, "AUTOCOMPLETE_MEMORY_INDEX", True):
+            self.assertEqual(
+                autocomplete_service.fetch_autocomplete_data(None, "company", "acme", limit=5),
+                [{"company_name": "Acme"}, {"company_name": "Acme Corp"}],
+            )
+            self.assertEqual(
+                autocomplete_service.fetch_autocomplete_data(None, "job_title", "acme", limit=1),
+                ["Acme"],
+            )
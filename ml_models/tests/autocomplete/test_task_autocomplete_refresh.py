@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from services import task_autocomplete_service
+from services.task_autocomplete_service import (
+    TaskAutocompleteRefresher,
+    fetch_tasks_autocomplete,
+    refresh_all_task_autocomplete_cache,
+    upsert_task_cache_rows,
+)
+
+
+def cached_db(last_update, rows=()):
+    """A session whose first query returns last_update and second the cached rows."""
+    db = MagicMock()
+    staleness = MagicMock()
+    staleness.fetchone.return_value = (last_update,)
+    db.execute.side_effect = [staleness, iter(rows)]
+    return db
+
+
+class TestTaskAutocompleteRefresher(TestCase):
+    def test_concurrent_requests_share_one_refresh(self):
+        release = threading.Event()
+        calls = []
+
+        def refresh(company, role):
+            calls.append((company, role))
+            release.wait(5)
+            return {"status": "success", "tasks_cached": 3}
+
+        refresher = TaskAutocompleteRefresher(refresh, workers=2)
+        self.addCleanup(refresher.shutdown)
+
+        first = refresher.schedule("Acme", "Analyst")
+        self.assertIs(refresher.schedule("Acme", "Analyst"), first)
+        other = refresher.schedule("Acme", "Engineer")
+        release.set()
+        self.assertEqual(first.result(5)["tasks_cached"], 3)
+        other.result(5)
+        self.assertEqual(sorted(calls), [("Acme", "Analyst"), ("Acme", "Engineer")])
+
+        # Finished successfully: the next stale read may refresh again
+        self.assertIsNotNone(refresher.schedule("Acme", "Analyst"))
+
+    def test_failed_refresh_backs_off(self):
+        def refresh(company, role):
+            raise RuntimeError("draup_world timeout")
+
+        refresher = TaskAutocompleteRefresher(refresh, workers=1, retry_seconds=60)
+        self.addCleanup(refresher.shutdown)
+        self.assertEqual(refresher.schedule("Acme", "Analyst").result(5)["status"], "error")
+        self.assertIsNone(refresher.schedule("Acme", "Analyst"))
+        self.assertEqual(refresher.stats()["backing_off"], ["Acme+Analyst"])
+
+
+class TestFetchTasksAutocomplete(TestCase):
+    def test_stale_cache_is_served_without_waiting(self):
+        refresher = MagicMock()
+        db = cached_db(datetime.utcnow() - timedelta(days=3), [("Reconcile invoices", "AI")])
+        with patch.object(task_autocomplete_service, "get_task_autocomplete_refresher", return_value=refresher), \
+                patch.object(task_autocomplete_service, "refresh_task_autocomplete_cache") as inline_refresh:
+            tasks = fetch_tasks_autocomplete(db, "Acme", "Analyst", "rec")
+        self.assertEqual(tasks, [{"task_name": "Reconcile invoices", "task_type": "AI"}])
+        refresher.schedule.assert_called_once_with("Acme", "Analyst")
+        inline_refresh.assert_not_called()
+
+    def test_fresh_cache_schedules_nothing(self):
+        refresher = MagicMock()
+        db = cached_db(datetime.utcnow() - timedelta(hours=2))
+        with patch.object(task_autocomplete_service, "get_task_autocomplete_refresher", return_value=refresher):
+            self.assertEqual(fetch_tasks_autocomplete(db, "Acme", "Analyst", "rec"), [])
+        refresher.schedule.assert_not_called()
+
+    def test_empty_cache_waits_for_the_first_refresh_up_to_a_limit(self):
+        refresher = TaskAutocompleteRefresher(lambda company, role: time.sleep(0.5) or {}, workers=1)
+        self.addCleanup(refresher.shutdown)
+        db = cached_db(None)
+        with patch.object(task_autocomplete_service, "get_task_autocomplete_refresher", return_value=refresher), \
+                patch.object(task_autocomplete_service, "TASK_AUTOCOMPLETE_COLD_WAIT_SECONDS", 0.05):
+            started = time.monotonic()
+            self.assertEqual(fetch_tasks_autocomplete(db, "Acme", "Analyst", "rec"), [])
+        self.assertLess(time.monotonic() - started, 0.4)
+
+
+class TestUpsert(TestCase):
+    def test_tasks_are_written_in_one_deduplicated_statement(self):
+        db = MagicMock()
+        tasks = [
+            {"task": "Reconcile invoices", "task_type": "Human"},
+            {"task": None},
+            {"task": "Approve payments", "task_type": "AI"},
+            {"task": "Reconcile invoices", "task_type": "Human + AI"},
+        ]
+        self.assertEqual(upsert_task_cache_rows(db, "Acme", "Analyst", tasks), 2)
+        db.execute.assert_called_once()
+
+        compiled = db.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        self.assertIn("ON CONFLICT (task_name, company, role) DO UPDATE", sql)
+        self.assertEqual(sql.count("VALUES"), 1)
+        self.assertEqual(
+            [value for key, value in compiled.params.items() if key.startswith("task_type")],
+            ["Human + AI", "AI"],
+        )
+
+    def test_large_task_lists_are_chunked(self):
+        db = MagicMock()
+        tasks = [{"task": f"Task {i}"} for i in range(2500)]
+        with patch.object(task_autocomplete_service, "UPSERT_CHUNK_SIZE", 1000):
+            self.assertEqual(upsert_task_cache_rows(db, "Acme", "Analyst", tasks), 2500)
+        self.assertEqual(db.execute.call_count, 3)
+
+
+class TestRefreshAll(TestCase):
+    def test_pairs_run_concurrently_within_the_limit_and_report_timings(self):
+        pairs = [("Acme", f"Role {i}") for i in range(8)]
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def refresh(db, company, role):
+            with lock:
+                running.append(role)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(role)
+            if role == "Role 3":
+                raise RuntimeError("draup_world timeout")
+            if role == "Role 5":
+                return {"status": "error", "error": "No tasks found"}
+            return {"status": "success", "company": company, "role": role, "tasks_cached": 5}
+
+        with patch.object(task_autocomplete_service, "get_known_company_role_combinations", return_value=pairs), \
+                patch.object(task_autocomplete_service, "refresh_task_autocomplete_cache", side_effect=refresh), \
+                patch.object(task_autocomplete_service, "SessionLocal"):
+            result = refresh_all_task_autocomplete_cache(MagicMock(), max_workers=3)
+
+        self.assertEqual((result["successful"], result["failed"]), (6, 2))
+        self.assertLessEqual(max(peak), 3)
+        self.assertGreater(max(peak), 1)
+        self.assertEqual([(r["company"], r["role"]) for r in result["results"]], pairs)
+        self.assertTrue(all(r["duration_seconds"] > 0 for r in result["results"]))
+        self.assertEqual(len(result["slowest"]), 8)
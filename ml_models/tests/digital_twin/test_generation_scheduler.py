@@ -0,0 +1,162 @@
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import TestCase
+
+from draup_world_model.digital_twin.generators.base_generator import BaseGenerator
+from draup_world_model.digital_twin.generators.scheduler import (
+    GenerationScheduler,
+    ResponseCache,
+    TokenBudgetExceeded,
+)
+
+
+class FakeLLM:
+    """LLM client stand-in: echoes the prompt after a delay and tracks concurrency."""
+
+    def __init__(self, delay: float = 0.0, usage=None):
+        self.delay = delay
+        self.usage = usage
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return SimpleNamespace(content=f"answer to {prompt}", usage_metadata=self.usage)
+
+
+def generator(scheduler: GenerationScheduler, llm: FakeLLM) -> BaseGenerator:
+    gen = BaseGenerator(scheduler=scheduler)
+    gen._llm = llm
+    return gen
+
+
+class TestGenerationScheduler(TestCase):
+    def test_llm_calls_stay_within_the_concurrency_limit(self):
+        llm = FakeLLM(delay=0.02)
+        gen = generator(GenerationScheduler(max_concurrency=3), llm)
+        # More threads than slots, as when step and batch fan-outs nest
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            answers = list(pool.map(gen.invoke_llm, [f"prompt {i}" for i in range(20)]))
+        self.assertEqual(answers, [f"answer to prompt {i}" for i in range(20)])
+        self.assertEqual(llm.peak, 3)
+        self.assertEqual(gen.scheduler.llm_calls, 20)
+
+    def test_tokens_are_charged_and_the_budget_stops_new_calls(self):
+        llm = FakeLLM(usage={"input_tokens": 10, "output_tokens": 5})
+        scheduler = GenerationScheduler(token_budget=30)
+        gen = generator(scheduler, llm)
+        gen.invoke_llm("first")
+        gen.invoke_llm("second")
+        self.assertEqual(scheduler.tokens_used, 30)
+        with self.assertRaises(TokenBudgetExceeded):
+            gen.invoke_llm("third")
+        self.assertEqual(llm.prompts, ["first", "second"])
+        self.assertEqual(scheduler.stats()["llm_calls"], 2)
+
+    def test_tokens_are_estimated_from_the_text_without_usage(self):
+        scheduler = GenerationScheduler()
+        scheduler.call(lambda: SimpleNamespace(content="x" * 400, usage_metadata=None))
+        self.assertEqual(scheduler.tokens_used, 100)
+
+    def test_map_keeps_the_input_order(self):
+        scheduler = GenerationScheduler(max_concurrency=4)
+
+        def slow_for_early_items(i):
+            time.sleep(0.002 * (10 - i))
+            return i * 10
+
+        self.assertEqual(scheduler.map(slow_for_early_items, range(10)), [i * 10 for i in range(10)])
+
+    def test_steps_start_once_their_dependencies_finish(self):
+        scheduler = GenerationScheduler(max_concurrency=4)
+        events = []
+        lock = threading.Lock()
+
+        def run_step(step):
+            with lock:
+                events.append(("start", step))
+            time.sleep(0.02)
+            with lock:
+                events.append(("end", step))
+
+        scheduler.run_steps(
+            ["taxonomy", "roles", "skills", "tasks"],
+            {"roles": ["taxonomy"], "skills": ["taxonomy"], "tasks": ["roles", "external"]},
+            run_step,
+        )
+        position = {event: i for i, event in enumerate(events)}
+        self.assertLess(position[("end", "taxonomy")], position[("start", "roles")])
+        self.assertLess(position[("end", "taxonomy")], position[("start", "skills")])
+        self.assertLess(position[("end", "roles")], position[("start", "tasks")])
+        # roles and skills only depend on taxonomy, so they overlap
+        self.assertLess(position[("start", "skills")], position[("end", "roles")])
+        self.assertLess(position[("start", "roles")], position[("end", "skills")])
+
+    def test_a_failing_step_stops_its_dependents(self):
+        scheduler = GenerationScheduler(max_concurrency=2)
+        ran = []
+
+        def run_step(step):
+            ran.append(step)
+            if step == "roles":
+                raise RuntimeError("LLM unavailable")
+
+        with self.assertRaisesRegex(RuntimeError, "LLM unavailable"):
+            scheduler.run_steps(["roles", "tasks"], {"tasks": ["roles"]}, run_step)
+        self.assertEqual(ran, ["roles"])
+
+        with self.assertRaises(ValueError):
+            scheduler.run_steps(["a", "b"], {"a": ["b"], "b": ["a"]}, run_step)
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+
+    def test_key_is_stable_and_covers_the_model_settings(self):
+        key = ResponseCache.key("prompt", model="m", temperature=0.3, max_tokens=100)
+        self.assertEqual(ResponseCache.key("prompt", max_tokens=100, temperature=0.3, model="m"), key)
+        self.assertEqual(len(key), 64)
+        self.assertNotEqual(ResponseCache.key("prompt", model="m", temperature=0.7, max_tokens=100), key)
+        self.assertNotEqual(ResponseCache.key("prompt!", model="m", temperature=0.3, max_tokens=100), key)
+
+    def test_miss_then_hit(self):
+        cache = ResponseCache(self.cache_dir)
+        self.assertIsNone(cache.get("abc123"))
+        cache.put("abc123", "response")
+        self.assertEqual(cache.get("abc123"), "response")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # A cache that does not read never serves, e.g. for forced regeneration
+        self.assertIsNone(ResponseCache(self.cache_dir, read=False).get("abc123"))
+
+    def test_repeated_prompts_are_answered_from_the_cache(self):
+        llm = FakeLLM()
+        scheduler = GenerationScheduler(cache=ResponseCache(self.cache_dir))
+        gen = generator(scheduler, llm)
+        self.assertEqual(gen.invoke_llm("prompt"), "answer to prompt")
+        self.assertEqual(gen.invoke_llm("prompt"), "answer to prompt")
+        self.assertEqual(llm.prompts, ["prompt"])
+
+        # A rerun (new scheduler, same directory) replays it too
+        rerun = generator(GenerationScheduler(cache=ResponseCache(self.cache_dir)), llm)
+        rerun.invoke_llm("prompt")
+        self.assertEqual(llm.prompts, ["prompt"])
+
+        gen.invoke_llm("prompt", fresh=True)
+        self.assertEqual(llm.prompts, ["prompt", "prompt"])
+        self.assertEqual(scheduler.stats()["cache_hits"], 1)
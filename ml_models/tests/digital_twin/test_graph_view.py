@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from draup_world_model.digital_twin.graph.graph_view import (
+    GraphViewService,
+    MAX_GRAPH_NODES,
+    assemble_payload,
+)
+from draup_world_model.digital_twin.graph.version import bump_graph_version
+
+ROWS = [
+    {
+        "id": "jf-1", "label": "DTJobFamily", "name": "Claims", "headcount": 40, "automation": None,
+        "description": None,
+        "out_edges": [{"target": "role-1", "type": "DT_HAS_ROLE"}, {"target": "role-9", "type": "DT_HAS_ROLE"}],
+    },
+    {
+        "id": "role-1", "label": "DTRole", "name": "Claims Adjuster", "headcount": 40, "automation": 0.4,
+        "description": "Handles claims",
+        "out_edges": [
+            {"target": "skill-1", "type": "DT_REQUIRES_SKILL"},
+            {"target": "tech-7", "type": "DT_USES_TECHNOLOGY"},
+        ],
+    },
+    {
+        "id": "skill-1", "label": "DTSkill", "name": "Negotiation", "headcount": 0, "automation": None,
+        "description": None, "out_edges": [],
+    },
+]
+
+
+class FakeNeo4j:
+    """Answers every read with the same rows and records the queries it was sent."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute_read_query(self, query, params=None):
+        self.queries.append((query, params))
+        return self.rows
+
+
+class TestAssemblePayload(TestCase):
+    def test_nodes_keep_row_order_and_edges_need_both_ends_in_view(self):
+        payload = assemble_payload(ROWS)
+        self.assertEqual([n["id"] for n in payload["nodes"]], ["jf-1", "role-1", "skill-1"])
+        self.assertEqual(payload["nodes"][1], {
+            "id": "role-1", "label": "DTRole", "name": "Claims Adjuster", "headcount": 40,
+            "automation": 0.4, "description": "Handles claims",
+        })
+        self.assertEqual(payload["edges"], [
+            {"source": "jf-1", "target": "role-1", "type": "DT_HAS_ROLE"},
+            {"source": "role-1", "target": "skill-1", "type": "DT_REQUIRES_SKILL"},
+        ])
+        self.assertEqual(payload["node_types"], ["DTJobFamily", "DTRole", "DTSkill"])
+        self.assertEqual(payload["edge_types"], ["DT_HAS_ROLE", "DT_REQUIRES_SKILL"])
+
+    def test_empty_scope(self):
+        self.assertEqual(assemble_payload([]), {"nodes": [], "edges": [], "node_types": [], "edge_types": []})
+
+
+class TestGraphViewService(TestCase):
+    def setUp(self):
+        self.conn = FakeNeo4j(ROWS)
+        self.service = GraphViewService(self.conn)
+
+    def test_scope_query_reads_edges_per_node(self):
+        payload = self.service.get("job_family", "Claims", node_types=["DTRole", "DTSkill", "DTRole"], limit=5000)
+        query, params = self.conn.queries[0]
+        self.assertIn("[(n)-[r]->(m) WHERE type(r) STARTS WITH 'DT_'", query)
+        self.assertNotIn("MATCH (a)-[r]->(b)", query)
+        self.assertEqual(params, {"node_types": ["DTRole", "DTSkill"], "limit": MAX_GRAPH_NODES, "scope_name": "Claims"})
+        self.assertEqual(len(payload["edges"]), 2)
+
+    def test_unknown_scopes_fall_back_to_the_organization(self):
+        self.service.get("planet", "Earth")
+        query, params = self.conn.queries[0]
+        self.assertIn("DTOrganization", query)
+        self.assertNotIn("scope_name", params)
+
+    def test_payloads_are_cached_until_the_graph_version_moves(self):
+        first = self.service.get("role", "Claims Adjuster")
+        self.assertIs(self.service.get("role", "Claims Adjuster"), first)
+        self.assertEqual(len(self.conn.queries), 1)
+
+        bump_graph_version()
+        self.assertIsNot(self.service.get("role", "Claims Adjuster"), first)
+        self.assertEqual(len(self.conn.queries), 2)
+        self.assertEqual(self.service.stats()["hits"], 1)
@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from draup_world_model.digital_twin.graph.version import bump_graph_version
+from draup_world_model.digital_twin.simulation.scope_selector import ScopeSelector
+
+
+def role_row(role_id, headcount, skill_ids, tech_ids):
+    """One row of the scope query: a role and its nested pattern comprehensions."""
+    return {
+        "r": {"id": role_id, "name": f"Role {role_id}", "computed_headcount": headcount},
+        "titles": [{"id": f"{role_id}-title", "name": "Title"}],
+        "workloads": [{
+            "workload": {"id": f"{role_id}-wl", "name": "Workload"},
+            "tasks": [
+                {
+                    "task": {"id": f"{role_id}-t1", "name": "Task 1"},
+                    "skills": [{"skill_id": "skill-a", "skill_name": "A", "relevance": "PRIMARY"}],
+                },
+                {"task": {"id": f"{role_id}-t2", "name": "Task 2"}, "skills": []},
+            ],
+        }],
+        "skills": [{"id": s, "name": s.upper()} for s in skill_ids],
+        "technologies": [{"id": t, "name": t.upper()} for t in tech_ids],
+    }
+
+
+class FakeNeo4j:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute_read_query(self, query, params=None):
+        self.queries.append((query, params))
+        return self.rows
+
+
+class TestScopeSelector(TestCase):
+    def setUp(self):
+        self.conn = FakeNeo4j([
+            role_row("r1", 10, ["skill-a", "skill-b"], ["tech-x"]),
+            role_row("r2", 5, ["skill-b"], ["tech-x", "tech-y"]),
+        ])
+        self.selector = ScopeSelector(self.conn)
+
+    def test_role_rows_are_flattened_into_the_scope(self):
+        scope = self.selector.select("job_family", "Claims")
+
+        self.assertEqual(len(self.conn.queries), 1)
+        self.assertEqual(self.conn.queries[0][1], {"name": "Claims"})
+        self.assertEqual([r["id"] for r in scope["roles"]], ["r1", "r2"])
+        self.assertEqual(scope["roles"][0]["skill_ids"], ["skill-a", "skill-b"])
+        self.assertEqual([t["id"] for t in scope["tasks"]], ["r1-t1", "r1-t2", "r2-t1", "r2-t2"])
+        self.assertEqual(scope["task_skill_mappings"], {
+            "r1-t1": [{"skill_id": "skill-a", "skill_name": "A", "relevance": "PRIMARY"}],
+            "r2-t1": [{"skill_id": "skill-a", "skill_name": "A", "relevance": "PRIMARY"}],
+        })
+        # Skills and technologies shared by several roles appear once
+        self.assertEqual([s["id"] for s in scope["skills"]], ["skill-a", "skill-b"])
+        self.assertEqual([t["id"] for t in scope["technologies"]], ["tech-x", "tech-y"])
+        self.assertEqual(scope["summary"], {
+            "role_count": 2, "title_count": 2, "workload_count": 2, "task_count": 4,
+            "skill_count": 2, "tech_count": 2, "total_headcount": 15,
+        })
+
+    def test_scope_is_cached_until_the_graph_version_moves(self):
+        first = self.selector.select("function", "Operations")
+        self.assertIs(self.selector.select("function", "Operations"), first)
+        self.assertEqual(len(self.conn.queries), 1)
+
+        bump_graph_version()
+        self.assertIsNot(self.selector.select("function", "Operations"), first)
+        self.assertEqual(len(self.conn.queries), 2)
+
+    def test_empty_scopes_are_not_cached(self):
+        self.conn.rows = []
+        self.assertEqual(self.selector.select("role", "Nobody")["summary"]["role_count"], 0)
+        self.selector.select("role", "Nobody")
+        self.assertEqual(len(self.conn.queries), 2)
+
+    def test_unknown_scope_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.selector.select("planet", "Earth")
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, joinedload, relationship, sessionmaker
+
+from common import pagination
+from common.pagination import (
+    COUNT_NONE,
+    COUNT_PLANNER_ESTIMATE,
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    paginate,
+)
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    updated_at = Column(DateTime, nullable=True)
+    statuses = relationship("ItemStatus")
+
+
+class ItemStatus(Base):
+    """Per-user rows of an item, like user_workflow_history_status."""
+    __tablename__ = "item_statuses"
+
+    id = Column(Integer, primary_key=True)
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
+    user_id = Column(Integer, nullable=False)
+    unread = Column(Boolean, nullable=False)
+
+
+class TestPaginate(TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+        start = datetime(2026, 1, 1)
+        # Repeated timestamps and NULLs, as in user_workflow_history.updated_at
+        self.db.add_all(
+            Item(id=i, name=f"item {i % 7}", updated_at=None if i % 10 == 0 else start + timedelta(hours=i // 3))
+            for i in range(1, 96)
+        )
+        self.db.commit()
+
+    def _all_pages(self, query, sort_keys, page_size, **kwargs):
+        pages = [paginate(query, page_size=page_size, sort_keys=sort_keys, **kwargs)]
+        while pages[-1].next_cursor:
+            pages.append(paginate(query, page_size=page_size, sort_keys=sort_keys, cursor=pages[-1].next_cursor, **kwargs))
+        return pages
+
+    def test_offset_callers_are_unchanged(self):
+        query = self.db.query(Item).order_by(Item.id)
+        result = paginate(query, page=2, page_size=10)
+        self.assertEqual([item.id for item in result.items], list(range(11, 21)))
+        self.assertEqual((result.total, result.total_pages, result.has_next, result.has_prev), (95, 10, True, True))
+        self.assertIsNone(result.next_cursor)
+        self.assertFalse(result.total_is_estimate)
+
+    def test_cursor_pages_match_offset_pages(self):
+        query = self.db.query(Item)
+        for sort_keys in (
+            [SortKey(Item.updated_at, True), SortKey(Item.id, True)],
+            [SortKey(Item.updated_at), SortKey(Item.id)],
+            [SortKey(Item.name), SortKey(Item.updated_at, True), SortKey(Item.id)],
+            [SortKey(Item.id, True)],
+        ):
+            pages = self._all_pages(query, sort_keys, 10)
+            offset_pages = [
+                paginate(query, page=page, page_size=10, sort_keys=sort_keys, count_mode=COUNT_NONE)
+                for page in range(1, 11)
+            ]
+            self.assertEqual(
+                [[item.id for item in p.items] for p in pages],
+                [[item.id for item in p.items] for p in offset_pages],
+                sort_keys,
+            )
+            self.assertEqual(sorted(item.id for p in pages for item in p.items), list(range(1, 96)))
+            self.assertEqual([p.has_next for p in pages], [True] * 9 + [False])
+            self.assertTrue(all(p.page is None and p.has_prev for p in pages[1:]))
+
+    def test_count_modes(self):
+        query = self.db.query(Item).filter(Item.id <= 25)
+        sort_keys = [SortKey(Item.id)]
+
+        skipped = paginate(query, page_size=10, sort_keys=sort_keys, count_mode=COUNT_NONE)
+        self.assertEqual((skipped.total, skipped.total_pages, skipped.has_next), (None, None, True))
+
+        with patch.object(pagination, "estimate_count", return_value=5000), \
+                patch.object(pagination, "ESTIMATE_EXACT_BELOW", 1000):
+            estimated = paginate(query, page_size=10, sort_keys=sort_keys, count_mode=COUNT_PLANNER_ESTIMATE)
+            self.assertEqual((estimated.total, estimated.total_pages, estimated.total_is_estimate), (5000, 500, True))
+            # Reaching the last page replaces the estimate with the real total
+            last = paginate(query, page=3, page_size=10, sort_keys=sort_keys, count_mode=COUNT_PLANNER_ESTIMATE)
+            self.assertEqual((last.total, last.total_is_estimate, last.has_next), (25, False, False))
+
+        with patch.object(pagination, "estimate_count", return_value=40):
+            small = paginate(query, page_size=10, count_mode=COUNT_PLANNER_ESTIMATE)
+            self.assertEqual((small.total, small.total_is_estimate), (25, False))
+
+    def test_cursor_errors(self):
+        query = self.db.query(Item)
+        with self.assertRaises(ValueError):
+            paginate(query, cursor=encode_cursor([1]))
+        with self.assertRaises(InvalidCursorError):
+            paginate(query, sort_keys=[SortKey(Item.id)], cursor="not-a-cursor")
+        with self.assertRaises(InvalidCursorError):
+            paginate(query, sort_keys=[SortKey(Item.id)], cursor=encode_cursor([1, 2]))
+        with self.assertRaises(ValueError):
+            paginate(query, count_mode="approximate")
+
+    def test_descending_keys_use_a_row_comparison(self):
+        cursor_values = [datetime(2026, 1, 2), 40]
+        sql = str(keyset_filter([SortKey(Item.updated_at, True), SortKey(Item.id, True)], cursor_values))
+        self.assertEqual(sql, "(items.updated_at, items.id) < (:param_1, :param_2)")
+        # Ascending nullable keys have NULLs after the cursor and need the expanded form
+        self.assertIn(" OR ", str(keyset_filter([SortKey(Item.updated_at), SortKey(Item.id)], cursor_values)))
+
+    def test_cursor_round_trips_typed_values(self):
+        values = [datetime(2026, 3, 4, 5, 6, 7), None, "a", 3]
+        self.assertEqual(decode_cursor(encode_cursor(values), 4), values)
+
+    def test_items_matched_through_a_one_to_many_relationship_are_paged_once_each(self):
+        # 10 items with two matching status rows each, paged as the workflow summary is
+        for item_id in range(1, 11):
+            self.db.add_all([
+                ItemStatus(item_id=item_id, user_id=1, unread=True),
+                ItemStatus(item_id=item_id, user_id=2, unread=True),
+                ItemStatus(item_id=item_id, user_id=3, unread=False),
+            ])
+        self.db.commit()
+        query = (
+            self.db.query(Item)
+            .filter(Item.statuses.any(ItemStatus.unread.is_(True)))
+            .options(joinedload(Item.statuses))
+        )
+        sort_keys = [SortKey(Item.updated_at, True), SortKey(Item.id, True)]
+        expected = [item.id for item in query.order_by(Item.updated_at.desc().nulls_first(), Item.id.desc())]
+
+        offset_pages = [paginate(query, page=page, page_size=3, sort_keys=sort_keys) for page in range(1, 5)]
+        self.assertEqual([len(p.items) for p in offset_pages], [3, 3, 3, 1])
+        self.assertEqual([p.has_next for p in offset_pages], [True, True, True, False])
+        self.assertEqual(offset_pages[0].total, 10)
+        self.assertEqual([item.id for p in offset_pages for item in p.items], expected)
+        self.assertEqual(len(offset_pages[0].items[0].statuses), 3)
+
+        cursor_pages = self._all_pages(query, sort_keys, 3, count_mode=COUNT_NONE)
+        self.assertEqual([item.id for p in cursor_pages for item in p.items], expected)
+        self.assertEqual([p.has_next for p in cursor_pages], [True, True, True, False])
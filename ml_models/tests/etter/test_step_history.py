@@ -0,0 +1,177 @@
+import copy
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from services import step_history
+from services.etter import next_version_step_data
+from services.step_history import (
+    apply_diff,
+    collect_snapshots,
+    encode_step_data,
+    is_delta,
+    json_diff,
+    resolve_rows,
+    snapshot_version,
+)
+
+HISTORY_ID = 7
+
+
+def step_row(step_info_id, version_id, data, row_id=None):
+    return SimpleNamespace(
+        id=row_id if row_id is not None else version_id * 100 + step_info_id,
+        type="data",
+        version_id=version_id,
+        user_workflow_history_id=HISTORY_ID,
+        workflow_step_info_id=step_info_id,
+        workflow_step_status={"completed": "2026-01-01"},
+        data=data,
+    )
+
+
+def workflow(steps=4):
+    return [
+        step_row(s, 1, {
+            "step": f"step_{s}",
+            "versionId": 1,
+            "expectedResponse": [
+                {"task": f"task {s}.{t}", "automation_score": t / 10, "editable": True} for t in range(8)
+            ],
+            "data": {"ai_automation_score": 40 + s, "notes": "draft " * 20},
+        })
+        for s in range(1, steps + 1)
+    ]
+
+
+class VersionedStore:
+    """In-memory step history driven through next_version_step_data, as create_new_version_for_steps does."""
+
+    def __init__(self, rows):
+        self.by_version = {1: rows}
+
+    def load(self, version):
+        rows = self.by_version[version]
+        wanted = {
+            (r.user_workflow_history_id, r.workflow_step_info_id, snapshot_version(r.data, r.version_id))
+            for r in rows if is_delta(r.data)
+        }
+        candidates = [r for v in {key[2] for key in wanted} for r in self.by_version[v]]
+        snapshots = collect_snapshots(wanted, candidates)
+        return resolve_rows(rows, snapshots), snapshots
+
+    def new_version(self, target_step_info_id, edit):
+        version = max(self.by_version) + 1
+        previous_rows = self.by_version[version - 1]
+        previous, snapshots = self.load(version - 1)
+        target = next(i for i, r in enumerate(previous_rows) if r.workflow_step_info_id == target_step_info_id)
+        new_data = edit(copy.deepcopy(previous[target]))
+        stored = next_version_step_data(previous_rows, snapshots, target_step_info_id, new_data, version)
+        self.by_version[version] = [step_row(step.workflow_step_info_id, version, data) for step, data in stored]
+        return version
+
+
+def edit_notes(data):
+    data["data"]["notes"] = "reviewed"
+    data["expectedResponse"][0]["automation_score"] = 0.99
+    return data
+
+
+class TestJsonDiff(TestCase):
+    def test_round_trip(self):
+        old = {"a": 1, "b": {"c": [1, 2, {"d": 3}], "e": "x"}, "gone": True, "l": [1, 2]}
+        new = {"a": 2, "b": {"c": [1, 2, {"d": 4}], "e": "x"}, "added": None, "l": [1, 2, 3]}
+        diff = json_diff(old, new)
+        self.assertEqual(apply_diff(old, diff), new)
+        self.assertEqual(old["b"]["c"][2]["d"], 3)
+
+    def test_equal_values_have_empty_diff(self):
+        value = {"a": [1, {"b": 2}]}
+        self.assertEqual(json_diff(value, copy.deepcopy(value)), {})
+        self.assertIs(apply_diff(value, {}), value)
+
+    def test_type_change_replaces(self):
+        self.assertEqual(apply_diff({"a": 1}, json_diff({"a": 1}, [1])), [1])
+
+
+class TestEncoding(TestCase):
+    def test_small_change_is_stored_as_delta(self):
+        base = workflow()[0].data
+        new = dict(base, versionId=2)
+        stored = encode_step_data(new, 2, 1, base)
+        self.assertTrue(is_delta(stored))
+        self.assertEqual(snapshot_version(stored, 2), 1)
+        self.assertEqual(step_history.decode_step_data(stored, base), new)
+
+    def test_snapshot_interval_and_large_changes_store_full_data(self):
+        base = workflow()[0].data
+        new = dict(base, versionId=99)
+        self.assertIs(encode_step_data(new, 1 + step_history.SNAPSHOT_INTERVAL, 1, base), new)
+        rewritten = {"step": "other", "versionId": 2}
+        self.assertIs(encode_step_data(rewritten, 2, 1, base), rewritten)
+
+    def test_full_mode_never_writes_deltas(self):
+        base = workflow()[0].data
+        new = dict(base, versionId=2)
+        with patch.object(step_history, "STEP_HISTORY_MODE", "full"):
+            self.assertIs(encode_step_data(new, 2, 1, base), new)
+
+    def test_decoded_deltas_are_private_copies(self):
+        base = workflow()[0].data
+        stored = encode_step_data(dict(base, versionId=2), 2, 1, base)
+        first = step_history.decode_step_data(stored, base)
+        first["expectedResponse"][0]["task"] = "mutated"
+        self.assertEqual(step_history.decode_step_data(stored, base)["expectedResponse"][0]["task"], "task 1.0")
+
+
+class TestVersioning(TestCase):
+    def _history(self, mode, versions=25):
+        with patch.object(step_history, "STEP_HISTORY_MODE", mode):
+            store = VersionedStore(workflow())
+            for v in range(versions - 1):
+                store.new_version(target_step_info_id=1 + v % 4, edit=edit_notes)
+        return store
+
+    def test_delta_history_reconstructs_like_full_copies(self):
+        delta, full = self._history("delta"), self._history("full")
+        for version in full.by_version:
+            self.assertEqual(delta.load(version)[0], [r.data for r in full.by_version[version]])
+
+    def test_deltas_point_at_snapshots_within_the_interval(self):
+        store = self._history("delta")
+        deltas = 0
+        for version, rows in store.by_version.items():
+            for row in rows:
+                if is_delta(row.data):
+                    deltas += 1
+                    base = snapshot_version(row.data, version)
+                    self.assertLess(version - base, step_history.SNAPSHOT_INTERVAL)
+                    base_row = next(r for r in store.by_version[base]
+                                    if r.workflow_step_info_id == row.workflow_step_info_id)
+                    self.assertFalse(is_delta(base_row.data))
+        self.assertGreater(deltas, 0)
+
+    def test_next_version_semantics(self):
+        store = VersionedStore(workflow())
+        version = store.new_version(target_step_info_id=2, edit=edit_notes)
+        data = {row.workflow_step_info_id: d for row, d in zip(store.by_version[version], store.load(version)[0])}
+
+        self.assertEqual(data[2]["data"]["notes"], "reviewed")
+        self.assertTrue(all(d["versionId"] == version for d in data.values()))
+        self.assertNotIn("isPreviousUpdated", data[1])
+        self.assertTrue(data[3]["isPreviousUpdated"] and data[4]["isPreviousUpdated"])
+        # Carried-over responses are locked; the edited step keeps what the user sent
+        self.assertFalse(any(r["editable"] for r in data[1]["expectedResponse"]))
+        self.assertTrue(data[2]["expectedResponse"][0]["editable"])
+        # The previous version is untouched
+        self.assertEqual(store.by_version[1][0].data["versionId"], 1)
+
+    def test_missing_target_step_raises(self):
+        rows = workflow()
+        with self.assertRaises(ValueError):
+            next_version_step_data(rows, {}, 99, {"step": "x"}, 2)
+
+    def test_missing_snapshot_raises(self):
+        stored = encode_step_data(dict(workflow()[0].data, versionId=2), 2, 1, workflow()[0].data)
+        with self.assertRaises(ValueError):
+            resolve_rows([step_row(1, 2, stored)], {})
@@ -0,0 +1,186 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+from unittest import TestCase
+
+import httpx
+
+from models.extraction import ExtractionStatus
+from services.extraction_batch_service import BatchExtractionEngine, ExtractionJob, TokenBucket
+from services.upstream_client import UpstreamClient
+
+LATENCY_SECONDS = 0.05
+FAKE_URL = "http://draup-world.test/input_repository/extract-from-url"
+
+
+class FakeUpstream:
+    """Extraction API stand-in: answers after a fixed delay and tracks concurrency."""
+
+    def __init__(self, latency: float = LATENCY_SECONDS, fail_urls: tuple = ()):
+        self.latency = latency
+        self.fail_urls = fail_urls
+        self.in_flight = 0
+        self.peak = 0
+        self.calls: List[float] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(time.perf_counter())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if request.url.params.get("doc") in self.fail_urls:
+            return httpx.Response(500, text="upstream error")
+        return httpx.Response(200, json={"status": "success", "tasks": ["t"], "skills": [], "stages": []})
+
+
+class FakeEngine(BatchExtractionEngine):
+    """Engine with the DB steps replaced by in-memory bookkeeping."""
+
+    def __init__(self, upstream: FakeUpstream, claimed: Optional[set] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.client = UpstreamClient(transport=httpx.MockTransport(upstream.handler))
+        self.claimed = claimed
+        self.statuses: Dict[int, ExtractionStatus] = {}
+        self.released: List[int] = []
+
+    def prepare(self, record_id: int, tenant_id: str) -> Optional[ExtractionJob]:
+        if self.claimed is not None and record_id in self.claimed:
+            return None
+        return ExtractionJob(record_id, f"{FAKE_URL}?doc={record_id}", f"doc-{record_id}.pdf", None)
+
+    async def extract(self, job: ExtractionJob) -> dict:
+        response = await self.client.request("POST", job.presigned_url)
+        response.raise_for_status()
+        return response.json()
+
+    def record(self, record_id: int, result: Optional[dict], error: Optional[str] = None) -> ExtractionStatus:
+        status = ExtractionStatus.FAILED if error is not None else ExtractionStatus.COMPLETED
+        self.statuses[record_id] = status
+        return status
+
+    def release(self, record_id: int) -> None:
+        self.released.append(record_id)
+
+
+def run_batch(engine: FakeEngine, record_ids: List[int], tenant_id: str = "1"):
+    async def go():
+        started = time.perf_counter()
+        counts = await engine.run(record_ids, tenant_id)
+        await engine.client.aclose()
+        return counts, time.perf_counter() - started
+
+    return asyncio.run(go())
+
+
+class TestBatchExtractionEngine(TestCase):
+    def test_speedup_is_near_linear_up_to_the_concurrency_limit(self):
+        documents = list(range(16))
+        elapsed = {}
+        for concurrency in (1, 4, 8):
+            upstream = FakeUpstream()
+            engine = FakeEngine(upstream, concurrency=concurrency, tenant_concurrency=concurrency, rate_per_second=0)
+            counts, elapsed[concurrency] = run_batch(engine, documents)
+            self.assertEqual(counts["completed"], len(documents))
+            self.assertEqual(upstream.peak, concurrency)
+
+        self.assertGreater(elapsed[1] / elapsed[4], 3.0)
+        self.assertGreater(elapsed[1] / elapsed[8], 5.5)
+
+    def test_tenant_limit_caps_one_tenant_below_the_global_limit(self):
+        upstream = FakeUpstream()
+        engine = FakeEngine(upstream, concurrency=8, tenant_concurrency=2, rate_per_second=0)
+        counts, _ = run_batch(engine, list(range(8)), tenant_id="42")
+        self.assertEqual(counts["completed"], 8)
+        self.assertEqual(upstream.peak, 2)
+
+    def test_tenants_share_the_global_limit(self):
+        upstream = FakeUpstream()
+        engine = FakeEngine(upstream, concurrency=6, tenant_concurrency=4, rate_per_second=0)
+
+        async def go():
+            results = await asyncio.gather(
+                engine.run(list(range(0, 8)), "a"),
+                engine.run(list(range(8, 16)), "b"),
+            )
+            await engine.client.aclose()
+            return results
+
+        results = asyncio.run(go())
+        self.assertEqual(sum(counts["completed"] for counts in results), 16)
+        self.assertEqual(upstream.peak, 6)
+
+    def test_a_tenant_at_its_limit_does_not_hold_global_slots(self):
+        upstream = FakeUpstream()
+        engine = FakeEngine(upstream, concurrency=4, tenant_concurrency=2, rate_per_second=0)
+
+        async def timed_run(record_ids, tenant_id):
+            started = time.perf_counter()
+            await engine.run(record_ids, tenant_id)
+            return time.perf_counter() - started
+
+        async def go():
+            busy = asyncio.create_task(timed_run(list(range(0, 12)), "a"))
+            await asyncio.sleep(0)
+            elapsed = await asyncio.gather(busy, timed_run([100, 101], "b"))
+            await engine.client.aclose()
+            return elapsed
+
+        busy_elapsed, other_elapsed = asyncio.run(go())
+        # "b" runs alongside "a" instead of queueing behind its waiting records
+        self.assertLess(other_elapsed, 2 * LATENCY_SECONDS)
+        self.assertGreater(busy_elapsed, 5 * LATENCY_SECONDS)
+        self.assertEqual(upstream.peak, 4)
+
+    def test_rate_limit_paces_upstream_calls(self):
+        upstream = FakeUpstream(latency=0.0)
+        engine = FakeEngine(upstream, concurrency=8, tenant_concurrency=8, rate_per_second=20, rate_burst=2)
+        counts, elapsed = run_batch(engine, list(range(10)))
+        self.assertEqual(counts["completed"], 10)
+        # 2 calls from the burst, the other 8 at 20 per second
+        self.assertGreaterEqual(elapsed, 8 / 20 * 0.9)
+
+    def test_failures_are_recorded_and_do_not_stop_the_batch(self):
+        upstream = FakeUpstream(fail_urls=("3", "5"))
+        engine = FakeEngine(upstream, concurrency=4, tenant_concurrency=4, rate_per_second=0)
+        counts, _ = run_batch(engine, list(range(8)))
+        self.assertEqual(counts, {"completed": 6, "failed": 2, "skipped": 0})
+        self.assertEqual(engine.statuses[3], ExtractionStatus.FAILED)
+
+    def test_records_claimed_elsewhere_are_skipped(self):
+        upstream = FakeUpstream()
+        engine = FakeEngine(upstream, claimed={1, 2}, concurrency=4, tenant_concurrency=4, rate_per_second=0)
+        counts, _ = run_batch(engine, list(range(6)))
+        self.assertEqual(counts, {"completed": 4, "failed": 0, "skipped": 2})
+        self.assertEqual(len(upstream.calls), 4)
+
+    def test_cancelled_records_are_released_for_resume(self):
+        upstream = FakeUpstream(latency=10)
+        engine = FakeEngine(upstream, concurrency=2, tenant_concurrency=2, rate_per_second=0)
+
+        async def go():
+            engine.submit([1, 2, 3], "1")
+            while upstream.in_flight < 2:
+                await asyncio.sleep(0.01)
+            await engine.shutdown()
+            await engine.client.aclose()
+
+        asyncio.run(go())
+        self.assertEqual(sorted(engine.released), [1, 2])
+        self.assertEqual(engine.statuses, {})
+
+    def test_token_bucket_allows_burst_then_paces(self):
+        async def go():
+            bucket = TokenBucket(rate=50, capacity=3)
+            started = time.perf_counter()
+            stamps = []
+            for _ in range(6):
+                await bucket.acquire()
+                stamps.append(time.perf_counter() - started)
+            return stamps
+
+        stamps = asyncio.run(go())
+        self.assertLess(stamps[2], 0.01)
+        self.assertGreaterEqual(stamps[5], 3 / 50 * 0.9)
@@ -0,0 +1,174 @@
+import gzip
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from unittest import TestCase
+
+from settings.datadog_logger import DatadogLogger
+from settings.log_shipper import LogShipper
+
+
+class IntakeStandIn:
+    """Local Datadog intake: answers after `latency` (or once `gate` opens) and records batches."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.gate = threading.Event()
+        self.gate.set()
+        self.batches: List[list] = []
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                stand_in.gate.wait()
+                time.sleep(stand_in.latency)
+                with stand_in.lock:
+                    stand_in.batches.append(json.loads(body))
+                self.send_response(202)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1/input"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def entries(self) -> list:
+        with self.lock:
+            return [e for batch in self.batches for e in batch]
+
+    def close(self):
+        self.gate.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _p99(samples: List[float]) -> float:
+    samples = sorted(samples)
+    return samples[int(len(samples) * 0.99) - 1]
+
+
+class TestLogShipper(TestCase):
+    def _intake(self, latency: float = 0.0) -> IntakeStandIn:
+        intake = IntakeStandIn(latency)
+        self.addCleanup(intake.close)
+        return intake
+
+    def _handler_latencies(self, latency: float, requests: int = 200):
+        """p99 of a request handler that logs three records, and what reached the intake."""
+        intake = self._intake(latency)
+        shipper = LogShipper(intake.url, batch_size=200, flush_interval=0.05)
+        dd_handler = DatadogLogger(service="etter-test", shipper=shipper)
+        logger = logging.getLogger(f"etter_app.test_shipper.{latency}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(dd_handler)
+        self.addCleanup(logger.removeHandler, dd_handler)
+
+        def handle_request(i: int):
+            logger.info("loading org %s", i)
+            logger.info("scenario computed")
+            logger.info(
+                "GET /api/org 200",
+                extra={"http.method": "GET", "http.url": "/api/org", "http.status_code": 200, "duration_ms": 1.0},
+            )
+
+        timings = []
+        for i in range(requests):
+            t0 = time.perf_counter()
+            handle_request(i)
+            timings.append(time.perf_counter() - t0)
+
+        self.assertTrue(shipper.flush(timeout=30))
+        dd_handler.close()
+        return _p99(timings), intake, shipper
+
+    def test_handler_latency_does_not_depend_on_intake_latency(self):
+        fast_p99, fast_intake, _ = self._handler_latencies(latency=0.0)
+        slow_p99, slow_intake, shipper = self._handler_latencies(latency=0.25)
+
+        # A synchronous POST per record would put three intake round trips in every request
+        self.assertLess(slow_p99, 0.025)
+        self.assertLess(slow_p99, max(fast_p99 * 10, 0.01))
+
+        # Nothing was lost on the way
+        self.assertEqual(len(slow_intake.entries), 600)
+        self.assertEqual(len(fast_intake.entries), 600)
+        stats = shipper.stats()
+        self.assertEqual(stats["shipped"], 600)
+        self.assertEqual(stats["dropped"] + stats["sampled_out"] + stats["failed"], 0)
+        structured = [e for e in slow_intake.entries if e.get("http.method") == "GET"]
+        self.assertEqual(len(structured), 200)
+        self.assertIn("http.status_code:200", structured[0]["ddtags"])
+
+    def test_batches_by_count(self):
+        intake = self._intake()
+        shipper = LogShipper(intake.url, batch_size=10, flush_interval=5.0)
+        for i in range(25):
+            shipper.submit({"message": f"m{i}"})
+        self.assertTrue(shipper.flush(timeout=5))
+        shipper.close()
+
+        sizes = [len(b) for b in intake.batches]
+        self.assertEqual(sum(sizes), 25)
+        self.assertLessEqual(max(sizes), 10)
+        self.assertEqual([e["message"] for e in intake.entries], [f"m{i}" for i in range(25)])
+
+    def test_batches_by_age(self):
+        intake = self._intake()
+        shipper = LogShipper(intake.url, batch_size=100, flush_interval=0.1)
+        self.addCleanup(shipper.close)
+        shipper.submit({"message": "lonely"})
+
+        deadline = time.monotonic() + 2.0
+        while not intake.entries and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual([e["message"] for e in intake.entries], ["lonely"])
+
+    def test_drops_instead_of_blocking_when_full(self):
+        intake = self._intake()
+        intake.gate.clear()
+        shipper = LogShipper(intake.url, batch_size=5, queue_size=20, sample_rate=1.0, timeout=10)
+
+        t0 = time.perf_counter()
+        accepted = sum(shipper.submit({"message": f"m{i}"}) for i in range(200))
+        elapsed = time.perf_counter() - t0
+
+        self.assertLess(elapsed, 0.5)
+        stats = shipper.stats()
+        self.assertGreater(stats["dropped"], 0)
+        self.assertEqual(stats["submitted"], accepted)
+        self.assertEqual(stats["submitted"] + stats["dropped"], 200)
+
+        intake.gate.set()
+        self.assertTrue(shipper.flush(timeout=10))
+        shipper.close()
+        self.assertEqual(shipper.stats()["shipped"], accepted)
+
+    def test_samples_info_but_keeps_warnings_under_backpressure(self):
+        intake = self._intake()
+        intake.gate.clear()
+        shipper = LogShipper(
+            intake.url, batch_size=1, queue_size=100, sample_high_water=0.5, sample_rate=0.0, timeout=10,
+        )
+        for i in range(60):
+            shipper.submit({"message": f"info {i}"}, logging.INFO)
+
+        self.assertFalse(shipper.submit({"message": "more info"}, logging.INFO))
+        self.assertTrue(shipper.submit({"message": "warning"}, logging.WARNING))
+        self.assertGreater(shipper.stats()["sampled_out"], 0)
+
+        intake.gate.set()
+        self.assertTrue(shipper.flush(timeout=10))
+        shipper.close()
+        self.assertIn("warning", [e["message"] for e in intake.entries])
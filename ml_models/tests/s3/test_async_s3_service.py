@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+from api.s3 import dependencies
+from api.s3.infra.s3 import s3_management_service
+from api.s3.infra.s3.async_s3_service import AsyncS3Service
+from api.s3.infra.s3.s3_management_service import S3ManagementService
+
+
+class FakeS3Client:
+    """In-memory multipart uploads. Early parts are slowest, so they finish last."""
+
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.uploads = {}
+        self.objects = {}
+        self.aborted = []
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        time.sleep(0.01 * max(0, 5 - PartNumber))
+        if PartNumber == self.fail_part:
+            raise ClientError({"Error": {"Code": "InternalError", "Message": "boom"}}, "UploadPart")
+        with self._lock:
+            self.uploads[UploadId][PartNumber] = Body.read()
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+        return {"ETag": '"object-etag"'}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+
+
+class ChunkedStream:
+    """Async stream that returns short reads, like an ``UploadFile`` over the network."""
+
+    def __init__(self, data: bytes, read_size: int = 3):
+        self.data = data
+        self.read_size = read_size
+
+    async def read(self, n: int) -> bytes:
+        await asyncio.sleep(0)
+        chunk, self.data = self.data[:min(n, self.read_size)], self.data[min(n, self.read_size):]
+        return chunk
+
+
+class TestAsyncS3Service(TestCase):
+    def service(self, client: FakeS3Client) -> AsyncS3Service:
+        with patch.object(s3_management_service.boto3, "client", return_value=client):
+            return AsyncS3Service(S3ManagementService(), max_workers=4)
+
+    def test_streamed_parts_are_uploaded_in_order(self):
+        client = FakeS3Client()
+        service = self.service(client)
+        data = bytes(range(256)) * 2
+
+        async def upload():
+            upload = await service.create_multipart("docs/report.pdf")
+            parts = await service.upload_stream("docs/report.pdf", upload.upload_id, ChunkedStream(data), 64, 3)
+            await service.complete_multipart(
+                "docs/report.pdf",
+                upload.upload_id,
+                [{"PartNumber": part.part_number, "ETag": part.etag} for part in parts],
+            )
+            return parts
+
+        parts = asyncio.run(upload())
+        self.assertEqual([part.part_number for part in parts], list(range(1, 9)))
+        self.assertEqual([part.etag for part in parts], [f"etag-{n}" for n in range(1, 9)])
+        self.assertEqual(client.objects["docs/report.pdf"], data)
+
+    def test_a_failed_part_aborts_the_upload(self):
+        client = FakeS3Client(fail_part=2)
+        service = self.service(client)
+
+        async def upload():
+            upload = await service.create_multipart("docs/report.pdf")
+            await service.upload_stream("docs/report.pdf", upload.upload_id, ChunkedStream(b"x" * 500), 64, 2)
+
+        with self.assertRaises(ClientError):
+            asyncio.run(upload())
+        self.assertEqual(client.aborted, ["upload-1"])
+        self.assertEqual(client.uploads, {})
+        self.assertNotIn("docs/report.pdf", client.objects)
+
+    def test_async_service_is_a_singleton_over_the_shared_s3_service(self):
+        with patch.object(s3_management_service.boto3, "client", return_value=FakeS3Client()), \
+                patch.object(dependencies, "_s3_service", None), \
+                patch.object(dependencies, "_async_s3_service", None):
+            service = dependencies.get_async_s3_service()
+            self.assertIs(dependencies.get_async_s3_service(), service)
+            self.assertIs(service.sync, dependencies.get_s3_service())
@@ -1,5 +1,4 @@
 from unittest.mock import Mock, MagicMock
-from unittest.mock import patch
 from unittest import TestCase
 
 import numpy as np
@@ -16,6 +15,7 @@ class TestEmployee(TestCase):
 
     def test_initialization(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.5)
         self.assertEqual(self.employee.role, "Engineer")
@@ -26,6 +26,7 @@ class TestEmployee(TestCase):
 
     def test_update_task_with_no_change(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.5)
 
@@ -41,6 +42,7 @@ class TestEmployee(TestCase):
 
     def test_update_task_with_change(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.5)
 
@@ -57,6 +59,7 @@ class TestEmployee(TestCase):
 
     def test_complete_work_all_manual(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.5)
         self.employee._workload_knowledge = np.zeros((2,), dtype=np.float32)
@@ -75,6 +78,7 @@ class TestEmployee(TestCase):
 
     def test_complete_half_saving(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.5)
         self.employee._workload_knowledge = np.zeros((2,), dtype=np.float32)
@@ -96,6 +100,7 @@ class TestEmployee(TestCase):
 
     def test_gain_knowledge_no_learning(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=0.0)
 
@@ -110,6 +115,7 @@ class TestEmployee(TestCase):
 
     def test_gain_knowledge_learning(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=1.0)
 
@@ -122,9 +128,11 @@ class TestEmployee(TestCase):
         self.assertEqual(self.employee._workload_knowledge[0], 0.0)
         self.assertEqual(self.employee._workload_knowledge[1], 0.2)
 
-    @patch("ml_models.simulation.agent.np.random.poisson", return_value=7)
-    def test_step_all_manual(self, mock_poisson):
+    def test_step_all_manual(self):
         model = Mock()
+        model.rng = Mock()
+        model.rng.poisson = MagicMock(return_value=7)
+        model.rng.random = MagicMock(return_value=0.5)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=1.0)
 
@@ -141,6 +149,7 @@ class TestEmployee(TestCase):
 
     def test_step_half_manual(self):
         model = Mock()
+        model.rng = np.random.default_rng(0)
         model.responsibilities_from_roles = MagicMock(return_value=self.workloads)
         self.employee = Employee(model=model, role="Engineer", automation_incentive=1.0)
         self.employee._workload_knowledge[1] = 1.0
@@ -0,0 +1,131 @@
+from unittest import TestCase
+
+import numpy as np
+from pandas import DataFrame
+
+from ml_models.simulation.role_lookup import DEFAULT_ROLES
+from ml_models.simulation import (
+    EmployeeGroupProfile,
+    InMemoryRoleDataProvider,
+    SimulationAggregator,
+    VectorizedAutomationImpactModel,
+    run_simulation_iteration,
+    run_simulation_trajectory,
+    run_vectorized_trajectories,
+    trajectory_metric_names,
+)
+
+FIELDS = [
+    "count",
+    "cost_savings",
+    "avg_automation_rate",
+    "avg_time_per_employee",
+    "total_salary_of_employee",
+    "avg_unused_output_capacity",
+]
+
+
+def reference_payloads(role_groups, rows):
+    """The DataFrame aggregation the job runner used before streaming."""
+    data = DataFrame(rows)
+    data["total_employees"] *= sum(group["count"] for group in role_groups)
+    data["total_salary_of_employees"] *= sum(group["salary"] * group["count"] for group in role_groups)
+    data["cost_savings"] = data["total_salary_of_employees"].iloc[0] - data["total_salary_of_employees"]
+    data["headcount_savings"] = data["total_employees"].iloc[0] - data["total_employees"]
+    labels = {
+        "avg_automation_rate": "automation",
+        "total_employees": "employees",
+        "avg_time_per_employee": "avg_time_per_employee",
+        "total_salary_of_employees": "total_salary_of_employees",
+        "cost_savings": "cost_savings",
+        "avg_unused_output_capacity": "avg_unused_output_capacity",
+        "headcount_savings": "headcount_savings",
+    }
+    for group in role_groups:
+        role = group["role"]
+        data[f"{role}_cost_savings"] = (
+            data[f"{role}_total_salary_of_employee"].iloc[0] - data[f"{role}_total_salary_of_employee"]
+        )
+        labels.update({f"{role}_{field}": f"{role}_{field}" for field in FIELDS})
+
+    grouped = data.groupby("Step").agg({name: ["mean", "min", "max"] for name in labels})
+    grouped.columns = [f"{labels[name]}_{stat}" for name, stat in grouped.columns]
+    grouped = grouped.reset_index()
+    values = grouped.drop(columns="Step").to_numpy()
+    yearly = values[12::12] - values[:len(values[12::12]) * 12:12]
+    return grouped.to_dict(orient="records"), [
+        {**dict(zip(grouped.columns[1:], row)), "Year": year + 1} for year, row in enumerate(yearly)
+    ]
+
+
+class TestSimulationAggregator(TestCase):
+    def setUp(self):
+        self.role_provider = InMemoryRoleDataProvider(DEFAULT_ROLES)
+        self.role_groups = [
+            EmployeeGroupProfile(role="Engineer", count=6, salary=1000.0),
+            EmployeeGroupProfile(role="Manager", count=3, salary=2500.0),
+        ]
+        self.metric_names = trajectory_metric_names(self.role_groups)
+        self.max_steps = 30
+
+    def trajectory(self, iteration):
+        return run_simulation_trajectory(
+            self.role_groups, self.role_provider, "", 0.5, self.max_steps,
+            self.metric_names, iteration=iteration, seed=5,
+        )
+
+    def assertPayloadsEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for actual_row, expected_row in zip(actual, expected):
+            self.assertEqual(list(actual_row), list(expected_row))
+            for key, value in expected_row.items():
+                self.assertAlmostEqual(actual_row[key], value, places=6, msg=key)
+
+    def test_trajectory_matches_rows(self):
+        rows = run_simulation_iteration(
+            self.role_groups, self.role_provider, "", 0.5, self.max_steps, iteration=2, seed=5
+        )
+        expected = np.array([[row[name] for name in self.metric_names] for row in rows])
+        np.testing.assert_array_equal(self.trajectory(2), expected)
+
+    def test_payloads_match_dataframe_aggregation(self):
+        rows = []
+        aggregator = SimulationAggregator(self.role_groups, self.max_steps + 1)
+        for iteration in range(6):
+            rows += run_simulation_iteration(
+                self.role_groups, self.role_provider, "", 0.5, self.max_steps,
+                iteration=iteration, seed=5,
+            )
+            aggregator.update(self.trajectory(iteration))
+
+        results, yearly_metrics = reference_payloads(self.role_groups, rows)
+        self.assertPayloadsEqual(aggregator.results(), results)
+        self.assertPayloadsEqual(aggregator.yearly_metrics(), yearly_metrics)
+        self.assertEqual([row["Year"] for row in aggregator.yearly_metrics()], [1, 2])
+
+    def test_merged_partials_match_single_aggregator(self):
+        trajectories = [self.trajectory(iteration) for iteration in range(4)]
+        whole = SimulationAggregator(self.role_groups, self.max_steps + 1)
+        whole.update(np.stack(trajectories))
+
+        first = SimulationAggregator(self.role_groups, self.max_steps + 1)
+        second = SimulationAggregator(self.role_groups, self.max_steps + 1)
+        first.update(np.stack(trajectories[:2]))
+        for step in range(self.max_steps + 1):
+            second.update_step(step, np.stack(trajectories[2:])[:, step])
+        second.n_iterations += 2
+        first.merge(second)
+
+        self.assertEqual(first.n_iterations, 4)
+        self.assertPayloadsEqual(first.results(), whole.results())
+
+    def test_vectorized_trajectories_match_run(self):
+        trajectories = run_vectorized_trajectories(
+            self.role_groups, self.role_provider, "", 0.5, self.max_steps,
+            [3, 7], self.metric_names, seed=5,
+        )
+        frame = VectorizedAutomationImpactModel(
+            self.role_groups, self.role_provider, automation_factor=0.5, seed=5, iterations=[3, 7]
+        ).run(self.max_steps)
+        expected = frame[self.metric_names].to_numpy().reshape(2, self.max_steps + 1, -1)
+        np.testing.assert_array_equal(trajectories, expected)
@@ -0,0 +1,96 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from mesa.batchrunner import batch_run
+
+from ml_models.simulation.role_lookup import DEFAULT_ROLES
+from ml_models.simulation import (
+    AutomationImpactOrganizationModel,
+    EmployeeGroupProfile,
+    InMemoryRoleDataProvider,
+    SimulationEngine,
+    run_simulation_iteration,
+)
+
+
+class TestRunSimulationIteration(TestCase):
+    def setUp(self):
+        self.role_provider = InMemoryRoleDataProvider(DEFAULT_ROLES)
+        self.role_groups = [
+            EmployeeGroupProfile(role="Engineer", count=5, salary=1000.0),
+            EmployeeGroupProfile(role="Manager", count=2, salary=2000.0),
+        ]
+
+    def test_rows_match_batch_run_shape(self):
+        max_steps = 6
+        rows = run_simulation_iteration(
+            self.role_groups, self.role_provider, "", 0.2, max_steps, run_id=3, iteration=3
+        )
+        expected = batch_run(
+            AutomationImpactOrganizationModel,
+            parameters={
+                "role_groups": [self.role_groups],
+                "role_provider": self.role_provider,
+                "automation_factor": 0.2,
+                "company": "",
+            },
+            iterations=1,
+            max_steps=max_steps,
+            number_processes=1,
+            data_collection_period=1,
+            display_progress=False,
+        )
+
+        self.assertEqual(len(rows), len(expected))
+        self.assertEqual(set(rows[0]), set(expected[0]))
+        self.assertEqual([row["Step"] for row in rows], [row["Step"] for row in expected])
+        self.assertTrue(all(row["RunId"] == 3 and row["iteration"] == 3 for row in rows))
+
+    def test_progress_is_reported_per_step(self):
+        reported = []
+        rows = run_simulation_iteration(
+            self.role_groups,
+            self.role_provider,
+            "",
+            0.2,
+            4,
+            iteration=1,
+            progress=lambda iteration, step: reported.append((iteration, step)),
+        )
+        self.assertEqual(reported, [(1, step) for step in range(1, 6)])
+        self.assertEqual(len(rows), 5)
+
+    def test_seeded_iteration_is_reproducible(self):
+        def run(iteration):
+            rows = run_simulation_iteration(
+                self.role_groups, self.role_provider, "", 0.5, 12, iteration=iteration, seed=9
+            )
+            return [row["avg_automation_rate"] for row in rows]
+
+        self.assertEqual(run(2), run(2))
+        self.assertNotEqual(run(1), run(2))
+
+    def test_engine_subset_matches_full_seeded_run(self):
+        engine = SimulationEngine(role_provider=self.role_provider, number_of_months=12)
+        full = engine.run_multiple_simulations(
+            self.role_groups, automation_factor=0.5, n_simulations=3, seed=4
+        )
+        subset = engine.run_multiple_simulations(
+            self.role_groups, automation_factor=0.5, seed=4, iterations=[2]
+        )
+        columns = ["iteration", "Step", "total_employees", "avg_automation_rate"]
+        self.assertTrue(
+            full[full["iteration"] == 2][columns].reset_index(drop=True).equals(subset[columns])
+        )
+
+    def test_engine_reuses_fetched_workload_map(self):
+        role_provider = Mock(wraps=self.role_provider)
+        engine = SimulationEngine(role_provider=role_provider, number_of_months=6)
+        workloads = engine.get_role_workload_map(self.role_groups)
+        role_provider.reset_mock()
+
+        engine.run_multiple_simulations(
+            self.role_groups, n_simulations=2, seed=1, role_workload_map=workloads
+        )
+        engine.run_single_simulation(self.role_groups, role_workload_map=workloads)
+        role_provider.get_responsibilities_from_role.assert_not_called()
@@ -0,0 +1,128 @@
+import queue
+from unittest import TestCase
+
+import numpy as np
+from mesa.batchrunner import batch_run
+
+from ml_models.simulation.engine import QueueProgressReporter
+from ml_models.simulation.role_lookup import DEFAULT_ROLES
+from ml_models.simulation.vectorized import _RoleWorkforce
+from ml_models.simulation import (
+    AutomationImpactOrganizationModel,
+    EmployeeGroupProfile,
+    InMemoryRoleDataProvider,
+    SimulationEngine,
+    VectorizedAutomationImpactModel,
+)
+
+
+class TestVectorizedAutomationImpactModel(TestCase):
+    def setUp(self):
+        self.role_provider = InMemoryRoleDataProvider(DEFAULT_ROLES)
+        self.role_groups = [
+            EmployeeGroupProfile(role="Engineer", count=20, salary=1000.0),
+            EmployeeGroupProfile(role="HR", count=8, salary=800.0),
+        ]
+
+    def test_rows_match_batch_run_shape(self):
+        max_steps = 5
+        model = VectorizedAutomationImpactModel(
+            self.role_groups, self.role_provider, automation_factor=0.2, n_iterations=3
+        )
+        results = model.run(max_steps)
+        expected = batch_run(
+            AutomationImpactOrganizationModel,
+            parameters={
+                "role_groups": [self.role_groups],
+                "role_provider": self.role_provider,
+                "automation_factor": 0.2,
+                "company": "",
+            },
+            iterations=1,
+            max_steps=max_steps,
+            number_processes=1,
+            data_collection_period=1,
+            display_progress=False,
+        )
+
+        self.assertEqual(set(results.columns), set(expected[0]))
+        self.assertEqual(len(results), 3 * len(expected))
+        self.assertEqual(list(results["Step"][: len(expected)]), [row["Step"] for row in expected])
+        self.assertEqual(list(results["iteration"].unique()), [0, 1, 2])
+
+    def test_first_step_matches_agent_model(self):
+        results = VectorizedAutomationImpactModel(
+            self.role_groups, self.role_provider, automation_factor=0.2, n_iterations=2
+        ).run(0)
+        model = AutomationImpactOrganizationModel(
+            self.role_groups, self.role_provider, automation_factor=0.2
+        )
+        model.step()
+        expected = model.datacollector.get_model_vars_dataframe().iloc[0]
+        for name, value in expected.items():
+            self.assertAlmostEqual(results[name].iloc[0], value, msg=name)
+
+    def test_reduce_workforce_matches_agent_model(self):
+        workloads = self.role_provider.get_responsibilities_from_role("Engineer")
+        model = AutomationImpactOrganizationModel(
+            [self.role_groups[0]], self.role_provider, automation_factor=0.6,
+            rng=np.random.default_rng(7),
+        )
+        for _ in range(30):
+            model.agents.shuffle_do("step")
+            employees = model.employees["Engineer"]
+            workforce = _RoleWorkforce("Engineer", len(employees), 1000.0, workloads, 1)
+            workforce.expected_output[0] = [e.expected_output for e in employees]
+            workforce.time_savings[0] = [e.time_savings for e in employees]
+            workforce.unused_output_capacity[0] = [e.unused_output_capacity for e in employees]
+            # Carry each employee's position through the reordering
+            workforce.time_to_complete[0] = np.arange(len(employees))
+
+            model._reduce_workforce()
+            workforce.reduce_workforce(np.array([True]))
+
+            remaining = int(workforce.count[0])
+            kept = [employees[int(i)] for i in workforce.time_to_complete[0, :remaining]]
+            self.assertEqual(kept, model.employees["Engineer"])
+            np.testing.assert_allclose(
+                workforce.expected_output[0, :remaining],
+                [e.expected_output for e in model.employees["Engineer"]],
+            )
+
+    def test_distribution_matches_agent_model(self):
+        n_iterations, n_months = 60, 24
+        final = {}
+        for vectorized in (False, True):
+            engine = SimulationEngine(number_of_months=n_months, vectorized=vectorized)
+            results = engine.run_multiple_simulations(
+                self.role_groups, automation_factor=0.3, n_simulations=n_iterations, seed=11
+            )
+            final[vectorized] = results[results["Step"] == n_months]
+
+        for name in ("total_employees", "avg_automation_rate", "avg_time_per_employee"):
+            agent, vector = final[False][name], final[True][name]
+            standard_error = np.sqrt(agent.var() / len(agent) + vector.var() / len(vector))
+            self.assertLess(abs(agent.mean() - vector.mean()), 4 * standard_error + 1e-9, name)
+
+    def test_seeded_iterations_are_reproducible(self):
+        def run(**kwargs):
+            results = VectorizedAutomationImpactModel(
+                self.role_groups, self.role_provider, automation_factor=0.4, seed=5, **kwargs
+            ).run(12)
+            return results.drop(columns=["role_groups", "role_provider"])
+
+        full = run(n_iterations=4)
+        self.assertTrue(full.equals(run(n_iterations=4)))
+        subset = run(iterations=[1, 3])
+        self.assertTrue(
+            full[full["iteration"].isin([1, 3])].reset_index(drop=True).equals(subset)
+        )
+
+    def test_progress_is_reported_once_per_step_for_the_chunk(self):
+        progress_queue = queue.Queue()
+        VectorizedAutomationImpactModel(
+            self.role_groups, self.role_provider, automation_factor=0.2, iterations=[4, 7, 9]
+        ).run(3, progress=QueueProgressReporter(progress_queue, "job-1"))
+
+        messages = [progress_queue.get_nowait() for _ in range(progress_queue.qsize())]
+        self.assertEqual(messages, [("job-1", (4, 7, 9), step) for step in range(1, 5)])
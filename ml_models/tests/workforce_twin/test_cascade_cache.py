@@ -0,0 +1,94 @@
+from dataclasses import replace
+from unittest import TestCase
+from unittest.mock import patch
+
+from workforce_twin_modeling.engine import cascade_cache as cascade_cache_module
+from workforce_twin_modeling.engine.cascade import Stimulus
+from workforce_twin_modeling.engine.cascade_cache import CascadeCache, cascade_key
+from workforce_twin_modeling.engine.loader import OrganizationData
+
+
+class TestCascadeCache(TestCase):
+    def setUp(self):
+        self.org = OrganizationData(data_dir="/data/acme", version="v1")
+        self.stimulus = Stimulus(
+            name="copilot", stimulus_type="technology_injection", tools=["Microsoft Copilot"],
+            target_scope="Claims", target_functions=["Claims"],
+        )
+        self.calls = []
+
+        def run_cascade(stimulus, org):
+            self.calls.append((stimulus.name, org.version))
+            return {"stimulus": stimulus, "version": org.version}
+
+        for patcher in (
+            patch.object(cascade_cache_module, "run_cascade", side_effect=run_cascade),
+            patch.object(cascade_cache_module, "replace", side_effect=lambda result, **kw: {**result, **kw}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_key_follows_the_org_version_and_the_cascade_inputs(self):
+        key = cascade_key(self.stimulus, self.org)
+        self.assertEqual(cascade_key(replace(self.stimulus, name="relabelled", target_scope="ALL"), self.org), key)
+        self.assertNotEqual(cascade_key(self.stimulus, replace(self.org, version="v2")), key)
+        for changed in (
+            replace(self.stimulus, tools=["GitHub Copilot"]),
+            replace(self.stimulus, target_roles=["R-1"]),
+            replace(self.stimulus, policy="no_layoffs"),
+            replace(self.stimulus, absorption_factor=0.5),
+            replace(self.stimulus, alpha=0.6),
+            replace(self.stimulus, training_cost_per_person=500),
+        ):
+            self.assertNotEqual(cascade_key(changed, self.org), key, changed)
+        # Orgs built in memory have no version and are never cached
+        self.assertIsNone(cascade_key(self.stimulus, OrganizationData()))
+
+    def test_hits_reuse_the_result_under_the_callers_stimulus(self):
+        cache = CascadeCache(max_size=4)
+        cache.run(self.stimulus, self.org)
+        relabelled = replace(self.stimulus, name="same cascade")
+        result = cache.run(relabelled, self.org)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertIs(result["stimulus"], relabelled)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (1, 1))
+
+        cache.run(self.stimulus, replace(self.org, version="v2"))
+        self.assertEqual(self.calls[-1], ("copilot", "v2"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CascadeCache(max_size=2)
+        low, mid, high = (replace(self.stimulus, alpha=alpha) for alpha in (0.2, 0.5, 0.8))
+        cache.run(low, self.org)
+        cache.run(mid, self.org)
+        cache.run(low, self.org)
+        cache.run(high, self.org)
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        cache.run(low, self.org)
+        self.assertEqual(len(self.calls), 3)
+        cache.run(mid, self.org)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_invalidate_drops_one_version_or_everything(self):
+        cache = CascadeCache(max_size=8)
+        v2 = replace(self.org, version="v2")
+        cache.run(self.stimulus, self.org)
+        cache.run(self.stimulus, v2)
+        cache.run(replace(self.stimulus, alpha=0.5), v2)
+
+        self.assertEqual(cache.invalidate("v2"), 2)
+        self.assertEqual(cache.stats()["size"], 1)
+        cache.run(self.stimulus, self.org)
+        self.assertEqual(len(self.calls), 3)
+
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_size_zero_disables_the_cache(self):
+        cache = CascadeCache(max_size=0)
+        cache.run(self.stimulus, self.org)
+        cache.run(self.stimulus, self.org)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(cache.stats()["size"], 0)
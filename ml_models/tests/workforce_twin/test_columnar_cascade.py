@@ -0,0 +1,120 @@
+import dataclasses
+import itertools
+import math
+import os
+from unittest import TestCase
+
+import numpy as np
+
+import workforce_twin_modeling
+from workforce_twin_modeling.engine.cascade import Stimulus, Step4_SkillResult, run_cascade
+from workforce_twin_modeling.engine.columnar import (
+    ColumnarOrg,
+    load_columnar_organization,
+    run_columnar_cascade,
+)
+from workforce_twin_modeling.engine.loader import load_organization
+from workforce_twin_modeling.scripts.benchmark_cascade import synthetic_org
+
+ACME_DIR = os.path.join(os.path.dirname(workforce_twin_modeling.__file__), "data", "Acme Corporation")
+POLICIES = ["moderate_reduction", "no_layoffs", "natural_attrition", "active_reduction", "rapid_redeployment"]
+
+
+def reference_steps(stimulus, org):
+    result = run_cascade(stimulus, org)
+    return [
+        result.step1_scope, result.step2_reclassification, result.step3_capacity,
+        result.step4_skills, result.step5_workforce, result.step6_financial,
+    ]
+
+
+class TestColumnarCascadeParity(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.acme = load_organization(ACME_DIR)
+        cls.acme_columnar = ColumnarOrg.from_organization(cls.acme)
+        cls.synthetic = synthetic_org(2_000, 25)
+        cls.synthetic_columnar = ColumnarOrg.from_organization(cls.synthetic)
+
+    def assertSameResult(self, expected, actual, path=""):
+        if dataclasses.is_dataclass(expected):
+            self.assertIs(type(expected), type(actual), path)
+            for f in dataclasses.fields(expected):
+                self.assertSameResult(getattr(expected, f.name), getattr(actual, f.name), f"{path}.{f.name}")
+        elif isinstance(expected, dict):
+            self.assertEqual(expected.keys(), actual.keys(), path)
+            for key in expected:
+                self.assertSameResult(expected[key], actual[key], f"{path}[{key!r}]")
+        elif isinstance(expected, list):
+            self.assertEqual(len(expected), len(actual), path)
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                self.assertSameResult(e, a, f"{path}[{i}]")
+        elif isinstance(expected, float) or isinstance(actual, float):
+            # Sums may be taken in a different order, and an empty sum() is int 0
+            self.assertTrue(
+                expected == actual or math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9),
+                f"{path}: {expected} != {actual}",
+            )
+        else:
+            self.assertEqual(expected, actual, path)
+            self.assertIs(type(expected), type(actual), path)
+
+    def assertMatchesCascade(self, stimulus, org, corg):
+        expected = reference_steps(stimulus, org)
+        actual = run_columnar_cascade(stimulus, corg).to_steps()
+        for e, a in zip(expected, actual):
+            if isinstance(e, Step4_SkillResult):
+                # The dataclass path lists skills in set iteration order
+                for name in ("sunset_skills", "sunrise_skills", "critical_sunset"):
+                    getattr(e, name).sort(key=lambda s: s.skill_id)
+                    getattr(a, name).sort(key=lambda s: s.skill_id)
+            self.assertSameResult(e, a, type(e).__name__)
+
+    def _sweep(self, org, corg, max_combinations):
+        tool_names = [t.tool_name for t in org.tools.values()]
+        functions = org.functions
+        for k in (1, 2, 3):
+            for tools in list(itertools.combinations(tool_names, k))[:max_combinations]:
+                for scope in ([], [functions[0]], functions[1:3]):
+                    for policy in POLICIES:
+                        stimulus = Stimulus(
+                            name="parity", stimulus_type="technology_injection", tools=list(tools),
+                            target_scope="ALL", target_functions=scope, policy=policy,
+                            absorption_factor=0.3, alpha=0.8,
+                        )
+                        with self.subTest(tools=tools, scope=scope, policy=policy):
+                            self.assertMatchesCascade(stimulus, org, corg)
+
+    def test_matches_dataclass_cascade_on_acme(self):
+        self._sweep(self.acme, self.acme_columnar, max_combinations=10)
+
+    def test_matches_dataclass_cascade_on_synthetic_org(self):
+        self._sweep(self.synthetic, self.synthetic_columnar, max_combinations=4)
+
+    def test_target_roles_keep_order_and_duplicates(self):
+        role_ids = list(self.acme.roles)
+        stimulus = Stimulus(
+            name="roles", stimulus_type="technology_injection",
+            tools=[t.tool_name for t in self.acme.tools.values()][:2],
+            target_scope="roles", target_roles=[role_ids[3], role_ids[0], role_ids[3]],
+        )
+        self.assertMatchesCascade(stimulus, self.acme, self.acme_columnar)
+
+    def test_unknown_tools_and_functions_affect_nothing(self):
+        stimulus = Stimulus(
+            name="none", stimulus_type="technology_injection", tools=["No Such Tool"],
+            target_scope="ALL", target_functions=["No Such Function"],
+        )
+        self.assertMatchesCascade(stimulus, self.acme, self.acme_columnar)
+        result = run_columnar_cascade(stimulus, self.acme_columnar)
+        self.assertEqual(len(result.scope_tasks), 0)
+        self.assertEqual(result.total_reducible, 0)
+
+    def test_csv_loader_matches_conversion(self):
+        loaded = load_columnar_organization(ACME_DIR)
+        for f in dataclasses.fields(ColumnarOrg):
+            expected, actual = getattr(self.acme_columnar, f.name), getattr(loaded, f.name)
+            if isinstance(expected, np.ndarray):
+                np.testing.assert_array_equal(expected, actual, err_msg=f.name)
+            else:
+                self.assertEqual(expected, actual, f.name)
@@ -0,0 +1,107 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+from workforce_twin_modeling.engine import executor as executor_module
+from workforce_twin_modeling.engine.executor import ScenarioExecutor
+from workforce_twin_modeling.engine.loader import OrganizationData
+
+
+def square(org, value, fail=False):
+    if fail:
+        raise ValueError(f"bad value {value}")
+    return value * value
+
+
+def org_dir(org):
+    return org.data_dir
+
+
+class TestScenarioExecutor(TestCase):
+    def setUp(self):
+        # max_workers=0 runs on one background thread, in this process
+        self.executor = ScenarioExecutor(max_workers=0)
+        self.addCleanup(self.executor.shutdown)
+        self.org = OrganizationData()
+
+    def test_run_yields_every_item_by_index(self):
+        items = [{"value": i, "fail": i == 3} for i in range(8)]
+        results = {}
+        for index, future in self.executor.run(self.org, square, items, max_in_flight=3):
+            results[index] = future.exception() or future.result()
+        self.assertEqual(sorted(results), list(range(8)))
+        self.assertEqual(results[5], 25)
+        self.assertIsInstance(results[3], ValueError)
+
+    def test_run_stops_submitting_when_closed_early(self):
+        calls = []
+
+        def record(org, value):
+            calls.append(value)
+            return value
+
+        scenarios = self.executor.run(self.org, record, [{"value": i} for i in range(10)], max_in_flight=2)
+        next(scenarios)
+        scenarios.close()
+        self.executor.shutdown()
+        # Only the first max_in_flight calls were ever submitted
+        self.assertLessEqual(len(calls), 2)
+
+    def test_stream_yields_every_item_by_index(self):
+        async def go():
+            results = {}
+            async for index, future in self.executor.stream(
+                self.org, square, [{"value": i} for i in range(6)], max_in_flight=2
+            ):
+                results[index] = future.result()
+            return results
+
+        self.assertEqual(asyncio.run(go()), {i: i * i for i in range(6)})
+
+
+class TestWorkerOrgs(TestCase):
+    def setUp(self):
+        self.executor = ScenarioExecutor(max_workers=0)
+        self.addCleanup(self.executor.shutdown)
+        self.versions = {}
+        self.loads = []
+
+        def prepare(data_dir):
+            self.loads.append(data_dir)
+            return OrganizationData(data_dir=data_dir, version=self.versions[data_dir])
+
+        for patcher in (
+            patch.object(executor_module, "prepare_organization", side_effect=prepare),
+            patch.dict(executor_module._worker_orgs, clear=True),
+            patch.object(executor_module, "_worker_generation", 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def held(self, data_dir):
+        self.versions[data_dir] = self.versions.get(data_dir, "v1")
+        self.executor.preload(data_dir, self.versions[data_dir])
+        return OrganizationData(data_dir=data_dir, version=self.versions[data_dir])
+
+    def test_orgs_added_after_the_pool_started_are_preloaded(self):
+        acme = self.held("/data/acme")
+        self.assertEqual(self.executor.submit(acme, org_dir).result(5), "/data/acme")
+
+        self.held("/data/globex")
+        self.executor.submit(acme, org_dir).result(5)
+        self.assertEqual(set(executor_module._worker_orgs), {"/data/acme", "/data/globex"})
+        self.assertEqual(sorted(self.loads), ["/data/acme", "/data/globex"])
+
+    def test_evicted_orgs_are_dropped_and_new_versions_reloaded(self):
+        acme = self.held("/data/acme")
+        self.held("/data/globex")
+        self.executor.submit(acme, org_dir).result(5)
+
+        self.executor.evict("/data/globex")
+        self.versions["/data/acme"] = "v2"
+        acme = self.held("/data/acme")
+        self.executor.submit(acme, org_dir).result(5)
+
+        self.assertEqual(list(executor_module._worker_orgs), ["/data/acme"])
+        self.assertEqual(executor_module._worker_orgs["/data/acme"].version, "v2")
+        self.assertEqual(self.loads.count("/data/acme"), 2)
@@ -0,0 +1,79 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from workforce_twin_modeling.api import org_store
+from workforce_twin_modeling.api.org_store import CompanyNotFound, OrgStore
+from workforce_twin_modeling.engine.loader import OrganizationData, data_version
+
+
+def write_roles(data_dir: str, rows: int) -> None:
+    with open(os.path.join(data_dir, "roles.csv"), "w") as f:
+        f.write("role_id\n" + "".join(f"R-{i}\n" for i in range(rows)))
+
+
+class TestOrgStore(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.dirs = {}
+        for company in ("Acme", "Globex", "Initech"):
+            self.dirs[company] = os.path.join(root.name, company)
+            os.mkdir(self.dirs[company])
+            write_roles(self.dirs[company], 100)
+
+        self.executor = MagicMock()
+        self.cascade_cache = MagicMock()
+        for patcher in (
+            patch.object(org_store, "prepare_organization", side_effect=self.prepare),
+            patch.object(org_store, "get_scenario_executor", return_value=self.executor),
+            patch.object(org_store, "get_cascade_cache", return_value=self.cascade_cache),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def prepare(data_dir):
+        return OrganizationData(data_dir=data_dir, version=data_version(data_dir))
+
+    def store(self, **kwargs) -> OrgStore:
+        store = OrgStore(lambda company: self.dirs.get(company, ""), **kwargs)
+        self.addCleanup(store.shutdown)
+        return store
+
+    def test_unchanged_data_is_served_from_the_same_snapshot(self):
+        store = self.store()
+        first = store.get("Acme")
+        self.assertIs(store.get("Acme"), first)
+        self.assertIs(store.refresh("Acme"), first)
+        self.executor.preload.assert_called_once_with(self.dirs["Acme"], first.version)
+        with self.assertRaises(CompanyNotFound):
+            store.get("Hooli")
+
+    def test_changed_data_is_reloaded_as_a_new_snapshot(self):
+        store = self.store()
+        old = store.get("Acme")
+        write_roles(self.dirs["Acme"], 200)
+
+        new = store.refresh("Acme")
+        self.assertIsNot(new, old)
+        self.assertNotEqual(new.version, old.version)
+        self.assertIs(store.get("Acme"), new)
+        self.cascade_cache.invalidate.assert_called_once_with(old.version)
+        self.executor.preload.assert_called_with(self.dirs["Acme"], new.version)
+
+    def test_least_recently_used_company_is_evicted_over_budget(self):
+        size = org_store.estimate_size(self.dirs["Acme"])
+        store = self.store(budget_bytes=2 * size)
+        acme = store.get("Acme")
+        store.get("Globex")
+        store.get("Acme")
+        store.get("Initech")
+
+        self.assertEqual(set(store.stats()["companies"]), {"Acme", "Initech"})
+        self.assertIsNone(store.peek("Globex"))
+        self.assertIs(store.peek("Acme"), acme)
+        self.executor.evict.assert_called_once_with(self.dirs["Globex"])
+        # An evicted company loads again on its next request
+        self.assertEqual(store.get("Globex").data_dir, self.dirs["Globex"])
@@ -0,0 +1,118 @@
+import dataclasses
+import math
+import os
+from unittest import TestCase
+
+import workforce_twin_modeling
+from workforce_twin_modeling.engine.cascade import Stimulus
+from workforce_twin_modeling.engine.feedback import FeedbackParams, HumanSystemState
+from workforce_twin_modeling.engine.inverse_solver import params_for_alpha, solve_inverse
+from workforce_twin_modeling.engine.loader import load_organization
+from workforce_twin_modeling.engine.rates import ALL_SCENARIOS, P2_BALANCED, P3_AGGRESSIVE
+from workforce_twin_modeling.engine.simulator_batch import simulate_batch
+from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback
+from workforce_twin_modeling.scripts.benchmark_cascade import synthetic_org
+from workforce_twin_modeling.stages.stage_4_scenarios import run_sensitivity_sweep
+
+ACME_DIR = os.path.join(os.path.dirname(workforce_twin_modeling.__file__), "data", "Acme Corporation")
+INITIAL_STATES = [
+    None,
+    HumanSystemState(proficiency=25, readiness=45, trust=35, political_capital=60),
+    HumanSystemState(proficiency=10, readiness=8, trust=15, political_capital=30),
+    HumanSystemState(proficiency=70, readiness=80, trust=75, political_capital=15),
+]
+
+
+class TestSimulateBatchParity(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.acme = load_organization(ACME_DIR)
+        cls.stimulus = Stimulus(
+            name="batch", stimulus_type="technology_injection", tools=["Microsoft Copilot"],
+            target_scope="function", target_functions=["Claims"],
+        )
+
+    def assertSameResult(self, expected, actual, path=""):
+        if dataclasses.is_dataclass(expected):
+            for f in dataclasses.fields(expected):
+                self.assertSameResult(getattr(expected, f.name), getattr(actual, f.name), f"{path}.{f.name}")
+        elif isinstance(expected, dict):
+            self.assertEqual(expected.keys(), actual.keys(), path)
+            for key in expected:
+                self.assertSameResult(expected[key], actual[key], f"{path}[{key!r}]")
+        elif isinstance(expected, list):
+            self.assertEqual(len(expected), len(actual), path)
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                self.assertSameResult(e, a, f"{path}[{i}]")
+        elif isinstance(expected, float) or isinstance(actual, float):
+            self.assertTrue(
+                math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9),
+                f"{path}: {expected} != {actual}",
+            )
+        else:
+            self.assertEqual(expected, actual, path)
+
+    def assertMatchesScalar(self, stimulus, org, params, fb_params=None, initial_hs=None):
+        initial_hs = initial_hs or [None] * len(params)
+        batch = simulate_batch(stimulus, org, params, fb_params, initial_hs)
+        for i, (p, hs) in enumerate(zip(params, initial_hs)):
+            expected = simulate_with_feedback(stimulus, org, p, fb_params, hs)
+            self.assertSameResult(expected, batch.result(i), f"variant {i}")
+
+    def test_every_scenario_and_initial_state(self):
+        for label, params in ALL_SCENARIOS.items():
+            with self.subTest(scenario=label):
+                self.assertMatchesScalar(
+                    self.stimulus, self.acme, [params] * len(INITIAL_STATES), initial_hs=INITIAL_STATES,
+                )
+
+    def test_alpha_grid_in_one_batch(self):
+        params = [params_for_alpha(P3_AGGRESSIVE, 0.05 + 0.1 * i) for i in range(10)]
+        self.assertMatchesScalar(self.stimulus, self.acme, params)
+
+    def test_shocks_and_errors(self):
+        fb_params = FeedbackParams(ai_error_month=9, trust_shock_start_month=4, trust_shock_magnitude=12.0)
+        params = [params_for_alpha(P2_BALANCED, alpha) for alpha in (0.2, 0.5, 0.9)]
+        self.assertMatchesScalar(self.stimulus, self.acme, params, fb_params, INITIAL_STATES[1:])
+
+    def test_synthetic_org(self):
+        org = synthetic_org(5_000, 10)
+        stimulus = Stimulus(
+            name="batch", stimulus_type="technology_injection",
+            tools=[t.tool_name for t in org.tools.values()][:3],
+            target_scope="function", target_functions=org.functions[:3],
+        )
+        params = [params_for_alpha(P3_AGGRESSIVE, alpha) for alpha in (0.3, 0.6, 0.9)]
+        self.assertMatchesScalar(stimulus, org, params)
+
+    def test_variants_must_share_policy(self):
+        with self.assertRaises(ValueError):
+            simulate_batch(self.stimulus, self.acme, [P2_BALANCED, P3_AGGRESSIVE])
+
+    def test_sensitivity_sweep_matches_scalar_runs(self):
+        base_hs = HumanSystemState(proficiency=25, readiness=45, trust=35, political_capital=60)
+        sweep = run_sensitivity_sweep(
+            self.stimulus, self.acme, P2_BALANCED, FeedbackParams(), base_hs,
+            ["readiness", "trust"], [-20, 0, 20],
+        )
+        self.assertEqual(list(sweep), ["readiness", "trust"])
+        for param_name, results in sweep.items():
+            for label, delta, result in results:
+                hs = HumanSystemState(
+                    proficiency=base_hs.proficiency, readiness=base_hs.readiness,
+                    trust=base_hs.trust, political_capital=base_hs.political_capital,
+                )
+                setattr(hs, param_name, max(5, min(95, getattr(hs, param_name) + delta)))
+                expected = simulate_with_feedback(self.stimulus, self.acme, P2_BALANCED, FeedbackParams(), hs)
+                self.assertSameResult(expected, result, label)
+
+    def test_inverse_solution_matches_scalar_run(self):
+        for stimulus_type, target in [("headcount_target", 8.0), ("automation_target", 30.0)]:
+            with self.subTest(stimulus_type=stimulus_type):
+                solved = solve_inverse(stimulus_type, target, self.stimulus, self.acme, P3_AGGRESSIVE)
+                self.assertTrue(solved.solved)
+                self.assertLessEqual(solved.error_pct, 2.0)
+                expected = simulate_with_feedback(
+                    self.stimulus, self.acme, params_for_alpha(P3_AGGRESSIVE, solved.solved_alpha), FeedbackParams(),
+                )
+                self.assertSameResult(expected, solved.simulation_result)
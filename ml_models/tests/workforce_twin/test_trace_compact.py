@@ -0,0 +1,75 @@
+import os
+import pickle
+from unittest import TestCase
+
+import workforce_twin_modeling
+from workforce_twin_modeling.engine.cascade import Stimulus
+from workforce_twin_modeling.engine.feedback import FeedbackParams
+from workforce_twin_modeling.engine.loader import load_organization
+from workforce_twin_modeling.engine.rates import ALL_SCENARIOS, P3_AGGRESSIVE
+from workforce_twin_modeling.engine.simulator_fb import simulate_with_feedback
+from workforce_twin_modeling.engine.trace_compact import MONTH_FIELDS
+
+ACME_DIR = os.path.join(os.path.dirname(workforce_twin_modeling.__file__), "data", "Acme Corporation")
+
+
+class TestCompactTrace(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.acme = load_organization(ACME_DIR)
+        cls.stimulus = Stimulus(
+            name="trace", stimulus_type="technology_injection", tools=["Microsoft Copilot"],
+            target_scope="ALL", target_functions=cls.acme.functions,
+        )
+        cls.fb_params = FeedbackParams(ai_error_month=9, trust_shock_start_month=4, trust_shock_magnitude=12.0)
+        cls.traced = simulate_with_feedback(cls.stimulus, cls.acme, P3_AGGRESSIVE, cls.fb_params, trace=True)
+
+    def test_record_only_leaves_results_unchanged(self):
+        plain = simulate_with_feedback(self.stimulus, self.acme, P3_AGGRESSIVE, self.fb_params)
+        recorded = simulate_with_feedback(self.stimulus, self.acme, P3_AGGRESSIVE, self.fb_params, record_trace=True)
+        self.assertIsNone(plain.compact_trace)
+        self.assertIsNone(recorded.trace)
+        self.assertEqual(plain.timeline, recorded.timeline)
+        self.assertEqual(recorded.compact_trace.to_trace().to_dict(), self.traced.trace.to_dict())
+
+    def test_slices_match_full_trace(self):
+        compact = self.traced.compact_trace
+        full = self.traced.trace.to_dict()
+        self.assertEqual(compact.n_months, P3_AGGRESSIVE.time_horizon_months + 1)
+        for start, end in [(0, 0), (8, 10), (30, None), (35, 99)]:
+            with self.subTest(start=start, end=end):
+                part = compact.to_trace(start, end).to_dict()
+                stop = len(full["months"]) if end is None else end + 1
+                self.assertEqual(part["months"], full["months"][start:stop])
+                self.assertEqual(part["phase_summary"], full["phase_summary"])
+                self.assertEqual(part["improvement_summary"], full["improvement_summary"])
+        for month in (0, 9, 36):
+            self.assertEqual(compact.to_trace(month, month).months[0], compact.month_trace(month))
+
+    def test_columns_match_timeline(self):
+        compact = self.traced.compact_trace
+        columns = compact.columns(["effective", "productivity", "hc_reduced", "ai_error"], start=5, end=14)
+        timeline = self.traced.timeline[5:15]
+        self.assertEqual(columns["month"], list(range(5, 15)))
+        self.assertEqual(columns["effective"], [s.effective_adoption_pct for s in timeline])
+        self.assertEqual(columns["productivity"], [s.productivity_index for s in timeline])
+        self.assertEqual(columns["hc_reduced"], [s.hc_reduced_this_month for s in timeline])
+        self.assertEqual(columns["ai_error"], [s.ai_error_occurred for s in timeline])
+        self.assertEqual(set(compact.columns()) - {"month"}, set(MONTH_FIELDS))
+        with self.assertRaises(KeyError):
+            compact.columns(["no_such_field"])
+
+    def test_role_decisions_are_recorded(self):
+        for preset in ALL_SCENARIOS.values():
+            result = simulate_with_feedback(self.stimulus, self.acme, preset, trace=True)
+            with self.subTest(policy=preset.policy):
+                roles = [r for m in result.trace.months for r in m.hc_decision["roles"]]
+                reduced = sum(r["reduced"] for r in roles)
+                self.assertEqual(reduced, result.total_hc_reduced)
+                for r in roles:
+                    self.assertEqual(r["hc_after"], r["hc_before"] - r["reduced"])
+
+    def test_pickles_for_worker_processes(self):
+        compact = pickle.loads(pickle.dumps(self.traced.compact_trace))
+        self.assertEqual(compact.to_trace().to_dict(), self.traced.trace.to_dict())
+
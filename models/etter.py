@@ -151,6 +151,26 @@ class FinancialSimulator(Base):
     user = relationship('User')
 
 
+class SimulationResultCache(Base):
+    """
+    Aggregated result of a seeded financial simulation, keyed by a hash of
+    everything that determines it (workloads, role groups, automation factor,
+    iterations, seed, kernel).
+    """
+    __tablename__ = 'etter_simulation_result_cache'
+    __table_args__ = {'schema': 'etter'}
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+    company = Column(String(200), nullable=True)
+    seed = Column(Integer, nullable=False)
+    n_iterations = Column(Integer, nullable=False)
+    kernel = Column(String(50), nullable=False)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_used_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class RoleAdjacency(Base):
     __tablename__ = 'etter_roleadjacency'
     __table_args__ = (
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 from pydantic import ConfigDict
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 from datetime import datetime
 
 
@@ -70,6 +70,9 @@ class UserWorkflowHistoryFilters(BaseModel):
     unread_flag: Optional[bool] = None
     page: int = 0
     limit: int = 30
+    # next_cursor of the previous response; when set, page is ignored
+    cursor: Optional[str] = None
+    count_mode: Literal["exact", "planner_estimate", "none"] = "exact"
 
 
 class ColumnFilter(BaseModel):
@@ -130,6 +133,7 @@ class SimulationRequest(BaseModel):
     automation_factor: float
     roles: list[EmployeeGroupProfile]
     company: Optional[str] = ""
+    seed: Optional[int] = None
 
 
 class RoleAdjacencyRequest(BaseModel):
@@ -316,13 +316,15 @@ class RoleTaxonomyBulkDeleteResponse(BaseModel):
 class RoleTaxonomyListResponse(BaseModel):
     """Response model for role taxonomy list."""
     data: List[RoleTaxonomyResponse]
-    total_count: int
+    total_count: Optional[int]
     pending_count: int
-    page: int = 1
+    page: Optional[int] = 1
     page_size: int = 50
-    total_pages: int = 1
+    total_pages: Optional[int] = 1
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class GroupedRoleTaxonomyListResponse(BaseModel):
@@ -435,13 +437,15 @@ class SkillTaxonomyBulkDeleteResponse(BaseModel):
 class SkillTaxonomyListResponse(BaseModel):
     """Response model for skill taxonomy list."""
     data: List[SkillTaxonomyResponse]
-    total_count: int
+    total_count: Optional[int]
     pending_count: int
-    page: int = 1
+    page: Optional[int] = 1
     page_size: int = 50
-    total_pages: int = 1
+    total_pages: Optional[int] = 1
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class GroupedSkillTaxonomyListResponse(BaseModel):
@@ -574,13 +578,15 @@ class TechStackTaxonomyBulkDeleteResponse(BaseModel):
 class TechStackTaxonomyListResponse(BaseModel):
     """Response model for tech stack taxonomy list."""
     data: List[TechStackTaxonomyResponse]
-    total_count: int
+    total_count: Optional[int]
     pending_count: int
-    page: int = 1
+    page: Optional[int] = 1
     page_size: int = 50
-    total_pages: int = 1
+    total_pages: Optional[int] = 1
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 # =============================================================================
@@ -0,0 +1,182 @@
+"""
+Autocomplete Benchmark
+
+Per-keystroke latency of autocomplete searches over a synthetic table of
+job titles (default one million rows), typing a few search terms one
+character at a time as the autocomplete inputs do.
+
+In-process comparison (always runs):
+- scan: what the legacy query makes Postgres do without an index, i.e. a
+  case-insensitive substring test on every row, then a sort by length;
+- index: services/autocomplete_index.AutocompleteIndex (prefix matches
+  first, then the other substring matches, each by length).
+
+Postgres comparison (--database-url): loads the same rows into a temporary
+table and times the legacy query (ILIKE '%term%' ORDER BY LENGTH) and the
+ranked two-phase query used by services/autocomplete_service, first
+without indexes and then with the pg_trgm GIN and lower() text_pattern_ops
+indexes the alembic migration creates. Requires the pg_trgm extension.
+
+Run from the repository root:
+    python scripts/autocomplete_benchmark.py [rows] [--database-url postgresql://...]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.autocomplete_index import AutocompleteIndex  # noqa: E402
+
+SEED = 0
+LIMIT = 10
+TYPED_TERMS = ["data engineer", "analyst", "nurse", "hr gen", "zq"]
+
+LEVELS = ["", "Junior ", "Senior ", "Lead ", "Principal ", "Staff ", "Associate ", "Chief "]
+AREAS = [
+    "Data", "Software", "Payroll", "HR", "Finance", "Marketing", "Sales", "Clinical", "Network",
+    "Supply Chain", "Customer Success", "Security", "Product", "Legal", "Facilities", "Research",
+]
+ROLES = [
+    "Engineer", "Analyst", "Manager", "Specialist", "Generalist", "Coordinator", "Architect",
+    "Scientist", "Consultant", "Administrator", "Nurse", "Designer", "Director", "Technician",
+]
+
+
+def synthetic_titles(rows: int) -> list:
+    rng = random.Random(SEED)
+    return [
+        f"{rng.choice(LEVELS)}{rng.choice(AREAS)} {rng.choice(ROLES)}"
+        f"{'' if rng.random() < 0.3 else ' ' + format(rng.randrange(16 ** 5), 'x')}"
+        for _ in range(rows)
+    ]
+
+
+def keystrokes(term: str) -> list:
+    return [term[:i] for i in range(1, len(term) + 1)]
+
+
+def scan_search(values: list, term: str, limit: int) -> list:
+    term = term.lower()
+    return sorted((v for v in values if term in v.lower()), key=len)[:limit]
+
+
+def timed(search, terms: list) -> list:
+    latencies = []
+    for term in terms:
+        t0 = time.perf_counter()
+        search(term)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"{name:<28} {statistics.median(latencies):>10.2f} {p95:>10.2f} {latencies[-1]:>10.2f}")
+
+
+def run_in_process(values: list, terms: list) -> None:
+    t0 = time.perf_counter()
+    index = AutocompleteIndex(values)
+    print(f"index build: {time.perf_counter() - t0:.1f}s for {len(index):,} distinct values")
+
+    # Sanity check: same ranks as a full scan ranked prefix-first
+    for term in terms:
+        lowered = term.lower()
+        expected = sorted(
+            {v for v in values if lowered in v.lower()},
+            key=lambda v: (not v.lower().startswith(lowered), len(v)),
+        )[:LIMIT]
+        got = index.search(term, LIMIT)
+        rank = lambda vs, lowered=lowered: [(not v.lower().startswith(lowered), len(v)) for v in vs]  # noqa: E731
+        if rank(got) != rank(expected):
+            raise SystemExit(f"index ranking differs from a full scan for {term!r}")
+
+    print(f"{'per keystroke (ms)':<28} {'p50':>10} {'p95':>10} {'max':>10}")
+    report("scan + sort by length", timed(lambda t: scan_search(values, t, LIMIT), terms))
+    report("in-process index", timed(lambda t: index.search(t, LIMIT), terms))
+
+
+def run_postgres(database_url: str, values: list, terms: list) -> None:
+    from sqlalchemy import create_engine, text
+
+    from services.autocomplete_service import MIN_TRIGRAM_TERM, _search_params
+
+    legacy = text(
+        "SELECT title FROM autocomplete_bench WHERE title ILIKE :contains "
+        "ORDER BY LENGTH(title) LIMIT :limit"
+    )
+    is_prefix = "LOWER(title) LIKE :prefix ESCAPE '\\'"
+    ranked = {
+        "all": text(
+            f"SELECT title FROM autocomplete_bench WHERE title ILIKE :contains ESCAPE '\\' "
+            f"ORDER BY ({is_prefix}) DESC, LENGTH(title) LIMIT :limit"
+        ),
+        "prefix": text(
+            f"SELECT title FROM autocomplete_bench WHERE {is_prefix} ORDER BY LENGTH(title) LIMIT :limit"
+        ),
+        "rest": text(
+            f"SELECT title FROM autocomplete_bench WHERE title ILIKE :contains ESCAPE '\\' "
+            f"AND NOT ({is_prefix}) ORDER BY LENGTH(title) LIMIT :limit"
+        ),
+    }
+
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text("CREATE TEMPORARY TABLE autocomplete_bench (id serial PRIMARY KEY, title text)"))
+        batch = 10000
+        for start in range(0, len(values), batch):
+            conn.execute(
+                text("INSERT INTO autocomplete_bench (title) VALUES (:title)"),
+                [{"title": v} for v in values[start:start + batch]],
+            )
+        conn.execute(text("ANALYZE autocomplete_bench"))
+
+        def legacy_search(term):
+            conn.execute(legacy, {**_search_params(term), "limit": LIMIT}).all()
+
+        def ranked_search(term):
+            params = {**_search_params(term), "limit": LIMIT}
+            if len(term) >= MIN_TRIGRAM_TERM:
+                conn.execute(ranked["all"], params).all()
+                return
+            found = conn.execute(ranked["prefix"], params).all()
+            if len(found) < LIMIT:
+                conn.execute(ranked["rest"], {**params, "limit": LIMIT - len(found)}).all()
+
+        print(f"{'postgres per keystroke (ms)':<28} {'p50':>10} {'p95':>10} {'max':>10}")
+        report("legacy, no index", timed(legacy_search, terms))
+        report("ranked, no index", timed(ranked_search, terms))
+
+        t0 = time.perf_counter()
+        conn.execute(text("CREATE INDEX ON autocomplete_bench USING gin (title gin_trgm_ops)"))
+        conn.execute(text("CREATE INDEX ON autocomplete_bench (lower(title) text_pattern_ops)"))
+        conn.execute(text("ANALYZE autocomplete_bench"))
+        print(f"index build: {time.perf_counter() - t0:.1f}s")
+        report("legacy, trigram indexes", timed(legacy_search, terms))
+        report("ranked, trigram indexes", timed(ranked_search, terms))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rows", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--database-url", help="Also time the SQL paths against this Postgres database")
+    args = parser.parse_args()
+
+    values = synthetic_titles(args.rows)
+    terms = [t for term in TYPED_TERMS for t in keystrokes(term)]
+    print(f"{args.rows:,} rows, {len(terms)} keystrokes over {TYPED_TERMS}, limit {LIMIT}")
+
+    run_in_process(values, terms)
+    if args.database_url:
+        run_postgres(args.database_url, values, terms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+S3 Multipart Upload Benchmark
+
+Uploads files of 100 MB to 2 GB to a local S3 stand-in (moto) and compares:
+
+- blocking: S3ManagementService.put_single called straight from a coroutine,
+  as the upload routes used to do;
+- streamed: AsyncS3Service.upload_stream (server-side multipart) with 1, 4
+  and 8 parts in flight, read from a starlette UploadFile.
+
+For each it reports throughput and the longest event-loop stall seen by a
+10 ms ticker running alongside the upload. moto answers from memory, so each
+request is delayed to model the network: a round trip (default 50 ms) plus
+its body at a per-connection bandwidth (default 50 MB/s). Pass 0 0 to
+measure moto alone. moto keeps every object in memory, so the 2 GB case
+needs a few GB of RAM. moto also runs in this process, so the stalls left on
+the streamed path are mostly moto assembling parts while holding the GIL
+(complete_multipart in particular), not work done on the event loop.
+
+Requires moto: pip install "moto[s3]"
+
+Run from the repository root:
+    python scripts/s3_multipart_upload_benchmark.py [latency_ms] [mb_per_second] [size_mb ...]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("ENV", "dev")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-2")
+os.environ.setdefault("S3_DOCUMENTS_BUCKET", "etter-upload-benchmark")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from moto import mock_aws  # noqa: E402
+from starlette.datastructures import UploadFile  # noqa: E402
+
+from api.s3.infra.s3.async_s3_service import AsyncS3Service, part_size_for  # noqa: E402
+from api.s3.infra.s3.s3_management_service import S3ManagementService  # noqa: E402
+
+MB = 1024 * 1024
+CONCURRENCY = [1, 4, 8]
+
+
+class LoopMonitor:
+    """Ticks every 10 ms and records the longest gap between ticks."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.max_stall = 0.0
+        self._task = None
+
+    async def _tick(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.max_stall = max(self.max_stall, time.perf_counter() - started - self.interval)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+
+async def blocking_upload(service: S3ManagementService, path: str, key: str) -> None:
+    with open(path, "rb") as fileobj:
+        service.put_single(key=key, fileobj=fileobj)
+
+
+async def streamed_upload(facade: AsyncS3Service, path: str, key: str, size: int, in_flight: int) -> None:
+    upload = await facade.create_multipart(key=key)
+    with open(path, "rb") as fileobj:
+        parts = await facade.upload_stream(
+            key=key,
+            upload_id=upload.upload_id,
+            stream=UploadFile(file=fileobj, size=size),
+            part_size=part_size_for(size),
+            max_in_flight=in_flight,
+        )
+    await facade.complete_multipart(
+        key=key,
+        upload_id=upload.upload_id,
+        parts=[{"PartNumber": part.part_number, "ETag": part.etag} for part in parts],
+    )
+
+
+async def measure(upload) -> tuple:
+    with LoopMonitor() as monitor:
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await upload
+        seconds = time.perf_counter() - started
+        await asyncio.sleep(0.02)
+    return seconds, monitor.max_stall
+
+
+def write_file(directory: str, size: int) -> str:
+    path = os.path.join(directory, f"upload-{size}.bin")
+    block = os.urandom(MB)
+    with open(path, "wb") as handle:
+        for _ in range(size // MB):
+            handle.write(block)
+    return path
+
+
+def network_delay(latency: float, bandwidth: float):
+    def delay(request, **_) -> None:
+        size = int(request.headers.get("Content-Length") or 0)
+        time.sleep(latency + (size / bandwidth if bandwidth else 0.0))
+    return delay
+
+
+async def run(latency: float, bandwidth: float, sizes_mb: list) -> None:
+    service = S3ManagementService()
+    service.client.create_bucket(
+        Bucket=service.bucket,
+        CreateBucketConfiguration={"LocationConstraint": service.client.meta.region_name},
+    )
+    service.client.meta.events.register("before-send.s3.*", network_delay(latency, bandwidth))
+    facade = AsyncS3Service(service)
+
+    print(f"round trip {latency * 1000:.0f} ms, {bandwidth / MB:.0f} MB/s per connection\n")
+    print(f"{'size MB':>8} {'mode':>14} {'seconds':>9} {'MB/s':>8} {'max loop stall ms':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in sizes_mb:
+            size = size_mb * MB
+            path = write_file(directory, size)
+            runs = [("blocking", lambda key, path=path: blocking_upload(service, path, key))]
+            runs += [
+                (
+                    f"streamed x{n}",
+                    lambda key, path=path, size=size, n=n: streamed_upload(facade, path, key, size, n),
+                )
+                for n in CONCURRENCY
+            ]
+            for mode, upload in runs:
+                key = f"bench/{size_mb}/{mode.replace(' ', '-')}"
+                seconds, stall = await measure(upload(key))
+                print(f"{size_mb:>8} {mode:>14} {seconds:>9.2f} {size_mb / seconds:>8.1f} {stall * 1000:>18.1f}")
+                service.client.delete_object(Bucket=service.bucket, Key=key)
+            os.remove(path)
+
+
+def main() -> None:
+    latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 50.0
+    mb_per_second = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+    sizes_mb = [int(size) for size in sys.argv[3:]] or [100, 500, 2048]
+    with mock_aws():
+        asyncio.run(run(latency_ms / 1000, mb_per_second * MB, sizes_mb))
+
+
+if __name__ == "__main__":
+    main()
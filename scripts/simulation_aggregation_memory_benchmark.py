@@ -0,0 +1,116 @@
+"""
+Simulation Aggregation Memory Benchmark
+
+Compares the peak memory of the two ways of turning a simulation's iterations
+into the ``simulation_steps`` / ``yearly_metrics`` payloads:
+
+- dataframe: every iteration in one vectorized run, one row per
+  (iteration, step), then ``transform_simulation_results``;
+- streaming: what the job runner does now, chunks of iterations produce
+  trajectories that are folded into a ``SimulationAggregator`` one iteration
+  at a time.
+
+Peak memory is measured with tracemalloc over simulation plus aggregation.
+The streaming peak should stay flat as the iteration count grows, and both
+paths should produce the same payloads.
+
+Run from the repository root:
+    python scripts/simulation_aggregation_memory_benchmark.py [headcount] [months] [iterations ...]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_models.simulation import (  # noqa: E402
+    EmployeeGroupProfile,
+    InMemoryRoleDataProvider,
+    SimulationAggregator,
+    run_vectorized_simulation,
+    run_vectorized_trajectories,
+    trajectory_metric_names,
+)
+from ml_models.simulation.role_lookup import DEFAULT_ROLES  # noqa: E402
+from services.simulation.job_service import VECTORIZED_CHUNK_ITERATIONS  # noqa: E402
+from services.simulation.simulation_service import transform_simulation_results  # noqa: E402
+
+AUTOMATION_FACTOR = 0.3
+SEED = 0
+
+
+def role_groups(headcount: int) -> list:
+    shares = {"Engineer": 0.6, "HR": 0.3, "Manager": 0.1}
+    salaries = {"Engineer": 1000.0, "HR": 800.0, "Manager": 2000.0}
+    return [
+        EmployeeGroupProfile(role=role, count=max(1, int(headcount * share)), salary=salaries[role])
+        for role, share in shares.items()
+    ]
+
+
+def dataframe_path(groups: list, provider, months: int, iterations: int):
+    simulation_data = run_vectorized_simulation(
+        groups, provider, "", AUTOMATION_FACTOR, months, iterations, seed=SEED
+    )
+    return transform_simulation_results(groups, simulation_data)
+
+
+def streaming_path(groups: list, provider, months: int, iterations: int):
+    names = trajectory_metric_names(groups)
+    aggregator = SimulationAggregator(groups, months + 1)
+    for start in range(0, iterations, VECTORIZED_CHUNK_ITERATIONS):
+        chunk = list(range(start, min(start + VECTORIZED_CHUNK_ITERATIONS, iterations)))
+        trajectories = run_vectorized_trajectories(
+            groups, provider, "", AUTOMATION_FACTOR, months, chunk, names, seed=SEED
+        )
+        for trajectory in trajectories:
+            aggregator.update(trajectory)
+    return aggregator.results(), aggregator.yearly_metrics()
+
+
+def measure(path, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    payloads = path(*args)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return payloads, seconds, peak / 2**20
+
+
+def max_relative_difference(expected: list, actual: list) -> float:
+    worst = 0.0
+    for expected_row, actual_row in zip(expected, actual):
+        for key, value in expected_row.items():
+            worst = max(worst, abs(actual_row[key] - value) / max(1.0, abs(value)))
+    return worst
+
+
+def main() -> None:
+    headcount = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 48
+    counts = [int(n) for n in sys.argv[3:]] or [100, 400, 1600]
+    groups = role_groups(headcount)
+    provider = InMemoryRoleDataProvider(DEFAULT_ROLES)
+
+    print(f"{headcount} employees x {months} months, chunks of {VECTORIZED_CHUNK_ITERATIONS}\n")
+    print(f"{'iterations':>10} {'dataframe MiB':>14} {'streaming MiB':>14} {'dataframe s':>12} {'streaming s':>12} {'max rel diff':>13}")
+    for iterations in counts:
+        (steps, yearly), frame_seconds, frame_peak = measure(dataframe_path, groups, provider, months, iterations)
+        (stream_steps, stream_yearly), stream_seconds, stream_peak = measure(
+            streaming_path, groups, provider, months, iterations
+        )
+        difference = max(
+            max_relative_difference(steps, stream_steps),
+            max_relative_difference(yearly, stream_yearly),
+        )
+        print(
+            f"{iterations:>10} {frame_peak:>14.1f} {stream_peak:>14.1f} "
+            f"{frame_seconds:>12.2f} {stream_seconds:>12.2f} {difference:>13.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
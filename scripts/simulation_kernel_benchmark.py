@@ -0,0 +1,75 @@
+"""
+Simulation Kernel Benchmark
+
+Runs the same financial simulation on the Mesa agent model and on the
+vectorized kernel (SimulationEngine(vectorized=True)) and reports the wall
+time of each, the speedup, and how closely the final-month distributions of
+the headline metrics agree: difference of means in standard errors and the
+two-sample Kolmogorov-Smirnov statistic.
+
+Run from the repository root:
+    python scripts/simulation_kernel_benchmark.py [headcount] [iterations] [months]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_models.simulation import EmployeeGroupProfile, SimulationEngine  # noqa: E402
+
+METRICS = ["total_employees", "avg_automation_rate", "avg_time_per_employee", "avg_unused_output_capacity"]
+AUTOMATION_FACTOR = 0.3
+
+
+def role_groups(headcount: int) -> list:
+    shares = {"Engineer": 0.6, "HR": 0.3, "Manager": 0.1}
+    salaries = {"Engineer": 1000.0, "HR": 800.0, "Manager": 2000.0}
+    return [
+        EmployeeGroupProfile(role=role, count=max(1, int(headcount * share)), salary=salaries[role])
+        for role, share in shares.items()
+    ]
+
+
+def ks_statistic(a: np.ndarray, b: np.ndarray) -> float:
+    values = np.sort(np.concatenate([a, b]))
+    cdf_a = np.searchsorted(np.sort(a), values, side="right") / len(a)
+    cdf_b = np.searchsorted(np.sort(b), values, side="right") / len(b)
+    return float(np.max(np.abs(cdf_a - cdf_b)))
+
+
+def run(vectorized: bool, groups: list, iterations: int, months: int):
+    engine = SimulationEngine(number_of_months=months, vectorized=vectorized)
+    started = time.perf_counter()
+    results = engine.run_multiple_simulations(
+        groups, automation_factor=AUTOMATION_FACTOR, n_simulations=iterations
+    )
+    return time.perf_counter() - started, results[results["Step"] == months]
+
+
+def main() -> None:
+    headcount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    months = int(sys.argv[3]) if len(sys.argv) > 3 else 48
+    groups = role_groups(headcount)
+
+    print(f"{headcount} employees x {months} months x {iterations} iterations\n")
+    mesa_seconds, mesa_final = run(False, groups, iterations, months)
+    vector_seconds, vector_final = run(True, groups, iterations, months)
+    print(f"mesa       : {mesa_seconds:8.2f}s")
+    print(f"vectorized : {vector_seconds:8.2f}s")
+    print(f"speedup    : {mesa_seconds / vector_seconds:8.1f}x\n")
+
+    print(f"{'metric':<28}{'mesa mean':>12}{'vector mean':>13}{'diff/se':>9}{'KS':>7}")
+    for name in METRICS:
+        a, b = mesa_final[name].to_numpy(float), vector_final[name].to_numpy(float)
+        standard_error = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b)) if len(a) > 1 else 0.0
+        z = abs(a.mean() - b.mean()) / standard_error if standard_error else 0.0
+        print(f"{name:<28}{a.mean():>12.4f}{b.mean():>13.4f}{z:>9.2f}{ks_statistic(a, b):>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Workflow Step History Benchmark
+
+Saves 50 versions of a realistic workflow (10 steps, each with a list of
+task responses; every version edits one step, as the step editor does) and
+compares the two step history storage modes:
+
+- full: every version copies the JSON of every step;
+- delta: steps are stored as diffs against a snapshot of the same step
+  (services/step_history), with a snapshot every SNAPSHOT_INTERVAL versions.
+
+Both modes run the same code as create_new_version_for_steps
+(next_version_step_data) against an in-memory row store. Bytes are the JSON
+text written per version (what the JSONB column stores, before TOAST
+compression); latencies are the Python save/load paths without database
+round trips, which are the same number of queries in both modes.
+
+Run from the repository root:
+    python scripts/step_history_benchmark.py [versions] [steps] [tasks_per_step]
+"""
+
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import step_history  # noqa: E402
+from services.etter import next_version_step_data  # noqa: E402
+
+HISTORY_ID = 1
+SEED = 0
+
+
+def workflow_steps(steps: int, tasks_per_step: int) -> list:
+    rng = random.Random(SEED)
+    return [
+        {
+            "step": f"step_{s}",
+            "versionId": 1,
+            "title": f"Step {s}: review workload and task breakdown",
+            "expectedResponse": [
+                {
+                    "task": f"Task {s}.{t}",
+                    "description": "Reconcile the weekly vendor invoices against purchase orders "
+                                   "and flag mismatches for the finance lead.",
+                    "automation_score": round(rng.random(), 3),
+                    "augmentation_score": round(rng.random(), 3),
+                    "time_share": round(rng.random() * 10, 2),
+                    "skills": ["reconciliation", "excel", "erp"],
+                    "editable": True,
+                }
+                for t in range(tasks_per_step)
+            ],
+            "data": {"ai_automation_score": round(rng.random() * 100, 1), "notes": "initial draft"},
+        }
+        for s in range(steps)
+    ]
+
+
+def edit(step_data: dict, rng: random.Random) -> dict:
+    """A user edit: change one task's scores and the step notes."""
+    edited = json.loads(json.dumps(step_data))
+    task = rng.randrange(len(edited["expectedResponse"]))
+    edited["expectedResponse"][task]["automation_score"] = round(rng.random(), 3)
+    edited["expectedResponse"][task]["editable"] = True
+    edited["data"]["notes"] = f"edited task {task}"
+    return edited
+
+
+def run(mode: str, versions: int, steps: int, tasks_per_step: int) -> dict:
+    step_history.STEP_HISTORY_MODE = mode
+    rng = random.Random(SEED)
+    rows = [
+        SimpleNamespace(
+            id=i, type="data", version_id=1, user_workflow_history_id=HISTORY_ID,
+            workflow_step_info_id=i + 1, workflow_step_status={}, data=data,
+        )
+        for i, data in enumerate(workflow_steps(steps, tasks_per_step))
+    ]
+    by_version = {1: list(rows)}
+    bytes_written = [sum(len(json.dumps(r.data)) for r in rows)]
+
+    def load(version: int) -> list:
+        version_rows = by_version[version]
+        wanted = {
+            (r.user_workflow_history_id, r.workflow_step_info_id, step_history.snapshot_version(r.data, r.version_id))
+            for r in version_rows if step_history.is_delta(r.data)
+        }
+        candidates = [r for v in {key[2] for key in wanted} for r in by_version[v]]
+        snapshots = step_history.collect_snapshots(wanted, candidates)
+        return step_history.resolve_rows(version_rows, snapshots), snapshots
+
+    save_ms = []
+    for version in range(2, versions + 1):
+        t0 = time.perf_counter()
+        previous, snapshots = load(version - 1)
+        target = rng.randrange(steps)
+        new_data = edit(previous[target], rng)
+        stored = next_version_step_data(by_version[version - 1], snapshots, target + 1, new_data, version)
+        new_rows = [
+            SimpleNamespace(
+                id=len(rows) + i, type="data", version_id=version, user_workflow_history_id=HISTORY_ID,
+                workflow_step_info_id=step.workflow_step_info_id, workflow_step_status={}, data=data,
+            )
+            for i, (step, data) in enumerate(stored)
+        ]
+        save_ms.append((time.perf_counter() - t0) * 1000)
+        rows.extend(new_rows)
+        by_version[version] = new_rows
+        bytes_written.append(sum(len(json.dumps(r.data)) for r in new_rows))
+
+    load_ms = []
+    loaded = {}
+    for version in range(1, versions + 1):
+        t0 = time.perf_counter()
+        loaded[version], _ = load(version)
+        load_ms.append((time.perf_counter() - t0) * 1000)
+
+    return {
+        "bytes_total": sum(bytes_written),
+        "bytes_per_version": statistics.mean(bytes_written[1:]) if versions > 1 else bytes_written[0],
+        "save_ms_p50": statistics.median(save_ms) if save_ms else 0.0,
+        "save_ms_max": max(save_ms) if save_ms else 0.0,
+        "load_ms_p50": statistics.median(load_ms),
+        "load_ms_max": max(load_ms),
+        "loaded": loaded,
+    }
+
+
+def main():
+    versions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    tasks_per_step = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    full = run("full", versions, steps, tasks_per_step)
+    delta = run("delta", versions, steps, tasks_per_step)
+    if full["loaded"] != delta["loaded"]:
+        raise SystemExit("delta mode reconstructed different step data than full mode")
+
+    print(f"{versions} versions x {steps} steps x {tasks_per_step} tasks, "
+          f"snapshot interval {step_history.SNAPSHOT_INTERVAL}")
+    print(f"{'mode':<6} {'bytes total':>12} {'bytes/version':>14} {'save p50 ms':>12} "
+          f"{'save max ms':>12} {'load p50 ms':>12} {'load max ms':>12}")
+    for mode, r in (("full", full), ("delta", delta)):
+        print(f"{mode:<6} {r['bytes_total']:>12,} {r['bytes_per_version']:>14,.0f} {r['save_ms_p50']:>12.2f} "
+              f"{r['save_ms_max']:>12.2f} {r['load_ms_p50']:>12.2f} {r['load_ms_max']:>12.2f}")
+    print(f"delta writes {delta['bytes_total'] / full['bytes_total']:.1%} of the full-copy bytes; "
+          f"every version reconstructs identically")
+
+
+if __name__ == "__main__":
+    main()
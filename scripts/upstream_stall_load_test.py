@@ -0,0 +1,114 @@
+"""
+Upstream Stall Load Test
+
+Shows that the shared async upstream client keeps the event loop responsive
+while an upstream stalls. A local HTTP stand-in holds every request for
+STALL_SECONDS; CONCURRENCY proxied calls are fired at it from one event loop
+while a heartbeat task measures how late the loop wakes up.
+
+Two modes are compared:
+  blocking - requests.post from inside coroutines (the previous proxy code)
+  async    - services.upstream_client over a pooled httpx.AsyncClient
+
+Run from the repository root:
+    python scripts/upstream_stall_load_test.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.upstream_client import UpstreamClient  # noqa: E402
+
+STALL_SECONDS = 1.0
+CONCURRENCY = 20
+HEARTBEAT_INTERVAL = 0.01
+HOST = "127.0.0.1"
+PORT = 8765
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while (await reader.readline()) not in (b"\r\n", b""):
+        pass
+    await asyncio.sleep(STALL_SECONDS)
+    body = b'{"status": "ok"}'
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    writer.close()
+
+
+def start_stalling_upstream() -> None:
+    """Serve the stand-in on its own loop so a blocked client loop cannot stall it."""
+    ready = threading.Event()
+
+    def run() -> None:
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(_handle, HOST, PORT))
+        ready.set()
+        loop.run_until_complete(server.serve_forever())
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+
+
+async def heartbeat(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - started - HEARTBEAT_INTERVAL)
+
+
+async def run_mode(mode: str) -> dict:
+    url = f"http://{HOST}:{PORT}/query"
+    client = UpstreamClient()
+    lags: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+
+    async def call() -> None:
+        if mode == "blocking":
+            requests.post(url, json={}, timeout=30)
+        else:
+            await client.request("POST", url, json={})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+    await client.aclose()
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "wall_seconds": round(elapsed, 2),
+        "heartbeat_p50_ms": round(lags[len(lags) // 2] * 1000, 1) if lags else None,
+        "heartbeat_max_ms": round(lags[-1] * 1000, 1) if lags else None,
+        "heartbeats": len(lags),
+    }
+
+
+def main() -> None:
+    start_stalling_upstream()
+    print(f"{CONCURRENCY} concurrent calls, upstream stalls {STALL_SECONDS}s per request\n")
+    for mode in ("blocking", "async"):
+        result = asyncio.run(run_mode(mode))
+        print(
+            f"{result['mode']:>8}: wall={result['wall_seconds']}s "
+            f"heartbeats={result['heartbeats']} "
+            f"loop lag p50={result['heartbeat_p50_ms']}ms max={result['heartbeat_max_ms']}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
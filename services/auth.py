@@ -5,9 +5,9 @@ from models.auth import User
 import bcrypt
 from sqlalchemy.orm import Session
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from constants.auth import DRAUP_API, CLIENT_ID, CLIENT_SECRET, TEMP_AUTH_TOKEN, ENV
-from services.redis_store import get_redis_qa_login_client, get_cache_data
-import json
+from constants.auth import DRAUP_API, CLIENT_ID, CLIENT_SECRET, TEMP_AUTH_TOKEN
+from services.token_cache import token_cache, auth_metrics, SOURCE_REMOTE
+from services.upstream_client import get_upstream_client, UPSTREAM_AUTH
 # from api.user_management import generate_random_password
 # import jwt as PyJWT
 # from datetime import datetime, timedelta, UTC
@@ -26,7 +26,9 @@ from jwt import PyJWTError
 from typing import Optional
 
 import requests
+import time
 from typing import Dict, Any
+from starlette.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import os
 import random
@@ -97,56 +99,93 @@ from fastapi import Request
 
 security = HTTPBearer()
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> ResponseModel:
-    credentials_exception = HTTPException(
+AUTH_TIMEOUT_SECONDS = 30
+
+
+def _user_details_request(token: str) -> Dict[str, Any]:
+    return {
+        "url": f"{DRAUP_API}/service/client/user/authenticate/",
+        "headers": {
+            "Authorization": "Bearer " + token,
+            "product-id": "5",
+            "Content-Type": "application/json",
+        },
+        "json": {"client_id": CLIENT_ID, "client_secret": CLIENT_SECRET},
+    }
+
+
+def _cached_verification(token: str, started: float, include_redis: bool = True) -> Optional[ResponseModel]:
+    cached = token_cache.lookup(token, include_redis=include_redis)
+    if cached is None:
+        return None
+    source, user_data = cached
+    auth_metrics.observe(source, started)
+    if user_data is None:
+        raise _credentials_exception()
+    return ResponseModel(data=user_data)
+
+
+def _verified_response(token: str, status_code: int, user_data: Any, started: float) -> ResponseModel:
+    logger.info(f"Response from draup api: {status_code}")
+    auth_metrics.observe(SOURCE_REMOTE, started)
+    if status_code == 200:
+        token_cache.store(token, user_data)
+        return ResponseModel(data=user_data)
+
+    logger.info(f"Error occurred while fetching user details from draup api")
+    if status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN):
+        token_cache.store_rejected(token)
+    raise _credentials_exception()
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or expired token",
     )
-    response = ResponseModel()
+
+
+def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> ResponseModel:
+    started = time.perf_counter()
     token = credentials.credentials
-    user_details_api = f"{DRAUP_API}/service/client/user/authenticate/"
-    
-    if ENV == "qa":
-        try:
-            redis_client = get_redis_qa_login_client()
-            cached_data = get_cache_data(redis_client, token)
-            
-            if cached_data:
-                logger.info(f"Cache hit for token in QA environment")
-                response.data = cached_data
-                return response
-            else:
-                logger.info(f"Cache miss for token in QA environment, making API call")
-        except Exception as redis_error:
-            logger.warning(f"Redis error in verify_token, falling back to API call: {str(redis_error)}")
-    
-    headers = {
-        "Authorization": "Bearer " + token,
-        "product-id": "5",
-        "Content-Type": "application/json",
-    }
-    logger.info(f"Hitting draup api to get user details: {user_details_api}")
-    payload = {"client_id": CLIENT_ID, "client_secret": CLIENT_SECRET}
-    user_response = requests.post(user_details_api, headers=headers, json=payload)
-    logger.info(f"Response from draup api: {user_response.status_code}")
-    logger.info(f"Response content from draup api: {user_response.content}")
-    
-    if user_response.status_code == 200:
-        user_data = user_response.json()
-        response.data = user_data
-        
-        if ENV == "qa":
-            try:
-                redis_client = get_redis_qa_login_client()
-                redis_client.set(token, json.dumps(user_data))
-                logger.info(f"Cached user response for token in QA environment")
-            except Exception as cache_error:
-                logger.warning(f"Failed to cache user response: {str(cache_error)}")
-    else:
-        logger.info(f"Error occurred while fetching user details from draup api")
-        raise credentials_exception
-
-    return response
+    cached = _cached_verification(token, started)
+    if cached is not None:
+        return cached
+
+    request_kwargs = _user_details_request(token)
+    logger.info(f"Hitting draup api to get user details: {request_kwargs['url']}")
+    user_response = requests.post(timeout=AUTH_TIMEOUT_SECONDS, **request_kwargs)
+    user_data = user_response.json() if user_response.status_code == 200 else None
+    return _verified_response(token, user_response.status_code, user_data, started)
+
+
+async def verify_token_async(credentials: HTTPAuthorizationCredentials = Security(security)) -> ResponseModel:
+    """
+    Same contract as ``verify_token`` for async routes: cache hits are served
+    without leaving the event loop and misses use a non-blocking HTTP call.
+    """
+    started = time.perf_counter()
+    token = credentials.credentials
+    cached = _cached_verification(token, started, include_redis=False)
+    if cached is None:
+        cached = await run_in_threadpool(_cached_verification, token, started)
+    if cached is not None:
+        return cached
+
+    request_kwargs = _user_details_request(token)
+    logger.info(f"Hitting draup api to get user details: {request_kwargs['url']}")
+    user_response = await get_upstream_client().request("POST", upstream=UPSTREAM_AUTH, **request_kwargs)
+    user_data = user_response.json() if user_response.status_code == 200 else None
+    return _verified_response(token, user_response.status_code, user_data, started)
+
+
+def revoke_user_tokens(email: str) -> None:
+    """Drop cached verifications for a user so their next request is re-verified."""
+    token_cache.revoke_user(email)
+
+
+def get_auth_metrics() -> Dict[str, Any]:
+    return {**auth_metrics.snapshot(), "cached_tokens": len(token_cache)}
 
 
 def create_jwt_token(
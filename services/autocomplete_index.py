@@ -0,0 +1,200 @@
+"""
+In-process autocomplete index
+
+Optional alternative to the Postgres path for large AUTOCOMPLETE_REGISTRY
+entries (AUTOCOMPLETE_MEMORY_INDEX=true). Each entry's distinct values
+(per company for company-filtered entries) are loaded once into an
+``AutocompleteIndex`` and answered from memory:
+
+- values are numbered in (length, value) order, so "shortest first" is
+  just "smallest id first";
+- prefix matches come from a bisect over the lower-cased values;
+- substring matches walk the posting list of the term's rarest trigram in
+  id order and stop at ``limit``; terms under three characters walk all
+  ids in the same order.
+
+Ranking matches the SQL path: prefix matches first, then other substring
+matches, each by length.
+
+The ``AutocompleteIndexManager`` loads indexes in a background thread on
+first use (callers fall back to SQL until the index is ready) and reloads
+them every AUTOCOMPLETE_INDEX_REFRESH_SECONDS, serving the previous index
+while a reload runs.
+"""
+
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from typing import Callable, Dict, Final, Hashable, Iterable, List, Optional
+
+from common.logger import logger
+
+AUTOCOMPLETE_MEMORY_INDEX: Final[bool] = environ.get("AUTOCOMPLETE_MEMORY_INDEX", "false").lower() == "true"
+AUTOCOMPLETE_INDEX_REFRESH_SECONDS: Final[int] = int(environ.get("AUTOCOMPLETE_INDEX_REFRESH_SECONDS", 900))
+AUTOCOMPLETE_INDEX_MAX_INDEXES: Final[int] = int(environ.get("AUTOCOMPLETE_INDEX_MAX_INDEXES", 64))
+
+NGRAM: Final[int] = 3
+_MAX_CHAR: Final[str] = "\U0010ffff"
+
+
+class AutocompleteIndex:
+    """Prefix + trigram index over a fixed set of strings."""
+
+    def __init__(self, values: Iterable[str]):
+        self.values: List[str] = sorted({v for v in values if v}, key=lambda v: (len(v), v))
+        self._lowered = [v.lower() for v in self.values]
+        self._by_text = array("i", sorted(range(len(self.values)), key=self._lowered.__getitem__))
+        self._sorted_text = [self._lowered[i] for i in self._by_text]
+        postings: Dict[str, array] = defaultdict(lambda: array("i"))
+        for i, text in enumerate(self._lowered):
+            for gram in {text[j:j + NGRAM] for j in range(len(text) - NGRAM + 1)}:
+                postings[gram].append(i)
+        self._postings = dict(postings)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def search(self, search_string: Optional[str], limit: int) -> List[str]:
+        """Values containing search_string (case-insensitive): prefix matches first, then by length."""
+        if limit <= 0:
+            return []
+        term = (search_string or "").lower()
+        if not term:
+            return self.values[:limit]
+
+        prefix_ids = self._prefix_ids(term, limit)
+        if len(prefix_ids) >= limit:
+            return [self.values[i] for i in prefix_ids]
+
+        found = list(prefix_ids)
+        seen = set(prefix_ids)
+        for i in self._substring_candidates(term):
+            if i not in seen and term in self._lowered[i]:
+                found.append(i)
+                if len(found) >= limit:
+                    break
+        return [self.values[i] for i in found]
+
+    def _prefix_ids(self, term: str, limit: int) -> List[int]:
+        lo = bisect_left(self._sorted_text, term)
+        hi = bisect_left(self._sorted_text, term + _MAX_CHAR, lo)
+        return heapq.nsmallest(limit, self._by_text[lo:hi])
+
+    def _substring_candidates(self, term: str) -> Iterable[int]:
+        """Ids that may contain term, in id (length) order."""
+        if len(term) < NGRAM:
+            return range(len(self.values))
+        grams = {term[j:j + NGRAM] for j in range(len(term) - NGRAM + 1)}
+        postings = [self._postings.get(gram) for gram in grams]
+        if any(p is None for p in postings):
+            return ()
+        return min(postings, key=len)
+
+
+class AutocompleteIndexManager:
+    """
+    Keeps one AutocompleteIndex per key, loading and refreshing them off the request path.
+
+    Args:
+        loader: Returns the values to index for a key.
+        refresh_seconds: Age after which an index is reloaded.
+        max_indexes: Indexes kept; the least recently used is dropped beyond that.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Hashable], Iterable[str]],
+        refresh_seconds: int = AUTOCOMPLETE_INDEX_REFRESH_SECONDS,
+        max_indexes: int = AUTOCOMPLETE_INDEX_MAX_INDEXES,
+    ):
+        self.loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.max_indexes = max_indexes
+        self._indexes: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._loading: set = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autocomplete-index")
+        self._stop = threading.Event()
+        self._scheduler: Optional[threading.Thread] = None
+
+    def get(self, key: Hashable) -> Optional[AutocompleteIndex]:
+        """The index for key, or None while its first load runs (the load is started here)."""
+        with self._lock:
+            entry = self._indexes.get(key)
+            if entry is not None:
+                self._indexes.move_to_end(key)
+        if entry is None:
+            self._schedule(key)
+            return None
+        return entry[1]
+
+    def refresh_due(self) -> None:
+        """Reload every index older than refresh_seconds."""
+        now = time.monotonic()
+        with self._lock:
+            due = [key for key, (loaded_at, _) in self._indexes.items() if now - loaded_at >= self.refresh_seconds]
+        for key in due:
+            self._schedule(key)
+
+    def start(self) -> None:
+        if self._scheduler is not None:
+            return
+        self._stop.clear()
+        self._scheduler = threading.Thread(target=self._run_scheduler, name="autocomplete-index-refresh", daemon=True)
+        self._scheduler.start()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "indexes": {
+                    str(key): {"values": len(index), "age_seconds": round(now - loaded_at, 1)}
+                    for key, (loaded_at, index) in self._indexes.items()
+                },
+                "loading": [str(key) for key in self._loading],
+            }
+
+    def _run_scheduler(self) -> None:
+        interval = max(1, min(self.refresh_seconds, 60))
+        while not self._stop.wait(interval):
+            self.refresh_due()
+
+    def _schedule(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._loading:
+                return
+            self._loading.add(key)
+        try:
+            self._executor.submit(self._load, key)
+        except RuntimeError:
+            # Executor shut down
+            with self._lock:
+                self._loading.discard(key)
+
+    def _load(self, key: Hashable) -> None:
+        started = time.perf_counter()
+        try:
+            index = AutocompleteIndex(self.loader(key))
+        except Exception as e:
+            logger.error(f"Failed to load autocomplete index {key}: {e}")
+            return
+        finally:
+            with self._lock:
+                self._loading.discard(key)
+        with self._lock:
+            self._indexes[key] = (time.monotonic(), index)
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        logger.info(
+            f"Loaded autocomplete index {key}: {len(index)} values in {time.perf_counter() - started:.2f}s"
+        )
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func, or_
-from typing import List, Dict, Any, Optional
+from sqlalchemy import text, func, literal, or_
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from models.extraction import (
     RoleTaxonomy,
@@ -17,6 +17,8 @@ from models.etter import (
     FunctionWorkflow,
     SampleData,
 )
+from services.autocomplete_index import AUTOCOMPLETE_MEMORY_INDEX, AutocompleteIndexManager
+from settings.database import SessionLocal
 
 DEFAULT_LIMIT = 10
 
@@ -31,6 +33,7 @@ AUTOCOMPLETE_REGISTRY: Dict[str, Dict[str, Any]] = {
         "column": "job_title",
         "company_filter_column": "company_id",
         "default_limit": DEFAULT_LIMIT,
+        "memory_index": True,
     },
     "management_level": {
         "style": MASTER_JOIN,
@@ -99,16 +102,76 @@ AUTOCOMPLETE_REGISTRY: Dict[str, Dict[str, Any]] = {
         "table": "ace.machine_learning_jobrole",
         "column": "job_role",
         "default_limit": DEFAULT_LIMIT,
+        "memory_index": True,
     },
     "company": {
         "style": RAW,
         "table": "iris1.iris1_mastercompany",
         "column": "company_name",
         "default_limit": DEFAULT_LIMIT,
+        "memory_index": True,
     },
 }
 
 
+# ──────────────────────────────────────────────────────────────
+# Matching and ranking
+#
+# Every registry search is a case-insensitive substring match ranked by
+# prefix match first, then length. The alembic migration
+# "add autocomplete trigram indexes" gives each registry column a pg_trgm
+# GIN index (substring ILIKE, 3+ characters) and a lower(col)
+# text_pattern_ops index (prefix LIKE). Terms shorter than a trigram cannot
+# use the GIN index, so they are answered in two phases: prefix matches
+# through the btree index, then the remaining substring matches only if
+# the prefix phase did not fill the limit.
+# ──────────────────────────────────────────────────────────────
+
+MIN_TRIGRAM_TERM = 3
+
+ALL = "all"          # substring matches, prefix matches ranked first
+PREFIX = "prefix"    # prefix matches only
+REST = "rest"        # substring matches that are not prefix matches
+
+
+def _escape_like(search_string: str) -> str:
+    return search_string.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_params(search_string: str) -> Dict[str, str]:
+    escaped = _escape_like(search_string)
+    return {"contains": f"%{escaped}%", "prefix": f"{escaped.lower()}%"}
+
+
+def _match_filters(col, search_string: Optional[str], phase: str) -> list:
+    if not search_string:
+        return []
+    params = _search_params(search_string)
+    is_prefix = func.lower(col).like(params["prefix"], escape="\\")
+    if phase == PREFIX:
+        return [is_prefix]
+    contains = col.ilike(params["contains"], escape="\\")
+    if phase == REST:
+        return [contains, ~is_prefix]
+    return [contains]
+
+
+def _prefix_rank(col, search_string: Optional[str]):
+    if not search_string:
+        return literal(False)
+    return func.lower(col).like(_search_params(search_string)["prefix"], escape="\\")
+
+
+def _ranked(run: Callable[[str, int], List[Any]], search_string: Optional[str], limit: int) -> List[Any]:
+    """Run a search as one ranked query, or prefix-then-rest for short terms."""
+    if not search_string or len(search_string) >= MIN_TRIGRAM_TERM:
+        return run(ALL, limit)
+    found = run(PREFIX, limit)
+    if len(found) < limit:
+        found += run(REST, limit - len(found))
+    return found
+
+
 def _run_direct(
     db: Session,
     config: Dict[str, Any],
@@ -121,18 +184,25 @@ def _run_direct(
     company_col = config.get("company_filter_column")
     response_key = config.get("response_key")
     col = getattr(model, col_name)
-    subq = db.query(col.label("val"), func.length(col).label("_len"))
-    if getattr(model, "job_title", None) is not None and col_name == "job_title":
-        subq = subq.filter(col.isnot(None))
-    if company_id and company_col:
-        subq = subq.filter(getattr(model, company_col) == company_id)
-    if search_string:
-        subq = subq.filter(col.ilike(f"%{search_string}%"))
-    subq = subq.distinct().subquery()
-    results = (
-        db.query(subq.c.val).order_by(subq.c._len).limit(limit).all()
-    )
-    values = [row[0] for row in results]
+
+    def run(phase: str, phase_limit: int) -> List[Any]:
+        subq = db.query(
+            col.label("val"),
+            func.length(col).label("_len"),
+            _prefix_rank(col, search_string).label("_prefix"),
+        )
+        if getattr(model, "job_title", None) is not None and col_name == "job_title":
+            subq = subq.filter(col.isnot(None))
+        if company_id and company_col:
+            subq = subq.filter(getattr(model, company_col) == company_id)
+        subq = subq.filter(*_match_filters(col, search_string, phase))
+        subq = subq.distinct().subquery()
+        results = (
+            db.query(subq.c.val).order_by(subq.c._prefix.desc(), subq.c._len).limit(phase_limit).all()
+        )
+        return [row[0] for row in results]
+
+    values = _ranked(run, search_string, limit)
     if response_key:
         return [{response_key: v} for v in values]
     return values
@@ -151,22 +221,24 @@ def _run_master_join(
     join_fk_attr = config["join_fk_attr"]
     company_attr = config["company_filter_attr"]
     col = getattr(model, col_name)
-    subquery = db.query(col).distinct()
-    if company_id:
-        subquery = subquery.join(
-            join_model,
-            getattr(join_model, join_fk_attr) == model.id,
-        ).filter(getattr(join_model, company_attr) == company_id)
-    if search_string:
-        subquery = subquery.filter(col.ilike(f"%{search_string}%"))
-    query = (
-        db.query(col)
-        .filter(col.in_(subquery))
-        .order_by(func.length(col))
-        .limit(limit)
-    )
-    results = query.all()
-    return [row[0] for row in results]
+
+    def run(phase: str, phase_limit: int) -> List[Any]:
+        subquery = db.query(col).distinct()
+        if company_id:
+            subquery = subquery.join(
+                join_model,
+                getattr(join_model, join_fk_attr) == model.id,
+            ).filter(getattr(join_model, company_attr) == company_id)
+        subquery = subquery.filter(*_match_filters(col, search_string, phase))
+        query = (
+            db.query(col)
+            .filter(col.in_(subquery))
+            .order_by(_prefix_rank(col, search_string).desc(), func.length(col))
+            .limit(phase_limit)
+        )
+        return [row[0] for row in query.all()]
+
+    return _ranked(run, search_string, limit)
 
 
 def _run_raw(
@@ -177,27 +249,107 @@ def _run_raw(
 ) -> List[Any]:
     table_name = config["table"]
     column_name = config["column"]
-    if search_string:
-        q = f"""
-        SELECT {column_name}
-        FROM {table_name}
-        WHERE {column_name} ILIKE :search_value
-        ORDER BY LENGTH({column_name}) ASC
-        LIMIT :limit
-        """
-        result = db.execute(
-            text(q),
-            {"search_value": f"%{search_string}%", "limit": limit},
-        )
-    else:
+
+    def run(phase: str, phase_limit: int) -> List[Any]:
+        params: Dict[str, Any] = {"limit": phase_limit}
+        conditions = []
+        order_by = f"LENGTH({column_name}) ASC"
+        if search_string:
+            params.update(_search_params(search_string))
+            is_prefix = f"LOWER({column_name}) LIKE :prefix ESCAPE '\\'"
+            if phase == PREFIX:
+                conditions.append(is_prefix)
+            else:
+                conditions.append(f"{column_name} ILIKE :contains ESCAPE '\\'")
+                if phase == REST:
+                    conditions.append(f"NOT ({is_prefix})")
+            order_by = f"({is_prefix}) DESC, {order_by}"
         q = f"""
         SELECT {column_name}
         FROM {table_name}
-        ORDER BY LENGTH({column_name}) ASC
+        {("WHERE " + " AND ".join(conditions)) if conditions else ""}
+        ORDER BY {order_by}
         LIMIT :limit
         """
-        result = db.execute(text(q), {"limit": limit})
-    return [dict(row._mapping) for row in result]
+        result = db.execute(text(q), params)
+        return [dict(row._mapping) for row in result]
+
+    return _ranked(run, search_string, limit)
+
+
+# ──────────────────────────────────────────────────────────────
+# In-process index (AUTOCOMPLETE_MEMORY_INDEX, entries with "memory_index")
+# ──────────────────────────────────────────────────────────────
+
+
+def _index_key(search_type: str, company_id: Optional[int]) -> Tuple[str, Optional[int]]:
+    config = AUTOCOMPLETE_REGISTRY[search_type]
+    company_filtered = config.get("company_filter_column") or config["style"] == MASTER_JOIN
+    return search_type, company_id if company_filtered else None
+
+
+def _load_index_values(key: Tuple[str, Optional[int]]) -> List[str]:
+    """Distinct values of a registry entry (for one company if company-filtered)."""
+    search_type, company_id = key
+    config = AUTOCOMPLETE_REGISTRY[search_type]
+    db = SessionLocal()
+    try:
+        if config["style"] == RAW:
+            q = f"SELECT DISTINCT {config['column']} FROM {config['table']} WHERE {config['column']} IS NOT NULL"
+            return [row[0] for row in db.execute(text(q))]
+        col = getattr(config["model"], config["column"])
+        query = db.query(col).filter(col.isnot(None)).distinct()
+        if config["style"] == DIRECT and company_id and config.get("company_filter_column"):
+            query = query.filter(getattr(config["model"], config["company_filter_column"]) == company_id)
+        if config["style"] == MASTER_JOIN and company_id:
+            join_model = config["join_model"]
+            query = query.join(
+                join_model, getattr(join_model, config["join_fk_attr"]) == config["model"].id,
+            ).filter(getattr(join_model, config["company_filter_attr"]) == company_id)
+        return [row[0] for row in query.all()]
+    finally:
+        db.close()
+
+
+_index_manager: Optional[AutocompleteIndexManager] = None
+
+
+def get_autocomplete_index_manager() -> AutocompleteIndexManager:
+    """
+    Getting the process-wide autocomplete index manager
+    """
+    global _index_manager
+    if _index_manager is None:
+        _index_manager = AutocompleteIndexManager(_load_index_values)
+    return _index_manager
+
+
+def warm_autocomplete_indexes() -> None:
+    """Start the index refresher and load the organization-wide index of every memory_index entry."""
+    manager = get_autocomplete_index_manager()
+    manager.start()
+    for search_type, config in AUTOCOMPLETE_REGISTRY.items():
+        if config.get("memory_index"):
+            manager.get(_index_key(search_type, None))
+
+
+def _search_memory_index(
+    search_type: str,
+    config: Dict[str, Any],
+    search_string: Optional[str],
+    company_id: Optional[int],
+    limit: int,
+) -> Optional[List[Any]]:
+    """Results from the in-process index in the entry's response shape, or None if it is not ready."""
+    index = get_autocomplete_index_manager().get(_index_key(search_type, company_id))
+    if index is None:
+        return None
+    values = index.search(search_string, limit)
+    if config["style"] == RAW:
+        return [{config["column"]: v} for v in values]
+    if config.get("response_key"):
+        return [{config["response_key"]: v} for v in values]
+    return values
 
 
 def _sample_data_roles(
@@ -331,6 +483,11 @@ def fetch_autocomplete_data(
     if limit is not None:
         effective_limit = limit
 
+    if AUTOCOMPLETE_MEMORY_INDEX and config.get("memory_index"):
+        results = _search_memory_index(search_type, config, search_string, company_id, effective_limit)
+        if results is not None:
+            return results
+
     if config["style"] == DIRECT:
         return _run_direct(
             db, config, search_string, company_id, effective_limit
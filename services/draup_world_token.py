@@ -0,0 +1,292 @@
+"""
+Draup World service token manager
+
+Caches the service-account token used for Draup World API calls so that
+proxied requests no longer log in on every call. Tokens are kept in process
+memory with an optional Redis tier shared across workers, refreshed ahead of
+expiry by a single caller, and invalidated when the upstream answers 401.
+"""
+
+import json
+import threading
+import time
+from os import environ
+from typing import Any, Dict, Final, Optional, Tuple
+
+import httpx
+import jwt
+import requests
+from starlette.concurrency import run_in_threadpool
+
+from common.logger import logger
+from constants.etter import DRAUP_WORLD_USERNAME, DRAUP_WORLD_PASSWORD
+from services.redis_store import get_redis_client
+from services.upstream_client import get_upstream_client, UPSTREAM_DRAUP_WORLD
+
+TOKEN_TTL_SECONDS: Final[int] = int(environ.get("DRAUP_WORLD_TOKEN_TTL_SECONDS", 3600))
+TOKEN_REFRESH_MARGIN_SECONDS: Final[int] = int(
+    environ.get("DRAUP_WORLD_TOKEN_REFRESH_MARGIN_SECONDS", 300)
+)
+TOKEN_REDIS_ENABLED: Final[bool] = (
+    environ.get("DRAUP_WORLD_TOKEN_REDIS_ENABLED", "true").lower() == "true"
+)
+LOGIN_TIMEOUT_SECONDS: Final[int] = 30
+REDIS_RETRY_SECONDS: Final[int] = 60
+REDIS_KEY_PREFIX: Final[str] = "draup_world:service_token"
+
+
+def _token_expiry(token: str, issued_at: float) -> float:
+    """
+    Expiry of a token as a unix timestamp. JWTs carry their own ``exp``;
+    opaque tokens fall back to the configured TTL.
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        if claims.get("exp"):
+            return float(claims["exp"])
+    except jwt.PyJWTError:
+        pass
+    return issued_at + TOKEN_TTL_SECONDS
+
+
+class DraupWorldTokenManager:
+    """
+    Process-wide cache for the Draup World service token of one base URL.
+
+    ``get_token`` is safe to call from many threads at once: only one caller
+    logs in when the token is missing or expired, the rest wait for its result.
+    Inside the refresh margin the current token keeps being served while a
+    single caller refreshes it.
+    """
+
+    def __init__(self, base_url: str, use_redis: bool = TOKEN_REDIS_ENABLED):
+        self.base_url = base_url
+        self.use_redis = use_redis
+        self._token: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._lock = threading.Lock()
+        self._redis_retry_at: float = 0.0
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "redis_hits": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def redis_key(self) -> str:
+        return f"{REDIS_KEY_PREFIX}:{self.base_url}"
+
+    def get_token(self) -> Optional[str]:
+        now = time.time()
+        token, expires_at = self._token, self._expires_at
+        if token and now < expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+            self._stats["hits"] += 1
+            return token
+
+        if token and now < expires_at:
+            # Still valid but close to expiry: one caller refreshes, the others
+            # keep using the current token instead of queueing on the login.
+            self._stats["hits"] += 1
+            if self._lock.acquire(blocking=False):
+                try:
+                    if self._token == token:
+                        self._refresh()
+                finally:
+                    self._lock.release()
+                return self._token or token
+            return token
+
+        self._stats["misses"] += 1
+        with self._lock:
+            # Another caller may have refreshed while we were waiting.
+            if self._token and time.time() < self._expires_at:
+                return self._token
+            cached = self._read_redis()
+            if cached:
+                self._stats["redis_hits"] += 1
+                self._token, self._expires_at = cached
+                return self._token
+            return self._refresh()
+
+    async def get_token_async(self) -> Optional[str]:
+        """
+        ``get_token`` for async callers: a fresh cached token is returned
+        directly, anything that may log in or touch Redis runs in a thread.
+        """
+        token = self._token
+        if token and time.time() < self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+            self._stats["hits"] += 1
+            return token
+        return await run_in_threadpool(self.get_token)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drop the cached token. When ``token`` is given, only drop it if it is
+        still the cached one, so a stale 401 does not discard a fresh token.
+        """
+        with self._lock:
+            if token is not None and token != self._token:
+                return
+            self._stats["invalidations"] += 1
+            self._token, self._expires_at = None, 0.0
+            redis_client = self._redis()
+            if redis_client is None:
+                return
+            try:
+                cached = redis_client.get(self.redis_key)
+                if cached and (token is None or json.loads(cached).get("token") == token):
+                    redis_client.delete(self.redis_key)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate Draup World token in redis: {e}")
+
+    def request(self, method: str, url: str, token: Optional[str] = None, **kwargs) -> requests.Response:
+        """
+        Send a request with the service token, invalidating and retrying once
+        with a fresh token if the upstream answers 401.
+        """
+        token = token or self.get_token()
+        if not token:
+            raise RuntimeError("Failed to obtain auth token for Draup World API")
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Authorization"] = f"Token {token}"
+        response = requests.request(method, url, headers=headers, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        logger.info(f"Draup World API returned 401 for {url}, refreshing service token")
+        response.close()
+        self.invalidate(token)
+        fresh_token = self.get_token()
+        if not fresh_token:
+            raise RuntimeError("Failed to obtain auth token for Draup World API")
+        headers["Authorization"] = f"Token {fresh_token}"
+        return requests.request(method, url, headers=headers, **kwargs)
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        token: Optional[str] = None,
+        upstream: str = UPSTREAM_DRAUP_WORLD,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Async ``request`` over the shared upstream client. With ``stream=True``
+        the response is returned before its body is read and must be closed
+        by the caller.
+        """
+        client = get_upstream_client()
+        send = client.open_stream if stream else client.request
+        token = token or await self.get_token_async()
+        if not token:
+            raise RuntimeError("Failed to obtain auth token for Draup World API")
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Authorization"] = f"Token {token}"
+        response = await send(method, url, upstream=upstream, headers=headers, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        logger.info(f"Draup World API returned 401 for {url}, refreshing service token")
+        await response.aclose()
+        await run_in_threadpool(self.invalidate, token)
+        fresh_token = await self.get_token_async()
+        if not fresh_token:
+            raise RuntimeError("Failed to obtain auth token for Draup World API")
+        headers["Authorization"] = f"Token {fresh_token}"
+        return await send(method, url, upstream=upstream, headers=headers, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "base_url": self.base_url,
+            "has_token": self._token is not None,
+            "expires_in_seconds": max(0, int(self._expires_at - time.time())),
+        }
+
+    def _refresh(self) -> Optional[str]:
+        """Log in and store the new token. Must be called with the lock held."""
+        token = self._login()
+        if not token:
+            self._stats["refresh_failures"] += 1
+            return self._token if self._token and time.time() < self._expires_at else None
+
+        self._stats["refreshes"] += 1
+        issued_at = time.time()
+        self._token, self._expires_at = token, _token_expiry(token, issued_at)
+        self._write_redis(token, self._expires_at)
+        return token
+
+    def _login(self) -> Optional[str]:
+        try:
+            resp = requests.post(
+                f"{self.base_url}/login",
+                headers={"Content-Type": "application/json"},
+                json={"username": DRAUP_WORLD_USERNAME, "password": DRAUP_WORLD_PASSWORD},
+                timeout=LOGIN_TIMEOUT_SECONDS,
+            )
+            if resp.status_code == 200:
+                return resp.json().get("token")
+            logger.error(f"Failed to get token, status code: {resp.status_code}, response: {resp.text}")
+        except Exception as e:
+            logger.error(f"Error in getting token: {e}")
+        return None
+
+    def _redis(self):
+        if not self.use_redis or time.time() < self._redis_retry_at:
+            return None
+        try:
+            return get_redis_client()
+        except Exception as e:
+            logger.warning(f"Redis unavailable for Draup World token cache: {e}")
+            self._redis_retry_at = time.time() + REDIS_RETRY_SECONDS
+            return None
+
+    def _read_redis(self) -> Optional[Tuple[str, float]]:
+        redis_client = self._redis()
+        if redis_client is None:
+            return None
+        try:
+            cached = redis_client.get(self.redis_key)
+            if not cached:
+                return None
+            data = json.loads(cached)
+            if time.time() < data["expires_at"] - TOKEN_REFRESH_MARGIN_SECONDS:
+                return data["token"], float(data["expires_at"])
+        except Exception as e:
+            logger.warning(f"Failed to read Draup World token from redis: {e}")
+        return None
+
+    def _write_redis(self, token: str, expires_at: float) -> None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        ttl = int(expires_at - time.time())
+        if ttl <= 0:
+            return
+        try:
+            redis_client.setex(
+                self.redis_key, ttl, json.dumps({"token": token, "expires_at": expires_at})
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache Draup World token in redis: {e}")
+
+
+_token_managers: Dict[str, DraupWorldTokenManager] = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(base_url: str) -> DraupWorldTokenManager:
+    """
+    Getting the token manager for a Draup World base URL
+    """
+    manager = _token_managers.get(base_url)
+    if manager is None:
+        with _token_managers_lock:
+            manager = _token_managers.setdefault(base_url, DraupWorldTokenManager(base_url))
+    return manager
@@ -15,6 +15,7 @@ from sqlalchemy import text, or_
 from typing import List, Dict, Any, Optional
 from models.etter import MasterCompany, MasterFunction, FunctionWorkflow
 from sqlalchemy import func
+from services import step_history
 
 logger = logging.getLogger(__name__)
 
@@ -286,9 +287,9 @@ def upsert_user_workflow_history_data(workflow_history_data, current_user, db=No
             UserWorkflowStepsHistory.user_workflow_history_id == user_workflow_history_obj.id,
             UserWorkflowStepsHistory.type == 'data'
         ).all()
-        for step in data:
-            if step.data and isinstance(step.data, dict) and 'data' in step.data:
-                inner = step.data.get('data')
+        for step_data in step_history.resolve_step_data(db, data):
+            if step_data and isinstance(step_data, dict) and 'data' in step_data:
+                inner = step_data.get('data')
                 if isinstance(inner, dict):
                     score = inner.get('ai_automation_score', 0)
                 else:
@@ -394,7 +395,7 @@ def update_user_workflow_step_history_data(workflow_step_data, db):
             UserWorkflowStepsHistory.version_id == version_id,
             UserWorkflowStepsHistory.is_latest == True
         ).all()
-        return latest_steps_raw
+        return _with_full_data(db, latest_steps_raw)
     else:
         if workflow_step_info_obj:
             user_workflow_step_history_obj = db.query(UserWorkflowStepsHistory).filter(
@@ -417,8 +418,16 @@ def update_user_workflow_step_history_data(workflow_step_data, db):
                 updated_at=datetime.now(),
             )
         else:
+            # Edited in place: stays a delta against its snapshot when it already was one
+            stored = data_value
+            if step_history.is_delta(user_workflow_step_history_obj.data):
+                base_version = step_history.snapshot_version(user_workflow_step_history_obj.data, version_id)
+                snapshots = step_history.load_snapshots(db, [user_workflow_step_history_obj])
+                stored = step_history.encode_step_data(
+                    data_value, version_id, base_version, next(iter(snapshots.values()), None)
+                )
             user_workflow_step_history_obj.type = workflow_step_data["data_type"]
-            user_workflow_step_history_obj.data = data_value
+            user_workflow_step_history_obj.data = stored
             user_workflow_step_history_obj.workflow_step_status = workflow_status
             user_workflow_step_history_obj.is_latest = True
             user_workflow_step_history_obj.updated_at = datetime.now()
@@ -426,17 +435,24 @@ def update_user_workflow_step_history_data(workflow_step_data, db):
 
         db.add(user_workflow_step_history_obj)
 
-    db.commit()
-    db.refresh(user_workflow_step_history_obj)
-
     for status in user_workflow_history_obj.status_records:
         status.unread_flag = False if status.user_id == workflow_step_data["user_id"] else True
 
     user_workflow_history_obj.updated_at = datetime.now()
     db.add(user_workflow_history_obj)
     db.commit()
+    db.refresh(user_workflow_step_history_obj)
 
-    return user_workflow_step_history_obj
+    return _with_full_data(db, [user_workflow_step_history_obj])[0]
+
+
+def _with_full_data(db, steps):
+    """Detach step rows and put their full data in place of any stored delta, for API responses."""
+    full_data = step_history.resolve_step_data(db, steps)
+    for step, data in zip(steps, full_data):
+        db.expunge(step)
+        step.data = data
+    return steps
 
 
 def create_new_version_for_steps(
@@ -448,6 +464,12 @@ def create_new_version_for_steps(
         new_data: dict,
         new_status: dict
 ):
+    """
+    Add version `new_version_id` of every data step, replacing the target step's data.
+
+    Unchanged steps are stored as deltas against their snapshot (services/step_history).
+    Nothing is committed here: the caller commits the whole version at once.
+    """
     if not db:
         db = get_db()
 
@@ -470,54 +492,78 @@ def create_new_version_for_steps(
         UserWorkflowStepsHistory.version_id == new_version_id - 1,
     ).order_by(UserWorkflowStepsHistory.id).all()
 
+    snapshots = step_history.load_snapshots(db, existing_steps)
+    next_version = next_version_step_data(
+        existing_steps, snapshots, target_step_info_id, new_data, new_version_id
+    )
+
     updated_step_obj = None
-    target_step_found = False
+    now = datetime.now()
 
     for step in existing_steps:
         step.is_latest = False
-        step.updated_at = datetime.now()
+        step.updated_at = now
+        db.add(step)
 
-        if (
-                step.data
-                and isinstance(step.data, dict)
-                and isinstance(step.data.get("expectedResponse"), list)
-        ):
-            step.data["expectedResponse"] = [
-                {**resp, "editable": False} for resp in step.data["expectedResponse"] if isinstance(resp, dict)
-            ]
+    for step, stored_data in next_version:
+        new_step = UserWorkflowStepsHistory(
+            workflow_step_info_id=step.workflow_step_info_id,
+            user_workflow_history_id=step.user_workflow_history_id,
+            version_id=new_version_id,
+            type=step.type,
+            data=stored_data,
+            workflow_step_status=step.workflow_step_status,
+            is_latest=True,
+            created_at=now,
+            updated_at=now,
+        )
+        db.add(new_step)
 
-        db.add(step)
+    db.flush()
+    return updated_step_obj
 
-    for step in existing_steps:
-        if step.type == 'data':
-            new_step_data = copy.deepcopy(step.data)
-            new_step_status = step.workflow_step_status
-
-            if step.workflow_step_info_id == target_step_info_id:
-                new_step_data = new_data
-                target_step_found = True
-            elif step.workflow_step_info_id > target_step_info_id and isinstance(new_step_data, dict):
+
+def next_version_step_data(existing_steps, snapshots, target_step_info_id, new_data, new_version_id):
+    """
+    (previous step row, data to store) for each data step of the next version.
+
+    The target step gets `new_data`; the others carry over with their responses
+    locked and, after the target, flagged isPreviousUpdated. Stored data is a
+    delta against the step's snapshot where that pays off (services/step_history).
+    """
+    existing_data = step_history.resolve_rows(existing_steps, snapshots)
+    target_step_found = False
+    next_version = []
+
+    for step, step_data in zip(existing_steps, existing_data):
+        if step.type != 'data':
+            continue
+        if step.workflow_step_info_id == target_step_info_id:
+            new_step_data = new_data
+            target_step_found = True
+        else:
+            # Data decoded from a delta is already a private copy
+            new_step_data = step_data if step_history.is_delta(step.data) else copy.deepcopy(step_data)
+            if isinstance(new_step_data, dict) and isinstance(new_step_data.get("expectedResponse"), list):
+                new_step_data["expectedResponse"] = [
+                    {**resp, "editable": False}
+                    for resp in new_step_data["expectedResponse"] if isinstance(resp, dict)
+                ]
+            if step.workflow_step_info_id > target_step_info_id and isinstance(new_step_data, dict):
                 new_step_data["isPreviousUpdated"] = True
-            new_step_data['versionId'] = new_version_id
-
-            new_step = UserWorkflowStepsHistory(
-                workflow_step_info_id=step.workflow_step_info_id,
-                user_workflow_history_id=step.user_workflow_history_id,
-                version_id=new_version_id,
-                type=step.type,
-                data=new_step_data,
-                workflow_step_status=new_step_status,
-                is_latest=True,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
-            db.add(new_step)
+        new_step_data['versionId'] = new_version_id
+
+        base_version = step_history.snapshot_version(step.data, step.version_id)
+        base_data = step_data if base_version == step.version_id else snapshots.get(
+            (step.user_workflow_history_id, step.workflow_step_info_id, base_version)
+        )
+        next_version.append(
+            (step, step_history.encode_step_data(new_step_data, new_version_id, base_version, base_data))
+        )
 
     if not target_step_found:
         raise ValueError(f"Target step with id {target_step_info_id} not found in previous version")
-
-    db.commit()
-    return updated_step_obj
+    return next_version
 
 
 def get_sample_data(
@@ -753,7 +799,7 @@ def _get_consolidated_tasks_for_role(
     Returns:
         Dictionary with tasks list or error
     """
-    from api.etter_apis import get_draup_world_api
+    from api.etter_apis import get_draup_world_api, draup_world_request
 
     try:
         # Call draup_world_model API for task consolidator
@@ -771,7 +817,7 @@ def _get_consolidated_tasks_for_role(
             }
         }
 
-        response = requests.post(target_url, headers=headers, json=payload, timeout=60)
+        response = draup_world_request("POST", target_url, token=token, headers=headers, json=payload, timeout=60)
 
         if response.status_code == 200:
             result = response.json()
@@ -866,7 +912,7 @@ def get_tasks_from_sources(
     Returns:
         Dictionary with source, tasks list, and metadata
     """
-    from api.etter_apis import get_token, get_draup_world_api
+    from api.etter_apis import get_token, get_draup_world_api, draup_world_request
     
     # If workflow_name is provided but workflow_id is not, look up the workflow_id
     if workflow_name and not workflow_id:
@@ -926,7 +972,7 @@ def get_tasks_from_sources(
                 }
             }
             
-            response = requests.post(target_url, headers=headers, json=payload, timeout=60)
+            response = draup_world_request("POST", target_url, token=token, headers=headers, json=payload, timeout=60)
             
             if response.status_code == 200:
                 result = response.json()
@@ -1110,7 +1156,7 @@ def get_tasks_from_sources(
                 }
             }
             
-            response = requests.post(target_url, headers=headers, json=payload, timeout=60)
+            response = draup_world_request("POST", target_url, token=token, headers=headers, json=payload, timeout=60)
             
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,337 @@
+"""
+Batch extraction engine
+
+Runs document extractions concurrently instead of one after another. At most
+``EXTRACTION_CONCURRENCY`` documents are in flight per process, and at most
+``EXTRACTION_TENANT_CONCURRENCY`` of them for any one tenant, so one large
+session cannot starve the others. New calls to the Draup World Model are
+paced by a token bucket.
+
+Every document is handled in its own short-lived DB sessions and its status
+is committed as it moves, so the session's status counters stay current and
+nothing is lost when a pod restarts: a document is claimed PENDING ->
+PROCESSING with a single conditional UPDATE, and a periodic sweep picks up
+PENDING documents and PROCESSING ones whose claim has gone stale.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from os import environ
+from typing import Dict, Final, List, Optional, Set
+
+from sqlalchemy import and_, or_
+from starlette.concurrency import run_in_threadpool
+
+from api.s3.dependencies import get_s3_service
+from api.s3.infra.db.uow import UnitOfWork
+from models.extraction import (
+    ExtractedDocument, ExtractionSession,
+    ExtractionStatus, ExtractionSessionStatus
+)
+from models.s3 import Document
+from services.extraction_service import ExtractionService, TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CONCURRENCY: Final[int] = int(environ.get("EXTRACTION_CONCURRENCY", 8))
+EXTRACTION_TENANT_CONCURRENCY: Final[int] = int(environ.get("EXTRACTION_TENANT_CONCURRENCY", 4))
+# Token bucket toward the Draup World Model: sustained calls per second and burst size
+EXTRACTION_RATE_PER_SECOND: Final[float] = float(environ.get("EXTRACTION_RATE_PER_SECOND", 2))
+EXTRACTION_RATE_BURST: Final[int] = int(environ.get("EXTRACTION_RATE_BURST", 4))
+# A document PROCESSING for longer than this is assumed abandoned by its pod
+EXTRACTION_STALE_SECONDS: Final[int] = int(
+    environ.get("EXTRACTION_STALE_SECONDS", TIMEOUT_SECONDS + 300)
+)
+EXTRACTION_RESUME_INTERVAL_SECONDS: Final[int] = int(
+    environ.get("EXTRACTION_RESUME_INTERVAL_SECONDS", 300)
+)
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``acquire`` waits until a token is available.
+    Tokens refill at ``rate`` per second up to ``capacity``. A non-positive
+    rate disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class ExtractionJob:
+    """A claimed document, ready to be sent to the extraction API."""
+    record_id: int
+    presigned_url: str
+    document_name: Optional[str]
+    document_type: Optional[str]
+
+
+class BatchExtractionEngine:
+    def __init__(
+        self,
+        concurrency: int = EXTRACTION_CONCURRENCY,
+        tenant_concurrency: int = EXTRACTION_TENANT_CONCURRENCY,
+        rate_per_second: float = EXTRACTION_RATE_PER_SECOND,
+        rate_burst: int = EXTRACTION_RATE_BURST,
+    ):
+        self.concurrency = concurrency
+        self.tenant_concurrency = tenant_concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+        self._tenant_slots: Dict[str, asyncio.Semaphore] = {}
+        self._bucket = TokenBucket(rate_per_second, rate_burst)
+        self._scheduled: Set[int] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def submit(self, record_ids: List[int], tenant_id: str) -> asyncio.Task:
+        """
+        Schedule extraction of ``record_ids`` and return immediately. Records
+        already scheduled in this process are skipped.
+        """
+        record_ids = [record_id for record_id in record_ids if record_id not in self._scheduled]
+        self._scheduled.update(record_ids)
+        task = asyncio.create_task(self.run(record_ids, tenant_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def run(self, record_ids: List[int], tenant_id: str) -> Dict[str, int]:
+        """Extract ``record_ids`` concurrently. Returns how many completed, failed or were skipped."""
+        started = time.perf_counter()
+        # return_exceptions so that, when cancelled, every record gets to release its claim first
+        statuses = await asyncio.gather(
+            *(self._extract(record_id, tenant_id) for record_id in record_ids), return_exceptions=True
+        )
+        counts = {
+            "completed": statuses.count(ExtractionStatus.COMPLETED),
+            "failed": statuses.count(ExtractionStatus.FAILED),
+            "skipped": statuses.count(None),
+        }
+        logger.info(
+            f"Batch extraction for tenant {tenant_id} finished in {time.perf_counter() - started:.1f}s: {counts}"
+        )
+        return counts
+
+    async def _extract(self, record_id: int, tenant_id: str) -> Optional[ExtractionStatus]:
+        job: Optional[ExtractionJob] = None
+        try:
+            # Tenant first: a tenant at its limit waits without holding a global
+            # slot, so it cannot starve the other tenants.
+            async with self._tenant_slots.setdefault(
+                tenant_id, asyncio.Semaphore(self.tenant_concurrency)
+            ), self._slots:
+                await self._bucket.acquire()
+                try:
+                    job = await run_in_threadpool(self.prepare, record_id, tenant_id)
+                    if job is None:
+                        return None
+                    result, error = await self.extract(job), None
+                except asyncio.CancelledError:
+                    if job is not None:
+                        await run_in_threadpool(self.release, record_id)
+                    raise
+                except Exception as e:
+                    logger.error(f"Extraction failed for record {record_id}: {e}")
+                    result, error = None, str(e)
+                return await run_in_threadpool(self.record, record_id, result, error)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to store extraction record {record_id}: {e}", exc_info=True)
+            return None
+        finally:
+            self._scheduled.discard(record_id)
+
+    def prepare(self, record_id: int, tenant_id: str) -> Optional[ExtractionJob]:
+        """
+        Claim the record and presign its document. Returns None when another
+        worker holds the record or it is already finished.
+        """
+        from settings.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            if not _claim(db, record_id):
+                return None
+            extracted_doc = db.query(ExtractedDocument).get(record_id)
+            service = ExtractionService(UnitOfWork(db), get_s3_service())
+            presigned_url, original_filename = service.get_presigned_url(
+                document_id=extracted_doc.document_id,
+                tenant_id=tenant_id
+            )
+            if not extracted_doc.document_name:
+                extracted_doc.document_name = original_filename
+                db.commit()
+            return ExtractionJob(
+                record_id=record_id,
+                presigned_url=presigned_url,
+                document_name=extracted_doc.document_name,
+                document_type=extracted_doc.document_type
+            )
+        finally:
+            db.close()
+
+    async def extract(self, job: ExtractionJob) -> dict:
+        return await ExtractionService.call_extraction_api_async(
+            presigned_url=job.presigned_url,
+            document_name=job.document_name,
+            document_type=job.document_type
+        )
+
+    def record(self, record_id: int, result: Optional[dict], error: Optional[str] = None) -> ExtractionStatus:
+        """Store an extraction result, or ``error``, on the record."""
+        from settings.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            extracted_doc = db.query(ExtractedDocument).get(record_id)
+            if error is not None:
+                extracted_doc.status = ExtractionStatus.FAILED
+                extracted_doc.error_message = error[:1000]
+            else:
+                ExtractionService.apply_result(extracted_doc, result)
+            db.commit()
+            logger.info(f"Extraction record {record_id} finished: status={extracted_doc.status.value}")
+            return extracted_doc.status
+        finally:
+            db.close()
+
+    def release(self, record_id: int) -> None:
+        """Hand an interrupted record back as PENDING so it is resumed."""
+        from settings.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            db.query(ExtractedDocument).filter(
+                ExtractedDocument.id == record_id,
+                ExtractedDocument.status == ExtractionStatus.PROCESSING
+            ).update(
+                {ExtractedDocument.status: ExtractionStatus.PENDING},
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def resumable(self) -> Dict[str, List[int]]:
+        """
+        PENDING records, and PROCESSING records with a stale claim, of active
+        sessions, grouped by tenant.
+        """
+        from settings.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(ExtractedDocument.id, Document.tenant_id)
+                .join(Document, Document.id == ExtractedDocument.document_id)
+                .join(ExtractionSession, ExtractionSession.id == ExtractedDocument.session_id)
+                .filter(
+                    ExtractionSession.status == ExtractionSessionStatus.ACTIVE,
+                    _claimable(),
+                )
+                .order_by(ExtractedDocument.id)
+                .all()
+            )
+        finally:
+            db.close()
+
+        pending: Dict[str, List[int]] = {}
+        for record_id, tenant_id in rows:
+            pending.setdefault(tenant_id, []).append(record_id)
+        return pending
+
+    async def resume(self) -> int:
+        """Schedule every resumable record. Returns how many were scheduled."""
+        pending = await run_in_threadpool(self.resumable)
+        scheduled = 0
+        for tenant_id, record_ids in pending.items():
+            record_ids = [record_id for record_id in record_ids if record_id not in self._scheduled]
+            if record_ids:
+                self.submit(record_ids, tenant_id)
+                scheduled += len(record_ids)
+        if scheduled:
+            logger.info(f"Resumed {scheduled} extraction record(s)")
+        return scheduled
+
+    async def _sweep(self) -> None:
+        while True:
+            try:
+                await self.resume()
+            except Exception as e:
+                logger.error(f"Failed to resume extraction records: {e}", exc_info=True)
+            await asyncio.sleep(EXTRACTION_RESUME_INTERVAL_SECONDS)
+
+    def start(self) -> None:
+        """Start the periodic resume sweep; the first pass runs straight away."""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def shutdown(self) -> None:
+        """Stop the sweep and cancel running batches; their records go back to PENDING."""
+        tasks = list(self._tasks) + ([self._sweeper] if self._sweeper else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._sweeper = None
+
+
+def _claimable():
+    stale_before = datetime.utcnow() - timedelta(seconds=EXTRACTION_STALE_SECONDS)
+    return or_(
+        ExtractedDocument.status == ExtractionStatus.PENDING,
+        and_(
+            ExtractedDocument.status == ExtractionStatus.PROCESSING,
+            ExtractedDocument.modified_on < stale_before
+        )
+    )
+
+
+def _claim(db, record_id: int) -> bool:
+    """Atomically move a claimable record to PROCESSING; False if someone else has it."""
+    claimed = db.query(ExtractedDocument).filter(
+        ExtractedDocument.id == record_id,
+        _claimable()
+    ).update(
+        {
+            ExtractedDocument.status: ExtractionStatus.PROCESSING,
+            ExtractedDocument.modified_on: datetime.utcnow()
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    return claimed == 1
+
+
+_batch_extraction_engine: Optional[BatchExtractionEngine] = None
+
+
+def get_batch_extraction_engine() -> BatchExtractionEngine:
+    """
+    Getting the process-wide batch extraction engine
+    """
+    global _batch_extraction_engine
+    if _batch_extraction_engine is None:
+        _batch_extraction_engine = BatchExtractionEngine()
+    return _batch_extraction_engine
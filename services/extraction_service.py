@@ -14,7 +14,7 @@ import requests
 from api.s3.infra.db.uow import UnitOfWork
 from api.s3.infra.s3.s3_management_service import S3ManagementService
 from api.s3.domain.services.document_custodian import DocumentCustodian
-from api.etter_apis import get_draup_world_api, get_token
+from api.etter_apis import get_draup_world_api, get_token, draup_world_request, draup_world_request_async
 from models.extraction import (
     ExtractedDocument, ExtractionSession,
     ExtractionStatus, ApprovalStatus, ExtractionSessionStatus
@@ -26,6 +26,33 @@ logger = logging.getLogger(__name__)
 DRAUP_WORLD_MODEL_BASE_URL = get_draup_world_api()
 EXTRACT_FROM_URL_ENDPOINT = f"{DRAUP_WORLD_MODEL_BASE_URL}/input_repository/extract-from-url"
 TIMEOUT_SECONDS = 300  # 5 minutes for LLM processing
+EXTRACTION_HEADERS = {
+    'Content-Type': 'application/json',
+    'Origin': 'https://draup-world.draup.technology'
+}
+
+
+def _extraction_payload(
+    presigned_url: str,
+    document_name: Optional[str],
+    document_type: Optional[str]
+) -> dict:
+    return {
+        "presigned_url": presigned_url,
+        "document_name": document_name,
+        "document_type": document_type
+    }
+
+
+def _raise_for_status(status_code: int, text: str) -> None:
+    if status_code != 200:
+        logger.error(
+            f"Extraction API error: status={status_code}, "
+            f"body={text[:500]}"
+        )
+        raise requests.RequestException(
+            f"Extraction API returned {status_code}: {text}"
+        )
 
 
 class ExtractionService:
@@ -95,38 +122,59 @@ class ExtractionService:
         if not token:
             raise RuntimeError("Failed to obtain auth token for Draup World Model")
 
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Token {token}',
-            'Origin': 'https://draup-world.draup.technology'
-        }
+        logger.info(f"Calling extraction API: {EXTRACT_FROM_URL_ENDPOINT}")
+
+        response = draup_world_request(
+            "POST",
+            EXTRACT_FROM_URL_ENDPOINT,
+            token=token,
+            json=_extraction_payload(presigned_url, document_name, document_type),
+            headers=EXTRACTION_HEADERS,
+            timeout=TIMEOUT_SECONDS
+        )
+        _raise_for_status(response.status_code, response.text)
 
-        payload = {
-            "presigned_url": presigned_url,
-            "document_name": document_name,
-            "document_type": document_type
-        }
+        return response.json()
 
+    @staticmethod
+    async def call_extraction_api_async(
+        presigned_url: str,
+        document_name: Optional[str] = None,
+        document_type: Optional[str] = None
+    ) -> dict:
+        """
+        Non-blocking ``call_extraction_api`` over the shared upstream
+        connection pool, for the batch extraction engine.
+        """
         logger.info(f"Calling extraction API: {EXTRACT_FROM_URL_ENDPOINT}")
 
-        response = requests.post(
+        response = await draup_world_request_async(
+            "POST",
             EXTRACT_FROM_URL_ENDPOINT,
-            json=payload,
-            headers=headers,
+            json=_extraction_payload(presigned_url, document_name, document_type),
+            headers=EXTRACTION_HEADERS,
             timeout=TIMEOUT_SECONDS
         )
-
-        if response.status_code != 200:
-            logger.error(
-                f"Extraction API error: status={response.status_code}, "
-                f"body={response.text[:500]}"
-            )
-            raise requests.RequestException(
-                f"Extraction API returned {response.status_code}: {response.text}"
-            )
+        _raise_for_status(response.status_code, response.text)
 
         return response.json()
 
+    @staticmethod
+    def apply_result(extracted_doc: ExtractedDocument, result: dict) -> None:
+        """Copy an extraction API result onto the record and set its final status."""
+        if result.get("status") == "success":
+            extracted_doc.status = ExtractionStatus.COMPLETED
+            extracted_doc.document_type = result.get("document_type")
+            extracted_doc.extraction_confidence = result.get("extraction_confidence")
+            extracted_doc.extraction_metadata = result.get("metadata")
+            extracted_doc.tasks = result.get("tasks", [])
+            extracted_doc.skills = result.get("skills", [])
+            extracted_doc.stages = result.get("stages", [])
+            extracted_doc.task_to_skill = result.get("task_to_skill", [])
+        else:
+            extracted_doc.status = ExtractionStatus.FAILED
+            extracted_doc.error_message = result.get("message", "Unknown error")
+
     def process_document(
         self,
         extracted_doc: ExtractedDocument,
@@ -170,18 +218,7 @@ class ExtractionService:
             )
 
             # Update record with results
-            if result.get("status") == "success":
-                extracted_doc.status = ExtractionStatus.COMPLETED
-                extracted_doc.document_type = result.get("document_type")
-                extracted_doc.extraction_confidence = result.get("extraction_confidence")
-                extracted_doc.extraction_metadata = result.get("metadata")
-                extracted_doc.tasks = result.get("tasks", [])
-                extracted_doc.skills = result.get("skills", [])
-                extracted_doc.stages = result.get("stages", [])
-                extracted_doc.task_to_skill = result.get("task_to_skill", [])
-            else:
-                extracted_doc.status = ExtractionStatus.FAILED
-                extracted_doc.error_message = result.get("message", "Unknown error")
+            self.apply_result(extracted_doc, result)
 
             db_session.commit()
             logger.info(
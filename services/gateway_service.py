@@ -1,11 +1,12 @@
 import logging
 import os
 from typing import List, Dict, Optional
-import requests
+import httpx
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from models.extraction import MasterTechStack
 from constants.auth import ENV
+from services.upstream_client import get_upstream_client, UPSTREAM_GATEWAY
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +22,7 @@ class GatewayService:
         if not self.token:
             logger.warning("GATEWAY_TOKEN environment variable not set")
 
-    def get_techstack_suggestions(
+    async def get_techstack_suggestions(
         self,
         input_text: List[str],
         score_limit: float = 0.8
@@ -42,16 +43,17 @@ class GatewayService:
         }
         
         try:
-            response = requests.post(
+            response = await get_upstream_client().request(
+                "POST",
                 endpoint,
+                upstream=UPSTREAM_GATEWAY,
                 json=payload,
                 headers=headers,
-                timeout=30
             )
             
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Gateway API request failed: {str(e)}")
             raise
 
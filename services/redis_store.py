@@ -46,6 +46,15 @@ class RedisClient:
     def hget(self, key: str, field: str) -> Optional[str]:
         return cast(Optional[str], self.redis.hget(key, field))
 
+    def sadd(self, key: str, *values: str) -> None:
+        self.redis.sadd(key, *values)
+
+    def smembers(self, key: str) -> set:
+        return cast(set, self.redis.smembers(key))
+
+    def expire(self, key: str, exp_seconds: int) -> None:
+        self.redis.expire(key, exp_seconds)
+
 
 redis_client = None
 redis_qa_login_client = None
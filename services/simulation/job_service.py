@@ -0,0 +1,434 @@
+"""
+Simulation job runner
+
+Runs financial simulations off the request path. Submitting a job returns
+immediately; its Monte-Carlo iterations are fanned out to a bounded pool of
+long-lived worker processes, and progress is written to ``SimulationStore``
+so any API worker can serve polling and SSE clients. Identical requests
+(same ``sim_cache_key``) join the job that is already running, and seeded
+runs are served from, and saved to, the persistent result cache.
+
+Workers return compact per-iteration trajectories that are folded into a
+``SimulationAggregator`` as they arrive, so a job never holds a row per
+(iteration, step) and its memory does not grow with ``n_iterations``.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import environ
+from typing import Any, AsyncIterator, Callable, Dict, Final, List, Optional, Tuple
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+from common.logger import logger
+from ml_models.simulation import (
+    RoleDataProvider,
+    SimulationAggregator,
+    SimulationEngine,
+    SimulationRequestData,
+    run_simulation_trajectory,
+    run_vectorized_trajectories,
+    trajectory_metric_names,
+)
+from ml_models.simulation.engine import QueueProgressReporter
+from services.simulation.simulation_service import (
+    get_simulation_engine,
+    explain_results,
+)
+from services.simulation.result_cache import (
+    SimulationCacheKeys,
+    get_simulation_result_store,
+    simulation_cache_keys,
+)
+from services.simulation.store import get_sim_store
+
+SIMULATION_WORKERS: Final[int] = int(
+    environ.get("SIMULATION_WORKERS", max(1, (os.cpu_count() or 2) - 1))
+)
+# A job whose progress has not moved for this long is considered abandoned
+# (e.g. its pod restarted) and is resubmitted by the next identical request.
+SIMULATION_JOB_STALE_SECONDS: Final[int] = int(environ.get("SIMULATION_JOB_STALE_SECONDS", 600))
+PROGRESS_FLUSH_SECONDS: Final[float] = 0.5
+# Iterations the vectorized kernel advances together in one worker; bounds its memory
+VECTORIZED_CHUNK_ITERATIONS: Final[int] = int(environ.get("VECTORIZED_CHUNK_ITERATIONS", 64))
+
+JOB_QUEUED: Final[str] = "queued"
+JOB_IN_PROGRESS: Final[str] = "in_progress"
+JOB_COMPLETED: Final[str] = "completed"
+JOB_FAILED: Final[str] = "failed"
+TERMINAL_STATUSES: Final[tuple] = (JOB_COMPLETED, JOB_FAILED)
+
+
+def sim_id_key(sim_id: str) -> str:
+    return f"sim_id:{sim_id}"
+
+
+def is_active_job(sim_data: Optional[Dict]) -> bool:
+    """Whether a stored simulation is still being worked on by some worker."""
+    if not sim_data or sim_data.get("status") not in (JOB_QUEUED, JOB_IN_PROGRESS):
+        return False
+    updated_at = sim_data.get("updated_at") or 0
+    return time.time() - updated_at < SIMULATION_JOB_STALE_SECONDS
+
+
+class SimulationJobRunner:
+    def __init__(self, max_workers: int = SIMULATION_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress_queue: Any = None
+        self._mp_manager: Any = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._on_complete: Dict[str, List[Callable[[Dict], None]]] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._pump_task: Optional[asyncio.Task] = None
+
+    def _ensure_pool(self) -> None:
+        if self._executor is None:
+            context = multiprocessing.get_context("spawn")
+            self._mp_manager = context.Manager()
+            self._progress_queue = self._mp_manager.Queue()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    async def submit(
+        self,
+        sim_cache_key: str,
+        sim_id: str,
+        data: SimulationRequestData,
+        on_complete: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
+        """
+        Register and start a job, or join the one already running for
+        ``sim_cache_key``, and return the stored job state without waiting
+        for anything else. ``on_complete`` receives the stored result once
+        the job succeeds, also when joining.
+        """
+        sim_store = get_sim_store()
+        if self._join(sim_cache_key, on_complete):
+            return sim_store.get(sim_cache_key)
+
+        sim_store.create(
+            sim_cache_key,
+            id=sim_id,
+            input_data=data,
+            status=JOB_QUEUED,
+            simulation_steps=[],
+            progress=_progress(0, data["n_iterations"], 0),
+            updated_at=time.time(),
+        )
+        sim_store.create(sim_id_key(sim_id), cache_key=sim_cache_key)
+
+        self._on_complete[sim_cache_key] = [on_complete] if on_complete is not None else []
+        task = asyncio.create_task(self._run(sim_cache_key, sim_id, data))
+        self._inflight[sim_cache_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(sim_cache_key, None))
+        return sim_store.get(sim_cache_key)
+
+    def _join(self, sim_cache_key: str, on_complete: Optional[Callable[[Dict], None]]) -> bool:
+        if not self.is_running(sim_cache_key):
+            return False
+        if on_complete is not None:
+            self._on_complete[sim_cache_key].append(on_complete)
+        return True
+
+    def is_running(self, sim_cache_key: str) -> bool:
+        """Whether this process is running the job for ``sim_cache_key``."""
+        running = self._inflight.get(sim_cache_key)
+        return running is not None and not running.done()
+
+    def get_job(self, sim_id: str) -> Optional[Dict]:
+        sim_store = get_sim_store()
+        pointer = sim_store.get(sim_id_key(sim_id))
+        if not pointer:
+            return None
+        return sim_store.get(pointer["cache_key"])
+
+    async def _run(
+        self,
+        sim_cache_key: str,
+        sim_id: str,
+        data: SimulationRequestData,
+    ) -> None:
+        sim_store = get_sim_store()
+        result_store = get_simulation_result_store()
+        engine = get_simulation_engine()
+        n_iterations = data["n_iterations"]
+        steps_per_iteration = engine.n_months + 1
+        # Only a seeded run is reproducible, so only a seeded run is cached.
+        seeded = data.get("seed") is not None
+
+        workloads: Optional[List[Dict]] = None
+        cache_keys: Optional[SimulationCacheKeys] = None
+        simulation_steps: List[Dict] = []
+        yearly_metrics: List[Dict] = []
+        explanations: List[Dict] = []
+        error: Optional[str] = None
+        try:
+            if n_iterations > 0:
+                workloads = await engine.get_role_workload_map_async(data["roles"], data["company"])
+                if seeded:
+                    cache_keys = simulation_cache_keys(workloads, data, engine.n_months, _kernel(engine))
+                    cached = await self._cached_result(cache_keys)
+                    if cached:
+                        await self._finish(sim_cache_key, sim_id, data, cached)
+                        return
+
+                self._ensure_pool()
+                role_provider = engine.build_local_role_provider(
+                    data["roles"], data["company"], role_workload_map=workloads
+                )
+
+                metric_names = trajectory_metric_names(data["roles"])
+                # Iterations finished by an earlier run with the same seed are reused.
+                cached_iterations: Dict[int, np.ndarray] = {}
+                if seeded:
+                    cached_iterations = await run_in_threadpool(
+                        result_store.get_iterations,
+                        cache_keys.iterations,
+                        range(n_iterations),
+                        (steps_per_iteration, len(metric_names)),
+                    )
+                missing = [i for i in range(n_iterations) if i not in cached_iterations]
+                self._jobs[sim_id] = {
+                    "sim_cache_key": sim_cache_key,
+                    "n_iterations": n_iterations,
+                    "total_steps": n_iterations * steps_per_iteration,
+                    "steps": {i: steps_per_iteration for i in cached_iterations},
+                }
+                sim_store.update(sim_cache_key, status=JOB_IN_PROGRESS, updated_at=time.time())
+                self._ensure_pump()
+
+                # Fold iterations one at a time in iteration order, so the sums
+                # and therefore the result do not depend on completion order or
+                # on which iterations came from the cache.
+                aggregator = SimulationAggregator(data["roles"], steps_per_iteration)
+                pending: Dict[int, np.ndarray] = dict(cached_iterations)
+                next_iteration = 0
+
+                def fold_ready() -> None:
+                    nonlocal next_iteration
+                    while next_iteration in pending:
+                        aggregator.update(pending.pop(next_iteration))
+                        next_iteration += 1
+
+                fold_ready()
+                async for simulated in self._simulate(
+                    engine, data, role_provider, sim_id, missing, metric_names
+                ):
+                    if seeded:
+                        await run_in_threadpool(result_store.put_iterations, cache_keys.iterations, simulated)
+                    pending.update(simulated)
+                    fold_ready()
+
+                simulation_steps = aggregator.results()
+                yearly_metrics = aggregator.yearly_metrics()
+                explanations = explain_results(data["roles"], workloads, yearly_metrics)
+        except Exception as e:
+            logger.exception(f"Simulation {sim_id} failed")
+            error = str(e) or type(e).__name__
+        finally:
+            self._jobs.pop(sim_id, None)
+
+        result = {
+            "workloads": workloads or [],
+            "yearly_metrics": yearly_metrics,
+            "explanations": explanations,
+            "simulation_steps": simulation_steps,
+        }
+        if simulation_steps and seeded:
+            await run_in_threadpool(result_store.put_result, cache_keys.result, data, _kernel(engine), result)
+        await self._finish(sim_cache_key, sim_id, data, result, error)
+
+    async def _cached_result(self, cache_keys: SimulationCacheKeys) -> Optional[Dict]:
+        try:
+            return await run_in_threadpool(get_simulation_result_store().get_result, cache_keys.result)
+        except Exception:
+            logger.exception("Error checking the simulation result cache")
+            return None
+
+    async def _finish(
+        self,
+        sim_cache_key: str,
+        sim_id: str,
+        data: SimulationRequestData,
+        result: Dict,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Store the job's final state, failed with ``error`` when the run raised,
+        and run its completion hooks if it succeeded.
+        """
+        sim_store = get_sim_store()
+        n_iterations = data["n_iterations"]
+        sim_store.update(
+            sim_cache_key,
+            id=sim_id,
+            status=JOB_FAILED if error is not None else JOB_COMPLETED,
+            error=error,
+            **result,
+            progress=_progress(n_iterations, n_iterations, 100.0),
+            updated_at=time.time(),
+        )
+        callbacks = self._on_complete.pop(sim_cache_key, [])
+        if error is not None or not result["simulation_steps"]:
+            return
+        stored = sim_store.get(sim_cache_key)
+        for on_complete in callbacks:
+            try:
+                await run_in_threadpool(on_complete, stored)
+            except Exception:
+                logger.exception(f"Error in simulation completion hook for {sim_id}")
+
+    async def _simulate(
+        self,
+        engine: SimulationEngine,
+        data: SimulationRequestData,
+        role_provider: RoleDataProvider,
+        sim_id: str,
+        iterations: List[int],
+        metric_names: List[str],
+    ) -> AsyncIterator[Dict[int, np.ndarray]]:
+        """
+        Run ``iterations`` on the worker pool and yield their trajectories,
+        by iteration, as each unit of work finishes.
+        """
+        loop = asyncio.get_running_loop()
+        reporter = QueueProgressReporter(self._progress_queue, sim_id)
+        if engine.vectorized:
+            # Each worker advances a chunk of iterations at once.
+            chunks = [
+                iterations[i:i + VECTORIZED_CHUNK_ITERATIONS]
+                for i in range(0, len(iterations), VECTORIZED_CHUNK_ITERATIONS)
+            ]
+            units = [
+                (chunk, partial(
+                    run_vectorized_trajectories,
+                    data["roles"],
+                    role_provider,
+                    data["company"],
+                    data["automation_factor"],
+                    engine.n_months,
+                    chunk,
+                    metric_names,
+                    progress=reporter,
+                    seed=data.get("seed"),
+                ))
+                for chunk in chunks
+            ]
+        else:
+            units = [
+                ([iteration], partial(
+                    run_simulation_trajectory,
+                    data["roles"],
+                    role_provider,
+                    data["company"],
+                    data["automation_factor"],
+                    engine.n_months,
+                    metric_names,
+                    iteration=iteration,
+                    progress=reporter,
+                    seed=data.get("seed"),
+                ))
+                for iteration in iterations
+            ]
+
+        async def run_unit(unit_iterations: List[int], work: Callable) -> Tuple[List[int], np.ndarray]:
+            trajectories = await loop.run_in_executor(self._executor, work)
+            shape = (len(unit_iterations), *np.shape(trajectories)[-2:])
+            return unit_iterations, np.reshape(trajectories, shape)
+
+        tasks = [asyncio.ensure_future(run_unit(*unit)) for unit in units]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                unit_iterations, trajectories = await finished
+                yield dict(zip(unit_iterations, trajectories))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _ensure_pump(self) -> None:
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump_progress())
+
+    async def _pump_progress(self) -> None:
+        """
+        Drain per-step reports from the workers, each covering a unit's
+        iterations, and flush each running job's progress to the store,
+        until no job is left.
+        """
+        while self._jobs:
+            await asyncio.sleep(PROGRESS_FLUSH_SECONDS)
+            messages = await run_in_threadpool(self._drain_progress_queue)
+            for job_id, iterations, step in messages:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                for iteration in iterations:
+                    job["steps"][iteration] = max(step, job["steps"].get(iteration, 0))
+
+            sim_store = get_sim_store()
+            for job in self._jobs.values():
+                completed_steps = sum(job["steps"].values())
+                steps_per_iteration = job["total_steps"] // job["n_iterations"]
+                completed_iterations = sum(
+                    1 for step in job["steps"].values() if step >= steps_per_iteration
+                )
+                sim_store.update(
+                    job["sim_cache_key"],
+                    progress=_progress(
+                        completed_iterations,
+                        job["n_iterations"],
+                        round(100.0 * completed_steps / job["total_steps"], 1),
+                        iteration_steps={str(k): v for k, v in sorted(job["steps"].items())},
+                    ),
+                    updated_at=time.time(),
+                )
+
+    def _drain_progress_queue(self) -> List[tuple]:
+        messages = []
+        while True:
+            try:
+                messages.append(self._progress_queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def shutdown(self) -> None:
+        for task in self._inflight.values():
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._mp_manager is not None:
+            self._mp_manager.shutdown()
+            self._mp_manager = None
+
+
+def _kernel(engine: SimulationEngine) -> str:
+    return "vectorized" if engine.vectorized else "mesa"
+
+
+def _progress(completed_iterations: int, n_iterations: int, percent: float, **extra) -> Dict:
+    return {
+        "completed_iterations": completed_iterations,
+        "n_iterations": n_iterations,
+        "percent": percent,
+        **extra,
+    }
+
+
+_job_runner: Optional[SimulationJobRunner] = None
+
+
+def get_simulation_job_runner() -> SimulationJobRunner:
+    """
+    Getting the process-wide simulation job runner
+    """
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = SimulationJobRunner()
+    return _job_runner
@@ -0,0 +1,224 @@
+"""
+Simulation result cache
+
+A seeded simulation is fully determined by its inputs, so its results can be
+kept well beyond the 1 hour ``SimulationStore`` TTL:
+
+- the aggregated result (``transform_simulation_results`` output plus
+  explanations) is stored in Redis and Postgres under a key built from the
+  role workloads, role groups, automation factor, iteration count, seed,
+  kernel and horizon, and repeat requests are answered without simulating;
+- the trajectory (steps x metrics array) of every finished iteration is
+  stored in Redis under the same key minus the iteration count, so a
+  request for more iterations only simulates the ones that are missing.
+"""
+
+import hashlib
+import json
+import time
+import zlib
+from datetime import datetime
+from os import environ
+from typing import Dict, Final, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from common.logger import logger
+from ml_models.simulation import SimulationRequestData
+from models.etter import SimulationResultCache
+from services.redis_store import get_redis_client
+from settings.database import SessionLocal
+
+SIMULATION_RESULT_CACHE_TTL_SECONDS: Final[int] = int(
+    environ.get("SIMULATION_RESULT_CACHE_TTL_SECONDS", 30 * 24 * 3600)
+)
+SIMULATION_ITERATION_CACHE_TTL_SECONDS: Final[int] = int(
+    environ.get("SIMULATION_ITERATION_CACHE_TTL_SECONDS", 7 * 24 * 3600)
+)
+# Bump when the model changes in a way that invalidates earlier results
+SIMULATION_MODEL_VERSION: Final[int] = 2
+REDIS_RETRY_SECONDS: Final[int] = 60
+# last_used_at is only rewritten on a read once it is at least this old
+LAST_USED_REFRESH_SECONDS: Final[int] = int(environ.get("SIMULATION_RESULT_LAST_USED_REFRESH_SECONDS", 24 * 3600))
+RESULT_KEY_PREFIX: Final[str] = "simcache:result"
+ITERATION_KEY_PREFIX: Final[str] = "simcache:iterations"
+
+RESULT_FIELDS: Final[tuple] = ("workloads", "yearly_metrics", "explanations", "simulation_steps")
+
+
+class SimulationCacheKeys(NamedTuple):
+    result: str
+    iterations: str
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+
+
+def simulation_cache_keys(
+    workloads: List[Dict], data: SimulationRequestData, n_months: int, kernel: str
+) -> SimulationCacheKeys:
+    """
+    Cache keys for a seeded run. ``workloads`` is the role workload map the
+    run will use, so a change in a role's workloads is a cache miss.
+    """
+    run = {
+        "version": SIMULATION_MODEL_VERSION,
+        "workloads": _digest(workloads),
+        "roles": data["roles"],
+        "company": data["company"],
+        "automation_factor": data["automation_factor"],
+        "seed": data["seed"],
+        "kernel": kernel,
+        "n_months": n_months,
+    }
+    iterations_key = _digest(run)
+    return SimulationCacheKeys(
+        result=_digest({"run": iterations_key, "n_iterations": data["n_iterations"]}),
+        iterations=iterations_key,
+    )
+
+
+class SimulationResultStore:
+    """
+    Redis in front of Postgres for aggregated results, Redis only for
+    per-iteration trajectories. Every backend failure degrades to a cache miss.
+    """
+
+    def __init__(self, use_db: bool = True):
+        self.use_db = use_db
+        self._redis_retry_at: float = 0.0
+
+    def _redis(self):
+        if time.time() < self._redis_retry_at:
+            return None
+        try:
+            return get_redis_client()
+        except Exception as e:
+            logger.warning(f"Redis unavailable for simulation result cache: {e}")
+            self._redis_retry_at = time.time() + REDIS_RETRY_SECONDS
+            return None
+
+    def get_result(self, result_key: str) -> Optional[Dict]:
+        redis_client = self._redis()
+        if redis_client is not None:
+            try:
+                cached = redis_client.get(f"{RESULT_KEY_PREFIX}:{result_key}")
+                if cached:
+                    return json.loads(cached)
+            except Exception as e:
+                logger.warning(f"Failed to read simulation result from redis: {e}")
+
+        if not self.use_db:
+            return None
+        db = SessionLocal()
+        try:
+            row = db.query(SimulationResultCache).filter(
+                SimulationResultCache.cache_key == result_key
+            ).first()
+            if row is None:
+                return None
+            result = row.result
+            now = datetime.utcnow()
+            if row.last_used_at is None or (now - row.last_used_at).total_seconds() >= LAST_USED_REFRESH_SECONDS:
+                row.last_used_at = now
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to read simulation result from database: {e}")
+            return None
+        finally:
+            db.close()
+
+        self._write_redis_result(result_key, result)
+        return result
+
+    def put_result(self, result_key: str, data: SimulationRequestData, kernel: str, result: Dict) -> None:
+        result = {field: result[field] for field in RESULT_FIELDS}
+        self._write_redis_result(result_key, result)
+        if not self.use_db:
+            return
+        db = SessionLocal()
+        try:
+            row = db.query(SimulationResultCache).filter(
+                SimulationResultCache.cache_key == result_key
+            ).first()
+            now = datetime.utcnow()
+            if row is None:
+                db.add(SimulationResultCache(
+                    cache_key=result_key,
+                    company=data["company"],
+                    seed=data["seed"],
+                    n_iterations=data["n_iterations"],
+                    kernel=kernel,
+                    result=result,
+                    created_at=now,
+                    last_used_at=now,
+                ))
+            else:
+                row.result = result
+                row.last_used_at = now
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to store simulation result in database: {e}")
+        finally:
+            db.close()
+
+    def _write_redis_result(self, result_key: str, result: Dict) -> None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.setex(
+                f"{RESULT_KEY_PREFIX}:{result_key}",
+                SIMULATION_RESULT_CACHE_TTL_SECONDS,
+                json.dumps(result),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache simulation result in redis: {e}")
+
+    def get_iterations(
+        self, iterations_key: str, iterations: Iterable[int], shape: Tuple[int, int]
+    ) -> Dict[int, np.ndarray]:
+        """Trajectories of the requested iterations that are already cached, by iteration."""
+        redis_client = self._redis()
+        if redis_client is None:
+            return {}
+        found: Dict[int, np.ndarray] = {}
+        key = f"{ITERATION_KEY_PREFIX}:{iterations_key}"
+        try:
+            for iteration in iterations:
+                cached = redis_client.hget(key, str(iteration))
+                if cached:
+                    trajectory = np.frombuffer(zlib.decompress(cached), dtype=np.float64)
+                    if trajectory.size == shape[0] * shape[1]:
+                        found[iteration] = trajectory.reshape(shape)
+        except Exception as e:
+            logger.warning(f"Failed to read simulation iterations from redis: {e}")
+        return found
+
+    def put_iterations(self, iterations_key: str, trajectories: Dict[int, np.ndarray]) -> None:
+        """Store each iteration's trajectory as compressed float64 bytes."""
+        redis_client = self._redis()
+        if redis_client is None or not trajectories:
+            return
+        key = f"{ITERATION_KEY_PREFIX}:{iterations_key}"
+        try:
+            for iteration, trajectory in trajectories.items():
+                payload = np.ascontiguousarray(trajectory, dtype=np.float64).tobytes()
+                redis_client.hset(key, str(iteration), zlib.compress(payload))
+            redis_client.expire(key, SIMULATION_ITERATION_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to cache simulation iterations in redis: {e}")
+
+
+result_store = SimulationResultStore()
+
+
+def get_simulation_result_store() -> SimulationResultStore:
+    """
+    Getting the process-wide simulation result cache
+    """
+    return result_store
@@ -1,13 +1,19 @@
 import re
 import json
+import time
+import copy
+import asyncio
+import threading
+from collections import OrderedDict
 from os import environ
-from typing import List, Dict, Final, Optional, cast
+from typing import List, Dict, Final, Optional, Tuple, cast
 import traceback
 
 import requests
-import httpx
+from starlette.concurrency import run_in_threadpool
 from constants.auth import DRAUP_LLM_USER, ENV
 from services.simulation.store import InMemoryStore, RedisStore
+from services.upstream_client import get_upstream_client, UPSTREAM_DEFAULT
 from draup_packages.draup_llm_manager import DraupLLMManager
 from ml_models.simulation import RoleDataProvider, Workload
 
@@ -18,6 +24,61 @@ REDIS_HOST: Final[str] = environ.get("REDIS_RW_HOST", "localhost")
 REDIS_PASSWORD: Final[Optional[str]] = environ.get("REDIS_PASSWORD", None)
 
 CACHE_EXPERATION_SECONDS: Final[int] = 30 * 86400
+# In-process memo in front of redis; entries are immutable for the redis TTL,
+# the memo TTL only bounds how long a deleted redis entry keeps being served.
+WORKLOAD_MEMO_TTL_SECONDS: Final[int] = int(environ.get("WORKLOAD_MEMO_TTL_SECONDS", 3600))
+WORKLOAD_MEMO_MAX_ENTRIES: Final[int] = int(environ.get("WORKLOAD_MEMO_MAX_ENTRIES", 2048))
+# Roles fetched and analysed at the same time (workflow API call plus LLM completion)
+WORKLOAD_FETCH_CONCURRENCY: Final[int] = int(environ.get("WORKLOAD_FETCH_CONCURRENCY", 8))
+# Fixed pool of locks that serialize fetches of the same role; keys share a
+# lock by hash, so the pool does not grow with the number of roles seen.
+WORKLOAD_FETCH_LOCK_STRIPES: Final[int] = 64
+WORKFLOW_HISTORY_TIMEOUT_SECONDS: Final[int] = 30
+
+WORKFLOW_API_URL: Final[str] = "https://draup-world.draup.technology/api/workflows"
+WORKFLOW_API_HEADERS: Final[Dict[str, str]] = {
+    "Content-Type": "application/json",
+    "Origin": "https://draup-world.draup.technology",
+}
+
+# Served when a role's workloads cannot be fetched or generated
+DEFAULT_WORKLOADS: Final[List[Workload]] = [
+    {
+        "Name": "Read and write internal documents",
+        "Type": "Non-Auto",
+        "Skill": 0.3,
+        "Time": 0.2,
+        "Reason": "This is a default workload for the role",
+    },
+    {
+        "Name": "Attend meetings",
+        "Type": "Non-Auto",
+        "Skill": 0.4,
+        "Time": 0.15,
+        "Reason": "This is a default workload for the role",
+    },
+    {
+        "Name": "Basic data entry",
+        "Type": "Auto",
+        "Skill": 0.2,
+        "Time": 0.3,
+        "Reason": "This is a default workload for the role",
+    },
+    {
+        "Name": "Email correspondence",
+        "Type": "Non-Auto",
+        "Skill": 0.35,
+        "Time": 0.15,
+        "Reason": "This is a default workload for the role",
+    },
+    {
+        "Name": "Schedule appointments",
+        "Type": "Auto",
+        "Skill": 0.25,
+        "Time": 0.2,
+        "Reason": "This is a default workload for the role",
+    },
+]
 
 
 def extract_json_from_text(text: str) -> Dict:
@@ -63,6 +124,16 @@ def convert_to_snake_case(input_str):
 
 
 class EtterConsoleDataProvider(RoleDataProvider):
+    """
+    Role workloads built from a role's Etter assessment: the workflow history
+    is fetched from Draup World and an LLM splits its task table into
+    automatable and manual workloads.
+
+    Results are looked up in an in-process memo, then in redis (30 days).
+    Concurrent requests for the same (company, role) share one fetch, and
+    async fetches across roles are bounded by ``WORKLOAD_FETCH_CONCURRENCY``.
+    """
+
     def __init__(self, llm_provider: str = "openai", model_name: str = "gpt-4.1-mini"):
         self._model_name = model_name
         self._llm_provider = llm_provider
@@ -81,15 +152,21 @@ class EtterConsoleDataProvider(RoleDataProvider):
             llm_provider=llm_provider,
             process="workload_automation_analysis",
         )
+        self._session = requests.Session()
 
-    def _get_workflow_history(self, company_name: str, role_name: str) -> dict:
-        url = "https://draup-world.draup.technology/api/workflows"
-        headers = {
-            "Content-Type": "application/json",
-            "Origin": "https://draup-world.draup.technology",
-        }
+        self._memo: "OrderedDict[str, Tuple[float, List[Workload]]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._key_locks: List[threading.Lock] = [threading.Lock() for _ in range(WORKLOAD_FETCH_LOCK_STRIPES)]
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._fetch_slots = asyncio.Semaphore(WORKLOAD_FETCH_CONCURRENCY)
+
+    @staticmethod
+    def _cache_key(role: str, company: str) -> str:
+        return f"workloads:{convert_to_snake_case(role)}#{convert_to_snake_case(company)}"
 
-        data = {
+    @staticmethod
+    def _workflow_request(company_name: str, role_name: str) -> dict:
+        return {
             "workflow": "role_assessment_data",
             "step": "get_complete_assessment_data",
             "data": {
@@ -99,7 +176,24 @@ class EtterConsoleDataProvider(RoleDataProvider):
             },
         }
 
-        response = requests.post(url, headers=headers, json=data)
+    def _get_workflow_history(self, company_name: str, role_name: str) -> dict:
+        response = self._session.post(
+            WORKFLOW_API_URL,
+            headers=WORKFLOW_API_HEADERS,
+            json=self._workflow_request(company_name, role_name),
+            timeout=WORKFLOW_HISTORY_TIMEOUT_SECONDS,
+        )
+        return response.json()
+
+    async def _get_workflow_history_async(self, company_name: str, role_name: str) -> dict:
+        response = await get_upstream_client().request(
+            "POST",
+            WORKFLOW_API_URL,
+            upstream=UPSTREAM_DEFAULT,
+            headers=WORKFLOW_API_HEADERS,
+            json=self._workflow_request(company_name, role_name),
+        )
+        response.raise_for_status()
         return response.json()
 
     def _extract_task_analysis_and_impact_score(
@@ -148,39 +242,19 @@ class EtterConsoleDataProvider(RoleDataProvider):
         workload_table = cast(List[Workload], workload_table)
         return workload_table
 
-    def _generate_auto_and_non_auto_workloads(self, data: Dict) -> List[Workload]:
-        res = self._llm_client.completion(
-            prompt_name="workload_automation_analysis_no_reasoning",
-            placeholders={
+    @staticmethod
+    def _workload_prompt(data: Dict) -> Dict:
+        return {
+            "prompt_name": "workload_automation_analysis_no_reasoning",
+            "placeholders": {
                 "COMPANY": data["company_name"],
                 "ROLE": data["role_name"],
                 "WORKLOAD_TABLE": json.dumps(data["workload_table"]),
                 "AI_IMPACT_SCORE": str(data["ai_impact_score"]),
             },
-        )
-
-        workload_json_str = extract_tag_from_text(
-            "json", res["choices"][0]["message"]["content"]
-        )
-        if workload_json_str is None:
-            print(res["choices"][0]["message"]["content"])
-            raise Exception("Failed to extract workload data")
-
-        workload_data = json.loads(workload_json_str)
-        workload_data = self._validate_workload_table(workload_data)
-        return workload_data
-
-    async def _generate_auto_and_non_auto_workloads_async(self, data: Dict) -> List[Workload]:
-        res = await self._llm_client.acompletion(
-            prompt_name="workload_automation_analysis_no_reasoning",
-            placeholders={
-                "COMPANY": data["company_name"],
-                "ROLE": data["role_name"],
-                "WORKLOAD_TABLE": json.dumps(data["workload_table"]),
-                "AI_IMPACT_SCORE": str(data["ai_impact_score"]),
-            },
-        )
+        }
 
+    def _parse_workloads(self, res: Dict) -> List[Workload]:
         workload_json_str = extract_tag_from_text(
             "json", res["choices"][0]["message"]["content"]
         )
@@ -192,40 +266,100 @@ class EtterConsoleDataProvider(RoleDataProvider):
         workload_data = self._validate_workload_table(workload_data)
         return workload_data
 
+    def _generate_auto_and_non_auto_workloads(self, data: Dict) -> List[Workload]:
+        res = self._llm_client.completion(**self._workload_prompt(data))
+        return self._parse_workloads(res)
 
-    async def _get_workflow_history_async(self, company_name: str, role_name: str) -> dict:
-        url = "https://draup-world.draup.technology/api/workflows"
-        headers = {
-            "Content-Type": "application/json",
-            "Origin": "https://draup-world.draup.technology",
-        }
+    async def _generate_auto_and_non_auto_workloads_async(self, data: Dict) -> List[Workload]:
+        res = await self._llm_client.acompletion(**self._workload_prompt(data))
+        return self._parse_workloads(res)
 
-        data = {
-            "workflow": "role_assessment_data",
-            "step": "get_complete_assessment_data",
-            "data": {
-                "company": company_name,
-                "role": role_name,
-                "include_history": False,
-            },
+    def _analysis_input(self, company: str, role: str, workflow_history: dict) -> Dict:
+        try:
+            workload_analysis_table, ai_impact_score = (
+                self._extract_task_analysis_and_impact_score(workflow_history)
+            )
+        except Exception as e:
+            print(f"Workflow history: {json.dumps(workflow_history)}")
+            raise Exception(
+                f"Error extracting task analysis and impact score for {company} {role}: {e}"
+            )
+        return {
+            "workload_table": workload_analysis_table,
+            "ai_impact_score": ai_impact_score,
+            "company_name": company,
+            "role_name": role,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            return response.json()
-
+    def _memo_get(self, key: str) -> Optional[List[Workload]]:
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > WORKLOAD_MEMO_TTL_SECONDS:
+                del self._memo[key]
+                return None
+            self._memo.move_to_end(key)
+            return entry[1]
+
+    def _memo_put(self, key: str, workloads: List[Workload]) -> None:
+        with self._memo_lock:
+            self._memo[key] = (time.monotonic(), workloads)
+            self._memo.move_to_end(key)
+            while len(self._memo) > WORKLOAD_MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+
+    def _cached(self, key: str) -> Optional[List[Workload]]:
+        """Workloads from the memo, else from redis (memoised on the way out)."""
+        workloads = self._memo_get(key)
+        if workloads is not None:
+            return workloads
+        try:
+            workload_data = self._cache.get(key)
+        except Exception as e:
+            print(f"Error reading workloads from redis: {e}", flush=True)
+            return None
+        if not workload_data:
+            return None
+        workloads = json.loads(workload_data)
+        self._memo_put(key, workloads)
+        return workloads
+
+    def _store(self, key: str, workloads: List[Workload]) -> None:
+        self._memo_put(key, workloads)
+        try:
+            self._cache.setex(key, CACHE_EXPERATION_SECONDS, json.dumps(workloads))
+        except Exception as e:
+            print(f"Error caching workloads in redis: {e}", flush=True)
+
+    @staticmethod
+    def _fallback(role: str, company: str, error: Exception) -> List[Workload]:
+        """Default workloads for a role whose analysis failed. They are not cached."""
+        print(
+            f"While using llm to extract role metrics {role} {company}, Error:",
+            error,
+            flush=True,
+        )
+        traceback.print_exc()
+        return copy.deepcopy(DEFAULT_WORKLOADS)
 
     def get_responsibilities_from_role(
         self, role: str, company: str = ""
     ) -> List[Workload]:
-        role_company_id = (
-            f"workloads:{convert_to_snake_case(role)}#{convert_to_snake_case(company)}"
-        )
-        workload_data = self._cache.get(role_company_id)
-        if workload_data:
-            return json.loads(workload_data)
-
+        key = self._cache_key(role, company)
+        workloads = self._cached(key)
+        if workloads is not None:
+            return workloads
+
+        with self._key_locks[hash(key) % len(self._key_locks)]:
+            # Another thread may have fetched this role while we waited.
+            workloads = self._cached(key)
+            if workloads is not None:
+                return workloads
+            return self._fetch_workloads(key, role, company)
+
+    def _fetch_workloads(self, key: str, role: str, company: str) -> List[Workload]:
+        workload_data = None
         try:
             try:
                 workflow_history = self._get_workflow_history(company, role)
@@ -233,91 +367,40 @@ class EtterConsoleDataProvider(RoleDataProvider):
                 raise Exception(
                     f"Error getting workflow history for {company} {role}: {e}"
                 )
-
-            try:
-                workload_analysis_table, ai_impact_score = (
-                    self._extract_task_analysis_and_impact_score(workflow_history)
-                )
-            except Exception as e:
-                print(f"Workflow history: {json.dumps(workflow_history)}")
-                raise Exception(
-                    f"Error extracting task analysis and impact score for {company} {role}: {e}"
-                )
+            analysis_input = self._analysis_input(company, role, workflow_history)
             try:
-                workload_data = self._generate_auto_and_non_auto_workloads(
-                    data={
-                        "workload_table": workload_analysis_table,
-                        "ai_impact_score": ai_impact_score,
-                        "company_name": company,
-                        "role_name": role,
-                    }
-                )
-                self._cache.setex(
-                    role_company_id, CACHE_EXPERATION_SECONDS, json.dumps(workload_data)
-                )
+                workload_data = self._generate_auto_and_non_auto_workloads(data=analysis_input)
+                self._store(key, workload_data)
             except Exception:
                 raise Exception(
                     f"Generated a invalid workload table for {company} {role}: {workload_data}"
                 )
-
         except Exception as e:
-            print(
-                f"While using llm to extract role metrics {role} {company}, Error:",
-                e,
-                flush=True,
-            )
-            traceback.print_exc()
-            workload_data = [
-                {
-                    "Name": "Read and write internal documents",
-                    "Type": "Non-Auto",
-                    "Skill": 0.3,
-                    "Time": 0.2,
-                    "Reason": "This is a default workload for the role",
-                },
-                {
-                    "Name": "Attend meetings",
-                    "Type": "Non-Auto",
-                    "Skill": 0.4,
-                    "Time": 0.15,
-                    "Reason": "This is a default workload for the role",
-                },
-                {
-                    "Name": "Basic data entry",
-                    "Type": "Auto",
-                    "Skill": 0.2,
-                    "Time": 0.3,
-                    "Reason": "This is a default workload for the role",
-                },
-                {
-                    "Name": "Email correspondence",
-                    "Type": "Non-Auto",
-                    "Skill": 0.35,
-                    "Time": 0.15,
-                    "Reason": "This is a default workload for the role",
-                },
-                {
-                    "Name": "Schedule appointments",
-                    "Type": "Auto",
-                    "Skill": 0.25,
-                    "Time": 0.2,
-                    "Reason": "This is a default workload for the role",
-                },
-            ]
-
+            return self._fallback(role, company, e)
         return workload_data
 
-
     async def get_responsibilities_from_role_async(
-            self, role: str, company: str = ""
-        ) -> List[Workload]:
-            role_company_id = (
-                f"workloads:{convert_to_snake_case(role)}#{convert_to_snake_case(company)}"
-            )
-            workload_data = self._cache.get(role_company_id)
-            if workload_data:
-                return json.loads(workload_data)
-
+        self, role: str, company: str = ""
+    ) -> List[Workload]:
+        key = self._cache_key(role, company)
+        # Only a memo miss goes to redis, off the event loop.
+        workloads = self._memo_get(key)
+        if workloads is None:
+            workloads = await run_in_threadpool(self._cached, key)
+        if workloads is not None:
+            return workloads
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_workloads_async(key, role, company))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the fetch other callers are waiting on.
+        return await asyncio.shield(pending)
+
+    async def _fetch_workloads_async(self, key: str, role: str, company: str) -> List[Workload]:
+        workload_data = None
+        async with self._fetch_slots:
             try:
                 try:
                     workflow_history = await self._get_workflow_history_async(company, role)
@@ -325,76 +408,16 @@ class EtterConsoleDataProvider(RoleDataProvider):
                     raise Exception(
                         f"Error getting workflow history for {company} {role}: {e}"
                     )
-
-                try:
-                    workload_analysis_table, ai_impact_score = (
-                        self._extract_task_analysis_and_impact_score(workflow_history)
-                    )
-                except Exception as e:
-                    print(f"Workflow history: {json.dumps(workflow_history)}")
-                    raise Exception(
-                        f"Error extracting task analysis and impact score for {company} {role}: {e}"
-                    )
+                analysis_input = self._analysis_input(company, role, workflow_history)
                 try:
                     workload_data = await self._generate_auto_and_non_auto_workloads_async(
-                        data={
-                            "workload_table": workload_analysis_table,
-                            "ai_impact_score": ai_impact_score,
-                            "company_name": company,
-                            "role_name": role,
-                        }
-                    )
-                    self._cache.setex(
-                        role_company_id, CACHE_EXPERATION_SECONDS, json.dumps(workload_data)
+                        data=analysis_input
                     )
+                    await run_in_threadpool(self._store, key, workload_data)
                 except Exception:
                     raise Exception(
                         f"Generated a invalid workload table for {company} {role}: {workload_data}"
                     )
-
             except Exception as e:
-                print(
-                    f"While using llm to extract role metrics {role} {company}, Error:",
-                    e,
-                    flush=True,
-                )
-                traceback.print_exc()
-                workload_data = [
-                    {
-                        "Name": "Read and write internal documents",
-                        "Type": "Non-Auto",
-                        "Skill": 0.3,
-                        "Time": 0.2,
-                        "Reason": "This is a default workload for the role",
-                    },
-                    {
-                        "Name": "Attend meetings",
-                        "Type": "Non-Auto",
-                        "Skill": 0.4,
-                        "Time": 0.15,
-                        "Reason": "This is a default workload for the role",
-                    },
-                    {
-                        "Name": "Basic data entry",
-                        "Type": "Auto",
-                        "Skill": 0.2,
-                        "Time": 0.3,
-                        "Reason": "This is a default workload for the role",
-                    },
-                    {
-                        "Name": "Email correspondence",
-                        "Type": "Non-Auto",
-                        "Skill": 0.35,
-                        "Time": 0.15,
-                        "Reason": "This is a default workload for the role",
-                    },
-                    {
-                        "Name": "Schedule appointments",
-                        "Type": "Auto",
-                        "Skill": 0.25,
-                        "Time": 0.2,
-                        "Reason": "This is a default workload for the role",
-                    },
-                ]
-
-            return workload_data
+                return self._fallback(role, company, e)
+        return workload_data
@@ -1,13 +1,14 @@
-import traceback
 import json
 from os import environ
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Final
 from pandas import DataFrame, Series, concat
 
 from ml_models.simulation import SimulationEngine
-from ml_models.simulation import SimulationRequestData
 from services.simulation.role_provider import EtterConsoleDataProvider
 
+# Run iterations on the vectorized, agent-free kernel instead of Mesa agents
+SIMULATION_VECTORIZED: Final[bool] = environ.get("SIMULATION_VECTORIZED", "false").lower() == "true"
+
 
 def get_simulation_engine() -> SimulationEngine:
     """
@@ -18,12 +19,14 @@ def get_simulation_engine() -> SimulationEngine:
     if not hasattr(get_simulation_engine, "_engine"):
         if provider_type == "local":
             print("Using LocalSimulationEngine", flush=True)
-            get_simulation_engine._engine = SimulationEngine(number_of_months=48)
+            get_simulation_engine._engine = SimulationEngine(
+                number_of_months=48, vectorized=SIMULATION_VECTORIZED
+            )
         else:
             print("Using EtterConsoleDataProvider", flush=True)
             provider = EtterConsoleDataProvider()
             get_simulation_engine._engine = SimulationEngine(
-                role_provider=provider, number_of_months=48
+                role_provider=provider, number_of_months=48, vectorized=SIMULATION_VECTORIZED
             )
     return get_simulation_engine._engine
 
@@ -32,7 +35,7 @@ def transform_simulation_results(
     role_groups: List[Dict], simulation_data: DataFrame
 ) -> Tuple[List[Dict], List[Dict]]:
     simulation_data.drop(
-        columns=["role_groups", "role_provider", "automation_factor"], inplace=True
+        columns=["role_groups", "role_provider", "automation_factor"], inplace=True, errors="ignore"
     )
     total_employee = sum([group["count"] for group in role_groups])
     total_salary = sum([group["salary"] * group["count"] for group in role_groups])
@@ -387,43 +390,3 @@ def explain_results(role_groups: List[Dict], role_workload_map: List[Dict], year
         })
     
     return explanations
-
-async def run_and_store_simulation(
-    data: SimulationRequestData,
-) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
-    """
-    Background task to run the simulation and update its results.
-    """
-    engine: SimulationEngine = get_simulation_engine()
-    
-    results = []
-    workloads = []
-    yearly_metrics = []
-    try:
-        if data["n_iterations"] > 0:
-            workloads = await engine.get_role_workload_map_async(data["roles"], data["company"])
-            results = engine.run_multiple_simulations(
-                role_groups=data["roles"],
-                company=data["company"],
-                automation_factor=data["automation_factor"],
-                n_simulations=data["n_iterations"],
-            )
-            results, yearly_metrics = transform_simulation_results(
-                data["roles"], simulation_data=results
-            )
-            explanations = explain_results(data["roles"], workloads, yearly_metrics)
-
-
-#         # 9. Limitations and Assumptions
-#         limitations_and_assumptions_text = """### Limitations and Assumptions
-# - **Linear Automation**: Automation adoption follows a simplified model and may not capture all real-world complexities. For example, the automation factor is fixed for the entire simulation period, and determines the speed of automation adoptions.
-# - **Static Workload Model**: Assumes workload characteristics remain constant throughout the simulation period.
-# - **Skill Homogeneity**: Assumes uniform skill levels across employees within the same role.
-# - **Automation Factor**: The automation factor is fixed for the entire simulation period, and determines the speed of automation adoptions.
-# """
-
-        return results, yearly_metrics, workloads, explanations
-    except Exception as e:
-        print("Error during simulation:", e)
-        traceback.print_exc()
-        return results, yearly_metrics, workloads, []
@@ -0,0 +1,204 @@
+"""
+Delta storage for workflow step history versions.
+
+Every version of a workflow gets one UserWorkflowStepsHistory row per step.
+Most steps do not change between versions (only versionId and
+isPreviousUpdated move), so in delta mode a row stores a structural JSON
+diff against a full snapshot of the same step instead of a copy:
+
+    {"$delta": {"base": <snapshot version_id>, "diff": <diff>}}
+
+Deltas always point at a snapshot, never at another delta, so any version
+is rebuilt from at most two rows. A step is written as a new snapshot when
+its snapshot is SNAPSHOT_INTERVAL versions old or when the diff would not
+be much smaller than the data itself, which keeps diffs from growing
+without bound.
+
+Rows written in full mode (and rows written before delta mode existed)
+are plain snapshots, so both modes read the same way. Readers must go
+through resolve_step_data() instead of reading UserWorkflowStepsHistory.data.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.etter import UserWorkflowStepsHistory
+
+STEP_HISTORY_MODE = os.getenv("ETTER_STEP_HISTORY_MODE", "delta")  # "delta" or "full"
+SNAPSHOT_INTERVAL = int(os.getenv("ETTER_STEP_HISTORY_SNAPSHOT_INTERVAL", "10"))
+# A delta is only kept if it is at most this fraction of the full data's size
+MAX_DELTA_RATIO = 0.5
+
+DELTA_KEY = "$delta"
+
+# Diff nodes: {} unchanged, {"=": value} replaced,
+# {"set": {...}, "del": [...], "sub": {...}} for dicts, {"items": {"i": node}} for equal-length lists
+_REPLACE = "="
+
+SnapshotKey = Tuple[int, Optional[int], int]
+
+
+# ──────────────────────────────────────────────────────────────
+# Structural JSON diff
+# ──────────────────────────────────────────────────────────────
+
+
+def json_diff(old: Any, new: Any) -> Dict[str, Any]:
+    """Diff turning `old` into `new`; {} when they are equal."""
+    if old == new:
+        return {}
+    if isinstance(old, dict) and isinstance(new, dict):
+        node: Dict[str, Any] = {}
+        changed = {k: v for k, v in new.items() if k not in old}
+        removed = [k for k in old if k not in new]
+        nested = {}
+        for k in old.keys() & new.keys():
+            if old[k] == new[k]:
+                continue
+            sub = json_diff(old[k], new[k])
+            if _REPLACE in sub:
+                changed[k] = sub[_REPLACE]
+            else:
+                nested[k] = sub
+        if changed:
+            node["set"] = changed
+        if removed:
+            node["del"] = removed
+        if nested:
+            node["sub"] = nested
+        return node
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        return {"items": {str(i): json_diff(a, b) for i, (a, b) in enumerate(zip(old, new)) if a != b}}
+    return {_REPLACE: new}
+
+
+def apply_diff(old: Any, diff: Dict[str, Any]) -> Any:
+    """Apply a json_diff() result to `old` without mutating it."""
+    if not diff:
+        return old
+    if _REPLACE in diff:
+        return diff[_REPLACE]
+    if "items" in diff:
+        new_list = list(old)
+        for i, sub in diff["items"].items():
+            new_list[int(i)] = apply_diff(new_list[int(i)], sub)
+        return new_list
+    new = {k: v for k, v in old.items() if k not in diff.get("del", ())}
+    for k, sub in diff.get("sub", {}).items():
+        new[k] = apply_diff(old[k], sub)
+    new.update(diff.get("set", {}))
+    return new
+
+
+# ──────────────────────────────────────────────────────────────
+# Row encoding
+# ──────────────────────────────────────────────────────────────
+
+
+def is_delta(stored: Any) -> bool:
+    return isinstance(stored, dict) and DELTA_KEY in stored and len(stored) == 1
+
+
+def snapshot_version(stored: Any, version_id: int) -> int:
+    """Version of the snapshot a stored row is rebuilt from (its own version for snapshots)."""
+    return stored[DELTA_KEY]["base"] if is_delta(stored) else version_id
+
+
+def encode_step_data(data: Any, version_id: int, base_version: Optional[int], base_data: Any) -> Any:
+    """What to store for `data` at `version_id`, given the step's latest snapshot.
+
+    Returns `data` itself (a new snapshot) in full mode, without a base,
+    once the snapshot is SNAPSHOT_INTERVAL versions old, or when the diff
+    is not worth it; otherwise a delta against the snapshot.
+    """
+    if (
+        STEP_HISTORY_MODE != "delta"
+        or base_version is None
+        or base_data is None
+        or version_id - base_version >= SNAPSHOT_INTERVAL
+    ):
+        return data
+    diff = json_diff(base_data, data)
+    if len(json.dumps(diff, default=str)) > MAX_DELTA_RATIO * len(json.dumps(data, default=str)):
+        return data
+    return {DELTA_KEY: {"base": base_version, "diff": diff}}
+
+
+def decode_step_data(stored: Any, snapshot: Any) -> Any:
+    """Full step data from a stored row and (for deltas) its snapshot's data.
+
+    Deltas decode to a private copy, so callers may mutate the result even
+    when several versions share one snapshot.
+    """
+    if not is_delta(stored):
+        return stored
+    if snapshot is None:
+        raise ValueError(f"Snapshot version {stored[DELTA_KEY]['base']} missing for step delta")
+    # JSONB values are plain JSON, so a JSON round trip is an exact (and faster) deep copy
+    return json.loads(json.dumps(apply_diff(snapshot, stored[DELTA_KEY]["diff"])))
+
+
+# ──────────────────────────────────────────────────────────────
+# Reads
+# ──────────────────────────────────────────────────────────────
+
+
+def _snapshot_key(row, version_id: int) -> SnapshotKey:
+    return row.user_workflow_history_id, row.workflow_step_info_id, version_id
+
+
+def load_snapshots(db, rows: Iterable[Any]) -> Dict[SnapshotKey, Any]:
+    """Snapshot data referenced by the delta rows among `rows`, in one query.
+
+    Rows need user_workflow_history_id, workflow_step_info_id, version_id and data.
+    """
+    wanted = {
+        _snapshot_key(row, snapshot_version(row.data, row.version_id))
+        for row in rows
+        if is_delta(row.data)
+    }
+    if not wanted:
+        return {}
+    history_ids = {key[0] for key in wanted}
+    versions = {key[2] for key in wanted}
+    candidates = (
+        db.query(
+            UserWorkflowStepsHistory.user_workflow_history_id,
+            UserWorkflowStepsHistory.workflow_step_info_id,
+            UserWorkflowStepsHistory.version_id,
+            UserWorkflowStepsHistory.data,
+        )
+        .filter(
+            UserWorkflowStepsHistory.user_workflow_history_id.in_(history_ids),
+            UserWorkflowStepsHistory.version_id.in_(versions),
+        )
+        .order_by(UserWorkflowStepsHistory.id)
+        .all()
+    )
+    return collect_snapshots(wanted, candidates)
+
+
+def collect_snapshots(wanted: Iterable[SnapshotKey], candidates: Iterable[Any]) -> Dict[SnapshotKey, Any]:
+    """Pick the snapshot rows matching `wanted` out of candidate rows (first row wins)."""
+    wanted = set(wanted)
+    snapshots: Dict[SnapshotKey, Any] = {}
+    for row in candidates:
+        key = _snapshot_key(row, row.version_id)
+        if key in wanted and key not in snapshots and not is_delta(row.data):
+            snapshots[key] = row.data
+    return snapshots
+
+
+def resolve_rows(rows: Sequence[Any], snapshots: Dict[SnapshotKey, Any]) -> List[Any]:
+    """Full data for each row, in order, given the snapshots from load_snapshots()."""
+    return [
+        decode_step_data(row.data, snapshots.get(_snapshot_key(row, snapshot_version(row.data, row.version_id))))
+        for row in rows
+    ]
+
+
+def resolve_step_data(db, rows: Sequence[Any]) -> List[Any]:
+    """Full data for each step history row (ORM objects or query rows), in order."""
+    rows = list(rows)
+    return resolve_rows(rows, load_snapshots(db, rows))
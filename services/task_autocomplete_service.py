@@ -3,19 +3,139 @@ Task Autocomplete Service
 
 Provides autocomplete functionality for tasks using PostgreSQL cache with GIN indexes.
 Tasks are cached from role_assessment_data workflow and can be refreshed on-demand or via scheduled jobs.
+
+Stale caches are served as they are while a background refresh runs
+(stale-while-revalidate); only a company+role with no cached tasks at all
+waits, up to TASK_AUTOCOMPLETE_COLD_WAIT_SECONDS, for its first refresh.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from os import environ
+from typing import List, Dict, Any, Final, Optional, Tuple
 from datetime import datetime, timedelta
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from sqlalchemy import text, and_
+from sqlalchemy import func, text
 
-from models.etter import TaskAutocompleteCache, SampleData
+from models.etter import TaskAutocompleteCache
 from services.etter import get_tasks_from_sources
+from settings.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+TASK_AUTOCOMPLETE_REFRESH_WORKERS: Final[int] = int(environ.get("TASK_AUTOCOMPLETE_REFRESH_WORKERS", 2))
+# A failed or empty refresh is not retried from the request path for this long
+TASK_AUTOCOMPLETE_RETRY_SECONDS: Final[int] = int(environ.get("TASK_AUTOCOMPLETE_RETRY_SECONDS", 300))
+TASK_AUTOCOMPLETE_COLD_WAIT_SECONDS: Final[float] = float(environ.get("TASK_AUTOCOMPLETE_COLD_WAIT_SECONDS", 5))
+TASK_AUTOCOMPLETE_BATCH_CONCURRENCY: Final[int] = int(environ.get("TASK_AUTOCOMPLETE_BATCH_CONCURRENCY", 4))
+UPSERT_CHUNK_SIZE: Final[int] = 1000
+
+
+class TaskAutocompleteRefresher:
+    """
+    Runs cache refreshes off the request path, at most one per company+role at a time.
+
+    Args:
+        refresh: Refreshes one company+role and returns its result dict.
+        workers: Refreshes running at once.
+        retry_seconds: How long a failed or empty refresh blocks new ones for the same pair.
+    """
+
+    def __init__(
+        self,
+        refresh,
+        workers: int = TASK_AUTOCOMPLETE_REFRESH_WORKERS,
+        retry_seconds: int = TASK_AUTOCOMPLETE_RETRY_SECONDS,
+    ):
+        self.refresh = refresh
+        self.retry_seconds = retry_seconds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task-autocomplete-refresh")
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._retry_at: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, company: str, role: str) -> Optional[Future]:
+        """
+        Queue a refresh of company+role unless one is already running (its future is returned then)
+        or the last one failed less than retry_seconds ago (returns None).
+        """
+        key = (company, role)
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            if self._retry_at.get(key, 0) > time.monotonic():
+                return None
+            try:
+                future = self._executor.submit(self._run, key)
+            except RuntimeError:
+                # Executor shut down
+                return None
+            self._in_flight[key] = future
+        return future
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "in_flight": [f"{company}+{role}" for company, role in self._in_flight],
+                "backing_off": [f"{company}+{role}" for (company, role), at in self._retry_at.items() if at > now],
+            }
+
+    def _run(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"status": "error", "company": key[0], "role": key[1]}
+        try:
+            result = self.refresh(*key)
+            return result
+        except Exception as e:
+            logger.error(f"Background refresh failed for {key[0]}+{key[1]}: {str(e)}")
+            result["error"] = str(e)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if result.get("status") == "success" and result.get("tasks_cached"):
+                    self._retry_at.pop(key, None)
+                else:
+                    self._retry_at[key] = time.monotonic() + self.retry_seconds
+
+
+def _refresh_with_own_session(company: str, role: str) -> Dict[str, Any]:
+    """Refresh one company+role in a session of its own (for worker threads)."""
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = refresh_task_autocomplete_cache(db, company, role)
+    except Exception as e:
+        logger.error(f"Error refreshing task cache for {company}+{role}: {str(e)}")
+        result = {'status': 'error', 'error': str(e), 'company': company, 'role': role}
+    finally:
+        db.close()
+    # Error results from refresh_task_autocomplete_cache do not name the pair
+    result.setdefault('company', company)
+    result.setdefault('role', role)
+    result['duration_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+_refresher: Optional[TaskAutocompleteRefresher] = None
+
+
+def get_task_autocomplete_refresher() -> TaskAutocompleteRefresher:
+    """
+    Getting the process-wide background refresher for the task autocomplete cache
+    """
+    global _refresher
+    if _refresher is None:
+        _refresher = TaskAutocompleteRefresher(_refresh_with_own_session)
+    return _refresher
+
 
 def fetch_tasks_autocomplete(
     db: Session,
@@ -42,10 +162,16 @@ def fetch_tasks_autocomplete(
         List of dictionaries with task_name and task_type (max 50 results)
     """
     try:
-        # Check if cache exists and is fresh
-        if check_cache_staleness(db, company, role):
-            logger.info(f"Cache is stale for {company}+{role}, refreshing...")
-            refresh_task_autocomplete_cache(db, company, role)
+        # Serve what is cached; refresh stale caches in the background
+        last_update = get_cache_last_update(db, company, role)
+        if _is_stale(last_update):
+            future = get_task_autocomplete_refresher().schedule(company, role)
+            if last_update is None and future is not None:
+                logger.info(f"No cache for {company}+{role}, waiting for the first refresh")
+                if not wait([future], timeout=TASK_AUTOCOMPLETE_COLD_WAIT_SECONDS).done:
+                    logger.info(f"First refresh for {company}+{role} still running, serving empty results")
+            elif future is not None:
+                logger.info(f"Cache is stale for {company}+{role}, refreshing in the background")
 
         # Query using GIN index for fast prefix matching
         # Build query with optional task_type filter
@@ -145,37 +271,7 @@ def refresh_task_autocomplete_cache(
                 'message': 'No tasks found'
             }
 
-        # Upsert tasks into cache table
-        tasks_cached = 0
-        for task_dict in tasks:
-            task_name = task_dict.get('task')
-            task_type = task_dict.get('task_type')
-
-            if not task_name:
-                continue
-
-            # Use raw SQL for efficient upsert
-            upsert_query = text("""
-                INSERT INTO etter.etter_task_autocomplete_cache
-                    (task_name, company, role, task_type, source, updated_at)
-                VALUES
-                    (:task_name, :company, :role, :task_type, :source, NOW())
-                ON CONFLICT (task_name, company, role)
-                DO UPDATE SET
-                    task_type = EXCLUDED.task_type,
-                    source = EXCLUDED.source,
-                    updated_at = NOW()
-            """)
-
-            db.execute(upsert_query, {
-                'task_name': task_name,
-                'company': company,
-                'role': role,
-                'task_type': task_type,
-                'source': 'role_assessment_data'
-            })
-            tasks_cached += 1
-
+        tasks_cached = upsert_task_cache_rows(db, company, role, tasks)
         db.commit()
 
         logger.info(f"Successfully cached {tasks_cached} tasks for {company}+{role}")
@@ -200,16 +296,61 @@ def refresh_task_autocomplete_cache(
         }
 
 
-def refresh_all_task_autocomplete_cache(db: Session) -> Dict[str, Any]:
+def upsert_task_cache_rows(db: Session, company: str, role: str, tasks: List[Dict[str, Any]]) -> int:
+    """
+    Upsert tasks into the cache with one multi-row INSERT ... ON CONFLICT per UPSERT_CHUNK_SIZE tasks.
+    Does not commit.
+
+    Returns:
+        Number of distinct task names written
+    """
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement,
+    # so repeated task names keep their last occurrence
+    rows = {}
+    for task_dict in tasks:
+        task_name = task_dict.get('task')
+        if not task_name:
+            continue
+        rows[task_name] = {
+            'task_name': task_name,
+            'company': company,
+            'role': role,
+            'task_type': task_dict.get('task_type'),
+            'source': 'role_assessment_data',
+        }
+
+    values = list(rows.values())
+    for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(TaskAutocompleteCache).values(values[start:start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['task_name', 'company', 'role'],
+            set_={
+                'task_type': stmt.excluded.task_type,
+                'source': stmt.excluded.source,
+                'updated_at': func.now(),
+            },
+        )
+        db.execute(stmt)
+    return len(values)
+
+
+def refresh_all_task_autocomplete_cache(
+    db: Session,
+    max_workers: int = TASK_AUTOCOMPLETE_BATCH_CONCURRENCY,
+) -> Dict[str, Any]:
     """
     Refresh task autocomplete cache for ALL known company+role combinations.
     Used by daily scheduled job.
 
+    Pairs are refreshed by up to max_workers threads, each with its own
+    session; every result carries its duration_seconds.
+
     Args:
-        db: Database session
+        db: Database session (used to list the combinations)
+        max_workers: Refreshes running at once
 
     Returns:
-        Summary dict with total, successful, and failed counts
+        Summary dict with total, successful, and failed counts, per-pair results and the slowest pairs
     """
     try:
         logger.info("Starting batch refresh of all task autocomplete caches")
@@ -227,35 +368,33 @@ def refresh_all_task_autocomplete_cache(db: Session) -> Dict[str, Any]:
                 'results': []
             }
 
-        results = []
-        successful = 0
-        failed = 0
-
-        for company, role in combinations:
-            try:
-                result = refresh_task_autocomplete_cache(db, company, role)
-                if result.get('status') == 'success':
-                    successful += 1
-                else:
-                    failed += 1
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to refresh {company}+{role}: {str(e)}")
-                failed += 1
-                results.append({
-                    'status': 'error',
-                    'company': company,
-                    'role': role,
-                    'error': str(e)
-                })
-
-        logger.info(f"Batch refresh complete: {successful} successful, {failed} failed out of {len(combinations)} total")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(combinations))),
+            thread_name_prefix="task-autocomplete-batch",
+        ) as pool:
+            results = list(pool.map(lambda pair: _refresh_with_own_session(*pair), combinations))
+        duration = time.perf_counter() - started
+
+        successful = sum(1 for result in results if result.get('status') == 'success')
+        failed = len(results) - successful
+        slowest = sorted(results, key=lambda result: result['duration_seconds'], reverse=True)[:10]
+
+        logger.info(
+            f"Batch refresh complete: {successful} successful, {failed} failed out of {len(combinations)} total "
+            f"in {duration:.1f}s ({max_workers} workers)"
+        )
 
         return {
             'status': 'success',
             'total_combinations': len(combinations),
             'successful': successful,
             'failed': failed,
+            'duration_seconds': round(duration, 3),
+            'slowest': [
+                {'company': r.get('company'), 'role': r.get('role'), 'duration_seconds': r['duration_seconds']}
+                for r in slowest
+            ],
             'results': results
         }
 
@@ -328,35 +467,36 @@ def check_cache_staleness(
         True if cache is stale and needs refresh, False otherwise
     """
     try:
-        # Check if any tasks exist for this company+role and when they were last updated
-        query = text("""
-            SELECT MAX(updated_at) as last_update
-            FROM etter.etter_task_autocomplete_cache
-            WHERE company = :company
-              AND role = :role
-        """)
+        last_update = get_cache_last_update(db, company, role)
+    except Exception as e:
+        logger.error(f"Error checking cache staleness: {str(e)}")
+        # On error, assume cache is stale to trigger refresh
+        return True
 
-        result = db.execute(query, {
-            'company': company,
-            'role': role
-        }).fetchone()
+    if last_update is None:
+        logger.info(f"No cache found for {company}+{role}")
+    return _is_stale(last_update, max_age_days)
 
-        if not result or not result[0]:
-            # No cache exists
-            logger.info(f"No cache found for {company}+{role}")
-            return True
 
-        last_update = result[0]
-        age = datetime.utcnow() - last_update
+def get_cache_last_update(db: Session, company: str, role: str) -> Optional[datetime]:
+    """
+    When the cache for a company+role was last written, or None if it has no rows.
+    """
+    # Check if any tasks exist for this company+role and when they were last updated
+    query = text("""
+        SELECT MAX(updated_at) as last_update
+        FROM etter.etter_task_autocomplete_cache
+        WHERE company = :company
+          AND role = :role
+    """)
 
-        if age > timedelta(days=max_age_days):
-            logger.info(f"Cache for {company}+{role} is {age.days} days old (stale)")
-            return True
+    result = db.execute(query, {
+        'company': company,
+        'role': role
+    }).fetchone()
 
-        logger.debug(f"Cache for {company}+{role} is fresh ({age.seconds // 3600} hours old)")
-        return False
+    return result[0] if result else None
 
-    except Exception as e:
-        logger.error(f"Error checking cache staleness: {str(e)}")
-        # On error, assume cache is stale to trigger refresh
-        return True
+
+def _is_stale(last_update: Optional[datetime], max_age_days: int = 1) -> bool:
+    return last_update is None or datetime.utcnow() - last_update > timedelta(days=max_age_days)
@@ -0,0 +1,257 @@
+"""
+Verified token cache
+
+Tiered cache for Draup platform tokens verified by ``services.auth``. An
+in-process TTL/LRU sits in front of the QA-login Redis store so that most
+authenticated requests never reach the remote authenticate endpoint.
+Entries are keyed by a sha256 of the token, never the raw token.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from os import environ
+from typing import Any, Deque, Dict, Final, Optional, Set, Tuple
+
+import jwt
+
+from common.logger import logger
+from services.redis_store import get_redis_qa_login_client
+
+TOKEN_CACHE_MAX_ENTRIES: Final[int] = int(environ.get("TOKEN_CACHE_MAX_ENTRIES", 10000))
+# Upper bound on how long a worker trusts its own memory. Revocations reach
+# other workers through Redis, so this is also the revocation propagation delay.
+TOKEN_CACHE_MEMORY_TTL_SECONDS: Final[int] = int(environ.get("TOKEN_CACHE_MEMORY_TTL_SECONDS", 60))
+TOKEN_CACHE_DEFAULT_TTL_SECONDS: Final[int] = int(environ.get("TOKEN_CACHE_DEFAULT_TTL_SECONDS", 900))
+TOKEN_CACHE_MAX_TTL_SECONDS: Final[int] = int(environ.get("TOKEN_CACHE_MAX_TTL_SECONDS", 86400))
+TOKEN_CACHE_NEGATIVE_TTL_SECONDS: Final[int] = int(environ.get("TOKEN_CACHE_NEGATIVE_TTL_SECONDS", 60))
+REDIS_RETRY_SECONDS: Final[int] = 60
+
+TOKEN_KEY_PREFIX: Final[str] = "auth:token"
+USER_KEY_PREFIX: Final[str] = "auth:user_tokens"
+
+# Sources reported by ``lookup`` and recorded by ``AuthLatencyMetrics``
+SOURCE_MEMORY: Final[str] = "memory"
+SOURCE_REDIS: Final[str] = "redis"
+SOURCE_REMOTE: Final[str] = "remote"
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_ttl_seconds(token: str) -> int:
+    """
+    Seconds a verified token may be cached: until its ``exp`` claim when it
+    has one, otherwise the default TTL. Capped at the max TTL.
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        if claims.get("exp"):
+            return max(0, min(int(claims["exp"] - time.time()), TOKEN_CACHE_MAX_TTL_SECONDS))
+    except jwt.PyJWTError:
+        pass
+    return TOKEN_CACHE_DEFAULT_TTL_SECONDS
+
+
+class TokenVerificationCache:
+    """
+    Two-tier cache of token verification results.
+
+    A cached value of ``None`` marks a rejected token (negative cache entry).
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES, use_redis: bool = True):
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._entries: "OrderedDict[str, Tuple[float, Optional[dict]]]" = OrderedDict()
+        self._user_tokens: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._redis_retry_at = 0.0
+
+    def lookup(self, token: str, include_redis: bool = True) -> Optional[Tuple[str, Optional[dict]]]:
+        """
+        Returns ``(source, user_data)`` on a hit, ``None`` on a miss.
+        """
+        key = hash_token(token)
+        hit = self._memory_get(key)
+        if hit is not None:
+            return SOURCE_MEMORY, hit[1]
+        if not include_redis:
+            return None
+
+        redis_client = self._redis()
+        if redis_client is None:
+            return None
+        try:
+            cached = redis_client.get(f"{TOKEN_KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"Redis error in token cache lookup: {e}")
+            return None
+        if not cached:
+            return None
+
+        data = json.loads(cached).get("data")
+        ttl = token_ttl_seconds(token) if data is not None else TOKEN_CACHE_NEGATIVE_TTL_SECONDS
+        self._memory_set(key, data, ttl)
+        return SOURCE_REDIS, data
+
+    def store(self, token: str, user_data: dict) -> None:
+        ttl = token_ttl_seconds(token)
+        if ttl <= 0:
+            return
+        key = hash_token(token)
+        self._memory_set(key, user_data, ttl)
+        user_key = _user_key(user_data)
+        if user_key:
+            with self._lock:
+                self._user_tokens.setdefault(user_key, set()).add(key)
+        self._redis_write(key, user_data, ttl, user_key)
+
+    def store_rejected(self, token: str) -> None:
+        key = hash_token(token)
+        self._memory_set(key, None, TOKEN_CACHE_NEGATIVE_TTL_SECONDS)
+        self._redis_write(key, None, TOKEN_CACHE_NEGATIVE_TTL_SECONDS, None)
+
+    def revoke_token(self, token: str) -> None:
+        self._drop([hash_token(token)])
+
+    def revoke_user(self, email: str) -> None:
+        """
+        Drop every cached token of a user (by email, the identifier shared by
+        the Draup payload and etter users), e.g. after a logout, deactivation
+        or permission change, so the next request is verified remotely.
+        """
+        user_key = email.strip().lower()
+        with self._lock:
+            keys = set(self._user_tokens.pop(user_key, set()))
+        redis_client = self._redis()
+        if redis_client is not None:
+            try:
+                keys.update(
+                    k.decode() if isinstance(k, bytes) else k
+                    for k in redis_client.smembers(f"{USER_KEY_PREFIX}:{user_key}")
+                )
+                redis_client.delete(f"{USER_KEY_PREFIX}:{user_key}")
+            except Exception as e:
+                logger.warning(f"Redis error revoking tokens for user {user_key}: {e}")
+        self._drop(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._user_tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _memory_get(self, key: str) -> Optional[Tuple[float, Optional[dict]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _memory_set(self, key: str, data: Optional[dict], ttl: int) -> None:
+        expires_at = time.time() + min(ttl, TOKEN_CACHE_MEMORY_TTL_SECONDS)
+        with self._lock:
+            self._entries[key] = (expires_at, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _drop(self, keys) -> None:
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        for key in keys:
+            try:
+                redis_client.delete(f"{TOKEN_KEY_PREFIX}:{key}")
+            except Exception as e:
+                logger.warning(f"Redis error revoking token: {e}")
+
+    def _redis(self):
+        if not self.use_redis or time.time() < self._redis_retry_at:
+            return None
+        try:
+            return get_redis_qa_login_client()
+        except Exception as e:
+            logger.warning(f"Redis unavailable for token cache: {e}")
+            self._redis_retry_at = time.time() + REDIS_RETRY_SECONDS
+            return None
+
+    def _redis_write(self, key: str, data: Optional[dict], ttl: int, user_key: Optional[str]) -> None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.setex(f"{TOKEN_KEY_PREFIX}:{key}", ttl, json.dumps({"data": data}))
+            if user_key:
+                redis_user_key = f"{USER_KEY_PREFIX}:{user_key}"
+                redis_client.sadd(redis_user_key, key)
+                redis_client.expire(redis_user_key, TOKEN_CACHE_MAX_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to cache token verification: {e}")
+
+
+def _user_key(user_data: dict) -> Optional[str]:
+    if isinstance(user_data, dict) and user_data.get("email"):
+        return str(user_data["email"]).strip().lower()
+    return None
+
+
+class AuthLatencyMetrics:
+    """
+    Rolling window of auth overhead samples, reported as p50/p99 per source.
+    """
+
+    def __init__(self, window: int = 2048):
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._window = window
+        self._lock = threading.Lock()
+
+    def observe(self, source: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._samples.setdefault(source, deque(maxlen=self._window)).append(elapsed_ms)
+            self._counts[source] = self._counts.get(source, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            per_source = {source: list(samples) for source, samples in self._samples.items()}
+            counts = dict(self._counts)
+        all_samples = [s for samples in per_source.values() for s in samples]
+        return {
+            "overall": _percentiles(all_samples),
+            "by_source": {
+                source: {**_percentiles(samples), "total": counts.get(source, 0)}
+                for source, samples in per_source.items()
+            },
+        }
+
+
+def _percentiles(samples) -> Dict[str, Any]:
+    if not samples:
+        return {"count": 0, "p50_ms": None, "p99_ms": None}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        "count": len(ordered),
+        "p50_ms": round(ordered[int(last * 0.50)], 3),
+        "p99_ms": round(ordered[int(last * 0.99)], 3),
+    }
+
+
+token_cache = TokenVerificationCache()
+auth_metrics = AuthLatencyMetrics()
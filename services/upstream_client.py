@@ -0,0 +1,148 @@
+"""
+Upstream HTTP client
+
+Shared, long-lived ``httpx.AsyncClient`` pools for calls from async routes to
+upstream services (Draup World, the gateway, the Draup platform). Each host
+gets its own connection pool with keep-alive, and each named upstream gets
+its own timeout budget, so one slow upstream cannot exhaust connections or
+block the event loop for the others.
+"""
+
+import asyncio
+from os import environ
+from typing import AsyncIterator, Dict, Final, Optional
+
+import httpx
+
+from common.logger import logger
+
+UPSTREAM_MAX_CONNECTIONS: Final[int] = int(environ.get("UPSTREAM_MAX_CONNECTIONS", 100))
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS: Final[int] = int(
+    environ.get("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+UPSTREAM_KEEPALIVE_EXPIRY_SECONDS: Final[float] = float(
+    environ.get("UPSTREAM_KEEPALIVE_EXPIRY_SECONDS", 30)
+)
+UPSTREAM_CONNECT_TIMEOUT_SECONDS: Final[float] = float(
+    environ.get("UPSTREAM_CONNECT_TIMEOUT_SECONDS", 10)
+)
+
+
+def _budget(name: str, read_seconds: float) -> httpx.Timeout:
+    """
+    Timeout budget for a named upstream. The read timeout can be overridden
+    with ``UPSTREAM_TIMEOUT_<NAME>_SECONDS``.
+    """
+    read = float(environ.get(f"UPSTREAM_TIMEOUT_{name.upper()}_SECONDS", read_seconds))
+    return httpx.Timeout(
+        read,
+        connect=UPSTREAM_CONNECT_TIMEOUT_SECONDS,
+        pool=UPSTREAM_CONNECT_TIMEOUT_SECONDS,
+    )
+
+
+# Named upstreams and their timeout budgets
+UPSTREAM_DEFAULT: Final[str] = "default"
+UPSTREAM_DRAUP_WORLD: Final[str] = "draup_world"
+UPSTREAM_DRAUP_WORLD_FAST: Final[str] = "draup_world_fast"
+UPSTREAM_DRAUP_WORLD_STREAM: Final[str] = "draup_world_stream"
+UPSTREAM_GATEWAY: Final[str] = "gateway"
+UPSTREAM_AUTH: Final[str] = "auth"
+
+UPSTREAM_TIMEOUTS: Dict[str, httpx.Timeout] = {
+    UPSTREAM_DEFAULT: _budget(UPSTREAM_DEFAULT, 30),
+    # LLM-backed workflow calls
+    UPSTREAM_DRAUP_WORLD: _budget(UPSTREAM_DRAUP_WORLD, 300),
+    # Interactive calls such as autocomplete and intent detection
+    UPSTREAM_DRAUP_WORLD_FAST: _budget(UPSTREAM_DRAUP_WORLD_FAST, 60),
+    # SSE streams: the read timeout applies between chunks, not to the whole stream
+    UPSTREAM_DRAUP_WORLD_STREAM: _budget(UPSTREAM_DRAUP_WORLD_STREAM, 300),
+    UPSTREAM_GATEWAY: _budget(UPSTREAM_GATEWAY, 30),
+    UPSTREAM_AUTH: _budget(UPSTREAM_AUTH, 30),
+}
+
+
+class UpstreamClient:
+    """
+    Lazily creates one ``httpx.AsyncClient`` per upstream host and reuses it
+    for the life of the process.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = UPSTREAM_MAX_CONNECTIONS,
+        max_keepalive_connections: int = UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = UPSTREAM_KEEPALIVE_EXPIRY_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        parsed = httpx.URL(url)
+        host_key = f"{parsed.scheme}://{parsed.host}:{parsed.port or ''}"
+        client = self._clients.get(host_key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=UPSTREAM_TIMEOUTS[UPSTREAM_DEFAULT],
+                transport=self._transport,
+            )
+            self._clients[host_key] = client
+        return client
+
+    async def request(
+        self, method: str, url: str, upstream: str = UPSTREAM_DEFAULT, **kwargs
+    ) -> httpx.Response:
+        kwargs.setdefault("timeout", UPSTREAM_TIMEOUTS.get(upstream, UPSTREAM_TIMEOUTS[UPSTREAM_DEFAULT]))
+        return await self.client_for(url).request(method, url, **kwargs)
+
+    async def open_stream(
+        self, method: str, url: str, upstream: str = UPSTREAM_DRAUP_WORLD_STREAM, **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request and return the response as soon as headers arrive,
+        without reading the body. The caller must close it, normally by
+        consuming it through ``iter_stream``.
+        """
+        kwargs.setdefault("timeout", UPSTREAM_TIMEOUTS.get(upstream, UPSTREAM_TIMEOUTS[UPSTREAM_DEFAULT]))
+        client = self.client_for(url)
+        request = client.build_request(method, url, **kwargs)
+        return await client.send(request, stream=True)
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+async def iter_stream(response: httpx.Response, on_error: Optional[bytes] = None) -> AsyncIterator[bytes]:
+    """
+    Pass an upstream stream through chunk by chunk, closing it when the
+    consumer is done or disconnects. ``on_error`` is yielded if the upstream
+    breaks mid-stream.
+    """
+    try:
+        async for chunk in response.aiter_bytes():
+            if chunk:
+                yield chunk
+    except Exception as exc:
+        logger.error(f"Streaming error: {exc}")
+        if on_error:
+            yield on_error
+    finally:
+        await response.aclose()
+
+
+upstream_client = UpstreamClient()
+
+
+def get_upstream_client() -> UpstreamClient:
+    """
+    Getting the process-wide upstream client
+    """
+    return upstream_client
@@ -1,8 +1,9 @@
 import logging
 import os
-import json
-import requests
 import re
+from typing import Optional
+
+from settings.log_shipper import LogShipper
 
 # =========================
 # Datadog Configuration
@@ -32,10 +33,20 @@ INCLUDE_LOGGERS = (
 # =========================
 
 class DatadogLogger(logging.Handler):
-    def __init__(self, service: str):
+    """
+    Builds a Datadog log entry per record and hands it to a LogShipper.
+
+    emit() never touches the network: entries are queued and sent in
+    compressed batches by the shipper's background thread (settings/log_shipper.py).
+    """
+
+    def __init__(self, service: str, shipper: Optional[LogShipper] = None):
         super().__init__()
         self.service = service
         self.env = os.getenv("ENV", "qa")
+        if shipper is None and DATADOG_API_KEY:
+            shipper = LogShipper(DATADOG_LOG_URL, headers={"DD-API-KEY": DATADOG_API_KEY})
+        self.shipper = shipper
 
         # IMPORTANT:
         # Do NOT add timestamps / levels here
@@ -93,85 +104,92 @@ class DatadogLogger(logging.Handler):
         return True
 
     def emit(self, record: logging.LogRecord):
-        if not DATADOG_API_KEY:
+        if self.shipper is None or self.shipper.is_flusher_thread():
             return
 
         try:
             if not self.should_log(record):
                 return
-
-            message = record.getMessage()
-            payload = {
-                "message": message,
-                "ddsource": "python",
-                "service": self.service,
-                "hostname": os.getenv("HOSTNAME"),
-                "status": record.levelname.lower(),
-                "ddtags": f"env:{self.env},service:{self.service}",
-            }
-            
-            # Extract structured fields from LogRecord (set via extra= in logger calls)
-            # Python logging adds extra fields directly as attributes on the LogRecord
-            http_method = getattr(record, "http.method", None)
-            http_url = getattr(record, "http.url", None)
-            http_status = getattr(record, "http.status_code", None)
-            event_type = getattr(record, "event_type", None)
-            
-            if http_method or http_url or http_status:
-                # Add structured HTTP fields to payload
-                if http_method:
-                    payload["http.method"] = http_method
-                if http_url:
-                    payload["http.url"] = http_url
-                if http_status:
-                    payload["http.status_code"] = http_status
-                if event_type:
-                    payload["event_type"] = event_type
-                
-                # Add other extra fields that might be present
-                for attr in dir(record):
-                    if attr.startswith("http.") or attr in ["duration_ms", "http.client_ip", "http.client_port", "http.request_id"]:
-                        value = getattr(record, attr, None)
-                        if value is not None and attr not in payload:
-                            payload[attr] = value
-                
-                # Build enhanced ddtags from structured fields
-                tags = [f"env:{self.env}", f"service:{self.service}"]
-                if http_method:
-                    tags.append(f"http.method:{http_method.lower()}")
-                if http_status:
-                    tags.append(f"http.status_code:{http_status}")
-                if event_type:
-                    tags.append(f"event_type:{event_type}")
-                
-                payload["ddtags"] = ",".join(tags)
-            
-            # If this is a uvicorn access log, parse and add structured fields
-            elif record.name == "uvicorn.access":
-                http_fields = self.parse_access_log(message)
-                if http_fields:
-                    # Add structured fields to payload
-                    payload.update(http_fields)
-                    # Add method and status to ddtags for better filtering
-                    method = http_fields.get("http.method", "").lower()
-                    status = http_fields.get("http.status_code", "")
-                    payload["ddtags"] += f",http.method:{method},http.status_code:{status}"
-            
-            # Add logger name for filtering
-            payload["logger"] = record.name
-
-            headers = {
-                "Content-Type": "application/json",
-                "DD-API-KEY": DATADOG_API_KEY,
-            }
-
-            requests.post(
-                DATADOG_LOG_URL,
-                headers=headers,
-                data=json.dumps(payload),
-                timeout=2,
-            )
+            self.shipper.submit(self.build_payload(record), record.levelno)
 
         except Exception:
             # Never break the app because of logging
             pass
+
+    def build_payload(self, record: logging.LogRecord) -> dict:
+        """
+        Datadog log entry for a record, with structured HTTP fields when present.
+        """
+        message = record.getMessage()
+        payload = {
+            "message": message,
+            "ddsource": "python",
+            "service": self.service,
+            "hostname": os.getenv("HOSTNAME"),
+            "status": record.levelname.lower(),
+            "ddtags": f"env:{self.env},service:{self.service}",
+        }
+        
+        # Extract structured fields from LogRecord (set via extra= in logger calls)
+        # Python logging adds extra fields directly as attributes on the LogRecord
+        http_method = getattr(record, "http.method", None)
+        http_url = getattr(record, "http.url", None)
+        http_status = getattr(record, "http.status_code", None)
+        event_type = getattr(record, "event_type", None)
+        
+        if http_method or http_url or http_status:
+            # Add structured HTTP fields to payload
+            if http_method:
+                payload["http.method"] = http_method
+            if http_url:
+                payload["http.url"] = http_url
+            if http_status:
+                payload["http.status_code"] = http_status
+            if event_type:
+                payload["event_type"] = event_type
+            
+            # Add other extra fields that might be present (extras live in the record's __dict__)
+            for attr in list(record.__dict__):
+                if attr.startswith("http.") or attr in ["duration_ms", "http.client_ip", "http.client_port", "http.request_id"]:
+                    value = getattr(record, attr, None)
+                    if value is not None and attr not in payload:
+                        payload[attr] = value
+            
+            # Build enhanced ddtags from structured fields
+            tags = [f"env:{self.env}", f"service:{self.service}"]
+            if http_method:
+                tags.append(f"http.method:{http_method.lower()}")
+            if http_status:
+                tags.append(f"http.status_code:{http_status}")
+            if event_type:
+                tags.append(f"event_type:{event_type}")
+            
+            payload["ddtags"] = ",".join(tags)
+        
+        # If this is a uvicorn access log, parse and add structured fields
+        elif record.name == "uvicorn.access":
+            http_fields = self.parse_access_log(message)
+            if http_fields:
+                # Add structured fields to payload
+                payload.update(http_fields)
+                # Add method and status to ddtags for better filtering
+                method = http_fields.get("http.method", "").lower()
+                status = http_fields.get("http.status_code", "")
+                payload["ddtags"] += f",http.method:{method},http.status_code:{status}"
+        
+        # Add logger name for filtering
+        payload["logger"] = record.name
+        return payload
+
+    def stats(self) -> dict:
+        """Shipper counters (queued, shipped, dropped, sampled out, failed)."""
+        return self.shipper.stats() if self.shipper is not None else {}
+
+    def flush(self):
+        if self.shipper is not None:
+            self.shipper.flush(timeout=5.0)
+
+    def close(self):
+        if self.shipper is not None:
+            self.shipper.close()
+        super().close()
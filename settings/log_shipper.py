@@ -0,0 +1,249 @@
+"""
+Background log shipping for the Datadog HTTP intake.
+
+Logging handlers call LogShipper.submit(), which only puts the entry on a
+bounded in-memory queue. A daemon flusher thread drains the queue and POSTs
+gzip-compressed JSON arrays to the intake, one batch per `batch_size`
+entries or per `flush_interval` seconds after the first entry of a batch,
+whichever comes first. Request handlers never wait on the network.
+
+Under backpressure the shipper sheds load instead of blocking:
+- once the queue is above `sample_high_water` of its capacity, records
+  below WARNING are kept with probability `sample_rate`
+- once the queue is full, new records are dropped
+Both are counted in stats() alongside shipped and failed records.
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+LOG_QUEUE_SIZE = int(os.getenv("DD_LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.getenv("DD_LOG_BATCH_SIZE", "500"))
+LOG_FLUSH_INTERVAL = float(os.getenv("DD_LOG_FLUSH_INTERVAL", "2.0"))
+LOG_SAMPLE_HIGH_WATER = float(os.getenv("DD_LOG_SAMPLE_HIGH_WATER", "0.8"))
+LOG_SAMPLE_RATE = float(os.getenv("DD_LOG_SAMPLE_RATE", "0.1"))
+
+# Datadog intake limits: 1000 entries and 5MB (uncompressed) per request
+MAX_BATCH_ENTRIES = 1000
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+SEND_ATTEMPTS = 2
+
+
+class LogShipper:
+    """Bounded queue + background flusher that ships log entries in batches.
+
+    Args:
+        url: Intake URL receiving a JSON array per POST.
+        headers: Extra request headers (e.g. the API key).
+        batch_size: Entries per POST, capped at the intake's 1000.
+        flush_interval: Maximum age in seconds of a batch before it is sent.
+        queue_size: Entries held in memory before new ones are dropped.
+        sample_high_water: Queue fill ratio above which sub-WARNING entries are sampled.
+        sample_rate: Fraction of sub-WARNING entries kept above the high-water mark.
+        timeout: Per-request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        queue_size: int = LOG_QUEUE_SIZE,
+        sample_high_water: float = LOG_SAMPLE_HIGH_WATER,
+        sample_rate: float = LOG_SAMPLE_RATE,
+        timeout: float = 5.0,
+    ):
+        self.url = url
+        self.headers = {
+            **(headers or {}),
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_ENTRIES))
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.sample_threshold = int(queue_size * sample_high_water)
+        self.sample_rate = sample_rate
+        self.timeout = timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._session: Optional[requests.Session] = None
+        self._closed = False
+        self._counters = {
+            "submitted": 0,
+            "shipped": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "failed": 0,
+            "batches": 0,
+            "bytes_sent": 0,
+        }
+
+    # ── Producer side (called from logging handlers) ─────────────
+
+    def submit(self, entry: Dict[str, Any], levelno: int = logging.INFO) -> bool:
+        """Queue an entry without blocking. Returns False if it was sampled out or dropped."""
+        if self._closed:
+            return False
+        self._ensure_started()
+        if (
+            levelno < logging.WARNING
+            and self.sample_rate < 1.0
+            and self._queue.qsize() >= self.sample_threshold
+            and random.random() >= self.sample_rate
+        ):
+            self._count("sampled_out")
+            return False
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("submitted")
+        return True
+
+    def is_flusher_thread(self) -> bool:
+        """True on the flusher thread (its own HTTP client logs must not be re-shipped)."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far has been sent (or given up on)."""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush what is queued and stop the flusher thread."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        if self._session is not None:
+            self._session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+        stats["queued"] = self._queue.qsize()
+        stats["queue_size"] = self.queue_size
+        return stats
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += n
+
+    def _ensure_started(self) -> None:
+        # Restart after fork: the flusher thread does not survive into the child
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                self._queue = queue.Queue(maxsize=self.queue_size)
+                self._session = None
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="log-shipper", daemon=True)
+            self._thread.start()
+
+    # ── Flusher thread ───────────────────────────────────────────
+
+    def _run(self) -> None:
+        while True:
+            batch, marker, stop = self._next_batch()
+            if batch:
+                self._ship(batch)
+            if marker is not None:
+                marker.set()
+            if stop:
+                return
+
+    def _next_batch(self):
+        """Collect up to batch_size entries, waiting at most flush_interval after the first.
+
+        Returns (entries, flush marker or None, stop flag).
+        """
+        batch: List[Dict[str, Any]] = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if item is None:
+                return batch, None, True
+            if isinstance(item, threading.Event):
+                return batch, item, False
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, None, False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return batch, None, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, None, False
+
+    def _ship(self, batch: List[Dict[str, Any]]) -> None:
+        for chunk, entries in self._split(batch):
+            body = gzip.compress(chunk, compresslevel=6)
+            if self._post(body):
+                self._count("batches")
+                self._count("bytes_sent", len(body))
+                self._count("shipped", entries)
+            else:
+                self._count("failed", entries)
+
+    @staticmethod
+    def _split(batch: List[Dict[str, Any]]) -> List[Tuple[bytes, int]]:
+        """Serialize a batch as JSON arrays under the intake's size limit, with entry counts."""
+        chunks: List[Tuple[bytes, int]] = []
+        current: List[bytes] = []
+        size = 2
+        for entry in batch:
+            encoded = json.dumps(entry, default=str).encode("utf-8")
+            if current and size + len(encoded) + 1 > MAX_BATCH_BYTES:
+                chunks.append((b"[" + b",".join(current) + b"]", len(current)))
+                current, size = [], 2
+            current.append(encoded)
+            size += len(encoded) + 1
+        if current:
+            chunks.append((b"[" + b",".join(current) + b"]", len(current)))
+        return chunks
+
+    def _post(self, body: bytes) -> bool:
+        if self._session is None:
+            self._session = requests.Session()
+        for attempt in range(SEND_ATTEMPTS):
+            try:
+                response = self._session.post(self.url, headers=self.headers, data=body, timeout=self.timeout)
+                if response.status_code < 500:
+                    return response.ok
+            except requests.RequestException:
+                pass
+            if attempt + 1 < SEND_ATTEMPTS:
+                time.sleep(0.5 * (attempt + 1))
+        return False
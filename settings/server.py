@@ -4,7 +4,9 @@ from settings.datadog_tracer import initialize_datadog_tracer
 from settings.datadog_logger import DatadogLogger
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
+from contextlib import asynccontextmanager
 from datetime import datetime
+import inspect
 import logging
 from api.s3.api.routes_documents import documents_router
 from api.s3.api.routes_uploads import uploads_router
@@ -18,14 +20,56 @@ from api.extraction import extraction_router
 from api.gateway import gateway_router
 from etter_workflows.api import router as pipeline_router
 from workforce_twin_modeling.api import router as workforce_twin_router
+from workforce_twin_modeling.api.app import get_org_store, warm_org_store
+from workforce_twin_modeling.engine.executor import get_scenario_executor
 from middleware.cors_middleware import add_cors_middleware
 from middleware.datadog_logging_middleware import DatadogLoggingMiddleware
+from services.auth import get_auth_metrics
+from services.upstream_client import get_upstream_client
+from services.simulation.job_service import get_simulation_job_runner
+from services.extraction_batch_service import get_batch_extraction_engine
+from services.autocomplete_index import AUTOCOMPLETE_MEMORY_INDEX
+from services.autocomplete_service import get_autocomplete_index_manager, warm_autocomplete_indexes
+from services.task_autocomplete_service import get_task_autocomplete_refresher
 
 description = """
 #### Etter APIs:  🚀
    Etter API's to handle all the client side requests and responses.
 """
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_batch_extraction_engine().start()
+    warm_org_store()
+    if AUTOCOMPLETE_MEMORY_INDEX:
+        warm_autocomplete_indexes()
+    yield
+    shutdown_steps = []
+    if AUTOCOMPLETE_MEMORY_INDEX:
+        shutdown_steps.append(("autocomplete indexes", lambda: get_autocomplete_index_manager().shutdown()))
+    shutdown_steps += [
+        ("batch extraction", lambda: get_batch_extraction_engine().shutdown()),
+        ("upstream client", lambda: get_upstream_client().aclose()),
+        ("simulation jobs", lambda: get_simulation_job_runner().shutdown()),
+        ("org store", lambda: get_org_store().shutdown()),
+        ("scenario executor", lambda: get_scenario_executor().shutdown()),
+        ("task autocomplete refresher", lambda: get_task_autocomplete_refresher().shutdown()),
+        ("datadog log flush", lambda: dd_handler.flush()),
+    ]
+    await run_shutdown_steps(shutdown_steps)
+
+
+async def run_shutdown_steps(steps):
+    """Run each (name, step) in order; a failing step is logged and the rest still run."""
+    for name, step in steps:
+        try:
+            result = step()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logging.getLogger(__name__).exception(f"Shutdown step '{name}' failed")
+
+
 etter_app = FastAPI(
     title="Etter",
     description=description,
@@ -34,6 +78,7 @@ etter_app = FastAPI(
     root_path="/api",
     docs_url="/docs/etter",
     terms_of_service="https://draup.com/privacy/",
+    lifespan=lifespan,
 )
 
 
@@ -83,6 +128,22 @@ def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+@etter_app.get('/health/auth')
+def auth_health():
+    """
+    Token verification cache size and p50/p99 auth overhead per cache tier.
+    """
+    return get_auth_metrics()
+
+
+@etter_app.get('/health/logging')
+def logging_health():
+    """
+    Datadog log shipper counters: queued, shipped, dropped and sampled-out records.
+    """
+    return dd_handler.stats()
+
+
 service_name = "Etter"
 
 # Initialize Jaeger tracer (existing)